@@ -7,6 +7,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from enum import Enum, auto
 import dataclasses
 import logging
@@ -36,7 +37,12 @@ from icon4py.model.common import (
 )
 from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import horizontal as h_grid, icon as icon_grid, geometry
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.states import tracer_state as tracers
+from icon4py.model.common.utils import (
+    data_allocation as data_alloc,
+    instrumentation,
+    precompilation,
+)
 
 
 """
@@ -133,7 +139,6 @@ class Advection(ABC):
     Runs one three-dimensional advection step.
 
     Missing advection-specific features:
-        -tracer loops: currently the `run` method only advects one type of tracer at once
         -optional tendency output: depending on the physics package, opt_ddt_tracer_adv might be needed
         -maximum advection height: tracer-specific control over which levels are used for advection
     """
@@ -160,6 +165,53 @@ class Advection(ABC):
         """
         ...
 
+    def run_tracers(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracers_now: Sequence[fa.CellKField[ta.wpfloat]],
+        p_tracers_new: Sequence[fa.CellKField[ta.wpfloat]],
+        dtime: ta.wpfloat,
+        p_grf_tend_tracers: Optional[Sequence[fa.CellKField[ta.wpfloat]]] = None,
+    ):
+        """
+        Run an advection step for several tracers at once.
+
+        Work that does not depend on the tracer (density reintegration, backtrajectories, ...) is
+        done once for all tracers and the new tracers are exchanged in a single halo exchange.
+
+        Args:
+            diagnostic_state: output argument, data class that contains diagnostic variables, the tracer fluxes contain the fluxes of the last tracer
+            prep_adv: input argument, data class that contains precalculated advection fields
+            p_tracers_now: input argument, fields that contain current tracer mass fractions
+            p_tracers_new: output argument, fields that contain new tracer mass fractions
+            dtime: input argument, the time step
+            p_grf_tend_tracers: input argument, tracer tendencies for use in grid refinement, one per tracer, defaults to diagnostic_state.grf_tend_tracer for all tracers
+
+        """
+        if p_grf_tend_tracers is None:
+            p_grf_tend_tracers = (diagnostic_state.grf_tend_tracer,) * len(p_tracers_now)
+        for p_tracer_now, p_tracer_new, p_grf_tend_tracer in zip(
+            p_tracers_now, p_tracers_new, p_grf_tend_tracers, strict=True
+        ):
+            self.run(
+                diagnostic_state=dataclasses.replace(
+                    diagnostic_state, grf_tend_tracer=p_grf_tend_tracer
+                ),
+                prep_adv=prep_adv,
+                p_tracer_now=p_tracer_now,
+                p_tracer_new=p_tracer_new,
+                dtime=dtime,
+            )
+
+    def precompile(self, max_workers: Optional[int] = None) -> precompilation.CompileReport:
+        """
+        Compile the programs of the advection, including the horizontal and vertical advection, before the first step.
+
+        See `precompilation.precompile`.
+        """
+        return precompilation.precompile(self, max_workers=max_workers)
+
 
 class NoAdvection(Advection):
     """Class that implements disabled three-dimensional advection."""
@@ -192,25 +244,48 @@ class NoAdvection(Advection):
         p_tracer_now: fa.CellKField[ta.wpfloat],
         p_tracer_new: fa.CellKField[ta.wpfloat],
         dtime: ta.wpfloat,
+    ):
+        self.run_tracers(
+            diagnostic_state=diagnostic_state,
+            prep_adv=prep_adv,
+            p_tracers_now=(p_tracer_now,),
+            p_tracers_new=(p_tracer_new,),
+            dtime=dtime,
+        )
+
+    @instrumentation.timed("advection.run_tracers")
+    def run_tracers(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracers_now: Sequence[fa.CellKField[ta.wpfloat]],
+        p_tracers_new: Sequence[fa.CellKField[ta.wpfloat]],
+        dtime: ta.wpfloat,
+        p_grf_tend_tracers: Optional[Sequence[fa.CellKField[ta.wpfloat]]] = None,
     ):
         log.debug("advection run - start")
 
         log.debug("communication of prep_adv cell field: mass_flx_ic - start")
-        self._exchange.exchange_and_wait(dims.CellDim, prep_adv.mass_flx_ic)
-        log.debug("communication of prep_adv cell field: mass_flx_ic - end")
+        with instrumentation.region("exchange.mass_flx_ic.start"):
+            mass_flx_ic_exchange = self._exchange.exchange(dims.CellDim, prep_adv.mass_flx_ic)
 
         log.debug("running stencil copy_cell_kdim_field - start")
-        self._copy_cell_kdim_field(
-            field_in=p_tracer_now,
-            field_out=p_tracer_new,
-            horizontal_start=self._start_cell_nudging,
-            horizontal_end=self._end_cell_local,
-            vertical_start=0,
-            vertical_end=self._grid.num_levels,
-            offset_provider=self._grid.offset_providers,
-        )
+        for p_tracer_now, p_tracer_new in zip(p_tracers_now, p_tracers_new, strict=True):
+            self._copy_cell_kdim_field(
+                field_in=p_tracer_now,
+                field_out=p_tracer_new,
+                horizontal_start=self._start_cell_nudging,
+                horizontal_end=self._end_cell_local,
+                vertical_start=0,
+                vertical_end=self._grid.num_levels,
+                offset_provider=self._grid.offset_providers,
+            )
         log.debug("running stencil copy_cell_kdim_field - end")
 
+        with instrumentation.region("exchange.mass_flx_ic.wait"):
+            mass_flx_ic_exchange.wait()
+        log.debug("communication of prep_adv cell field: mass_flx_ic - end")
+
         log.debug("advection run - end")
 
 
@@ -252,6 +327,7 @@ class GodunovSplittingAdvection(Advection):
         self._end_cell_lateral_boundary_level_4 = self._grid.end_index(
             cell_domain(h_grid.Zone.LATERAL_BOUNDARY_LEVEL_4)
         )
+        self._end_cell_local = self._grid.end_index(cell_domain(h_grid.Zone.LOCAL))
         self._end_cell_end = self._grid.end_index(cell_domain(h_grid.Zone.END))
 
         # density fields
@@ -275,14 +351,40 @@ class GodunovSplittingAdvection(Advection):
         p_tracer_now: fa.CellKField[ta.wpfloat],
         p_tracer_new: fa.CellKField[ta.wpfloat],
         dtime: ta.wpfloat,
+    ):
+        self.run_tracers(
+            diagnostic_state=diagnostic_state,
+            prep_adv=prep_adv,
+            p_tracers_now=(p_tracer_now,),
+            p_tracers_new=(p_tracer_new,),
+            dtime=dtime,
+        )
+
+    @instrumentation.timed("advection.run_tracers")
+    def run_tracers(
+        self,
+        diagnostic_state: advection_states.AdvectionDiagnosticState,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracers_now: Sequence[fa.CellKField[ta.wpfloat]],
+        p_tracers_new: Sequence[fa.CellKField[ta.wpfloat]],
+        dtime: ta.wpfloat,
+        p_grf_tend_tracers: Optional[Sequence[fa.CellKField[ta.wpfloat]]] = None,
     ):
         log.debug("advection run - start")
 
+        if len(p_tracers_now) != len(p_tracers_new):
+            raise ValueError(
+                f"Got {len(p_tracers_now)} current but {len(p_tracers_new)} new tracer fields."
+            )
+        if p_grf_tend_tracers is None:
+            p_grf_tend_tracers = (diagnostic_state.grf_tend_tracer,) * len(p_tracers_now)
+
         log.debug("communication of prep_adv cell field: mass_flx_ic - start")
-        self._exchange.exchange_and_wait(dims.CellDim, prep_adv.mass_flx_ic)
-        log.debug("communication of prep_adv cell field: mass_flx_ic - end")
+        with instrumentation.region("exchange.mass_flx_ic.start"):
+            mass_flx_ic_exchange = self._exchange.exchange(dims.CellDim, prep_adv.mass_flx_ic)
 
-        # reintegrate density for conservation of mass
+        # reintegrate density for conservation of mass: the stencil is column local, so the owned
+        # cells are computed while mass_flx_ic is exchanged and the halo cells afterwards
         rhodz_in, horizontal_start = (
             (diagnostic_state.airmass_now, self._start_cell_lateral_boundary_level_2)
             if self._even_timestep
@@ -298,6 +400,23 @@ class GodunovSplittingAdvection(Advection):
             p_dtime=dtime,
             even_timestep=self._even_timestep,
             horizontal_start=horizontal_start,
+            horizontal_end=self._end_cell_local,
+            vertical_start=0,
+            vertical_end=self._grid.num_levels,
+            offset_provider=self._grid.offset_providers,
+        )
+        with instrumentation.region("exchange.mass_flx_ic.wait"):
+            mass_flx_ic_exchange.wait()
+        log.debug("communication of prep_adv cell field: mass_flx_ic - end")
+        self._apply_density_increment(
+            rhodz_in=rhodz_in,
+            p_mflx_contra_v=prep_adv.mass_flx_ic,
+            deepatmo_divzl=self._metric_state.deepatmo_divzl,
+            deepatmo_divzu=self._metric_state.deepatmo_divzu,
+            rhodz_out=self._rhodz_ast2,
+            p_dtime=dtime,
+            even_timestep=self._even_timestep,
+            horizontal_start=self._end_cell_local,
             horizontal_end=self._end_cell_end,
             vertical_start=0,
             vertical_end=self._grid.num_levels,
@@ -308,10 +427,10 @@ class GodunovSplittingAdvection(Advection):
         # Godunov splitting
         if self._even_timestep:
             # vertical transport
-            self._vertical_advection.run(
+            self._vertical_advection.run_tracers(
                 prep_adv=prep_adv,
-                p_tracer_now=p_tracer_now,
-                p_tracer_new=p_tracer_new,
+                p_tracers_now=p_tracers_now,
+                p_tracers_new=p_tracers_new,
                 rhodz_now=diagnostic_state.airmass_now,
                 rhodz_new=self._rhodz_ast2,
                 p_mflx_tracer_v=diagnostic_state.vfl_tracer,
@@ -320,10 +439,10 @@ class GodunovSplittingAdvection(Advection):
             )
 
             # horizontal transport
-            self._horizontal_advection.run(
+            self._horizontal_advection.run_tracers(
                 prep_adv=prep_adv,
-                p_tracer_now=p_tracer_new,
-                p_tracer_new=p_tracer_new,
+                p_tracers_now=p_tracers_new,
+                p_tracers_new=p_tracers_new,
                 rhodz_now=self._rhodz_ast2,
                 rhodz_new=diagnostic_state.airmass_new,
                 p_mflx_tracer_h=diagnostic_state.hfl_tracer,
@@ -332,10 +451,10 @@ class GodunovSplittingAdvection(Advection):
 
         else:
             # horizontal transport
-            self._horizontal_advection.run(
+            self._horizontal_advection.run_tracers(
                 prep_adv=prep_adv,
-                p_tracer_now=p_tracer_now,
-                p_tracer_new=p_tracer_new,
+                p_tracers_now=p_tracers_now,
+                p_tracers_new=p_tracers_new,
                 rhodz_now=diagnostic_state.airmass_now,
                 rhodz_new=self._rhodz_ast2,
                 p_mflx_tracer_h=diagnostic_state.hfl_tracer,
@@ -343,10 +462,10 @@ class GodunovSplittingAdvection(Advection):
             )
 
             # vertical transport
-            self._vertical_advection.run(
+            self._vertical_advection.run_tracers(
                 prep_adv=prep_adv,
-                p_tracer_now=p_tracer_new,
-                p_tracer_new=p_tracer_new,
+                p_tracers_now=p_tracers_new,
+                p_tracers_new=p_tracers_new,
                 rhodz_now=self._rhodz_ast2,
                 rhodz_new=diagnostic_state.airmass_new,
                 p_mflx_tracer_v=diagnostic_state.vfl_tracer,
@@ -357,23 +476,27 @@ class GodunovSplittingAdvection(Advection):
         # update lateral boundaries with interpolated time tendencies
         if self._grid.limited_area:
             log.debug("running stencil apply_interpolated_tracer_time_tendency - start")
-            self._apply_interpolated_tracer_time_tendency(
-                p_tracer_now=p_tracer_now,
-                p_grf_tend_tracer=diagnostic_state.grf_tend_tracer,
-                p_tracer_new=p_tracer_new,
-                p_dtime=dtime,
-                horizontal_start=self._start_cell_lateral_boundary,
-                horizontal_end=self._end_cell_lateral_boundary_level_4,
-                vertical_start=0,
-                vertical_end=self._grid.num_levels,
-                offset_provider=self._grid.offset_providers,
-            )
+            for p_tracer_now, p_tracer_new, p_grf_tend_tracer in zip(
+                p_tracers_now, p_tracers_new, p_grf_tend_tracers, strict=True
+            ):
+                self._apply_interpolated_tracer_time_tendency(
+                    p_tracer_now=p_tracer_now,
+                    p_grf_tend_tracer=p_grf_tend_tracer,
+                    p_tracer_new=p_tracer_new,
+                    p_dtime=dtime,
+                    horizontal_start=self._start_cell_lateral_boundary,
+                    horizontal_end=self._end_cell_lateral_boundary_level_4,
+                    vertical_start=0,
+                    vertical_end=self._grid.num_levels,
+                    offset_provider=self._grid.offset_providers,
+                )
             log.debug("running stencil apply_interpolated_tracer_time_tendency - end")
 
-        # exchange updated tracer values, originally happens only if iforcing /= inwp
-        log.debug("communication of advection cell field: p_tracer_new - start")
-        self._exchange.exchange_and_wait(dims.CellDim, p_tracer_new)
-        log.debug("communication of advection cell field: p_tracer_new - end")
+        # exchange updated tracer values in one aggregated exchange, originally happens only if iforcing /= inwp
+        log.debug("communication of advection cell fields: p_tracers_new - start")
+        with instrumentation.region("exchange.tracers"):
+            self._exchange.exchange_and_wait(dims.CellDim, *p_tracers_new)
+        log.debug("communication of advection cell fields: p_tracers_new - end")
 
         # finalize step
         self._even_timestep = not self._even_timestep
@@ -381,6 +504,15 @@ class GodunovSplittingAdvection(Advection):
         log.debug("advection run - end")
 
 
+def tracer_fields(tracer_state: tracers.TracerState) -> tuple[fa.CellKField[ta.wpfloat], ...]:
+    """Return the tracer fields of a tracer state that are present, in the order of the tracer state, for `Advection.run_tracers`."""
+    return tuple(
+        field
+        for field in (getattr(tracer_state, f.name) for f in dataclasses.fields(tracer_state))
+        if field is not None
+    )
+
+
 def convert_config_to_horizontal_vertical_advection(
     config: AdvectionConfig,
     grid: icon_grid.IconGrid,
@@ -7,6 +7,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 import logging
 from typing import Optional
 
@@ -46,7 +47,7 @@ from icon4py.model.common import (
 )
 from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import horizontal as h_grid, icon as icon_grid, geometry
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import data_allocation as data_alloc, instrumentation
 
 
 """
@@ -146,7 +147,8 @@ class PositiveDefinite(HorizontalFluxLimiter):
         )
 
         log.debug("communication of advection cell field: r_m - start")
-        self._exchange.exchange_and_wait(dims.CellDim, self._r_m)
+        with instrumentation.region("exchange.r_m"):
+            self._exchange.exchange_and_wait(dims.CellDim, self._r_m)
         log.debug("communication of advection cell field: r_m - end")
 
         # limit outward fluxes
@@ -323,6 +325,40 @@ class HorizontalAdvection(ABC):
         """
         ...
 
+    def run_tracers(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracers_now: Sequence[fa.CellKField[ta.wpfloat]],
+        p_tracers_new: Sequence[fa.CellKField[ta.wpfloat]],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        rhodz_new: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_h: fa.EdgeKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+    ):
+        """
+        Run a horizontal advection step for several tracers.
+
+        Args:
+            prep_adv: input argument, data class that contains precalculated advection fields
+            p_tracers_now: input argument, fields that contain current tracer mass fractions
+            p_tracers_new: output argument, fields that contain new tracer mass fractions
+            rhodz_now: input argument, field that contains current air mass in each layer
+            rhodz_new: input argument, field that contains new air mass in each layer
+            p_mflx_tracer_h: output argument, field that contains new horizontal tracer mass flux of the last tracer
+            dtime: input argument, the time step
+
+        """
+        for p_tracer_now, p_tracer_new in zip(p_tracers_now, p_tracers_new, strict=True):
+            self.run(
+                prep_adv=prep_adv,
+                p_tracer_now=p_tracer_now,
+                p_tracer_new=p_tracer_new,
+                rhodz_now=rhodz_now,
+                rhodz_new=rhodz_new,
+                p_mflx_tracer_h=p_mflx_tracer_h,
+                dtime=dtime,
+            )
+
 
 class NoAdvection(HorizontalAdvection):
     """Class that implements disabled horizontal advection."""
@@ -384,27 +420,59 @@ class FiniteVolume(HorizontalAdvection):
         p_mflx_tracer_h: fa.EdgeKField[ta.wpfloat],
         dtime: ta.wpfloat,
     ):
-        log.debug("horizontal advection run - start")
-
-        self._compute_numerical_flux(
+        self.run_tracers(
             prep_adv=prep_adv,
-            p_tracer_now=p_tracer_now,
-            rhodz_now=rhodz_now,
-            p_mflx_tracer_h=p_mflx_tracer_h,
-            dtime=dtime,
-        )
-
-        self._update_unknowns(
-            p_tracer_now=p_tracer_now,
-            p_tracer_new=p_tracer_new,
+            p_tracers_now=(p_tracer_now,),
+            p_tracers_new=(p_tracer_new,),
             rhodz_now=rhodz_now,
             rhodz_new=rhodz_new,
             p_mflx_tracer_h=p_mflx_tracer_h,
             dtime=dtime,
         )
 
+    @instrumentation.timed("advection.horizontal")
+    def run_tracers(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracers_now: Sequence[fa.CellKField[ta.wpfloat]],
+        p_tracers_new: Sequence[fa.CellKField[ta.wpfloat]],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        rhodz_new: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_h: fa.EdgeKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+    ):
+        log.debug("horizontal advection run - start")
+
+        self._prepare_numerical_flux(prep_adv=prep_adv, dtime=dtime)
+
+        for p_tracer_now, p_tracer_new in zip(p_tracers_now, p_tracers_new, strict=True):
+            self._compute_numerical_flux(
+                prep_adv=prep_adv,
+                p_tracer_now=p_tracer_now,
+                rhodz_now=rhodz_now,
+                p_mflx_tracer_h=p_mflx_tracer_h,
+                dtime=dtime,
+            )
+
+            self._update_unknowns(
+                p_tracer_now=p_tracer_now,
+                p_tracer_new=p_tracer_new,
+                rhodz_now=rhodz_now,
+                rhodz_new=rhodz_new,
+                p_mflx_tracer_h=p_mflx_tracer_h,
+                dtime=dtime,
+            )
+
         log.debug("horizontal advection run - end")
 
+    def _prepare_numerical_flux(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        dtime: ta.wpfloat,
+    ):
+        """Compute the tracer-independent parts of the numerical flux, shared by all tracers."""
+        ...
+
     @abstractmethod
     def _compute_numerical_flux(
         self,
@@ -494,17 +562,12 @@ class SemiLagrangian(FiniteVolume):
 
         log.debug("horizontal advection class init - end")
 
-    def _compute_numerical_flux(
+    def _prepare_numerical_flux(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
-        p_tracer_now: fa.CellKField[ta.wpfloat],
-        rhodz_now: fa.CellKField[ta.wpfloat],
-        p_mflx_tracer_h: fa.EdgeKField[ta.wpfloat],
         dtime: ta.wpfloat,
     ):
-        log.debug("horizontal numerical flux computation - start")
-
-        ## tracer-independent part
+        log.debug("horizontal numerical flux preparation - start")
 
         # compute tangential velocity
         log.debug("running stencil compute_edge_tangential - start")
@@ -542,8 +605,19 @@ class SemiLagrangian(FiniteVolume):
         )
         log.debug("running stencil compute_barycentric_backtrajectory_alt - end")
 
-        ## tracer-specific part
+        log.debug("horizontal numerical flux preparation - end")
+
+    def _compute_numerical_flux(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_h: fa.EdgeKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+    ):
+        log.debug("horizontal numerical flux computation - start")
 
+        # the backtrajectory is computed in _prepare_numerical_flux
         self._tracer_flux.compute_tracer_flux(
             prep_adv=prep_adv,
             p_tracer_now=p_tracer_now,
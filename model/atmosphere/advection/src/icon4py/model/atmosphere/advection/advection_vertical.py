@@ -7,6 +7,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 import logging
 from typing import Optional
 
@@ -70,7 +71,7 @@ from icon4py.model.common import (
 )
 from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import horizontal as h_grid, icon as icon_grid, geometry
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import data_allocation as data_alloc, instrumentation
 
 
 """
@@ -386,6 +387,42 @@ class VerticalAdvection(ABC):
         """
         ...
 
+    def run_tracers(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracers_now: Sequence[fa.CellKField[ta.wpfloat]],
+        p_tracers_new: Sequence[fa.CellKField[ta.wpfloat]],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        rhodz_new: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_v: fa.CellKField[ta.wpfloat],  # TODO (dastrm): should be KHalfDim
+        dtime: ta.wpfloat,
+        even_timestep: bool = False,
+    ):
+        """
+        Run a vertical advection step for several tracers.
+
+        Args:
+            prep_adv: input argument, data class that contains precalculated advection fields
+            p_tracers_now: input argument, fields that contain current tracer mass fractions
+            p_tracers_new: output argument, fields that contain new tracer mass fractions
+            rhodz_now: input argument, field that contains current air mass in each layer
+            rhodz_new: input argument, field that contains new air mass in each layer
+            p_mflx_tracer_v: output argument, field that contains new vertical tracer mass flux of the last tracer
+            dtime: input argument, the time step
+            even_timestep: input argument, determines whether halo points are included
+        """
+        for p_tracer_now, p_tracer_new in zip(p_tracers_now, p_tracers_new, strict=True):
+            self.run(
+                prep_adv=prep_adv,
+                p_tracer_now=p_tracer_now,
+                p_tracer_new=p_tracer_new,
+                rhodz_now=rhodz_now,
+                rhodz_new=rhodz_new,
+                p_mflx_tracer_v=p_mflx_tracer_v,
+                dtime=dtime,
+                even_timestep=even_timestep,
+            )
+
 
 class NoAdvection(VerticalAdvection):
     """Class that implements disabled vertical advection."""
@@ -467,29 +504,70 @@ class FiniteVolume(VerticalAdvection):
         dtime: ta.wpfloat,
         even_timestep: bool = False,
     ):
-        log.debug("vertical advection run - start")
-
-        self._compute_numerical_flux(
+        self.run_tracers(
             prep_adv=prep_adv,
-            p_tracer_now=p_tracer_now,
+            p_tracers_now=(p_tracer_now,),
+            p_tracers_new=(p_tracer_new,),
             rhodz_now=rhodz_now,
+            rhodz_new=rhodz_new,
             p_mflx_tracer_v=p_mflx_tracer_v,
             dtime=dtime,
             even_timestep=even_timestep,
         )
 
-        self._update_unknowns(
-            p_tracer_now=p_tracer_now,
-            p_tracer_new=p_tracer_new,
+    @instrumentation.timed("advection.vertical")
+    def run_tracers(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracers_now: Sequence[fa.CellKField[ta.wpfloat]],
+        p_tracers_new: Sequence[fa.CellKField[ta.wpfloat]],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        rhodz_new: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_v: fa.CellKField[ta.wpfloat],  # TODO (dastrm): should be KHalfDim
+        dtime: ta.wpfloat,
+        even_timestep: bool = False,
+    ):
+        log.debug("vertical advection run - start")
+
+        self._prepare_numerical_flux(
+            prep_adv=prep_adv,
             rhodz_now=rhodz_now,
-            rhodz_new=rhodz_new,
-            p_mflx_tracer_v=p_mflx_tracer_v,
             dtime=dtime,
             even_timestep=even_timestep,
         )
 
+        for p_tracer_now, p_tracer_new in zip(p_tracers_now, p_tracers_new, strict=True):
+            self._compute_numerical_flux(
+                prep_adv=prep_adv,
+                p_tracer_now=p_tracer_now,
+                rhodz_now=rhodz_now,
+                p_mflx_tracer_v=p_mflx_tracer_v,
+                dtime=dtime,
+                even_timestep=even_timestep,
+            )
+
+            self._update_unknowns(
+                p_tracer_now=p_tracer_now,
+                p_tracer_new=p_tracer_new,
+                rhodz_now=rhodz_now,
+                rhodz_new=rhodz_new,
+                p_mflx_tracer_v=p_mflx_tracer_v,
+                dtime=dtime,
+                even_timestep=even_timestep,
+            )
+
         log.debug("vertical advection run - end")
 
+    def _prepare_numerical_flux(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        dtime: ta.wpfloat,
+        even_timestep: bool,
+    ):
+        """Compute the tracer-independent parts of the numerical flux, shared by all tracers."""
+        ...
+
     @abstractmethod
     def _compute_numerical_flux(
         self,
@@ -760,23 +838,20 @@ class PiecewiseParabolicMethod(FiniteVolume):
 
         return horizontal_start, horizontal_end
 
-    def _compute_numerical_flux(
+    def _prepare_numerical_flux(
         self,
         prep_adv: advection_states.AdvectionPrepAdvState,
-        p_tracer_now: fa.CellKField[ta.wpfloat],
         rhodz_now: fa.CellKField[ta.wpfloat],
-        p_mflx_tracer_v: fa.CellKField[ta.wpfloat],  # TODO (dastrm): should be KHalfDim
         dtime: ta.wpfloat,
         even_timestep: bool,
     ):
-        log.debug("vertical numerical flux computation - start")
+        log.debug("vertical numerical flux preparation - start")
 
         horizontal_start, horizontal_end = self._get_horizontal_start_end(
             even_timestep=even_timestep
         )
 
-        ## compute density-weighted Courant number
-
+        # compute density-weighted Courant number
         log.debug("running stencil init_constant_cell_kdim_field - start")
         self._init_constant_cell_kdim_field(
             field=self._z_cfl,
@@ -807,6 +882,23 @@ class PiecewiseParabolicMethod(FiniteVolume):
         )
         log.debug("running stencil compute_ppm4gpu_courant_number - end")
 
+        log.debug("vertical numerical flux preparation - end")
+
+    def _compute_numerical_flux(
+        self,
+        prep_adv: advection_states.AdvectionPrepAdvState,
+        p_tracer_now: fa.CellKField[ta.wpfloat],
+        rhodz_now: fa.CellKField[ta.wpfloat],
+        p_mflx_tracer_v: fa.CellKField[ta.wpfloat],  # TODO (dastrm): should be KHalfDim
+        dtime: ta.wpfloat,
+        even_timestep: bool,
+    ):
+        log.debug("vertical numerical flux computation - start")
+
+        horizontal_start, horizontal_end = self._get_horizontal_start_end(
+            even_timestep=even_timestep
+        )
+
         ## reconstruct face values
 
         # compute slope
@@ -11,6 +11,7 @@ import pytest
 from icon4py.model.atmosphere.advection import advection
 from icon4py.model.common import dimension as dims
 from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.testing import helpers
 
 from .utils import (
     construct_config,
@@ -160,3 +161,124 @@ def test_advection_run_single_step(
         p_tracer_new_ref=p_tracer_new_ref,
         even_timestep=even_timestep,
     )
+
+
+@pytest.mark.embedded_remap_error
+@pytest.mark.datatest
+@pytest.mark.parametrize(
+    "date, even_timestep, ntracer, horizontal_advection_type, horizontal_advection_limiter, vertical_advection_type, vertical_advection_limiter",
+    [
+        (
+            "2021-06-20T12:00:10.000",
+            False,
+            2,
+            advection.HorizontalAdvectionType.LINEAR_2ND_ORDER,
+            advection.HorizontalAdvectionLimiter.POSITIVE_DEFINITE,
+            advection.VerticalAdvectionType.NO_ADVECTION,
+            advection.VerticalAdvectionLimiter.NO_LIMITER,
+        ),
+        (
+            "2021-06-20T12:00:20.000",
+            True,
+            2,
+            advection.HorizontalAdvectionType.LINEAR_2ND_ORDER,
+            advection.HorizontalAdvectionLimiter.POSITIVE_DEFINITE,
+            advection.VerticalAdvectionType.NO_ADVECTION,
+            advection.VerticalAdvectionLimiter.NO_LIMITER,
+        ),
+        (
+            "2021-06-20T12:00:10.000",
+            False,
+            5,
+            advection.HorizontalAdvectionType.NO_ADVECTION,
+            advection.HorizontalAdvectionLimiter.NO_LIMITER,
+            advection.VerticalAdvectionType.PPM_3RD_ORDER,
+            advection.VerticalAdvectionLimiter.SEMI_MONOTONIC,
+        ),
+    ],
+)
+def test_advection_run_tracers(
+    grid_savepoint,
+    icon_grid,
+    interpolation_savepoint,
+    least_squares_savepoint,
+    metrics_savepoint,
+    advection_init_savepoint,
+    advection_exit_savepoint,
+    data_provider,
+    data_provider_advection,
+    backend,
+    even_timestep,
+    ntracer,
+    horizontal_advection_type,
+    horizontal_advection_limiter,
+    vertical_advection_type,
+    vertical_advection_limiter,
+):
+    config = construct_config(
+        horizontal_advection_type=horizontal_advection_type,
+        horizontal_advection_limiter=horizontal_advection_limiter,
+        vertical_advection_type=vertical_advection_type,
+        vertical_advection_limiter=vertical_advection_limiter,
+    )
+    advection_granule = advection.convert_config_to_advection(
+        config=config,
+        grid=icon_grid,
+        interpolation_state=construct_interpolation_state(interpolation_savepoint, backend=backend),
+        least_squares_state=construct_least_squares_state(least_squares_savepoint),
+        metric_state=construct_metric_state(icon_grid, metrics_savepoint, backend=backend),
+        edge_params=grid_savepoint.construct_edge_geometry(),
+        cell_params=grid_savepoint.construct_cell_geometry(),
+        even_timestep=even_timestep,
+        backend=backend,
+    )
+
+    prep_adv = construct_prep_adv(advection_init_savepoint)
+    # the reference tracer is advected last, the fluxes in the diagnostic state are the ones of
+    # the last tracer
+    p_tracer_now_ref = advection_init_savepoint.tracer(ntracer)
+    p_tracers_now = (0.5 * p_tracer_now_ref, 0.25 * p_tracer_now_ref, p_tracer_now_ref)
+    p_tracers_new = tuple(
+        data_alloc.zero_field(icon_grid, dims.CellDim, dims.KDim, backend=backend)
+        for _ in p_tracers_now
+    )
+    dtime = advection_init_savepoint.get_metadata("dtime").get("dtime")
+
+    # advect the tracers one by one as reference for the batched advection
+    p_tracers_new_single = []
+    for p_tracer_now in p_tracers_now:
+        p_tracer_new = data_alloc.zero_field(icon_grid, dims.CellDim, dims.KDim, backend=backend)
+        advection_granule.run(
+            diagnostic_state=construct_diagnostic_init_state(
+                icon_grid, advection_init_savepoint, ntracer, backend=backend
+            ),
+            prep_adv=prep_adv,
+            p_tracer_now=p_tracer_now,
+            p_tracer_new=p_tracer_new,
+            dtime=dtime,
+        )
+        p_tracers_new_single.append(p_tracer_new)
+
+    diagnostic_state = construct_diagnostic_init_state(
+        icon_grid, advection_init_savepoint, ntracer, backend=backend
+    )
+    advection_granule.run_tracers(
+        diagnostic_state=diagnostic_state,
+        prep_adv=prep_adv,
+        p_tracers_now=p_tracers_now,
+        p_tracers_new=p_tracers_new,
+        dtime=dtime,
+    )
+
+    for p_tracer_new, p_tracer_new_single in zip(p_tracers_new, p_tracers_new_single, strict=True):
+        assert helpers.dallclose(p_tracer_new.asnumpy(), p_tracer_new_single.asnumpy())
+    verify_advection_fields(
+        grid=icon_grid,
+        diagnostic_state=diagnostic_state,
+        diagnostic_state_ref=construct_diagnostic_exit_state(
+            icon_grid, advection_exit_savepoint, ntracer, backend=backend
+        ),
+        p_tracer_new=p_tracers_new[-1],
+        p_tracer_new_ref=advection_exit_savepoint.tracer(ntracer),
+        even_timestep=even_timestep,
+    )
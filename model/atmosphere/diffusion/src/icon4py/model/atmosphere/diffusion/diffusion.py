@@ -63,7 +63,11 @@ from icon4py.model.common.interpolation.stencils.mo_intp_rbf_rbf_vec_interpol_ve
     mo_intp_rbf_rbf_vec_interpol_vertex,
 )
 
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import (
+    data_allocation as data_alloc,
+    instrumentation,
+    precompilation,
+)
 
 from icon4py.model.common.orchestration import decorator as dace_orchestration
 
@@ -545,6 +549,15 @@ class Diffusion:
 
         self._horizontal_start_index_w_diffusion = _get_start_index_for_w_diffusion()
 
+    def precompile(self, max_workers: Optional[int] = None) -> precompilation.CompileReport:
+        """
+        Compile the programs of the diffusion before the first step.
+
+        See `precompilation.precompile`.
+        """
+        return precompilation.precompile(self, max_workers=max_workers)
+
+    @instrumentation.timed("diffusion.initial_run")
     def initial_run(
         self,
         diagnostic_state: diffusion_states.DiffusionDiagnosticState,
@@ -577,6 +590,7 @@ class Diffusion:
         )
         self._sync_cell_fields(prognostic_state)
 
+    @instrumentation.timed("diffusion.run")
     def run(
         self,
         diagnostic_state: diffusion_states.DiffusionDiagnosticState,
@@ -606,12 +620,13 @@ class Diffusion:
         IF ( linit .OR. (iforcing /= inwp .AND. iforcing /= iaes) ) THEN
         """
         log.debug("communication of prognostic cell fields: theta, w, exner - start")
-        self._exchange.exchange_and_wait(
-            dims.CellDim,
-            prognostic_state.w,
-            prognostic_state.theta_v,
-            prognostic_state.exner,
-        )
+        with instrumentation.region("exchange.w_theta_v_exner"):
+            self._exchange.exchange_and_wait(
+                dims.CellDim,
+                prognostic_state.w,
+                prognostic_state.theta_v,
+                prognostic_state.exner,
+            )
         log.debug("communication of prognostic cell fields: theta, w, exner - done")
 
     @dace_orchestration.orchestrate
@@ -695,6 +710,13 @@ class Diffusion:
             offset_provider=self._grid.offset_providers,
         )
         log.debug("running stencil 01 (calculate_nabla2_and_smag_coefficients_for_vn): end")
+
+        # HALO EXCHANGE  IF (discr_vn > 1) THEN CALL sync_patch_array
+        # z_nabla2_e is not used by stencils 02 03 so they are computed while it is exchanged
+        if self.config.type_vn_diffu > 1:
+            log.debug("communication rbf extrapolation of z_nable2_e - start")
+            handle_nabla2_comm = self._exchange(self.z_nabla2_e, dim=dims.EdgeDim, wait=False)
+
         if (
             self.config.shear_type
             >= TurbulenceShearForcingType.VERTICAL_HORIZONTAL_OF_HORIZONTAL_WIND
@@ -724,11 +746,8 @@ class Diffusion:
                 "running stencils 02 03 (calculate_diagnostic_quantities_for_turbulence): end"
             )
 
-        # HALO EXCHANGE  IF (discr_vn > 1) THEN CALL sync_patch_array
-        # TODO (magdalena) move this up and do asynchronous exchange
         if self.config.type_vn_diffu > 1:
-            log.debug("communication rbf extrapolation of z_nable2_e - start")
-            self._exchange(self.z_nabla2_e, dim=dims.EdgeDim, wait=True)
+            self.halo_exchange_wait(handle_nabla2_comm)
             log.debug("communication rbf extrapolation of z_nable2_e - end")
 
         log.debug("2nd rbf interpolation: start")
@@ -17,7 +17,11 @@ from gt4py.next import backend as gtx_backend
 import icon4py.model.atmosphere.dycore.solve_nonhydro_stencils as nhsolve_stencils
 import icon4py.model.common.grid.states as grid_states
 import icon4py.model.common.utils as common_utils
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import (
+    data_allocation as data_alloc,
+    instrumentation,
+    precompilation,
+)
 
 from icon4py.model.common import constants
 from icon4py.model.atmosphere.dycore.stencils.init_cell_kdim_field_with_zero_wp import (
@@ -812,6 +816,15 @@ class SolveNonhydro:
         if not at_first_substep:
             diagnostic_state_nh.ddt_vn_apc_pc.swap()
 
+    def precompile(self, max_workers: Optional[int] = None) -> precompilation.CompileReport:
+        """
+        Compile the programs of the dycore, including the velocity advection, before the first step.
+
+        See `precompilation.precompile`.
+        """
+        return precompilation.precompile(self, max_workers=max_workers)
+
+    @instrumentation.timed("solve_nonhydro.time_step")
     def time_step(
         self,
         diagnostic_state_nh: dycore_states.DiagnosticStateNonHydro,
@@ -928,6 +941,7 @@ class SolveNonhydro:
         )
 
     # flake8: noqa: C901
+    @instrumentation.timed("solve_nonhydro.predictor")
     def run_predictor_step(
         self,
         diagnostic_state_nh: dycore_states.DiagnosticStateNonHydro,
@@ -1243,6 +1257,11 @@ class SolveNonhydro:
                     offset_provider=self._grid.offset_providers,
                 )
 
+        # z_rho_e is final here, exchange it while the horizontal pressure gradient and vn are computed
+        log.debug("exchanging local field 'z_rho_e' - start")
+        with instrumentation.region("exchange.z_rho_e.start"):
+            z_rho_e_exchange = self._exchange.exchange(dims.EdgeDim, z_fields.z_rho_e)
+
         # scidoc:
         # Outputs:
         #  - z_gradh_exner :
@@ -1394,11 +1413,7 @@ class SolveNonhydro:
 
             # TODO (Christoph) check when merging fused stencil
             lowest_level = self._grid.num_levels - 1
-            hydro_corr_horizontal = gtx.as_field(
-                (dims.EdgeDim,),
-                self.z_hydro_corr.ndarray[:, lowest_level],
-                allocator=self._backend.allocator,
-            )
+            self.z_hydro_corr_horizontal.ndarray[...] = self.z_hydro_corr.ndarray[:, lowest_level]
 
             # scidoc:
             # Outputs:
@@ -1423,7 +1438,7 @@ class SolveNonhydro:
             self._apply_hydrostatic_correction_to_horizontal_gradient_of_exner_pressure(
                 ipeidx_dsl=self._metric_state_nonhydro.ipeidx_dsl,
                 pg_exdist=self._metric_state_nonhydro.pg_exdist,
-                z_hydro_corr=hydro_corr_horizontal,
+                z_hydro_corr=self.z_hydro_corr_horizontal,
                 z_gradh_exner=z_fields.z_gradh_exner,
                 horizontal_start=self._start_edge_nudging_level_2,
                 horizontal_end=self._end_edge_end,
@@ -1489,8 +1504,12 @@ class SolveNonhydro:
                 vertical_end=self._grid.num_levels,
                 offset_provider={},
             )
-        log.debug("exchanging prognostic field 'vn' and local field 'z_rho_e'")
-        self._exchange.exchange_and_wait(dims.EdgeDim, prognostic_states.next.vn, z_fields.z_rho_e)
+        with instrumentation.region("exchange.z_rho_e.wait"):
+            z_rho_e_exchange.wait()
+        log.debug("exchanging local field 'z_rho_e' - done")
+        log.debug("exchanging prognostic field 'vn'")
+        with instrumentation.region("exchange.vn"):
+            self._exchange.exchange_and_wait(dims.EdgeDim, prognostic_states.next.vn)
 
         self._compute_avg_vn_and_graddiv_vn_and_vt(
             e_flx_avg=self._interpolation_state.e_flx_avg,
@@ -1786,13 +1805,16 @@ class SolveNonhydro:
                 offset_provider=self._grid.offset_providers,
             )
             log.debug("exchanging prognostic field 'w' and local field 'z_dwdz_dd'")
-            self._exchange.exchange_and_wait(
-                dims.CellDim, prognostic_states.next.w, z_fields.z_dwdz_dd
-            )
+            with instrumentation.region("exchange.w_z_dwdz_dd"):
+                self._exchange.exchange_and_wait(
+                    dims.CellDim, prognostic_states.next.w, z_fields.z_dwdz_dd
+                )
         else:
             log.debug("exchanging prognostic field 'w'")
-            self._exchange.exchange_and_wait(dims.CellDim, prognostic_states.next.w)
+            with instrumentation.region("exchange.w"):
+                self._exchange.exchange_and_wait(dims.CellDim, prognostic_states.next.w)
 
+    @instrumentation.timed("solve_nonhydro.corrector")
     def run_corrector_step(
         self,
         diagnostic_state_nh: dycore_states.DiagnosticStateNonHydro,
@@ -1988,8 +2010,83 @@ class SolveNonhydro:
                 vertical_end=self._grid.num_levels,
                 offset_provider={},
             )
-        log.debug("exchanging prognostic field 'vn'")
-        self._exchange.exchange_and_wait(dims.EdgeDim, (prognostic_states.next.vn))
+        log.debug("exchanging prognostic field 'vn' - start")
+        with instrumentation.region("exchange.vn.start"):
+            vn_exchange = self._exchange.exchange(dims.EdgeDim, prognostic_states.next.vn)
+
+        # stencils 42 to 45b only work on cell columns and do not depend on vn, they are computed
+        # while vn is exchanged
+        if self._config.itime_scheme == TimeSteppingScheme.MOST_EFFICIENT:
+            log.debug(f"corrector start stencil 42 44 45 45b")
+            self._stencils_42_44_45_45b(
+                z_w_expl=z_fields.z_w_expl,
+                w_nnow=prognostic_states.current.w,
+                ddt_w_adv_ntl1=diagnostic_state_nh.ddt_w_adv_pc.predictor,
+                ddt_w_adv_ntl2=diagnostic_state_nh.ddt_w_adv_pc.corrector,
+                z_th_ddz_exner_c=self.z_th_ddz_exner_c,
+                z_contr_w_fl_l=z_fields.z_contr_w_fl_l,
+                rho_ic=diagnostic_state_nh.rho_ic,
+                w_concorr_c=diagnostic_state_nh.w_concorr_c,
+                vwind_expl_wgt=self._metric_state_nonhydro.vwind_expl_wgt,
+                z_beta=z_fields.z_beta,
+                exner_nnow=prognostic_states.current.exner,
+                rho_nnow=prognostic_states.current.rho,
+                theta_v_nnow=prognostic_states.current.theta_v,
+                inv_ddqz_z_full=self._metric_state_nonhydro.inv_ddqz_z_full,
+                z_alpha=z_fields.z_alpha,
+                vwind_impl_wgt=self._metric_state_nonhydro.vwind_impl_wgt,
+                theta_v_ic=diagnostic_state_nh.theta_v_ic,
+                z_q=z_fields.z_q,
+                k_field=self.k_field,
+                rd=constants.RD,
+                cvd=constants.CVD,
+                dtime=dtime,
+                cpd=constants.CPD,
+                wgt_nnow_vel=self._params.wgt_nnow_vel,
+                wgt_nnew_vel=self._params.wgt_nnew_vel,
+                nlev=self._grid.num_levels,
+                horizontal_start=self._start_cell_nudging,
+                horizontal_end=self._end_cell_local,
+                vertical_start=0,
+                vertical_end=self._grid.num_levels + 1,
+                offset_provider={},
+            )
+        else:
+            log.debug(f"corrector start stencil 43 44 45 45b")
+            self._stencils_43_44_45_45b(
+                z_w_expl=z_fields.z_w_expl,
+                w_nnow=prognostic_states.current.w,
+                ddt_w_adv_ntl1=diagnostic_state_nh.ddt_w_adv_pc.predictor,
+                z_th_ddz_exner_c=self.z_th_ddz_exner_c,
+                z_contr_w_fl_l=z_fields.z_contr_w_fl_l,
+                rho_ic=diagnostic_state_nh.rho_ic,
+                w_concorr_c=diagnostic_state_nh.w_concorr_c,
+                vwind_expl_wgt=self._metric_state_nonhydro.vwind_expl_wgt,
+                z_beta=z_fields.z_beta,
+                exner_nnow=prognostic_states.current.exner,
+                rho_nnow=prognostic_states.current.rho,
+                theta_v_nnow=prognostic_states.current.theta_v,
+                inv_ddqz_z_full=self._metric_state_nonhydro.inv_ddqz_z_full,
+                z_alpha=z_fields.z_alpha,
+                vwind_impl_wgt=self._metric_state_nonhydro.vwind_impl_wgt,
+                theta_v_ic=diagnostic_state_nh.theta_v_ic,
+                z_q=z_fields.z_q,
+                k_field=self.k_field,
+                rd=constants.RD,
+                cvd=constants.CVD,
+                dtime=dtime,
+                cpd=constants.CPD,
+                nlev=self._grid.num_levels,
+                horizontal_start=self._start_cell_nudging,
+                horizontal_end=self._end_cell_local,
+                vertical_start=0,
+                vertical_end=self._grid.num_levels + 1,
+                offset_provider={},
+            )
+        with instrumentation.region("exchange.vn.wait"):
+            vn_exchange.wait()
+        log.debug("exchanging prognostic field 'vn' - done")
+
         log.debug("corrector: start stencil 31")
         self._compute_avg_vn(
             e_flx_avg=self._interpolation_state.e_flx_avg,
@@ -2059,73 +2156,6 @@ class SolveNonhydro:
             offset_provider=self._grid.offset_providers,
         )
 
-        if self._config.itime_scheme == TimeSteppingScheme.MOST_EFFICIENT:
-            log.debug(f"corrector start stencil 42 44 45 45b")
-            self._stencils_42_44_45_45b(
-                z_w_expl=z_fields.z_w_expl,
-                w_nnow=prognostic_states.current.w,
-                ddt_w_adv_ntl1=diagnostic_state_nh.ddt_w_adv_pc.predictor,
-                ddt_w_adv_ntl2=diagnostic_state_nh.ddt_w_adv_pc.corrector,
-                z_th_ddz_exner_c=self.z_th_ddz_exner_c,
-                z_contr_w_fl_l=z_fields.z_contr_w_fl_l,
-                rho_ic=diagnostic_state_nh.rho_ic,
-                w_concorr_c=diagnostic_state_nh.w_concorr_c,
-                vwind_expl_wgt=self._metric_state_nonhydro.vwind_expl_wgt,
-                z_beta=z_fields.z_beta,
-                exner_nnow=prognostic_states.current.exner,
-                rho_nnow=prognostic_states.current.rho,
-                theta_v_nnow=prognostic_states.current.theta_v,
-                inv_ddqz_z_full=self._metric_state_nonhydro.inv_ddqz_z_full,
-                z_alpha=z_fields.z_alpha,
-                vwind_impl_wgt=self._metric_state_nonhydro.vwind_impl_wgt,
-                theta_v_ic=diagnostic_state_nh.theta_v_ic,
-                z_q=z_fields.z_q,
-                k_field=self.k_field,
-                rd=constants.RD,
-                cvd=constants.CVD,
-                dtime=dtime,
-                cpd=constants.CPD,
-                wgt_nnow_vel=self._params.wgt_nnow_vel,
-                wgt_nnew_vel=self._params.wgt_nnew_vel,
-                nlev=self._grid.num_levels,
-                horizontal_start=self._start_cell_nudging,
-                horizontal_end=self._end_cell_local,
-                vertical_start=0,
-                vertical_end=self._grid.num_levels + 1,
-                offset_provider={},
-            )
-        else:
-            log.debug(f"corrector start stencil 43 44 45 45b")
-            self._stencils_43_44_45_45b(
-                z_w_expl=z_fields.z_w_expl,
-                w_nnow=prognostic_states.current.w,
-                ddt_w_adv_ntl1=diagnostic_state_nh.ddt_w_adv_pc.predictor,
-                z_th_ddz_exner_c=self.z_th_ddz_exner_c,
-                z_contr_w_fl_l=z_fields.z_contr_w_fl_l,
-                rho_ic=diagnostic_state_nh.rho_ic,
-                w_concorr_c=diagnostic_state_nh.w_concorr_c,
-                vwind_expl_wgt=self._metric_state_nonhydro.vwind_expl_wgt,
-                z_beta=z_fields.z_beta,
-                exner_nnow=prognostic_states.current.exner,
-                rho_nnow=prognostic_states.current.rho,
-                theta_v_nnow=prognostic_states.current.theta_v,
-                inv_ddqz_z_full=self._metric_state_nonhydro.inv_ddqz_z_full,
-                z_alpha=z_fields.z_alpha,
-                vwind_impl_wgt=self._metric_state_nonhydro.vwind_impl_wgt,
-                theta_v_ic=diagnostic_state_nh.theta_v_ic,
-                z_q=z_fields.z_q,
-                k_field=self.k_field,
-                rd=constants.RD,
-                cvd=constants.CVD,
-                dtime=dtime,
-                cpd=constants.CPD,
-                nlev=self._grid.num_levels,
-                horizontal_start=self._start_cell_nudging,
-                horizontal_end=self._end_cell_local,
-                vertical_start=0,
-                vertical_end=self._grid.num_levels + 1,
-                offset_provider={},
-            )
         if not self.l_vert_nested:
             self._init_two_cell_kdim_fields_with_zero_wp(
                 cell_kdim_field_with_zero_wp_1=prognostic_states.next.w,
@@ -2314,9 +2344,10 @@ class SolveNonhydro:
                 offset_provider={},
             )
             log.debug("exchange prognostic fields 'rho' , 'exner', 'w'")
-            self._exchange.exchange_and_wait(
-                dims.CellDim,
-                prognostic_states.next.rho,
-                prognostic_states.next.exner,
-                prognostic_states.next.w,
-            )
+            with instrumentation.region("exchange.rho_exner_w"):
+                self._exchange.exchange_and_wait(
+                    dims.CellDim,
+                    prognostic_states.next.rho,
+                    prognostic_states.next.exner,
+                    prognostic_states.next.w,
+                )
@@ -55,7 +55,11 @@ from icon4py.model.common.grid import (
     vertical as v_grid,
 )
 from icon4py.model.common.states import prognostic_state as prognostics
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import (
+    data_allocation as data_alloc,
+    instrumentation,
+    precompilation,
+)
 
 
 class VelocityAdvection:
@@ -68,9 +72,13 @@ class VelocityAdvection:
         edge_params: grid_states.EdgeParams,
         owner_mask: fa.CellField[bool],
         backend: Optional[gtx_backend.Backend],
+        compute_cfl_statistics: bool = False,
     ):
         self.grid: icon_grid.IconGrid = grid
         self._backend = backend
+        self._xp = data_alloc.import_array_ns(self._backend)
+        #: if True 'max_vcfl' and 'num_cfl_clipped_cells' are updated together with 'levmask'
+        self.compute_cfl_statistics = compute_cfl_statistics
         self.metric_state: dycore_states.MetricStateNonHydro = metric_state
         self.interpolation_state: dycore_states.InterpolationState = interpolation_state
         self.vertical_params = vertical_params
@@ -155,6 +163,14 @@ class VelocityAdvection:
         self.vcfl_dsl = data_alloc.zero_field(
             self.grid, dims.CellDim, dims.KDim, backend=self._backend
         )
+        #: per level maximum of the absolute vertical CFL number of the cells with CFL clipping
+        self.max_vcfl = data_alloc.zero_field(self.grid, dims.KDim, backend=self._backend)
+        #: per level number of cells with CFL clipping (including halo cells)
+        self.num_cfl_clipped_cells = data_alloc.zero_field(
+            self.grid, dims.KDim, dtype=gtx.int32, backend=self._backend
+        )
+        # scratch buffer for the computation of 'max_vcfl'
+        self._min_vcfl = data_alloc.zero_field(self.grid, dims.KDim, backend=self._backend)
         self.k_field = data_alloc.index_field(
             self.grid, dims.KDim, extend={dims.KDim: 1}, backend=self._backend
         )
@@ -192,6 +208,15 @@ class VelocityAdvection:
         self._end_cell_local = self.grid.end_index(cell_domain(h_grid.Zone.LOCAL))
         self._end_cell_halo = self.grid.end_index(cell_domain(h_grid.Zone.HALO))
 
+    def precompile(self, max_workers: Optional[int] = None) -> precompilation.CompileReport:
+        """
+        Compile the programs of the velocity advection before the first step.
+
+        See `precompilation.precompile`.
+        """
+        return precompilation.precompile(self, max_workers=max_workers)
+
+    @instrumentation.timed("velocity_advection.predictor")
     def run_predictor_step(
         self,
         vn_only: bool,
@@ -637,16 +662,28 @@ class VelocityAdvection:
         )
 
     def _update_levmask_from_cfl_clipping(self):
-        xp = data_alloc.import_array_ns(self._backend)
-        self.levmask = gtx.as_field(
-            domain=(dims.KDim,), data=(xp.any(self.cfl_clipping.ndarray, 0)), dtype=bool
-        )
+        """
+        Reduce the CFL clipping mask over the cells into the preallocated per level fields.
+
+        The reductions run on the device and write into the existing buffers, nothing is
+        allocated or transferred to the host.
+        """
+        xp = self._xp
+        xp.any(self.cfl_clipping.ndarray, axis=0, out=self.levmask.ndarray)
+        if self.compute_cfl_statistics:
+            xp.sum(self.cfl_clipping.ndarray, axis=0, out=self.num_cfl_clipped_cells.ndarray)
+            # 'vcfl_dsl' is zero for cells without clipping
+            xp.max(self.vcfl_dsl.ndarray, axis=0, out=self.max_vcfl.ndarray)
+            xp.min(self.vcfl_dsl.ndarray, axis=0, out=self._min_vcfl.ndarray)
+            xp.negative(self._min_vcfl.ndarray, out=self._min_vcfl.ndarray)
+            xp.maximum(self.max_vcfl.ndarray, self._min_vcfl.ndarray, out=self.max_vcfl.ndarray)
 
     def _scale_factors_by_dtime(self, dtime):
         scaled_cfl_w_limit = self.cfl_w_limit / dtime
         scalfac_exdiff = self.scalfac_exdiff / (dtime * (0.85 - scaled_cfl_w_limit * dtime))
         return scaled_cfl_w_limit, scalfac_exdiff
 
+    @instrumentation.timed("velocity_advection.corrector")
     def run_corrector_step(
         self,
         diagnostic_state: dycore_states.DiagnosticStateNonHydro,
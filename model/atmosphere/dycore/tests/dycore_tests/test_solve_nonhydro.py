@@ -21,6 +21,7 @@ from icon4py.model.common.grid import horizontal as h_grid, vertical as v_grid
 from icon4py.model.common.math import smagorinsky
 from icon4py.model.common.utils import data_allocation as data_alloc
 from icon4py.model.testing import (
+    allocation_counter,
     datatest_utils as dt_utils,
     helpers,
 )
@@ -853,6 +854,86 @@ def test_run_solve_nonhydro_single_step(
     )
 
 
+@pytest.mark.embedded_remap_error
+@pytest.mark.datatest
+@pytest.mark.parametrize("experiment", [dt_utils.REGIONAL_EXPERIMENT])
+@pytest.mark.parametrize(
+    "istep_init, jstep_init, step_date_init, at_initial_timestep",
+    [(1, 0, "2021-06-20T12:00:10.000", True)],
+)
+def test_run_solve_nonhydro_does_not_allocate(
+    step_date_init,
+    experiment,
+    ndyn_substeps,
+    icon_grid,
+    savepoint_nonhydro_init,
+    lowest_layer_thickness,
+    model_top_height,
+    stretch_factor,
+    damping_height,
+    grid_savepoint,
+    metrics_savepoint,
+    interpolation_savepoint,
+    at_initial_timestep,
+    backend,
+):
+    config = utils.construct_solve_nh_config(experiment, ndyn_substeps)
+    sp = savepoint_nonhydro_init
+    vertical_config = v_grid.VerticalGridConfig(
+        icon_grid.num_levels,
+        lowest_layer_thickness=lowest_layer_thickness,
+        model_top_height=model_top_height,
+        stretch_factor=stretch_factor,
+        rayleigh_damping_height=damping_height,
+    )
+    prep_adv = dycore_states.PrepAdvection(
+        vn_traj=sp.vn_traj(),
+        mass_flx_me=sp.mass_flx_me(),
+        mass_flx_ic=sp.mass_flx_ic(),
+        vol_flx_ic=data_alloc.zero_field(icon_grid, dims.CellDim, dims.KDim, backend=backend),
+    )
+    diagnostic_state_nh = utils.construct_diagnostics(sp)
+    prognostic_states = utils.create_prognostic_states(sp)
+
+    solve_nonhydro = solve_nh.SolveNonhydro(
+        grid=icon_grid,
+        config=config,
+        params=solve_nh.NonHydrostaticParams(config),
+        metric_state_nonhydro=utils.construct_metric_state(metrics_savepoint, icon_grid.num_levels),
+        interpolation_state=utils.construct_interpolation_state(interpolation_savepoint),
+        vertical_params=utils.create_vertical_params(vertical_config, grid_savepoint),
+        edge_geometry=grid_savepoint.construct_edge_geometry(),
+        cell_geometry=grid_savepoint.construct_cell_geometry(),
+        owner_mask=grid_savepoint.c_owner_mask(),
+        backend=backend,
+    )
+
+    # savepoint data is read upfront, reading it allocates fields
+    divdamp_fac_o2 = sp.divdamp_fac_o2()
+    dtime = sp.get_metadata("dtime").get("dtime")
+    lprep_adv = sp.get_metadata("prep_adv").get("prep_adv")
+
+    def time_step(at_first_substep: bool):
+        solve_nonhydro.time_step(
+            diagnostic_state_nh=diagnostic_state_nh,
+            prognostic_states=prognostic_states,
+            prep_adv=prep_adv,
+            divdamp_fac_o2=divdamp_fac_o2,
+            dtime=dtime,
+            at_initial_timestep=at_initial_timestep,
+            lprep_adv=lprep_adv,
+            at_first_substep=at_first_substep,
+            at_last_substep=not at_first_substep,
+        )
+
+    # the first substep compiles the programs
+    time_step(at_first_substep=True)
+    with allocation_counter.AllocationCounter() as counter:
+        time_step(at_first_substep=False)
+
+    counter.assert_no_allocations()
+
+
 @pytest.mark.embedded_remap_error
 @pytest.mark.datatest
 @pytest.mark.parametrize("experiment", [dt_utils.REGIONAL_EXPERIMENT])
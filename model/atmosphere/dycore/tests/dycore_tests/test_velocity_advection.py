@@ -5,17 +5,19 @@
 #
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
+import numpy as np
 import pytest
 
 from icon4py.model.atmosphere.dycore import dycore_states, velocity_advection as advection
 from icon4py.model.common import dimension as dims, utils as common_utils
 from icon4py.model.common.grid import (
     horizontal as h_grid,
+    simple,
     states as grid_states,
     vertical as v_grid,
 )
 from icon4py.model.common.states import prognostic_state as prognostics
-from icon4py.model.testing import datatest_utils as dt_utils, helpers
+from icon4py.model.testing import allocation_counter, datatest_utils as dt_utils, helpers
 
 from . import utils
 
@@ -46,6 +48,44 @@ def test_scalfactors(savepoint_velocity_init, icon_grid, backend):
     assert scalfac_exdiff == savepoint_velocity_init.scalfac_exdiff()
 
 
+@pytest.mark.parametrize("compute_cfl_statistics", [True, False])
+def test_update_levmask_from_cfl_clipping(compute_cfl_statistics, backend):
+    grid = simple.SimpleGrid()
+    velocity_advection = advection.VelocityAdvection(
+        grid=grid,
+        metric_state=None,
+        interpolation_state=None,
+        vertical_params=None,
+        edge_params=None,
+        owner_mask=None,
+        backend=backend,
+        compute_cfl_statistics=compute_cfl_statistics,
+    )
+    levmask = velocity_advection.levmask
+    rng = np.random.default_rng(3)
+    cfl_clipping = rng.uniform(size=(grid.num_cells, grid.num_levels)) > 0.9
+    cfl_clipping[:, 3] = False
+    vcfl = np.where(cfl_clipping, rng.uniform(-2.0, 2.0, cfl_clipping.shape), 0.0)
+    velocity_advection.cfl_clipping.ndarray[...] = velocity_advection._xp.asarray(cfl_clipping)
+    velocity_advection.vcfl_dsl.ndarray[...] = velocity_advection._xp.asarray(vcfl)
+
+    with allocation_counter.AllocationCounter() as counter:
+        velocity_advection._update_levmask_from_cfl_clipping()
+
+    counter.assert_no_allocations()
+    assert velocity_advection.levmask is levmask
+    assert np.all(levmask.asnumpy() == np.any(cfl_clipping, axis=0))
+    assert not levmask.asnumpy()[3]
+    if compute_cfl_statistics:
+        assert np.all(
+            velocity_advection.num_cfl_clipped_cells.asnumpy() == np.sum(cfl_clipping, axis=0)
+        )
+        assert np.all(velocity_advection.max_vcfl.asnumpy() == np.max(np.abs(vcfl), axis=0))
+    else:
+        assert np.all(velocity_advection.num_cfl_clipped_cells.asnumpy() == 0)
+        assert np.all(velocity_advection.max_vcfl.asnumpy() == 0.0)
+
+
 @pytest.mark.datatest
 def test_velocity_init(
     savepoint_velocity_init,
@@ -9,7 +9,6 @@ import dataclasses
 from typing import Final, Optional
 
 import gt4py.next as gtx
-import numpy as np
 from gt4py.eve.utils import FrozenNamespace
 from gt4py.next import backend as gtx_backend, broadcast
 from gt4py.next.ffront.fbuiltins import (
@@ -91,6 +90,14 @@ class SaturationAdjustmentConfig:
     tolerance: ta.wpfloat = 1.0e-3
     #: An extra step of updating the variables from new temperature is done in ICON after satad is called in at the beginning of mo_nh_interface_nwp.f90. This is a new option to update those variables.
     diagnose_variables_from_new_temperature: bool = True
+    #: Number of Newton iterations between two convergence checks. Every check synchronizes the device with the host, a larger interval saves synchronizations at the cost of running idle iterations (which do not modify converged grid points) after convergence. Use max_iter to only check once before and once after the iterations.
+    convergence_check_interval: int = 1
+
+    def __post_init__(self):
+        if self.convergence_check_interval < 1:
+            raise ValueError(
+                f"convergence_check_interval must be positive, got {self.convergence_check_interval}."
+            )
 
 
 @dataclasses.dataclass
@@ -229,6 +236,7 @@ class SaturationAdjustment:
         backend: Optional[gtx_backend.Backend],
     ):
         self._backend = backend
+        self._xp = data_alloc.import_array_ns(self._backend)
         self.config = config
         self.grid = grid
         self.vertical_params: v_grid.VerticalGrid = vertical_params
@@ -334,6 +342,20 @@ class SaturationAdjustment:
             compute_pressure_ifc_tendency_after_saturation_adjustment.with_backend(self._backend)
         )
 
+    def _is_iterating(self, horizontal_start: gtx.int32, horizontal_end: gtx.int32) -> bool:
+        """
+        Check whether any grid point requires another Newton iteration.
+
+        The mask is reduced on the device, only the resulting scalar is transferred to the host.
+        """
+        return bool(
+            self._xp.any(
+                self._newton_iteration_mask.ndarray[
+                    horizontal_start:horizontal_end, 0 : self.grid.num_levels
+                ]
+            )
+        )
+
     def run(
         self,
         dtime: ta.wpfloat,
@@ -381,60 +403,60 @@ class SaturationAdjustment:
         # TODO (Chia Rui): this is inspired by the cpu version of the original ICON saturation_adjustment code. Consider to refactor this code when break and for loop features are ready in gt4py.
         temperature_list = [self._temperature1, self._temperature2]
         ncurrent, nnext = 0, 1
-        for _ in range(self.config.max_iter):
-            if np.any(
-                self._newton_iteration_mask.ndarray[
-                    start_cell_nudging:end_cell_local, 0 : self.grid.num_levels
-                ]
+        for iteration in range(self.config.max_iter):
+            if iteration % self.config.convergence_check_interval == 0 and not self._is_iterating(
+                start_cell_nudging, end_cell_local
             ):
-                self.update_temperature_by_newton_iteration(
-                    diagnostic_state.temperature,
-                    tracer_state.qv,
-                    prognostic_state.rho,
-                    self._newton_iteration_mask,
-                    self._lwdocvd,
-                    temperature_list[nnext],
-                    temperature_list[ncurrent],
-                    horizontal_start=start_cell_nudging,
-                    horizontal_end=end_cell_local,
-                    vertical_start=gtx.int32(0),
-                    vertical_end=self.grid.num_levels,
-                    offset_provider={},
-                )
+                break
+            self.update_temperature_by_newton_iteration(
+                diagnostic_state.temperature,
+                tracer_state.qv,
+                prognostic_state.rho,
+                self._newton_iteration_mask,
+                self._lwdocvd,
+                temperature_list[nnext],
+                temperature_list[ncurrent],
+                horizontal_start=start_cell_nudging,
+                horizontal_end=end_cell_local,
+                vertical_start=gtx.int32(0),
+                vertical_end=self.grid.num_levels,
+                offset_provider={},
+            )
 
-                self.compute_newton_iteration_mask(
-                    self.config.tolerance,
-                    temperature_list[ncurrent],
-                    temperature_list[nnext],
-                    self._newton_iteration_mask,
-                    horizontal_start=start_cell_nudging,
-                    horizontal_end=end_cell_local,
-                    vertical_start=gtx.int32(0),
-                    vertical_end=self.grid.num_levels,
-                    offset_provider={},
-                )
+            self.compute_newton_iteration_mask(
+                self.config.tolerance,
+                temperature_list[ncurrent],
+                temperature_list[nnext],
+                self._newton_iteration_mask,
+                horizontal_start=start_cell_nudging,
+                horizontal_end=end_cell_local,
+                vertical_start=gtx.int32(0),
+                vertical_end=self.grid.num_levels,
+                offset_provider={},
+            )
 
-                self.copy_temperature(
-                    self._newton_iteration_mask,
-                    temperature_list[ncurrent],
-                    temperature_list[nnext],
-                    horizontal_start=start_cell_nudging,
-                    horizontal_end=end_cell_local,
-                    vertical_start=gtx.int32(0),
-                    vertical_end=self.grid.num_levels,
-                    offset_provider={},
+            self.copy_temperature(
+                self._newton_iteration_mask,
+                temperature_list[ncurrent],
+                temperature_list[nnext],
+                horizontal_start=start_cell_nudging,
+                horizontal_end=end_cell_local,
+                vertical_start=gtx.int32(0),
+                vertical_end=self.grid.num_levels,
+                offset_provider={},
+            )
+            ncurrent = (ncurrent + 1) % 2
+            nnext = (nnext + 1) % 2
+        if self._is_iterating(start_cell_nudging, end_cell_local):
+            num_unconverged = int(
+                self._xp.count_nonzero(
+                    self._newton_iteration_mask.ndarray[
+                        start_cell_nudging:end_cell_local, 0 : self.grid.num_levels
+                    ]
                 )
-                ncurrent = (ncurrent + 1) % 2
-                nnext = (nnext + 1) % 2
-            else:
-                break
-        if np.any(
-            self._newton_iteration_mask.ndarray[
-                start_cell_nudging:end_cell_local, 0 : self.grid.num_levels
-            ]
-        ):
+            )
             raise ConvergenceError(
-                f"Maximum iteration of saturation adjustment ({self.config.max_iter}) is not enough. The max absolute error is {np.abs(self.new_temperature1.ndarray - self.new_temperature2.ndarray).max()} . Please raise max_iter"
+                f"Maximum iteration of saturation adjustment ({self.config.max_iter}) is not enough. {num_unconverged} grid points have not converged to the tolerance {self.config.tolerance}. Please raise max_iter"
             )
         self.update_temperature_qv_qc_tendencies(
             dtime,
@@ -5,12 +5,15 @@
 #
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
+import dataclasses
 
+import gt4py.next as gtx
+import numpy as np
 import pytest
 
 from icon4py.model.atmosphere.subgrid_scale_physics.microphysics import saturation_adjustment
 from icon4py.model.common import dimension as dims
-from icon4py.model.common.grid import vertical as v_grid
+from icon4py.model.common.grid import horizontal as h_grid, simple, vertical as v_grid
 from icon4py.model.common.states import (
     diagnostic_state as diagnostics,
     prognostic_state as prognostics,
@@ -295,3 +298,84 @@ def test_saturation_adjustment_in_physics_interface_call(
         nwp_interface_satad_diag_exit_savepoint.pressure_ifc().ndarray,
         atol=1.0e-13,
     )
+
+
+class _SimpleGridWithEndZone(simple.SimpleGrid):
+    """Simple grid on which the 'END' zone starts after the last cell, as on an ICON grid."""
+
+    def start_index(self, domain: h_grid.Domain) -> gtx.int32:
+        if domain.zone == h_grid.Zone.END:
+            return self.end_index(domain)
+        return super().start_index(domain)
+
+
+def _run_saturation_adjustment_on_simple_grid(
+    config: saturation_adjustment.SaturationAdjustmentConfig, backend
+):
+    grid = _SimpleGridWithEndZone()
+    rng = np.random.default_rng(7)
+
+    def _cell_k(low: float, high: float):
+        return gtx.as_field(
+            (dims.CellDim, dims.KDim),
+            rng.uniform(low, high, (grid.num_cells, grid.num_levels)),
+            allocator=backend,
+        )
+
+    granule = saturation_adjustment.SaturationAdjustment(
+        config=config,
+        grid=grid,
+        metric_state=saturation_adjustment.MetricStateSaturationAdjustment(
+            ddqz_z_full=_cell_k(100.0, 200.0)
+        ),
+        vertical_params=None,
+        backend=backend,
+    )
+    granule.run(
+        dtime=10.0,
+        prognostic_state=prognostics.PrognosticState(
+            rho=_cell_k(0.5, 1.2), vn=None, w=None, exner=None, theta_v=None
+        ),
+        diagnostic_state=diagnostics.DiagnosticState(
+            temperature=_cell_k(260.0, 300.0),
+            virtual_temperature=None,
+            pressure=None,
+            pressure_ifc=None,
+            u=None,
+            v=None,
+        ),
+        tracer_state=tracers.TracerState(
+            qv=_cell_k(1.0e-3, 2.0e-2),
+            qc=_cell_k(0.0, 1.0e-3),
+            qr=None,
+            qi=None,
+            qs=None,
+            qg=None,
+        ),
+    )
+    return granule
+
+
+@pytest.mark.parametrize("convergence_check_interval", [2, 3, 10])
+def test_saturation_adjustment_convergence_check_interval(convergence_check_interval, backend):
+    config = saturation_adjustment.SaturationAdjustmentConfig(
+        diagnose_variables_from_new_temperature=False
+    )
+    reference = _run_saturation_adjustment_on_simple_grid(config, backend)
+    granule = _run_saturation_adjustment_on_simple_grid(
+        dataclasses.replace(config, convergence_check_interval=convergence_check_interval),
+        backend,
+    )
+
+    for tendency in ("temperature_tendency", "qv_tendency", "qc_tendency"):
+        assert np.all(
+            getattr(granule, tendency).asnumpy() == getattr(reference, tendency).asnumpy()
+        )
+
+
+def test_saturation_adjustment_raises_convergence_error(backend):
+    config = saturation_adjustment.SaturationAdjustmentConfig(
+        max_iter=1, diagnose_variables_from_new_temperature=False
+    )
+    with pytest.raises(saturation_adjustment.ConvergenceError):
+        _run_saturation_adjustment_on_simple_grid(config, backend)
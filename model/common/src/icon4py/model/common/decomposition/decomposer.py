@@ -0,0 +1,271 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Domain decomposition of an ICON grid.
+
+The decomposition is done in two steps:
+- the cells of the global grid are distributed to the ranks by a 'Decomposer' working on the
+  C2E2C adjacency graph of the cells,
+- for a given rank the local domain consisting of the owned cells and a number of halo lines
+  is constructed, edges and vertices are owned by the lowest rank owning one of their
+  neighboring cells.
+
+As every rank computes the same partition from the global grid, no communication is needed and
+the resulting 'DecompositionInfo' can directly be used to set up the halo exchange.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional, Protocol
+
+import numpy as np
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import definitions
+from icon4py.model.common.grid import base
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+_log = logging.getLogger(__name__)
+
+_INVALID_INDEX = -1
+
+
+class Decomposer(Protocol):
+    def __call__(self, adjacency: np.ndarray, num_partitions: int) -> np.ndarray:
+        """
+        Partition the nodes of a graph.
+
+        Args:
+            adjacency: shape (n_nodes, max_neighbors), neighbor table of the graph, missing
+                neighbors are marked with -1
+            num_partitions: number of partitions
+        Returns:
+            shape (n_nodes,), partition id of each node
+        """
+        ...
+
+
+class SingleNodeDecomposer(Decomposer):
+    """Put all nodes in a single partition."""
+
+    def __call__(self, adjacency: np.ndarray, num_partitions: int) -> np.ndarray:
+        if num_partitions != 1:
+            raise ValueError(
+                f"'SingleNodeDecomposer' can only create one partition, got {num_partitions}."
+            )
+        return np.zeros(adjacency.shape[0], dtype=np.int32)
+
+
+class RecursiveBisectionDecomposer(Decomposer):
+    """
+    Partition a graph by recursive graph bisection.
+
+    In each step the nodes are ordered by a breadth first search starting from a
+    pseudo-peripheral node. The ordering is split such that the number of nodes in both halves
+    is proportional to the number of partitions they are subsequently divided into. This yields
+    compact partitions of equal size (+-1 node) on the quasi uniform ICON grids.
+    """
+
+    def __call__(self, adjacency: np.ndarray, num_partitions: int) -> np.ndarray:
+        if num_partitions < 1 or num_partitions > adjacency.shape[0]:
+            raise ValueError(
+                f"Invalid number of partitions: expected between 1 and {adjacency.shape[0]}, got {num_partitions}."
+            )
+        partition = np.zeros(adjacency.shape[0], dtype=np.int32)
+        self._bisect(
+            np.asarray(adjacency),
+            np.arange(adjacency.shape[0]),
+            num_partitions,
+            0,
+            partition,
+        )
+        return partition
+
+    def _bisect(
+        self,
+        adjacency: np.ndarray,
+        nodes: np.ndarray,
+        num_partitions: int,
+        first_partition: int,
+        partition: np.ndarray,
+    ):
+        """
+        Recursively bisect a sub graph.
+
+        Args:
+            adjacency: neighbor table of the sub graph in local numbering
+            nodes: global node ids of the sub graph
+            num_partitions: number of partitions the sub graph is divided into
+            first_partition: partition id of the first partition of this sub graph
+            partition: result array for all global nodes
+        """
+        if num_partitions == 1:
+            partition[nodes] = first_partition
+            return
+        order = _breadth_first_order(adjacency, _pseudo_peripheral_node(adjacency))
+        num_left = num_partitions // 2
+        split = (nodes.shape[0] * num_left) // num_partitions
+        for selection, parts, first in (
+            (order[:split], num_left, first_partition),
+            (order[split:], num_partitions - num_left, first_partition + num_left),
+        ):
+            self._bisect(
+                _sub_graph(adjacency, selection), nodes[selection], parts, first, partition
+            )
+
+
+def _sub_graph(adjacency: np.ndarray, selection: np.ndarray) -> np.ndarray:
+    """Neighbor table of the sub graph consisting of 'selection', in local numbering."""
+    relabel = np.full(adjacency.shape[0] + 1, _INVALID_INDEX, dtype=adjacency.dtype)
+    relabel[selection] = np.arange(selection.shape[0])
+    # invalid entries (-1) index the last element of relabel which stays invalid
+    return relabel[adjacency[selection]]
+
+
+def _breadth_first_order(adjacency: np.ndarray, start: int) -> np.ndarray:
+    """
+    Order the nodes of a graph by a breadth first search.
+
+    The search proceeds level by level and all nodes of a level are visited at once. Nodes in
+    components not connected to 'start' are appended by restarting the search.
+    """
+    num_nodes = adjacency.shape[0]
+    visited = np.zeros(num_nodes + 1, dtype=bool)
+    # invalid neighbors (-1) point to the additional last entry, which is marked as visited
+    visited[-1] = True
+    levels = []
+    num_visited = 0
+    while num_visited < num_nodes:
+        if visited[start]:
+            start = np.flatnonzero(~visited[:-1])[0]
+        front = np.asarray([start])
+        visited[start] = True
+        while front.shape[0] > 0:
+            levels.append(front)
+            num_visited += front.shape[0]
+            neighbors = np.unique(adjacency[front])
+            front = neighbors[~visited[neighbors]]
+            visited[front] = True
+    return np.concatenate(levels)
+
+
+def _pseudo_peripheral_node(adjacency: np.ndarray) -> int:
+    """Find a node far away from others, as the last node of a breadth first search."""
+    return int(_breadth_first_order(adjacency, 0)[-1])
+
+
+def _neighbors(table: np.ndarray, index: np.ndarray) -> np.ndarray:
+    neighbors = np.unique(table[index])
+    return neighbors[neighbors != _INVALID_INDEX]
+
+
+def _lowest_neighbor_owner(table: np.ndarray, cell_owner: np.ndarray) -> np.ndarray:
+    """Owner of entities that are owned by the lowest rank owning one of the neighbor cells."""
+    owners = np.where(table != _INVALID_INDEX, cell_owner[table], np.iinfo(np.int32).max)
+    return owners.min(axis=1)
+
+
+def construct_decomposition_info(
+    grid: base.BaseGrid,
+    cell_owner: data_alloc.NDArray,
+    rank: int,
+    num_halo_lines: int = 2,
+) -> definitions.DecompositionInfo:
+    """
+    Construct the local domain of a rank from a partition of the global grid cells.
+
+    Halo lines are constructed as in ICON: the cells of a halo line are all cells sharing a vertex
+    with a cell of the previous line that are not yet part of the local domain. The local edges and
+    vertices are all edges and vertices of the local cells. Local indices are ordered: owned
+    entries first, then halo entries ordered by their halo line and global index.
+
+    Args:
+        grid: global grid, needs the C2V, V2C, C2E, E2C connectivities
+        cell_owner: shape (n_cells,), rank owning each cell as produced by a 'Decomposer'
+        rank: the rank to construct the local domain for
+        num_halo_lines: number of halo lines of cells
+    Returns:
+        DecompositionInfo of the local domain of 'rank'
+    """
+    cell_owner = data_alloc.as_numpy(cell_owner)
+    c2v = data_alloc.as_numpy(grid.connectivities[dims.C2VDim])
+    v2c = data_alloc.as_numpy(grid.connectivities[dims.V2CDim])
+    c2e = data_alloc.as_numpy(grid.connectivities[dims.C2EDim])
+    e2c = data_alloc.as_numpy(grid.connectivities[dims.E2CDim])
+
+    is_local = cell_owner == rank
+    cell_lines = [np.flatnonzero(is_local)]
+    for _ in range(num_halo_lines):
+        candidates = _neighbors(v2c, _neighbors(c2v, cell_lines[-1]))
+        next_line = candidates[~is_local[candidates]]
+        is_local[next_line] = True
+        cell_lines.append(next_line)
+    local_cells = np.concatenate(cell_lines)
+
+    def _local_entities(
+        connectivity: np.ndarray, owner: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # ordering by halo line of the first local cell containing the entity
+        line_of_cell = np.concatenate(
+            [np.full(line.shape[0], i) for i, line in enumerate(cell_lines)]
+        )
+        entities = connectivity[local_cells].ravel()
+        lines = np.repeat(line_of_cell, connectivity.shape[1])
+        valid = entities != _INVALID_INDEX
+        entities, first = np.unique(entities[valid], return_index=True)
+        lines = lines[valid][first]
+        is_owned = owner[entities] == rank
+        order = np.lexsort((entities, lines, ~is_owned))
+        return entities[order], is_owned[order]
+
+    edges, edge_owner_mask = _local_entities(c2e, _lowest_neighbor_owner(e2c, cell_owner))
+    vertices, vertex_owner_mask = _local_entities(c2v, _lowest_neighbor_owner(v2c, cell_owner))
+    cell_owner_mask = np.zeros(local_cells.shape[0], dtype=bool)
+    cell_owner_mask[: cell_lines[0].shape[0]] = True
+
+    _log.info(
+        f"rank {rank}: local domain with {local_cells.shape[0]} cells ({cell_lines[0].shape[0]} owned),"
+        f" {edges.shape[0]} edges, {vertices.shape[0]} vertices"
+    )
+    decomposition_info = definitions.DecompositionInfo(
+        klevels=grid.num_levels,
+        num_cells=local_cells.shape[0],
+        num_edges=edges.shape[0],
+        num_vertices=vertices.shape[0],
+    )
+    return (
+        decomposition_info.with_dimension(dims.CellDim, local_cells, cell_owner_mask)
+        .with_dimension(dims.EdgeDim, edges, edge_owner_mask)
+        .with_dimension(dims.VertexDim, vertices, vertex_owner_mask)
+    )
+
+
+def decompose(
+    grid: base.BaseGrid,
+    num_ranks: int,
+    rank: int,
+    decomposer: Optional[Decomposer] = None,
+    num_halo_lines: int = 2,
+) -> definitions.DecompositionInfo:
+    """
+    Decompose a global grid and construct the local domain of 'rank'.
+
+    Args:
+        grid: the global grid, as constructed by the GridManager
+        num_ranks: number of ranks to decompose the grid for
+        rank: rank to construct the local domain for
+        decomposer: partitioner for the cell graph given by the C2E2C connectivity, defaults to
+            'RecursiveBisectionDecomposer'
+        num_halo_lines: number of halo lines of cells
+    """
+    decomposer = decomposer if decomposer is not None else RecursiveBisectionDecomposer()
+    c2e2c = data_alloc.as_numpy(grid.connectivities[dims.C2E2CDim])
+    cell_owner = decomposer(c2e2c, num_ranks)
+    return construct_decomposition_info(grid, cell_owner, rank, num_halo_lines)
@@ -12,7 +12,7 @@ import functools
 import logging
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Any, Optional, Protocol, Sequence, Union, runtime_checkable
+from typing import Any, Mapping, Optional, Protocol, Sequence, Union, runtime_checkable
 
 import numpy as np
 from gt4py.next import Dimension
@@ -168,6 +168,9 @@ class ExchangeRuntime(Protocol):
     def exchange_and_wait(self, dim: Dimension, *fields: tuple):
         ...
 
+    def exchange_batch(self, fields: Mapping[Dimension, Sequence]) -> ExchangeResult:
+        ...
+
     def get_size(self):
         ...
 
@@ -183,6 +186,9 @@ class SingleNodeExchange:
     def exchange_and_wait(self, dim: Dimension, *fields: tuple):
         return
 
+    def exchange_batch(self, fields: Mapping[Dimension, Sequence]) -> ExchangeResult:
+        return SingleNodeResult()
+
     def my_rank(self):
         return 0
 
@@ -8,10 +8,11 @@
 
 from __future__ import annotations
 
+import collections
 import functools
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, ClassVar, Final, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Mapping, Optional, Sequence, Union
 
 import numpy as np
 from gt4py.next import Dimension, Field
@@ -127,10 +128,17 @@ class MPICommProcessProperties(definitions.ProcessProperties):
         return self.comm.Get_size()
 
 
+def _data_pointer(array: data_alloc.NDArray) -> int:
+    if hasattr(array, "__cuda_array_interface__"):
+        return array.__cuda_array_interface__["data"][0]
+    return array.__array_interface__["data"][0]
+
+
 class GHexMultiNodeExchange:
     max_num_of_fields_to_communicate_dace: Final[
         int
     ] = 10  # maximum number of fields to perform halo exchange on (DaCe-related)
+    max_num_of_cached_field_descriptors: Final[int] = 256
 
     def __init__(
         self,
@@ -147,6 +155,11 @@ class GHexMultiNodeExchange:
         self._patterns = {dim: self._create_pattern(dim) for dim in dims.global_dimensions.values()}
         log.info(f"patterns for dimensions {self._patterns.keys()} initialized ")
         self._comm = make_communication_object(self._context)
+        # field descriptors of the exchanged buffers, the buffer is kept alongside its descriptor
+        # such that its memory cannot be reused by another array while it is in the cache
+        self._field_descriptors: collections.OrderedDict[
+            tuple, tuple[Any, data_alloc.NDArray]
+        ] = collections.OrderedDict()
 
         # DaCe SDFGConvertible interface
         self.num_of_halo_tasklets = (
@@ -215,35 +228,71 @@ class GHexMultiNodeExchange:
         else:
             raise ValueError(f"Unknown dimension {dim}")
 
-    def exchange(self, dim: definitions.Dimension, *fields: Sequence[Field]):
+    def _field_descriptor(self, field: Field, dim: definitions.Dimension):
         """
-        Exchange method that slices the fields based on the dimension and then performs halo exchange.
+        Return the GHEX field descriptor of a field, descriptors are cached by buffer.
 
-            This operation is *necessary* for the use inside FORTRAN as there fields are larger than the grid (nproma size). where it does not do anything in a purely Python setup.
-            the granule context where fields otherwise have length nproma.
+        The same buffers are exchanged repeatedly during a time step, the descriptor only depends on
+        the memory layout of the buffer and is therefore only created once per buffer.
         """
+        array = field.ndarray
+        key = (dim, _data_pointer(array), array.shape, array.strides, array.dtype.str)
+        cached = self._field_descriptors.get(key)
+        if cached is not None:
+            self._field_descriptors.move_to_end(key)
+            return cached[0]
+
+        # Slice the fields based on the dimension
+        sliced_field = self._slice_field_based_on_dim(field, dim)
+        descriptor = make_field_descriptor(
+            self._domain_descriptors[dim],
+            sliced_field,
+            arch=Architecture.CPU if isinstance(sliced_field, np.ndarray) else Architecture.GPU,
+        )
+        self._field_descriptors[key] = (descriptor, sliced_field)
+        if len(self._field_descriptors) > self.max_num_of_cached_field_descriptors:
+            self._field_descriptors.popitem(last=False)
+        return descriptor
+
+    def _apply_pattern(self, dim: definitions.Dimension, fields: Sequence[Field]) -> list:
         assert dim in dims.global_dimensions.values()
         pattern = self._patterns[dim]
         assert pattern is not None, f"pattern for {dim.value} not found"
         domain_descriptor = self._domain_descriptors[dim]
         assert domain_descriptor is not None, f"domain descriptor for {dim.value} not found"
+        return [pattern(self._field_descriptor(f, dim)) for f in fields]
 
-        # Slice the fields based on the dimension
-        sliced_fields = [self._slice_field_based_on_dim(f, dim) for f in fields]
+    def exchange(self, dim: definitions.Dimension, *fields: Sequence[Field]):
+        """
+        Exchange method that slices the fields based on the dimension and then performs halo exchange.
 
-        # Create field descriptors and perform the exchange
+            This operation is *necessary* for the use inside FORTRAN as there fields are larger than the grid (nproma size). where it does not do anything in a purely Python setup.
+            the granule context where fields otherwise have length nproma.
+        """
+        applied_patterns = self._apply_pattern(dim, fields)
+        handle = self._comm.exchange(applied_patterns)
+        log.debug(f"exchange for {len(fields)} fields of dimension ='{dim.value}' initiated.")
+        return MultiNodeResult(handle, applied_patterns)
+
+    def exchange_batch(
+        self, fields: Mapping[definitions.Dimension, Sequence[Field]]
+    ) -> MultiNodeResult:
+        """
+        Exchange fields of several horizontal dimensions in a single communication.
+
+        Messages of all fields going to the same neighbor rank are aggregated, which saves the
+        latency of separate exchanges per dimension.
+
+        Args:
+            fields: the fields to exchange grouped by their horizontal dimension
+        """
         applied_patterns = [
-            pattern(
-                make_field_descriptor(
-                    domain_descriptor,
-                    f,
-                    arch=Architecture.CPU if isinstance(f, np.ndarray) else Architecture.GPU,
-                )
-            )
-            for f in sliced_fields
+            p for dim, dim_fields in fields.items() for p in self._apply_pattern(dim, dim_fields)
         ]
         handle = self._comm.exchange(applied_patterns)
-        log.debug(f"exchange for {len(fields)} fields of dimension ='{dim.value}' initiated.")
+        log.debug(
+            f"exchange for {len(applied_patterns)} fields of dimensions {[d.value for d in fields.keys()]} initiated."
+        )
         return MultiNodeResult(handle, applied_patterns)
 
     def exchange_and_wait(self, dim: Dimension, *fields: tuple):
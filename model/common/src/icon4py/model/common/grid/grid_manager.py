@@ -15,12 +15,17 @@ import gt4py.next as gtx
 import gt4py.next.backend as gtx_backend
 import numpy as np
 
-from icon4py.model.common import dimension as dims, exceptions, type_alias as ta
+from icon4py.model.common import (
+    __version__ as icon4py_version,
+    dimension as dims,
+    exceptions,
+    type_alias as ta,
+)
 from icon4py.model.common.decomposition import (
     definitions as decomposition,
 )
-from icon4py.model.common.grid import base, icon, vertical as v_grid
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.grid import base, horizontal as h_grid, icon, vertical as v_grid
+from icon4py.model.common.utils import data_allocation as data_alloc, disk_cache
 
 
 try:
@@ -247,6 +252,10 @@ class GridFile:
 
     INVALID_INDEX = -1
 
+    #: maximal number of unrequested entries between two requested indices that are read in a
+    #: single hyperslab when doing indexed reads, larger gaps start a new hyperslab.
+    MAX_READ_GAP = 64
+
     def __init__(self, file_name: str):
         self._filename = file_name
         self._dataset = None
@@ -268,6 +277,7 @@ class GridFile:
 
         Args:
             name: name of the field to read
+            indices: indices of the horizontal dimension to read, see 'variable'
             transpose: flag to indicate whether the file should be transposed (for 2d fields)
         Returns:
             NDArray: field data
@@ -285,7 +295,10 @@ class GridFile:
     ) -> np.ndarray:
         """Read a  field from the grid file.
 
-        If a index array is given it only reads the values at those positions.
+        If a index array is given it only reads the values at those positions of the horizontal
+        dimension, which is the last dimension of the variable in the file. The result is
+        ordered as the index array.
+
         Args:
             name: name of the field to read
             indices: indices to read
@@ -296,7 +309,7 @@ class GridFile:
         try:
             variable = self._dataset.variables[name]
             _log.debug(f"reading {name}: transposing = {transpose}")
-            data = variable[:] if indices is None else variable[indices]
+            data = variable[:] if indices is None else self._read_indexed(variable, indices)
             data = np.array(data, dtype=dtype)
             return np.transpose(data) if transpose else data
         except KeyError as err:
@@ -305,6 +318,29 @@ class GridFile:
             _log.debug(f"Error: {err}")
             raise exceptions.IconGridError(msg) from err
 
+    def _read_indexed(self, variable, indices: np.ndarray) -> np.ndarray:
+        """
+        Read the entries at 'indices' along the last dimension of a netcdf variable.
+
+        Indexing a netcdf variable with an arbitrary index array results in one read per index.
+        Instead, the indices are sorted and coalesced into contiguous hyperslabs, that are read
+        one at the time. Gaps of up to MAX_READ_GAP entries between requested indices are read
+        along with them to reduce the number of read calls.
+        """
+        indices = np.asarray(indices)
+        if indices.size == 0:
+            return np.empty((*variable.shape[:-1], 0), dtype=variable.dtype)
+        unique_indices, inverse = np.unique(indices, return_inverse=True)
+        breaks = np.flatnonzero(np.diff(unique_indices) > self.MAX_READ_GAP + 1) + 1
+        slab_starts = unique_indices[np.concatenate(([0], breaks))]
+        slab_ends = unique_indices[np.concatenate((breaks - 1, [-1]))] + 1
+        slabs = [np.asarray(variable[..., start:end]) for start, end in zip(slab_starts, slab_ends)]
+        _log.debug(f"reading {indices.size} entries in {len(slabs)} hyperslabs")
+        slab_offsets = np.concatenate(([0], np.cumsum(slab_ends - slab_starts)[:-1]))
+        slab_of_index = np.searchsorted(slab_starts, unique_indices, side="right") - 1
+        positions = unique_indices - slab_starts[slab_of_index] + slab_offsets[slab_of_index]
+        return np.concatenate(slabs, axis=-1)[..., positions[inverse]]
+
     def close(self):
         self._dataset.close()
 
@@ -366,7 +402,17 @@ class GridManager:
         transformation: IndexTransformation,
         grid_file: Union[pathlib.Path, str],
         config: v_grid.VerticalGridConfig,  # TODO (@halungge) remove to separate vertical and horizontal grid
+        cache_path: Optional[Union[pathlib.Path, str]] = None,
     ):
+        """
+        Args:
+            transformation: index transformation applied to the connectivities read from the file
+            grid_file: path of the ICON grid file
+            config: vertical grid configuration
+            cache_path: optional directory of an on-disk grid cache. If given the fully
+                constructed grid is stored there on first use and later loaded from it instead
+                of being reconstructed from the grid file.
+        """
         self._transformation = transformation
         self._file_name = str(grid_file)
         self._vertical_config = config
@@ -375,6 +421,8 @@ class GridManager:
         self._geometry: GeometryDict = {}
         self._reader = None
         self._coordinates: CoordinateDict = {}
+        self._cache = disk_cache.DiskCache(cache_path) if cache_path is not None else None
+        self._refinement = {}
 
     def open(self):
         """Open the gridfile resource for reading."""
@@ -398,27 +446,171 @@ class GridManager:
         if exc_type is FileNotFoundError:
             raise FileNotFoundError(f"gridfile {self._file_name} not found, aborting")
 
-    def __call__(self, backend: Optional[gtx_backend.Backend], limited_area=True):
+    def __call__(
+        self,
+        backend: Optional[gtx_backend.Backend],
+        limited_area=True,
+        decomposition_info: Optional[decomposition.DecompositionInfo] = None,
+    ):
+        """
+        Read the grid file and construct the grid.
+
+        Args:
+            backend: the gt4py Backend we are running on
+            limited_area: whether the grid is a limited area grid
+            decomposition_info: if given, only the cells, edges and vertices of the local domain
+                (owned and halo) given by the global indices in the decomposition info are read
+                from the file. Connectivities are translated to local indices, neighbors outside of
+                the local domain are set to GridFile.INVALID_INDEX. The owned entries have to come
+                first and in increasing global order, followed by the halo entries, so that the
+                local domain keeps the zone ordering of the grid file.
+        """
         if not self._reader:
             self.open()
+        self._decomposition_info = decomposition_info
         on_gpu = data_alloc.is_cupy_device(backend)
+        use_cache = self._cache is not None and decomposition_info is None
+        if use_cache:
+            key = self._cache_key(limited_area)
+            if key in self._cache:
+                _log.info(f"loading grid from cache entry '{key}' in '{self._cache.path}'")
+                self._load_from_cache(key, backend, limited_area)
+                return
         self._grid = self._construct_grid(on_gpu=on_gpu, limited_area=limited_area)
         self._refinement = self._read_grid_refinement_fields(backend)
         self._coordinates = self._read_coordinates(backend)
         self._geometry = self._read_geometry_fields(backend)
+        if use_cache:
+            self._store_in_cache(key)
+
+    @property
+    def is_distributed(self) -> bool:
+        return self._decomposition_info is not None
+
+    def _global_indices(self, dim: gtx.Dimension) -> Optional[np.ndarray]:
+        """Global indices of the local domain to be read from the file or None for a full read."""
+        if not self.is_distributed:
+            return None
+        return data_alloc.as_numpy(
+            self._decomposition_info.global_index(
+                dim, decomposition.DecompositionInfo.EntryType.ALL
+            )
+        )
+
+    def _cache_key(self, limited_area: bool) -> str:
+        """
+        Key of the grid in the grid cache.
+
+        The key contains the 'uuidOfHGrid' of the grid file, whether the grid is a limited area
+        grid, the index transformation applied to the connectivities and the icon4py version, so
+        that a cached grid is invalidated if the grid construction changes.
+        """
+        grid_uuid = self._reader.attribute(MandatoryPropertyName.GRID_UUID)
+        grid_kind = "limited_area" if limited_area else "global"
+        transformation = type(self._transformation).__name__
+        return f"grid_{grid_uuid}_{grid_kind}_{transformation}_icon4py_{icon4py_version}"
+
+    def _store_in_cache(self, key: str):
+        start_indices, end_indices, _ = self._read_start_end_indices()
+        arrays = {}
+        field_dims = {}
+        for dim, connectivity in self._grid.connectivities.items():
+            arrays[f"connectivity_{dim.value}"] = connectivity
+        for dim in dims.global_dimensions.values():
+            arrays[f"start_index_{dim.value}"] = start_indices[dim]
+            arrays[f"end_index_{dim.value}"] = end_indices[dim]
+            arrays[f"refinement_{dim.value}"] = self._refinement[dim]
+            for coordinate, field in self._coordinates[dim].items():
+                name = f"coordinate_{dim.value}_{coordinate}"
+                arrays[name] = field.ndarray
+                field_dims[name] = [d.value for d in field.domain.dims]
+        for geometry_name, field in self._geometry.items():
+            name = f"geometry_{geometry_name}"
+            arrays[name] = field.ndarray
+            field_dims[name] = [d.value for d in field.domain.dims]
+
+        metadata = {
+            "id": str(self._grid.id),
+            "limited_area": self._grid.limited_area,
+            "root": int(self._grid.global_properties.root),
+            "level": int(self._grid.global_properties.level),
+            "num_cells": int(self._grid.num_cells),
+            "num_edges": int(self._grid.num_edges),
+            "num_vertices": int(self._grid.num_vertices),
+            "connectivities": [dim.value for dim in self._grid.connectivities.keys()],
+            "geometry": list(self._geometry.keys()),
+            "field_dims": field_dims,
+        }
+        self._cache.store(key, arrays, metadata)
+
+    def _load_from_cache(
+        self, key: str, backend: Optional[gtx_backend.Backend], limited_area: bool
+    ):
+        metadata, arrays = self._cache.load(key)
+        on_gpu = data_alloc.is_cupy_device(backend)
+        xp = data_alloc.array_ns(on_gpu)
+        dimensions = {d.value: d for d in vars(dims).values() if isinstance(d, gtx.Dimension)}
+
+        def as_field(name: str) -> gtx.Field:
+            domain = tuple(dimensions[d] for d in metadata["field_dims"][name])
+            return gtx.as_field(domain, arrays[name], allocator=backend)
+
+        global_params = icon.GlobalGridParams(level=metadata["level"], root=metadata["root"])
+        grid_size = base.HorizontalGridSize(
+            num_vertices=metadata["num_vertices"],
+            num_edges=metadata["num_edges"],
+            num_cells=metadata["num_cells"],
+        )
+        config = base.GridConfig(
+            horizontal_config=grid_size,
+            vertical_size=self._vertical_config.num_levels,
+            on_gpu=on_gpu,
+            limited_area=limited_area,
+        )
+        grid = icon.IconGrid(metadata["id"]).with_config(config).with_global_params(global_params)
+        grid.with_connectivities(
+            {
+                dimensions[name]: xp.asarray(arrays[f"connectivity_{name}"])
+                for name in metadata["connectivities"]
+            }
+        )
+        _update_size_for_1d_sparse_dims(grid)
+        for dim in dims.global_dimensions.values():
+            grid.with_start_end_indices(
+                dim,
+                np.asarray(arrays[f"start_index_{dim.value}"]),
+                np.asarray(arrays[f"end_index_{dim.value}"]),
+            )
+        self._grid = grid
+        self._refinement = {
+            dim: xp.asarray(arrays[f"refinement_{dim.value}"])
+            for dim in dims.global_dimensions.values()
+        }
+        self._coordinates = {
+            dim: {
+                coordinate: as_field(f"coordinate_{dim.value}_{coordinate}")
+                for coordinate in ("lat", "lon")
+            }
+            for dim in dims.global_dimensions.values()
+        }
+        self._geometry = {name: as_field(f"geometry_{name}") for name in metadata["geometry"]}
 
     def _read_coordinates(self, backend: Optional[gtx_backend.Backend]) -> CoordinateDict:
         return {
             dims.CellDim: {
                 "lat": gtx.as_field(
                     (dims.CellDim,),
-                    self._reader.variable(CoordinateName.CELL_LATITUDE),
+                    self._reader.variable(
+                        CoordinateName.CELL_LATITUDE, self._global_indices(dims.CellDim)
+                    ),
                     dtype=ta.wpfloat,
                     allocator=backend,
                 ),
                 "lon": gtx.as_field(
                     (dims.CellDim,),
-                    self._reader.variable(CoordinateName.CELL_LONGITUDE),
+                    self._reader.variable(
+                        CoordinateName.CELL_LONGITUDE, self._global_indices(dims.CellDim)
+                    ),
                     dtype=ta.wpfloat,
                     allocator=backend,
                 ),
@@ -426,13 +618,17 @@ class GridManager:
             dims.EdgeDim: {
                 "lat": gtx.as_field(
                     (dims.EdgeDim,),
-                    self._reader.variable(CoordinateName.EDGE_LATITUDE),
+                    self._reader.variable(
+                        CoordinateName.EDGE_LATITUDE, self._global_indices(dims.EdgeDim)
+                    ),
                     dtype=ta.wpfloat,
                     allocator=backend,
                 ),
                 "lon": gtx.as_field(
                     (dims.EdgeDim,),
-                    self._reader.variable(CoordinateName.EDGE_LONGITUDE),
+                    self._reader.variable(
+                        CoordinateName.EDGE_LONGITUDE, self._global_indices(dims.EdgeDim)
+                    ),
                     dtype=ta.wpfloat,
                     allocator=backend,
                 ),
@@ -440,13 +636,17 @@ class GridManager:
             dims.VertexDim: {
                 "lat": gtx.as_field(
                     (dims.VertexDim,),
-                    self._reader.variable(CoordinateName.VERTEX_LATITUDE),
+                    self._reader.variable(
+                        CoordinateName.VERTEX_LATITUDE, self._global_indices(dims.VertexDim)
+                    ),
                     allocator=backend,
                     dtype=ta.wpfloat,
                 ),
                 "lon": gtx.as_field(
                     (dims.VertexDim,),
-                    self._reader.variable(CoordinateName.VERTEX_LONGITUDE),
+                    self._reader.variable(
+                        CoordinateName.VERTEX_LONGITUDE, self._global_indices(dims.VertexDim)
+                    ),
                     allocator=backend,
                     dtype=ta.wpfloat,
                 ),
@@ -458,35 +658,57 @@ class GridManager:
             # TODO (@halungge) still needs to ported, values from "our" grid files contains (wrong) values:
             #   based on bug in generator fixed with this [PR40](https://gitlab.dkrz.de/dwd-sw/dwd_icon_tools/-/merge_requests/40) .
             GeometryName.CELL_AREA.value: gtx.as_field(
-                (dims.CellDim,), self._reader.variable(GeometryName.CELL_AREA), allocator=backend
+                (dims.CellDim,),
+                self._reader.variable(GeometryName.CELL_AREA, self._global_indices(dims.CellDim)),
+                allocator=backend,
             ),
             # TODO (@halungge) easily computed from a neighbor_sum V2C over the cell areas?
             GeometryName.DUAL_AREA.value: gtx.as_field(
-                (dims.VertexDim,), self._reader.variable(GeometryName.DUAL_AREA), allocator=backend
+                (dims.VertexDim,),
+                self._reader.variable(GeometryName.DUAL_AREA, self._global_indices(dims.VertexDim)),
+                allocator=backend,
             ),
             GeometryName.EDGE_CELL_DISTANCE.value: gtx.as_field(
                 (dims.EdgeDim, dims.E2CDim),
-                self._reader.variable(GeometryName.EDGE_CELL_DISTANCE, transpose=True),
+                self._reader.variable(
+                    GeometryName.EDGE_CELL_DISTANCE,
+                    self._global_indices(dims.EdgeDim),
+                    transpose=True,
+                ),
                 allocator=backend,
             ),
             GeometryName.EDGE_VERTEX_DISTANCE.value: gtx.as_field(
                 (dims.EdgeDim, dims.E2VDim),
-                self._reader.variable(GeometryName.EDGE_VERTEX_DISTANCE, transpose=True),
+                self._reader.variable(
+                    GeometryName.EDGE_VERTEX_DISTANCE,
+                    self._global_indices(dims.EdgeDim),
+                    transpose=True,
+                ),
             ),
             # TODO (@halungge) recompute from coordinates? field in gridfile contains NaN on boundary edges
             GeometryName.TANGENT_ORIENTATION.value: gtx.as_field(
                 (dims.EdgeDim,),
-                self._reader.variable(GeometryName.TANGENT_ORIENTATION),
+                self._reader.variable(
+                    GeometryName.TANGENT_ORIENTATION, self._global_indices(dims.EdgeDim)
+                ),
                 allocator=backend,
             ),
             GeometryName.CELL_NORMAL_ORIENTATION.value: gtx.as_field(
                 (dims.CellDim, dims.C2EDim),
-                self._reader.int_variable(GeometryName.CELL_NORMAL_ORIENTATION, transpose=True),
+                self._reader.int_variable(
+                    GeometryName.CELL_NORMAL_ORIENTATION,
+                    self._global_indices(dims.CellDim),
+                    transpose=True,
+                ),
                 allocator=backend,
             ),
             GeometryName.EDGE_ORIENTATION_ON_VERTEX.value: gtx.as_field(
                 (dims.VertexDim, dims.V2EDim),
-                self._reader.int_variable(GeometryName.EDGE_ORIENTATION_ON_VERTEX, transpose=True),
+                self._reader.int_variable(
+                    GeometryName.EDGE_ORIENTATION_ON_VERTEX,
+                    self._global_indices(dims.VertexDim),
+                    transpose=True,
+                ),
                 allocator=backend,
             ),
         }
@@ -549,7 +771,6 @@ class GridManager:
     def _read_grid_refinement_fields(
         self,
         backend: Optional[gtx_backend.Backend],
-        decomposition_info: Optional[decomposition.DecompositionInfo] = None,
     ) -> tuple[dict[dims.Dimension : data_alloc.NDArray]]:
         """
         Reads the refinement control fields from the grid file.
@@ -564,7 +785,9 @@ class GridManager:
             dims.VertexDim: GridRefinementName.CONTROL_VERTICES,
         }
         refinement_control_fields = {
-            dim: xp.asarray(self._reader.int_variable(name, decomposition_info, transpose=False))
+            dim: xp.asarray(
+                self._reader.int_variable(name, self._global_indices(dim), transpose=False)
+            )
             for dim, name in refinement_control_names.items()
         }
         return refinement_control_fields
@@ -599,32 +822,51 @@ class GridManager:
         """
         grid = self._initialize_global(limited_area, on_gpu)
 
-        global_connectivities = {
-            dims.C2E2C: self._get_index_field(ConnectivityName.C2E2C),
-            dims.C2E: self._get_index_field(ConnectivityName.C2E),
-            dims.E2C: self._get_index_field(ConnectivityName.E2C),
-            dims.V2E: self._get_index_field(ConnectivityName.V2E),
-            dims.E2V: self._get_index_field(ConnectivityName.E2V),
-            dims.V2C: self._get_index_field(ConnectivityName.V2C),
-            dims.C2V: self._get_index_field(ConnectivityName.C2V),
-            dims.V2E2V: self._get_index_field(ConnectivityName.V2E2V),
-            dims.E2V: self._get_index_field(ConnectivityName.E2V),
-            dims.C2V: self._get_index_field(ConnectivityName.C2V),
+        connectivity_names = {
+            dims.C2E2C: ConnectivityName.C2E2C,
+            dims.C2E: ConnectivityName.C2E,
+            dims.E2C: ConnectivityName.E2C,
+            dims.V2E: ConnectivityName.V2E,
+            dims.E2V: ConnectivityName.E2V,
+            dims.V2C: ConnectivityName.V2C,
+            dims.C2V: ConnectivityName.C2V,
+            dims.V2E2V: ConnectivityName.V2E2V,
         }
+        connectivities = {
+            offset: self._get_index_field(name, indices=self._global_indices(offset.target[0]))
+            for offset, name in connectivity_names.items()
+        }
+        if self.is_distributed:
+            connectivities = {
+                offset: _to_local_neighbor_index(table, self._global_indices(offset.source))
+                for offset, table in connectivities.items()
+            }
         xp = data_alloc.array_ns(on_gpu)
-        grid.with_connectivities(
-            {o.target[1]: xp.asarray(c) for o, c in global_connectivities.items()}
-        )
+        grid.with_connectivities({o.target[1]: xp.asarray(c) for o, c in connectivities.items()})
         _add_derived_connectivities(grid, array_ns=xp)
         _update_size_for_1d_sparse_dims(grid)
         start, end, _ = self._read_start_end_indices()
         for dim in dims.global_dimensions.values():
+            if self.is_distributed:
+                start[dim], end[dim] = _to_local_start_end_indices(
+                    dim,
+                    start[dim],
+                    end[dim],
+                    self._global_indices(dim),
+                    data_alloc.as_numpy(self._decomposition_info.owner_mask(dim)),
+                )
             grid.with_start_end_indices(dim, start[dim], end[dim])
 
         return grid
 
-    def _get_index_field(self, field: GridFileName, transpose=True, apply_offset=True):
-        field = self._reader.int_variable(field, transpose=transpose)
+    def _get_index_field(
+        self,
+        field: GridFileName,
+        transpose=True,
+        apply_offset=True,
+        indices: Optional[np.ndarray] = None,
+    ):
+        field = self._reader.int_variable(field, indices, transpose=transpose)
         if apply_offset:
             field = field + self._transformation(field)
         return field
@@ -644,9 +886,14 @@ class GridManager:
             IconGrid: basic grid, setup only with id and config information.
 
         """
-        num_cells = self._reader.dimension(DimensionName.CELL_NAME)
-        num_edges = self._reader.dimension(DimensionName.EDGE_NAME)
-        num_vertices = self._reader.dimension(DimensionName.VERTEX_NAME)
+        if self.is_distributed:
+            num_cells = self._global_indices(dims.CellDim).shape[0]
+            num_edges = self._global_indices(dims.EdgeDim).shape[0]
+            num_vertices = self._global_indices(dims.VertexDim).shape[0]
+        else:
+            num_cells = self._reader.dimension(DimensionName.CELL_NAME)
+            num_edges = self._reader.dimension(DimensionName.EDGE_NAME)
+            num_vertices = self._reader.dimension(DimensionName.VERTEX_NAME)
         uuid = self._reader.attribute(MandatoryPropertyName.GRID_UUID)
         grid_level = self._reader.attribute(MandatoryPropertyName.LEVEL)
         grid_root = self._reader.attribute(MandatoryPropertyName.ROOT)
@@ -701,6 +948,74 @@ def _add_derived_connectivities(grid: icon.IconGrid, array_ns: ModuleType = np)
     return grid
 
 
+def _to_local_neighbor_index(
+    table: data_alloc.NDArray, global_index: data_alloc.NDArray, array_ns: ModuleType = np
+) -> data_alloc.NDArray:
+    """
+    Translate a connectivity table containing global neighbor indices to local indices.
+
+    Args:
+        table: connectivity table with global indices of the neighbors
+        global_index: global indices of the local domain of the neighbor dimension, the position
+            in this array is the local index
+        array_ns: numpy or cupy module to use for the computation
+
+    Returns: connectivity table of local neighbor indices, neighbors that are not part of the local
+        domain and invalid neighbors are set to GridFile.INVALID_INDEX
+    """
+    order = array_ns.argsort(global_index)
+    sorted_index = global_index[order]
+    position = array_ns.clip(array_ns.searchsorted(sorted_index, table), 0, order.shape[0] - 1)
+    is_local = (sorted_index[position] == table) & (table != GridFile.INVALID_INDEX)
+    return array_ns.where(is_local, order[position], GridFile.INVALID_INDEX).astype(gtx.int32)
+
+
+def _to_local_start_end_indices(
+    dim: gtx.Dimension,
+    start_indices: np.ndarray,
+    end_indices: np.ndarray,
+    global_index: np.ndarray,
+    owner_mask: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Translate the start and end indices of the full grid to a local domain.
+
+    The owned entries of the local domain are ordered as in the grid file, so each zone of the
+    full grid maps to a contiguous range of owned entries. All halo entries are put into the
+    first halo line, the halo lines are not distinguished.
+
+    Args:
+        dim: horizontal dimension of the indices
+        start_indices: start indices of the full grid as read from the grid file
+        end_indices: end indices of the full grid as read from the grid file
+        global_index: global indices of the local domain, the position in this array is the
+            local index
+        owner_mask: whether an entry of the local domain is owned or part of the halo
+
+    Returns: start and end indices of the local domain
+
+    Raises:
+        NotImplementedError: if the owned entries are not ordered first and by their global index
+    """
+    num_owned = int(np.count_nonzero(owner_mask))
+    num_entries = global_index.shape[0]
+    owned = global_index[:num_owned]
+    if not (np.all(owner_mask[:num_owned]) and np.all(owned[1:] > owned[:-1])):
+        raise NotImplementedError(
+            f"Start and end indices of {dim.value} can only be constructed for a local domain whose "
+            "owned entries come first and are sorted by their global index, followed by the halo."
+        )
+    local_start = np.searchsorted(owned, start_indices).astype(gtx.int32)
+    local_end = np.searchsorted(owned, end_indices).astype(gtx.int32)
+
+    # the refinement indices below the local zone are the halo lines and the end of the domain
+    local_zone = h_grid.domain(dim)(h_grid.Zone.LOCAL)()
+    local_start[:local_zone] = num_entries
+    local_end[:local_zone] = num_entries
+    local_start[h_grid.domain(dim)(h_grid.Zone.HALO)()] = num_owned
+    return local_start, local_end
+
+
 def _update_size_for_1d_sparse_dims(grid):
     grid.update_size_connectivities(
         {
@@ -748,11 +1063,9 @@ def _construct_diamond_vertices(
     expanded = dummy_c2v[e2c, :]
     sh = expanded.shape
     flat = expanded.reshape(sh[0], sh[1] * sh[2])
-    far_indices = array_ns.zeros_like(e2v)
-    # TODO (magdalena) vectorize speed this up?
-    for i in range(sh[0]):
-        far_indices[i, :] = flat[i, ~array_ns.isin(flat[i, :], e2v[i, :])][:2]
-    return array_ns.hstack((e2v, far_indices))
+    is_far = ~(flat[:, :, array_ns.newaxis] == e2v[:, array_ns.newaxis, :]).any(axis=2)
+    far_indices = _compress_rows(flat, is_far, e2v.shape[1], array_ns=array_ns)
+    return array_ns.hstack((e2v, far_indices.astype(e2v.dtype)))
 
 
 def _construct_diamond_edges(
@@ -789,13 +1102,10 @@ def _construct_diamond_edges(
     flattened = expanded.reshape(sh[0], sh[1] * sh[2])
 
     diamond_sides = 4
-    e2c2e = GridFile.INVALID_INDEX * array_ns.ones((sh[0], diamond_sides), dtype=gtx.int32)
-    for i in range(sh[0]):
-        var = flattened[
-            i, (~array_ns.isin(flattened[i, :], array_ns.asarray([i, GridFile.INVALID_INDEX])))
-        ]
-        e2c2e[i, : var.shape[0]] = var
-    return e2c2e
+    edge_index = array_ns.arange(sh[0], dtype=flattened.dtype)[:, array_ns.newaxis]
+    is_side = (flattened != edge_index) & (flattened != GridFile.INVALID_INDEX)
+    e2c2e = _compress_rows(flattened, is_side, diamond_sides, array_ns=array_ns)
+    return e2c2e.astype(gtx.int32)
 
 
 def _construct_triangle_edges(
@@ -862,6 +1172,41 @@ def _construct_butterfly_cells(
     return c2e2c2e2c
 
 
+def _compress_rows(
+    table: data_alloc.NDArray,
+    mask: data_alloc.NDArray,
+    num_columns: int,
+    array_ns: ModuleType = np,
+) -> data_alloc.NDArray:
+    """
+    Select the masked entries of each row of a table and left align them in a new table.
+
+    For every row the first `num_columns` entries of `table` for which `mask` is `True` are
+    written to the result, in their original order. Rows with less selected entries are padded
+    with GridFile.INVALID_INDEX. The selection is done for all rows at once by scattering each
+    selected entry to its rank within the row, hence there is no loop over the table rows.
+
+    Args:
+        table: ndarray of shape (n, m) to select from
+        mask: boolean ndarray of shape (n, m) marking the entries to keep
+        num_columns: number of columns of the result
+        array_ns: numpy or cupy module to use for the computation
+
+    Returns: ndarray of shape (n, num_columns)
+
+    """
+    rank = array_ns.cumsum(mask, axis=1, dtype=gtx.int32) - 1
+    keep = mask & (rank < num_columns)
+    rows = array_ns.broadcast_to(
+        array_ns.arange(table.shape[0], dtype=gtx.int32)[:, array_ns.newaxis], table.shape
+    )
+    compressed = array_ns.full(
+        (table.shape[0], num_columns), GridFile.INVALID_INDEX, dtype=table.dtype
+    )
+    compressed[rows[keep], rank[keep]] = table[keep]
+    return compressed
+
+
 def _patch_with_dummy_lastline(ar, array_ns: ModuleType = np):
     """
     Patch an array for easy access with another offset containing invalid indices (-1).
@@ -658,22 +658,21 @@ def create_inverse_neighbor_index(
 
 
     Args:
-        source_offset:
-        inverse_offset:
+        source_offset: neighbor table of the neighbors, for example e2c
+        inverse_offset: neighbor table of the central elements, for example c2e
 
     Returns:
-        ndarray of the same shape as target_offset
+        ndarray of the same shape as inverse_offset, -1 for invalid neighbors and neighbors not
+        containing the central element
 
     """
-    inv_neighbor_idx = -1 * array_ns.ones(inverse_offset.shape, dtype=int)
-
-    for jc in range(inverse_offset.shape[0]):
-        for i in range(inverse_offset.shape[1]):
-            if inverse_offset[jc, i] >= 0:
-                inv_neighbor_idx[jc, i] = array_ns.argwhere(
-                    source_offset[inverse_offset[jc, i], :] == jc
-                )[0, 0]
-
+    num_elements = inverse_offset.shape[0]
+    is_self = source_offset[inverse_offset] == array_ns.arange(num_elements)[:, None, None]
+    inv_neighbor_idx = array_ns.where(
+        (inverse_offset >= 0) & array_ns.any(is_self, axis=2),
+        array_ns.argmax(is_self, axis=2),
+        -1,
+    )
     return inv_neighbor_idx
 
 
@@ -718,46 +717,30 @@ def compute_e_flx_avg(
         array_ns=array_ns,
     )
 
-    llb = 0
     e_flx_avg = array_ns.zeros([e2c.shape[0], 5])
-    index = array_ns.arange(llb, c2e.shape[0])
-    inv_neighbor_id = -array_ns.ones([c2e.shape[0] - llb, 3], dtype=int)
-    for i in range(c2e2c.shape[1]):
-        for j in range(c2e2c.shape[1]):
-            inv_neighbor_id[:, j] = array_ns.where(
-                array_ns.logical_and(c2e2c[c2e2c[llb:, j], i] == index, c2e2c[llb:, j] >= 0),
-                i,
-                inv_neighbor_id[:, j],
-            )
+    inv_neighbor_id = create_inverse_neighbor_index(c2e2c, c2e2c, array_ns=array_ns)
+    # position of the edge in the neighbor table of its first neighbor cell
+    edge_idx = create_inverse_neighbor_index(c2e, e2c, array_ns=array_ns)[:, 0]
+    # position of the first neighbor cell in the neighbor table of the second one
+    cell_idx = inv_neighbor_id[e2c[:, 0], edge_idx]
+    is_valid = owner_mask & (edge_idx >= 0)
 
     llb = horizontal_start_p3
-    index = array_ns.arange(llb, e2c.shape[0])
-    for j in range(c2e.shape[1]):
-        for i in range(2):
-            e_flx_avg[llb:, i + 1] = array_ns.where(
-                owner_mask[llb:],
-                array_ns.where(
-                    c2e[e2c[llb:, 0], j] == index,
-                    c_bln_avg[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], j] + 1]
-                    * geofac_div[e2c[llb:, 0], array_ns.mod(i + j + 1, 3)]
-                    / geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], j]],
-                    e_flx_avg[llb:, i + 1],
-                ),
-                e_flx_avg[llb:, i + 1],
-            )
-            e_flx_avg[llb:, i + 3] = array_ns.where(
-                owner_mask[llb:],
-                array_ns.where(
-                    c2e[e2c[llb:, 0], j] == index,
-                    c_bln_avg[e2c[llb:, 0], 1 + j]
-                    * geofac_div[
-                        e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], j] + i + 1, 3)
-                    ]
-                    / geofac_div[e2c[llb:, 0], j],
-                    e_flx_avg[llb:, i + 3],
-                ),
-                e_flx_avg[llb:, i + 3],
-            )
+    for i in range(2):
+        e_flx_avg[llb:, i + 1] = array_ns.where(
+            is_valid[llb:],
+            c_bln_avg[e2c[llb:, 1], cell_idx[llb:] + 1]
+            * geofac_div[e2c[llb:, 0], array_ns.mod(i + edge_idx[llb:] + 1, 3)]
+            / geofac_div[e2c[llb:, 1], cell_idx[llb:]],
+            e_flx_avg[llb:, i + 1],
+        )
+        e_flx_avg[llb:, i + 3] = array_ns.where(
+            is_valid[llb:],
+            c_bln_avg[e2c[llb:, 0], 1 + edge_idx[llb:]]
+            * geofac_div[e2c[llb:, 1], array_ns.mod(cell_idx[llb:] + i + 1, 3)]
+            / geofac_div[e2c[llb:, 0], edge_idx[llb:]],
+            e_flx_avg[llb:, i + 3],
+        )
 
     iie = -array_ns.ones([e2c.shape[0], 4], dtype=int)
     iie[:, 0] = array_ns.where(e2c[e2c2e[:, 0], 0] == e2c[:, 0], 2, -1)
@@ -781,47 +764,33 @@ def compute_e_flx_avg(
     )
 
     llb = horizontal_start_p4
-    index = array_ns.arange(llb, e2c.shape[0])
-    for i in range(c2e.shape[1]):
-        # INVALID_INDEX
-        if i <= gm.GridFile.INVALID_INDEX:
-            continue
-        e_flx_avg[llb:, 0] = array_ns.where(
-            owner_mask[llb:],
-            array_ns.where(
-                c2e[e2c[llb:, 0], i] == index,
-                0.5
-                * (
-                    (
-                        geofac_div[e2c[llb:, 0], i] * c_bln_avg[e2c[llb:, 0], 0]
-                        + geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
-                        * c_bln_avg[e2c[llb:, 0], i + 1]
-                        - e_flx_avg[e2c2e[llb:, 0], iie[llb:, 0]]
-                        * geofac_div[e2c[llb:, 0], array_ns.mod(i + 1, 3)]
-                        - e_flx_avg[e2c2e[llb:, 1], iie[llb:, 1]]
-                        * geofac_div[e2c[llb:, 0], array_ns.mod(i + 2, 3)]
-                    )
-                    / geofac_div[e2c[llb:, 0], i]
-                    + (
-                        geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
-                        * c_bln_avg[e2c[llb:, 1], 0]
-                        + geofac_div[e2c[llb:, 0], i]
-                        * c_bln_avg[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i] + 1]
-                        - e_flx_avg[e2c2e[llb:, 2], iie[llb:, 2]]
-                        * geofac_div[
-                            e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], i] + 1, 3)
-                        ]
-                        - e_flx_avg[e2c2e[llb:, 3], iie[llb:, 3]]
-                        * geofac_div[
-                            e2c[llb:, 1], array_ns.mod(inv_neighbor_id[e2c[llb:, 0], i] + 2, 3)
-                        ]
-                    )
-                    / geofac_div[e2c[llb:, 1], inv_neighbor_id[e2c[llb:, 0], i]]
-                ),
-                e_flx_avg[llb:, 0],
-            ),
-            e_flx_avg[llb:, 0],
-        )
+    i = edge_idx[llb:]
+    j = cell_idx[llb:]
+    e_flx_avg[llb:, 0] = array_ns.where(
+        is_valid[llb:],
+        0.5
+        * (
+            (
+                geofac_div[e2c[llb:, 0], i] * c_bln_avg[e2c[llb:, 0], 0]
+                + geofac_div[e2c[llb:, 1], j] * c_bln_avg[e2c[llb:, 0], i + 1]
+                - e_flx_avg[e2c2e[llb:, 0], iie[llb:, 0]]
+                * geofac_div[e2c[llb:, 0], array_ns.mod(i + 1, 3)]
+                - e_flx_avg[e2c2e[llb:, 1], iie[llb:, 1]]
+                * geofac_div[e2c[llb:, 0], array_ns.mod(i + 2, 3)]
+            )
+            / geofac_div[e2c[llb:, 0], i]
+            + (
+                geofac_div[e2c[llb:, 1], j] * c_bln_avg[e2c[llb:, 1], 0]
+                + geofac_div[e2c[llb:, 0], i] * c_bln_avg[e2c[llb:, 1], j + 1]
+                - e_flx_avg[e2c2e[llb:, 2], iie[llb:, 2]]
+                * geofac_div[e2c[llb:, 1], array_ns.mod(j + 1, 3)]
+                - e_flx_avg[e2c2e[llb:, 3], iie[llb:, 3]]
+                * geofac_div[e2c[llb:, 1], array_ns.mod(j + 2, 3)]
+            )
+            / geofac_div[e2c[llb:, 1], j]
+        ),
+        e_flx_avg[llb:, 0],
+    )
 
     checksum = e_flx_avg[:, 0]
     for i in range(4):
@@ -867,40 +836,39 @@ def compute_cells_aw_verts(
     Returns:
         aw_verts: numpy array, representing a gtx.Field[gtx.Dims[VertexDim, 6], ta.wpfloat]
     """
+
+    def _is_valid(table: data_alloc.NDArray) -> data_alloc.NDArray:
+        """Skip invalid and repeated neighbors (the last neighbor of pentagon points is repeated)."""
+        is_repeated = array_ns.zeros(table.shape, dtype=bool)
+        is_repeated[:, 1:] = table[:, 1:] == table[:, :-1]
+        return (table != gm.GridFile.INVALID_INDEX) & ~is_repeated
+
     cells_aw_verts = array_ns.zeros(v2e.shape)
-    for jv in range(horizontal_start, cells_aw_verts.shape[0]):
-        cells_aw_verts[jv, :] = 0.0
-        for je in range(v2e.shape[1]):
-            # INVALID_INDEX
-            if v2e[jv, je] == gm.GridFile.INVALID_INDEX or (
-                je > 0 and v2e[jv, je] == v2e[jv, je - 1]
-            ):
-                continue
-            ile = v2e[jv, je]
-            idx_ve = 0 if e2v[ile, 0] == jv else 1
-            cell_offset_idx_0 = e2c[ile, 0]
-            cell_offset_idx_1 = e2c[ile, 1]
-            for jc in range(v2e.shape[1]):
-                if v2c[jv, jc] == gm.GridFile.INVALID_INDEX or (
-                    jc > 0 and v2c[jv, jc] == v2c[jv, jc - 1]
-                ):
-                    continue
-                if cell_offset_idx_0 == v2c[jv, jc]:
-                    cells_aw_verts[jv, jc] = (
-                        cells_aw_verts[jv, jc]
-                        + 0.5
-                        / dual_area[jv]
-                        * edge_vert_length[ile, idx_ve]
-                        * edge_cell_length[ile, 0]
-                    )
-                elif cell_offset_idx_1 == v2c[jv, jc]:
-                    cells_aw_verts[jv, jc] = (
-                        cells_aw_verts[jv, jc]
-                        + 0.5
-                        / dual_area[jv]
-                        * edge_vert_length[ile, idx_ve]
-                        * edge_cell_length[ile, 1]
-                    )
+    v2e = v2e[horizontal_start:]
+    v2c = v2c[horizontal_start:, : v2e.shape[1]]
+    vertices = array_ns.arange(horizontal_start, cells_aw_verts.shape[0])[:, None]
+    is_valid_cell = _is_valid(v2c)
+    is_valid_edge = _is_valid(v2e)
+    idx_ve = array_ns.where(e2v[v2e, 0] == vertices, 0, 1)
+    weight = 0.5 / dual_area[vertices] * edge_vert_length[v2e, idx_ve]
+
+    # the contributions of the edges are added in the order of the edges
+    for je in range(v2e.shape[1]):
+        ile = v2e[:, je, None]
+        contribution = array_ns.where(
+            e2c[ile, 0] == v2c,
+            weight[:, je, None] * edge_cell_length[ile, 0],
+            array_ns.where(
+                e2c[ile, 1] == v2c,
+                weight[:, je, None] * edge_cell_length[ile, 1],
+                0.0,
+            ),
+        )
+        cells_aw_verts[horizontal_start:] = array_ns.where(
+            is_valid_edge[:, je, None] & is_valid_cell,
+            cells_aw_verts[horizontal_start:] + contribution,
+            cells_aw_verts[horizontal_start:],
+        )
 
     return cells_aw_verts
 
@@ -39,6 +39,8 @@ The IO module is configurable and can be configured with:
 - `field_groups`: list of field group configuration (see below).
 - `time_units` (optional, default is "seconds since 1970-01-01 00:00:00"): unit used with the time dimension in the data files.
 - `calendar` (optional, default is "proleptic_gregorian"). Caleandar used with the time dimension in the data files.
+- `asynchronous` (optional, default is False): if True, fields are copied to host buffers upon `store` and written to the data files by a background thread while the model continues.
+- `num_output_buffers` (optional, default is 2): number of copies per field group that can be waiting to be written in asynchronous mode. `store` blocks if all of them are in use, which bounds the memory used for output.
 
 Field groups are stored in the same file and share a common setting of
 
@@ -49,6 +51,9 @@ Field groups are stored in the same file and share a common setting of
 - `variables`: List of variables names to be output. Variable names are the `short_name` of the CF conventions used in the model state.
 - `nc_title` (optional): Title field of the generated netcdf file.
 - `nc_comment` (optional): Comment to be put to generated netcdf file.
+- `compression` (optional, default is None): compression of the data variables, one of "zlib", "zstd", "bzip2", "szip".
+- `compression_level` (optional, default is 4): compression level between 1 and 9.
+- `horizontal_chunk_size` (optional): number of horizontal points per chunk of the data variables, a chunk holds one time step and all levels.
 
 All fields in the `variables` list will be written out to the same file at regular
 `output_intervals` starting from the `start_time`. The output times **must exactly match a model time step**.
@@ -96,7 +101,7 @@ monitor.store(model_state, time)
 - No transformation are applied to any output data: Fields are written with the same unstructured grid resolutions as they are computed.
 - Horizontal coordinates the latitude and longitude in radians as provided by the ICON grid file.
 - Vertical coordinates are the model levels, there is no transformation to pressure levels.
-- Parallel writing is not yet implemented.
+- In distributed runs each rank writes the entries it owns to a shard file (`<filename>_rankNNNNN.nc`) together with their global indices (variables `global_index_cell`, `global_index_edge`, `global_index_vertex`). Writing needs neither communication nor a netCDF library built with parallel support. The shards are combined into a single file with the global index ordering by `writers.merge_shards`, typically as a post processing step.
 - Global attributes of the datafiles and field metadata is only scarcely available and needs to be augmented.
 ### General concept
 
@@ -130,6 +135,8 @@ The IO module is configurable and can be configured with:
 - `field_groups`: list of field group configuration (see below).
 - `time_units` (optional, default is "seconds since 1970-01-01 00:00:00"): unit used with the time dimension in the data files.
 - `calendar` (optional, default is "proleptic_gregorian"). Caleandar used with the time dimension in the data files.
+- `asynchronous` (optional, default is False): if True, fields are copied to host buffers upon `store` and written to the data files by a background thread while the model continues.
+- `num_output_buffers` (optional, default is 2): number of copies per field group that can be waiting to be written in asynchronous mode. `store` blocks if all of them are in use, which bounds the memory used for output.
 
 Field groups are stored in the same file and share a common setting of
 
@@ -140,6 +147,9 @@ Field groups are stored in the same file and share a common setting of
 - `variables`: List of variables names to be output. Variable names are the `short_name` of the CF conventions used in the model state.
 - `nc_title` (optional): Title field of the generated netcdf file.
 - `nc_comment` (optional): Comment to be put to generated netcdf file.
+- `compression` (optional, default is None): compression of the data variables, one of "zlib", "zstd", "bzip2", "szip".
+- `compression_level` (optional, default is 4): compression level between 1 and 9.
+- `horizontal_chunk_size` (optional): number of horizontal points per chunk of the data variables, a chunk holds one time step and all levels.
 
 All fields in the `variables` list will be written out to the same file at regular
 `output_intervals` starting from the `start_time`. The output times **must exactly match a model time step**.
@@ -187,7 +197,7 @@ monitor.store(model_state, time)
 - No transformation are applied to any output data: Fields are written with the same unstructured grid resolutions as they are computed.
 - Horizontal coordinates the latitude and longitude in radians as provided by the ICON grid file.
 - Vertical coordinates are the model levels, there is no transformation to pressure levels.
-- Parallel writing is not yet implemented.
+- In distributed runs each rank writes the entries it owns to a shard file (`<filename>_rankNNNNN.nc`) together with their global indices (variables `global_index_cell`, `global_index_edge`, `global_index_vertex`). Writing needs neither communication nor a netCDF library built with parallel support. The shards are combined into a single file with the global index ordering by `writers.merge_shards`, typically as a post processing step.
 - Global attributes of the datafiles and field metadata is only scarcely available and needs to be augmented.
 
 """
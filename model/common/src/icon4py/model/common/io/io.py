@@ -10,15 +10,17 @@ import abc
 import dataclasses
 import datetime as dt
 import enum
+import functools
 import logging
 import pathlib
 import uuid
-from typing import Optional, Sequence, TypedDict
+from typing import Callable, Optional, Sequence, TypedDict
 
 from typing_extensions import Required
 
 import icon4py.model.common.exceptions as exceptions
 from icon4py.model.common.components import monitor
+from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import horizontal as h_grid, vertical as v_grid
 from icon4py.model.common.io import cf_utils, ugrid, writers
 
@@ -94,6 +96,11 @@ class FieldGroupIOConfig(Config):
     timesteps_per_file: int = 10
     nc_title: str = "ICON4Py Simulation"
     nc_comment: str = "ICON inspired code in Python and GT4Py"
+    #: compression of the data variables, one of `writers.SUPPORTED_COMPRESSIONS`, None for no compression
+    compression: Optional[str] = None
+    compression_level: int = 4
+    #: number of horizontal points per chunk of the data variables, None for the netCDF default
+    horizontal_chunk_size: Optional[int] = None
 
     def __post_init__(self):
         self.validate()
@@ -112,6 +119,29 @@ class FieldGroupIOConfig(Config):
         if not self.variables:
             raise exceptions.InvalidConfigError("No variables provided for output.")
         self._validate_filename()
+        self._validate_storage_options()
+
+    def _validate_storage_options(self) -> None:
+        if self.compression is not None and self.compression not in writers.SUPPORTED_COMPRESSIONS:
+            raise exceptions.InvalidConfigError(
+                f"Unsupported compression '{self.compression}', use one of {writers.SUPPORTED_COMPRESSIONS}."
+            )
+        if not 1 <= self.compression_level <= 9:
+            raise exceptions.InvalidConfigError(
+                f"Compression level must be between 1 and 9: {self.compression_level}."
+            )
+        if self.horizontal_chunk_size is not None and self.horizontal_chunk_size < 1:
+            raise exceptions.InvalidConfigError(
+                f"Horizontal chunk size must be positive: {self.horizontal_chunk_size}."
+            )
+
+    @property
+    def storage_options(self) -> writers.StorageOptions:
+        return writers.StorageOptions(
+            compression=self.compression,
+            compression_level=self.compression_level,
+            horizontal_chunk_size=self.horizontal_chunk_size,
+        )
 
 
 @dataclasses.dataclass(frozen=True)
@@ -125,6 +155,10 @@ class IOConfig(Config):
 
     output_path: str = "./output/"
     field_groups: Sequence[FieldGroupIOConfig] = ()
+    #: write output in a background thread, the model continues while the data is written
+    asynchronous: bool = False
+    #: number of snapshots per field group that can be pending in asynchronous mode
+    num_output_buffers: int = 2
 
     time_units = cf_utils.DEFAULT_TIME_UNIT
     calendar = cf_utils.DEFAULT_CALENDAR
@@ -133,6 +167,10 @@ class IOConfig(Config):
         self.validate()
 
     def validate(self) -> None:
+        if self.num_output_buffers < 1:
+            raise exceptions.InvalidConfigError(
+                f"Number of output buffers must be positive: {self.num_output_buffers}."
+            )
         if not self.field_groups:
             log.warning("No field configurations provided for output")
         else:
@@ -143,6 +181,10 @@ class IOConfig(Config):
 class IOMonitor(monitor.Monitor):
     """
     Composite Monitor for all IO groups.
+
+    In a distributed run ('decomposition_info' is given and there is more than one rank) every rank
+    writes the entries it owns to a shard file, see `writers.ShardedNETCDFWriter`. The
+    'horizontal_size' is then the size of the global grid.
     """
 
     def __init__(
@@ -152,10 +194,14 @@ class IOMonitor(monitor.Monitor):
         horizontal_size: h_grid.HorizontalGridSize,
         grid_file_name: str,
         grid_id: uuid.UUID,
+        decomposition_info: Optional[decomposition.DecompositionInfo] = None,
+        process_properties: decomposition.ProcessProperties = decomposition.SingleNodeProcessProperties(),  # noqa: B008 # immutable default
     ):
         self.config = config
         self._grid_file = grid_file_name
+        self._process_properties = process_properties
         self._initialize_output()
+        self._writer = writers.AsyncWriter() if config.asynchronous else None
         self._group_monitors = [
             FieldGroupMonitor(
                 conf,
@@ -163,6 +209,10 @@ class IOMonitor(monitor.Monitor):
                 horizontal=horizontal_size,
                 grid_id=grid_id,
                 output_path=self._output_path,
+                writer=self._writer,
+                num_output_buffers=config.num_output_buffers,
+                decomposition_info=decomposition_info,
+                process_properties=process_properties,
             )
             for conf in config.field_groups
         ]
@@ -172,19 +222,36 @@ class IOMonitor(monitor.Monitor):
             return ds.attrs
 
     def _initialize_output(self) -> None:
-        self._create_output_dir()
-        self._write_ugrid()
+        """
+        Create the output directory and write the grid file on rank 0.
+
+        A failure on rank 0 is broadcast, so that all ranks raise an error instead of the other
+        ranks waiting for rank 0 forever.
+        """
+        self._output_path = pathlib.Path(self.config.output_path)
+        error: Optional[Exception] = None
+        if self._process_properties.rank == 0:
+            try:
+                self._create_output_dir()
+                self._write_ugrid()
+            except Exception as e:
+                error = e
+        message = None if error is None else f"{type(error).__name__}: {error}"
+        if self._process_properties.comm_size > 1:
+            # the broadcast also makes the other ranks wait until the directory exists
+            message = self._process_properties.comm.bcast(message, root=0)
+        if error is not None:
+            raise error
+        if message is not None:
+            raise RuntimeError(f"Initialization of the output failed on rank 0: {message}")
 
     def _create_output_dir(self) -> None:
-        path = pathlib.Path(self.config.output_path)
         try:
-            path.mkdir(parents=True, exist_ok=False, mode=0o777)
-            self._output_path = path
-        except OSError as error:
-            log.error(
-                f"Output directory at {path} exists: {error}. Re-run with another output directory. Aborting."
-            )
-            exit(1)
+            self._output_path.mkdir(parents=True, exist_ok=False, mode=0o777)
+        except FileExistsError as error:
+            raise exceptions.InvalidConfigError(
+                f"Output directory at {self._output_path} exists, re-run with another output directory."
+            ) from error
 
     def _write_ugrid(self) -> None:
         writer = ugrid.IconUGridWriter(self._grid_file, self._output_path)
@@ -199,8 +266,12 @@ class IOMonitor(monitor.Monitor):
             m.store(state, model_time, *args, **kwargs)
 
     def close(self):
-        for m in self._group_monitors:
-            m.close()
+        try:
+            for m in self._group_monitors:
+                m.close()
+        finally:
+            if self._writer is not None:
+                self._writer.shutdown()
 
 
 class GlobalFileAttributes(TypedDict, total=False):
@@ -244,6 +315,12 @@ class FieldGroupMonitor(monitor.Monitor):
     Monitor for a group of fields.
 
     This monitor is responsible for storing a group of fields that are output at the same time intervals.
+
+    If an `AsyncWriter` is passed, the fields are copied to host buffers upon `store` and all file
+    operations are done by the writer in the background.
+
+    If a 'decomposition_info' is passed in a run with more than one rank, each rank writes the
+    entries it owns to its own shard file, they can be combined with `writers.merge_shards`.
     """
 
     @property
@@ -263,6 +340,10 @@ class FieldGroupMonitor(monitor.Monitor):
         time_units: str = cf_utils.DEFAULT_TIME_UNIT,
         calendar: str = cf_utils.DEFAULT_CALENDAR,
         output_path: pathlib.Path = pathlib.Path(__file__).parent,
+        writer: Optional[writers.AsyncWriter] = None,
+        num_output_buffers: int = 2,
+        decomposition_info: Optional[decomposition.DecompositionInfo] = None,
+        process_properties: decomposition.ProcessProperties = decomposition.SingleNodeProcessProperties(),  # noqa: B008 # immutable default
     ):
         self._global_attrs: GlobalFileAttributes = {
             "Conventions": "CF-1.7",  # TODO (halungge) check changelog? latest version is 1.11
@@ -287,6 +368,14 @@ class FieldGroupMonitor(monitor.Monitor):
         self._file_counter = 0
         self._current_timesteps_in_file = 0
         self._dataset = None
+        self._writer = writer
+        self._buffers = writers.HostBufferPool(num_output_buffers) if writer is not None else None
+        self._decomposition_info = decomposition_info
+        self._process_properties = process_properties
+
+    @property
+    def is_distributed(self) -> bool:
+        return self._decomposition_info is not None and self._process_properties.comm_size > 1
 
     @property
     def output_path(self) -> pathlib.Path:
@@ -299,6 +388,12 @@ class FieldGroupMonitor(monitor.Monitor):
         self._output_path = path
         self._file_name_pattern = file.name
 
+    def _execute(self, task: Callable[[], None]) -> None:
+        if self._writer is None:
+            task()
+        else:
+            self._writer.submit(task)
+
     def _init_dataset(
         self,
         vertical_params: v_grid.VerticalGrid,
@@ -310,18 +405,41 @@ class FieldGroupMonitor(monitor.Monitor):
                           coordinate once there is terrain k-heights become [horizontal, vertical ] field
 
         """
-        if self._dataset is not None:
-            self._dataset.close()
         self._file_counter += 1
         filename = generate_name(self._file_name_pattern, self._file_counter)
         filename = self._output_path.joinpath(filename)
-        df = writers.NETCDFWriter(
-            filename,
-            vertical_params,
-            horizontal_size,
-            self._time_properties,
-            self._global_attrs,
+        self._execute(
+            functools.partial(self._open_dataset, filename, vertical_params, horizontal_size)
         )
+
+    def _open_dataset(
+        self,
+        filename: pathlib.Path,
+        vertical_params: v_grid.VerticalGrid,
+        horizontal_size: h_grid.HorizontalGridSize,
+    ) -> None:
+        if self._dataset is not None:
+            self._dataset.close()
+        if self.is_distributed:
+            df = writers.ShardedNETCDFWriter(
+                filename,
+                vertical_params,
+                horizontal_size,
+                self._time_properties,
+                self._global_attrs,
+                decomposition_info=self._decomposition_info,
+                process_properties=self._process_properties,
+                storage_options=self.config.storage_options,
+            )
+        else:
+            df = writers.NETCDFWriter(
+                filename,
+                vertical_params,
+                horizontal_size,
+                self._time_properties,
+                self._global_attrs,
+                storage_options=self.config.storage_options,
+            )
         df.initialize_dataset()
         self._dataset = df
 
@@ -337,7 +455,6 @@ class FieldGroupMonitor(monitor.Monitor):
         """
         # TODO (halungge) how to handle non time matches? That is if the model time jumps over the output time
         if self._at_capture_time(model_time):
-            # TODO (halungge) this should do a deep copy of the data
             try:
                 state_to_store = {field: state[field] for field in self._field_names}
             except KeyError as e:
@@ -366,14 +483,32 @@ class FieldGroupMonitor(monitor.Monitor):
         return 0 < self.config.timesteps_per_file == self._current_timesteps_in_file
 
     def _append_data(self, state_to_store: dict, model_time: dt.datetime) -> None:
-        self._dataset.append(state_to_store, model_time)
+        if self._buffers is None:
+            self._dataset.append(state_to_store, model_time)
+            return
+
+        # do not wait for the buffers of a failed writer, they might never be released
+        self._writer.check()
+        snapshot, buffers = self._buffers.snapshot(state_to_store)
+        try:
+            self._writer.submit(
+                lambda: self._dataset.append(snapshot, model_time),
+                cleanup=lambda: self._buffers.release(buffers),
+            )
+        except Exception:
+            self._buffers.release(buffers)
+            raise
 
     def _at_capture_time(self, model_time) -> bool:
         return self._next_output_time == model_time
 
-    def close(self) -> None:
+    def _close_dataset(self) -> None:
         if self._dataset is not None:
             self._dataset.close()
+
+    def close(self) -> None:
+        if self._file_counter > 0:
+            self._execute(self._close_dataset)
             self._current_timesteps_in_file = 0
 
 
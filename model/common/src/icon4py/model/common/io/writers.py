@@ -9,18 +9,24 @@
 import dataclasses
 import datetime as dt
 import functools
+import itertools
 import logging
 import pathlib
-from typing import Final
+import queue
+import threading
+from typing import Callable, Final, Optional, Sequence, Union
 
+import gt4py.next as gtx
 import netCDF4 as nc
 import numpy as np
 import xarray as xr
 
 import icon4py.model.common.states.metadata
+from icon4py.model.common import dimension as dims
 from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import horizontal as h_grid, vertical as v_grid
 from icon4py.model.common.io import cf_utils
+from icon4py.model.common.utils import data_allocation as data_alloc
 
 
 EDGE: Final[str] = "edge"
@@ -40,6 +46,43 @@ class TimeProperties:
     calendar: str
 
 
+#: compression algorithms of netCDF4 that can be configured for the output
+SUPPORTED_COMPRESSIONS: Final[tuple[str, ...]] = ("zlib", "zstd", "bzip2", "szip")
+
+#: prefix of the variables holding the global indices of the entries in a shard file
+GLOBAL_INDEX_PREFIX: Final[str] = "global_index_"
+#: prefix of the global attributes holding the global size of the horizontal dimensions in a shard file
+GLOBAL_SIZE_PREFIX: Final[str] = "global_size_"
+SHARD_RANK: Final[str] = "shard_rank"
+SHARD_COUNT: Final[str] = "shard_count"
+
+_HORIZONTAL_DIMENSIONS: Final[dict[str, gtx.Dimension]] = {
+    CELL: dims.CellDim,
+    EDGE: dims.EdgeDim,
+    VERTEX: dims.VertexDim,
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class StorageOptions:
+    """Compression and chunking of the data variables of a netcdf file."""
+
+    compression: Optional[str] = None
+    compression_level: int = 4
+    #: number of horizontal points in a chunk, a chunk always contains one time step and all levels
+    horizontal_chunk_size: Optional[int] = None
+
+    def variable_kwargs(self, shape: tuple[int, ...]) -> dict:
+        """Keyword arguments for 'createVariable' of a variable with dimensions (time, ..., horizontal)."""
+        kwargs = {}
+        if self.compression is not None:
+            kwargs.update(compression=self.compression, complevel=self.compression_level)
+        if self.horizontal_chunk_size is not None:
+            horizontal = max(1, min(self.horizontal_chunk_size, shape[-1]))
+            kwargs["chunksizes"] = (1, *shape[1:-1], horizontal)
+        return kwargs
+
+
 class NETCDFWriter:
     """
     Writer for netcdf files.
@@ -57,8 +100,10 @@ class NETCDFWriter:
         time_properties: TimeProperties,
         global_attrs: dict,
         process_properties: decomposition.ProcessProperties = processor_properties,
+        storage_options: StorageOptions = StorageOptions(),  # noqa: B008 # immutable default
     ):
         self._file_name = str(file_name)
+        self._storage_options = storage_options
         self._process_properties = process_properties
         self._time_properties = time_properties
         self._vertical_params = vertical
@@ -77,8 +122,8 @@ class NETCDFWriter:
     def num_interfaces(self) -> int:
         return self._vertical_params.interface_physical_height.ndarray.shape[0]
 
-    def initialize_dataset(self) -> None:
-        self.dataset = nc.Dataset(
+    def _open_dataset(self) -> nc.Dataset:
+        return nc.Dataset(
             self._file_name,
             "w",
             format="NETCDF4",
@@ -86,15 +131,28 @@ class NETCDFWriter:
             parallel=self._process_properties.comm_size > 1,
             comm=self._process_properties.comm,
         )
+
+    def _horizontal_sizes(self) -> dict[str, int]:
+        return {
+            CELL: self._horizontal_size.num_cells,
+            VERTEX: self._horizontal_size.num_vertices,
+            EDGE: self._horizontal_size.num_edges,
+        }
+
+    def _to_file_layout(self, data: xr.DataArray) -> xr.DataArray:
+        """Hook to transform the data of a field before it is written."""
+        return data
+
+    def initialize_dataset(self) -> None:
+        self.dataset = self._open_dataset()
         log.info(f"Creating file {self._file_name} at {self.dataset.filepath()}")
         self.dataset.setncatts({k: str(v) for (k, v) in self.attrs.items()})
         ## create dimensions all except time are fixed
         self.dataset.createDimension(TIME, None)
         self.dataset.createDimension(MODEL_LEVEL, self.num_levels)
         self.dataset.createDimension(MODEL_INTERFACE_LEVEL, self.num_interfaces)
-        self.dataset.createDimension(CELL, self._horizontal_size.num_cells)
-        self.dataset.createDimension(VERTEX, self._horizontal_size.num_vertices)
-        self.dataset.createDimension(EDGE, self._horizontal_size.num_edges)
+        for name, size in self._horizontal_sizes().items():
+            self.dataset.createDimension(name, size)
         log.debug(f"Creating dimensions {self.dataset.dimensions} in {self._file_name}")
         # create time variables
         times = self.dataset.createVariable(TIME, "f8", (TIME,))
@@ -149,12 +207,17 @@ class NETCDFWriter:
         time[time_pos] = cf_utils.date2num(model_time, units=time.units, calendar=time.calendar)
         for var_name, new_slice in state_to_append.items():
             standard_name = new_slice.standard_name
-            new_slice = cf_utils.to_canonical_dim_order(new_slice)
+            new_slice = self._to_file_layout(cf_utils.to_canonical_dim_order(new_slice))
             assert standard_name is not None, f"No short_name provided for {standard_name}."
             ds_var = filter_by_standard_name(self.dataset.variables, standard_name)
             if not ds_var:
                 dimensions = ("time", *new_slice.dims)
-                new_var = self.dataset.createVariable(var_name, new_slice.dtype, dimensions)
+                new_var = self.dataset.createVariable(
+                    var_name,
+                    new_slice.dtype,
+                    dimensions,
+                    **self._storage_options.variable_kwargs((1, *new_slice.shape)),
+                )
                 new_var[0, :] = new_slice.data
                 new_var.units = new_slice.units
                 new_var.standard_name = new_slice.standard_name
@@ -171,8 +234,8 @@ class NETCDFWriter:
                     len(new_slice.dims) == len(dims) - 1
                 ), f"Data variable dimensions do not match for {standard_name}."
 
-                # TODO (magdalena) change for parallel/distributed case: where we write at `global_index` field on the node for the horizontal dim.
                 # we can acutally assume fixed index ordering here, input arrays are  re-shaped to canonical order (see above)
+                # in the distributed case the data has been reduced to the owned entries (see `ShardedNETCDFWriter`)
 
                 right = (slice(None),) * (len(dims) - 1)
                 expand_slice = (
@@ -194,5 +257,315 @@ class NETCDFWriter:
         return self.dataset.variables
 
 
+def generate_shard_name(file_name: Union[pathlib.Path, str], rank: int) -> pathlib.Path:
+    file_name = pathlib.Path(file_name)
+    return file_name.with_name(f"{file_name.stem}_rank{rank:0>5}{file_name.suffix}")
+
+
+def find_shards(file_name: Union[pathlib.Path, str]) -> list[pathlib.Path]:
+    """Return the shard files written for 'file_name' ordered by rank."""
+    file_name = pathlib.Path(file_name)
+    return sorted(file_name.parent.glob(f"{file_name.stem}_rank[0-9]*{file_name.suffix}"))
+
+
+class ShardedNETCDFWriter(NETCDFWriter):
+    """
+    Writer for the output of a distributed run.
+
+    Every rank writes the entries it owns into its own file (shard), together with their global
+    indices. Writing does not need any communication, nor a netCDF library built with parallel
+    support. The shards are combined into a single global file by `merge_shards`, which can be
+    done after the run.
+
+    Args:
+        file_name: name of the global file, the shard file name is derived from it by adding the rank
+        horizontal: global sizes of the horizontal dimensions
+        decomposition_info: decomposition of the local domain of this rank
+    """
+
+    def __init__(
+        self,
+        file_name: pathlib.Path,
+        vertical: v_grid.VerticalGrid,
+        horizontal: h_grid.HorizontalGridSize,
+        time_properties: TimeProperties,
+        global_attrs: dict,
+        decomposition_info: decomposition.DecompositionInfo,
+        process_properties: decomposition.ProcessProperties = processor_properties,
+        storage_options: StorageOptions = StorageOptions(),  # noqa: B008 # immutable default
+    ):
+        super().__init__(
+            generate_shard_name(file_name, process_properties.rank),
+            vertical,
+            horizontal,
+            time_properties,
+            global_attrs,
+            process_properties,
+            storage_options,
+        )
+        self._owned_local_index = {
+            name: data_alloc.as_numpy(
+                decomposition_info.local_index(dim, decomposition.DecompositionInfo.EntryType.OWNED)
+            )
+            for name, dim in _HORIZONTAL_DIMENSIONS.items()
+        }
+        self._owned_global_index = {
+            name: data_alloc.as_numpy(
+                decomposition_info.global_index(
+                    dim, decomposition.DecompositionInfo.EntryType.OWNED
+                )
+            )
+            for name, dim in _HORIZONTAL_DIMENSIONS.items()
+        }
+
+    def _open_dataset(self) -> nc.Dataset:
+        return nc.Dataset(self._file_name, "w", format="NETCDF4", persist=True)
+
+    def _horizontal_sizes(self) -> dict[str, int]:
+        return {name: index.shape[0] for name, index in self._owned_local_index.items()}
+
+    def _to_file_layout(self, data: xr.DataArray) -> xr.DataArray:
+        horizontal = data.dims[-1]
+        if horizontal not in self._owned_local_index:
+            return data
+        return data.isel({horizontal: self._owned_local_index[horizontal]})
+
+    def initialize_dataset(self) -> None:
+        super().initialize_dataset()
+        self.dataset.setncatts(
+            {
+                SHARD_RANK: self._process_properties.rank,
+                SHARD_COUNT: self._process_properties.comm_size,
+                **{
+                    f"{GLOBAL_SIZE_PREFIX}{name}": size
+                    for name, size in super()._horizontal_sizes().items()
+                },
+            }
+        )
+        for name, index in self._owned_global_index.items():
+            global_index = self.dataset.createVariable(
+                f"{GLOBAL_INDEX_PREFIX}{name}", "i8", (name,)
+            )
+            global_index.long_name = f"global index of the {name}s in this shard"
+            global_index[:] = index
+
+
+def _contiguous_runs(index: np.ndarray) -> np.ndarray:
+    """Split a sorted index array into runs of consecutive values, return the run boundaries."""
+    breaks = np.flatnonzero(np.diff(index) != 1) + 1
+    return np.concatenate(([0], breaks, [index.shape[0]]))
+
+
+def merge_shards(
+    shards: Sequence[Union[pathlib.Path, str]],
+    target: Union[pathlib.Path, str],
+    storage_options: StorageOptions = StorageOptions(),  # noqa: B008 # immutable default
+) -> None:
+    """
+    Merge the shard files written by a `ShardedNETCDFWriter` into a global file.
+
+    The data of every shard is written at its global indices, runs of consecutive global indices
+    are written at once.
+
+    Args:
+        shards: all shard files of one output file
+        target: name of the global file
+        storage_options: compression and chunking of the data variables in the global file
+    """
+    if not shards:
+        raise ValueError("No shard files to merge.")
+    shard_attrs = (SHARD_RANK, SHARD_COUNT)
+    with nc.Dataset(shards[0], "r") as first, nc.Dataset(target, "w", format="NETCDF4") as out:
+        if first.getncattr(SHARD_COUNT) != len(shards):
+            raise ValueError(
+                f"Incomplete set of shards: expected {first.getncattr(SHARD_COUNT)} got {len(shards)}."
+            )
+        out.setncatts(
+            {
+                k: first.getncattr(k)
+                for k in first.ncattrs()
+                if k not in shard_attrs and not k.startswith(GLOBAL_SIZE_PREFIX)
+            }
+        )
+        for name, dimension in first.dimensions.items():
+            if dimension.isunlimited():
+                size = None
+            elif name in _HORIZONTAL_DIMENSIONS:
+                size = int(first.getncattr(f"{GLOBAL_SIZE_PREFIX}{name}"))
+            else:
+                size = len(dimension)
+            out.createDimension(name, size)
+
+        for name, variable in first.variables.items():
+            if name.startswith(GLOBAL_INDEX_PREFIX):
+                continue
+            is_distributed = variable.dimensions[-1] in _HORIZONTAL_DIMENSIONS
+            kwargs = (
+                storage_options.variable_kwargs(
+                    tuple(len(out.dimensions[d]) for d in variable.dimensions)
+                )
+                if is_distributed
+                else {}
+            )
+            new_var = out.createVariable(name, variable.dtype, variable.dimensions, **kwargs)
+            new_var.setncatts({k: variable.getncattr(k) for k in variable.ncattrs()})
+            if not is_distributed:
+                new_var[:] = variable[:]
+
+    with nc.Dataset(target, "a") as out:
+        for shard in shards:
+            with nc.Dataset(shard, "r") as ds:
+                ds.set_auto_mask(False)
+                sorted_index = {}
+                for name in _HORIZONTAL_DIMENSIONS:
+                    global_index = ds.variables[f"{GLOBAL_INDEX_PREFIX}{name}"][:]
+                    order = np.argsort(global_index)
+                    sorted_index[name] = (global_index[order], order)
+                for name, variable in ds.variables.items():
+                    horizontal = variable.dimensions[-1]
+                    if name.startswith(GLOBAL_INDEX_PREFIX) or horizontal not in sorted_index:
+                        continue
+                    global_index, order = sorted_index[horizontal]
+                    data = variable[:]
+                    runs = _contiguous_runs(global_index)
+                    for start, end in itertools.pairwise(runs):
+                        if start == end:
+                            continue
+                        out.variables[name][
+                            ..., global_index[start] : global_index[end - 1] + 1
+                        ] = data[..., order[start:end]]
+    log.info(f"merged {len(shards)} shards into {target}")
+
+
+def _allocate_host_buffer(array: data_alloc.NDArray) -> np.ndarray:
+    if isinstance(array, np.ndarray):
+        return np.empty(array.shape, dtype=array.dtype)
+    import cupyx
+
+    # page-locked memory for fast and asynchronous device to host transfers
+    return cupyx.empty_pinned(array.shape, dtype=array.dtype)
+
+
+def _copy_to_host(array: data_alloc.NDArray, buffer: np.ndarray) -> None:
+    if isinstance(array, np.ndarray):
+        np.copyto(buffer, array)
+    else:
+        array.get(out=buffer)
+
+
+class HostBufferPool:
+    """
+    Bounded pool of host buffers to take snapshots of output fields.
+
+    A snapshot copies the fields into a set of host buffers, such that the model can continue to
+    update the fields while the snapshot is written. The number of buffer sets bounds the memory
+    used by pending output: taking a snapshot blocks until a buffer set is released.
+
+    Args:
+        size: number of buffer sets
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"Buffer pool needs at least one buffer set, got {size}.")
+        self._free: queue.Queue[dict[str, np.ndarray]] = queue.Queue()
+        for _ in range(size):
+            self._free.put({})
+
+    def snapshot(
+        self, state: dict[str, xr.DataArray]
+    ) -> tuple[dict[str, xr.DataArray], dict[str, np.ndarray]]:
+        """
+        Copy the fields of a state into a free buffer set.
+
+        Returns:
+            the copied state and the buffer set, which has to be released once the copy is written
+        """
+        buffers = self._free.get()
+        snapshot = {}
+        for name, field in state.items():
+            data = field.data
+            buffer = buffers.get(name)
+            if buffer is None or buffer.shape != data.shape or buffer.dtype != data.dtype:
+                buffer = _allocate_host_buffer(data)
+                buffers[name] = buffer
+            _copy_to_host(data, buffer)
+            snapshot[name] = field.copy(deep=False, data=buffer)
+        return snapshot, buffers
+
+    def release(self, buffers: dict[str, np.ndarray]) -> None:
+        self._free.put(buffers)
+
+
+class AsyncWriter:
+    """
+    Execute write tasks in a background thread.
+
+    Tasks are executed one by one in submission order, so that all file operations happen on the
+    same thread in the same order as on the model side. An error raised by a task is re-raised
+    on the calling thread upon every later call to `check`, `submit`, `flush` or `shutdown`: the
+    tasks submitted after the failing one are not executed, only their cleanup is.
+    """
+
+    def __init__(self, name: str = "icon4py-output-writer"):
+        self._tasks: queue.Queue[
+            Optional[tuple[Callable[[], None], Optional[Callable[[], None]]]]
+        ] = queue.Queue()
+        self._error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._tasks.get()
+            try:
+                if item is None:
+                    return
+                task, cleanup = item
+                try:
+                    if self._error is None:
+                        task()
+                finally:
+                    if cleanup is not None:
+                        cleanup()
+            except Exception as error:
+                log.error(f"asynchronous output failed: {error}")
+                if self._error is None:
+                    self._error = error
+            finally:
+                self._tasks.task_done()
+
+    def check(self) -> None:
+        """Raise the error of a failed task, if any."""
+        if self._error is not None:
+            raise self._error
+
+    def submit(
+        self, task: Callable[[], None], cleanup: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Queue a task for execution.
+
+        Args:
+            task: the task to execute, skipped if an earlier task failed
+            cleanup: executed after the task, also if the task failed or was skipped
+        """
+        self.check()
+        if not self._thread.is_alive():
+            raise RuntimeError("Output writer has already been shut down.")
+        self._tasks.put((task, cleanup))
+
+    def flush(self) -> None:
+        """Block until all submitted tasks are done."""
+        self._tasks.join()
+        self.check()
+
+    def shutdown(self) -> None:
+        if self._thread.is_alive():
+            self._tasks.put(None)
+            self._thread.join()
+        self.check()
+
+
 def filter_by_standard_name(model_state: dict, value: str) -> dict:
-    return {k: v for k, v in model_state.items() if value == v.standard_name}
+    return {k: v for k, v in model_state.items() if value == getattr(v, "standard_name", None)}
@@ -0,0 +1,95 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Batched searches in vertical columns of heights.
+
+Heights in ICON decrease with the level index (level 0 is the model top). The functions in this
+module search many values in many such columns at once: the search is a binary search executed
+in lockstep for all values, which needs a fixed number of vectorized steps (log2 of the number of
+levels) and works with NumPy as well as CuPy arrays.
+"""
+
+from types import ModuleType
+
+import numpy as np
+
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+def count_levels_above(
+    columns: data_alloc.NDArray,
+    values: data_alloc.NDArray,
+    inclusive: bool = False,
+    array_ns: ModuleType = np,
+) -> data_alloc.NDArray:
+    """
+    Count the number of levels in a column that are higher than a value.
+
+    This is the equivalent of `searchsorted` for columns sorted in decreasing order.
+
+    Args:
+        columns: shape (n, m), heights decreasing along the second axis
+        values: shape (n, l), values to search in the column of the same row
+        inclusive: if True count levels higher than or equal to the value
+    Returns:
+        shape (n, l), number of levels 'k' with columns[i, k] > values[i, j] (or >=)
+    """
+    num_levels = columns.shape[1]
+    lower = array_ns.zeros(values.shape, dtype=np.int64)
+    upper = array_ns.full(values.shape, num_levels, dtype=np.int64)
+    for _ in range(num_levels.bit_length()):
+        middle = (lower + upper) // 2
+        height = array_ns.take_along_axis(columns, array_ns.minimum(middle, num_levels - 1), axis=1)
+        is_above = (height >= values) if inclusive else (height > values)
+        is_above &= middle < upper
+        lower = array_ns.where(is_above, middle + 1, lower)
+        upper = array_ns.where(is_above, upper, middle)
+    return lower
+
+
+def find_bracketing_level(
+    columns: data_alloc.NDArray,
+    values: data_alloc.NDArray,
+    start: data_alloc.NDArray = None,
+    from_top: bool = True,
+    array_ns: ModuleType = np,
+) -> tuple[data_alloc.NDArray, data_alloc.NDArray]:
+    """
+    Find the level 'k' with columns[k] >= value >= columns[k + 1] for every value.
+
+    The result is the same as that of a linear search through the levels: starting at 'start'
+    and going down if 'from_top', otherwise starting at the bottom and going up, returning the
+    first bracketing level encountered.
+
+    Args:
+        columns: shape (n, m), heights strictly decreasing along the second axis
+        values: shape (n, l), values to search in the column of the same row
+        start: shape (n, 1) or (n, l), first level searched if 'from_top', defaults to 0
+        from_top: search direction
+    Returns:
+        tuple of shape (n, l) arrays: the bracketing level (in [0, m - 2]) and whether a
+        bracketing level was found, levels of values without bracketing level are undefined
+    """
+    num_levels = columns.shape[1]
+    if from_top:
+        # the first level whose lower neighbor is not above the value
+        level = count_levels_above(columns[:, 1:], values, array_ns=array_ns)
+        if start is not None:
+            level = array_ns.maximum(level, start)
+        is_valid = level <= num_levels - 2
+    else:
+        # the last level that is not below the value
+        level = count_levels_above(columns, values, inclusive=True, array_ns=array_ns) - 1
+        is_valid = True
+    level = array_ns.clip(level, 0, num_levels - 2)
+    found = (
+        is_valid
+        & (array_ns.take_along_axis(columns, level, axis=1) >= values)
+        & (array_ns.take_along_axis(columns, level + 1, axis=1) <= values)
+    )
+    return level, found
@@ -10,6 +10,7 @@ from types import ModuleType
 
 import numpy as np
 
+from icon4py.model.common.math import column_search
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
@@ -25,85 +26,32 @@ def compute_max_nbhgt_array_ns(
     return max_nbhgt
 
 
-def _compute_nbidx(
-    k_range: range,
+def _compute_nbidx_and_z_vintcoeff(
     z_mc: data_alloc.NDArray,
     z_mc_off: data_alloc.NDArray,
-    nbidx: data_alloc.NDArray,
-    jc: int,
-    nlev: int,
-) -> data_alloc.NDArray:
-    for ind in range(3):
-        jk_start = nlev - 1
-        for jk in reversed(k_range):
-            for jk1 in reversed(range(jk_start)):
-                if (
-                    z_mc[jc, jk] <= z_mc_off[jc, ind, jk1]
-                    and z_mc[jc, jk] >= z_mc_off[jc, ind, jk1 + 1]
-                ):
-                    nbidx[jc, ind, jk] = jk1
-                    jk_start = jk1 + 1
-                    break
-
-    return nbidx[jc, :, :]
-
-
-def _compute_z_vintcoeff(
-    k_range: range,
-    z_mc: data_alloc.NDArray,
-    z_mc_off: data_alloc.NDArray,
-    z_vintcoeff: data_alloc.NDArray,
-    jc: int,
-    nlev: int,
-) -> data_alloc.NDArray:
-    for ind in range(3):
-        jk_start = nlev - 1
-        for jk in reversed(k_range):
-            for jk1 in reversed(range(jk_start)):
-                if (
-                    z_mc[jc, jk] <= z_mc_off[jc, ind, jk1]
-                    and z_mc[jc, jk] >= z_mc_off[jc, ind, jk1 + 1]
-                ):
-                    z_vintcoeff[jc, ind, jk] = (z_mc[jc, jk] - z_mc_off[jc, ind, jk1 + 1]) / (
-                        z_mc_off[jc, ind, jk1] - z_mc_off[jc, ind, jk1 + 1]
-                    )
-                    jk_start = jk1 + 1
-                    break
-
-    return z_vintcoeff[jc, :, :]
-
-
-def _compute_ls_params(
-    k_start: list,
-    k_end: list,
-    maxslp_avg: data_alloc.NDArray,
-    maxhgtd_avg: data_alloc.NDArray,
-    c_owner_mask: data_alloc.NDArray,
-    thslp_zdiffu: float,
-    thhgtd_zdiffu: float,
-    cell_nudging: int,
-    n_cells: int,
-    nlev: int,
-) -> tuple[list, int, int]:
-    indlist = [0] * n_cells
-    listreduce = 0
-    ji = -1
-    ji_ind = -1
-
-    for jc in range(cell_nudging, n_cells):
-        if (
-            maxslp_avg[jc, nlev - 1] >= thslp_zdiffu or maxhgtd_avg[jc, nlev - 1] >= thhgtd_zdiffu
-        ) and c_owner_mask[jc]:
-            ji += 1
-            indlist[ji] = jc
-
-            if all((k_start[jc], k_end[jc])) and k_start[jc] > k_end[jc]:
-                listreduce += 1
-            else:
-                ji_ind += 1
-                indlist[ji_ind] = jc
-
-    return indlist, listreduce, ji
+    array_ns: ModuleType = np,
+) -> tuple[data_alloc.NDArray, data_alloc.NDArray]:
+    """
+    Find the full levels of the neighbor cells bracketing the full levels of a cell.
+
+    Returns:
+        the neighbor level above the height of each level and the interpolation weight of that
+        neighbor level, the level is 1 and the weight 0 where no neighbor level brackets it
+    """
+    n_cells, n_c2e2c, nlev = z_mc_off.shape
+    z_mc_off = z_mc_off.reshape(n_cells * n_c2e2c, nlev)
+    z_mc = array_ns.repeat(z_mc, n_c2e2c, axis=0)
+    level, found = column_search.find_bracketing_level(
+        z_mc_off, z_mc, from_top=False, array_ns=array_ns
+    )
+    z_above = array_ns.take_along_axis(z_mc_off, level, axis=1)
+    z_below = array_ns.take_along_axis(z_mc_off, level + 1, axis=1)
+    nbidx = array_ns.where(found, level, 1)
+    z_vintcoeff = array_ns.where(found, (z_mc - z_below) / (z_above - z_below), 0.0)
+    return (
+        nbidx.reshape(n_cells, n_c2e2c, nlev),
+        z_vintcoeff.reshape(n_cells, n_c2e2c, nlev),
+    )
 
 
 def _compute_k_start_end(
@@ -111,33 +59,27 @@ def _compute_k_start_end(
     max_nbhgt: data_alloc.NDArray,
     maxslp_avg: data_alloc.NDArray,
     maxhgtd_avg: data_alloc.NDArray,
-    c_owner_mask: data_alloc.NDArray,
     thslp_zdiffu: float,
     thhgtd_zdiffu: float,
-    cell_nudging: int,
-    n_cells: int,
     nlev: int,
-) -> tuple[list, list]:
-    k_start = [None] * n_cells
-    k_end = [None] * n_cells
-    for jc in range(cell_nudging, n_cells):
-        if (
-            maxslp_avg[jc, nlev - 1] >= thslp_zdiffu or maxhgtd_avg[jc, nlev - 1] >= thhgtd_zdiffu
-        ) and c_owner_mask[jc]:
-            for jk in reversed(range(nlev)):
-                if z_mc[jc, jk] >= max_nbhgt[jc]:
-                    k_end[jc] = jk + 1
-                    break
-
-            for jk in range(nlev):
-                if maxslp_avg[jc, jk] >= thslp_zdiffu or maxhgtd_avg[jc, jk] >= thhgtd_zdiffu:
-                    k_start[jc] = jk
-                    break
-
-            if all((k_start[jc], k_end[jc])) and k_start[jc] > k_end[jc]:
-                k_start[jc] = nlev - 1
-
-    return k_start, k_end
+    array_ns: ModuleType = np,
+) -> tuple[data_alloc.NDArray, data_alloc.NDArray, data_alloc.NDArray, data_alloc.NDArray]:
+    """
+    Compute the range of levels with reduced horizontal diffusion of all cells.
+
+    Returns:
+        first level of the range, end of the range (the level below the lowest level above the
+        highest neighbor cell), whether the end exists and whether the range has been reduced
+        to the lowest level because it is empty
+    """
+    is_steep = (maxslp_avg >= thslp_zdiffu) | (maxhgtd_avg >= thhgtd_zdiffu)
+    is_above_nbhgt = z_mc >= max_nbhgt[:, np.newaxis]
+    k_start = array_ns.argmax(is_steep, axis=1)
+    k_end = nlev - array_ns.argmax(is_above_nbhgt[:, ::-1], axis=1)
+    has_k_end = array_ns.any(is_above_nbhgt, axis=1)
+    is_reduced = has_k_end & (k_start > 0) & (k_start > k_end)
+    k_start = array_ns.where(is_reduced, nlev - 1, k_start)
+    return k_start, k_end, has_k_end, is_reduced
 
 
 def compute_diffusion_metrics(
@@ -155,68 +97,46 @@ def compute_diffusion_metrics(
 ) -> tuple[data_alloc.NDArray, data_alloc.NDArray, data_alloc.NDArray, data_alloc.NDArray]:
     n_cells = c2e2c.shape[0]
     n_c2e2c = c2e2c.shape[1]
-    z_mc_off = z_mc[c2e2c]
-    nbidx = array_ns.ones(shape=(n_cells, n_c2e2c, nlev), dtype=int)
-    z_vintcoeff = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
-    mask_hdiff = array_ns.zeros(shape=(n_cells, nlev), dtype=bool)
-    zd_vertoffset_dsl = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
-    zd_intcoef_dsl = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
-    zd_diffcoef_dsl = array_ns.zeros(shape=(n_cells, nlev))
-    k_start, k_end = _compute_k_start_end(
+    k_start, k_end, has_k_end, is_reduced = _compute_k_start_end(
         z_mc=z_mc,
         max_nbhgt=max_nbhgt,
         maxslp_avg=maxslp_avg,
         maxhgtd_avg=maxhgtd_avg,
-        c_owner_mask=c_owner_mask,
         thslp_zdiffu=thslp_zdiffu,
         thhgtd_zdiffu=thhgtd_zdiffu,
-        cell_nudging=cell_nudging,
-        n_cells=n_cells,
         nlev=nlev,
+        array_ns=array_ns,
     )
+    is_selected = (
+        (maxslp_avg[:, nlev - 1] >= thslp_zdiffu) | (maxhgtd_avg[:, nlev - 1] >= thhgtd_zdiffu)
+    ) & array_ns.asarray(c_owner_mask, dtype=bool)
+    is_selected[:cell_nudging] = False
+    # cells with a reduced range are left out, as is the last cell of the remaining list
+    cells = array_ns.flatnonzero(is_selected & ~is_reduced)[:-1]
+    # ranges starting at level 0 are skipped
+    cells = cells[has_k_end[cells] & (k_start[cells] > 0)]
+
+    levels = array_ns.arange(nlev)[np.newaxis, :]
+    mask_hdiff = array_ns.zeros(shape=(n_cells, nlev), dtype=bool)
+    mask_hdiff[cells] = (levels >= k_start[cells, np.newaxis]) & (levels < k_end[cells, np.newaxis])
 
-    indlist, listreduce, ji = _compute_ls_params(
-        k_start=k_start,
-        k_end=k_end,
-        maxslp_avg=maxslp_avg,
-        maxhgtd_avg=maxhgtd_avg,
-        c_owner_mask=c_owner_mask,
-        thslp_zdiffu=thslp_zdiffu,
-        thhgtd_zdiffu=thhgtd_zdiffu,
-        cell_nudging=cell_nudging,
-        n_cells=n_cells,
-        nlev=nlev,
+    nbidx, z_vintcoeff = _compute_nbidx_and_z_vintcoeff(
+        z_mc[cells], z_mc[c2e2c[cells]], array_ns=array_ns
     )
-
-    listdim = ji - listreduce
-
-    for ji in range(listdim):
-        jc = indlist[ji]
-        k_range = range(k_start[jc], k_end[jc])
-        if all((k_range)):
-            nbidx[jc, :, :] = _compute_nbidx(k_range, z_mc, z_mc_off, nbidx, jc, nlev)
-            z_vintcoeff[jc, :, :] = _compute_z_vintcoeff(
-                k_range, z_mc, z_mc_off, z_vintcoeff, jc, nlev
-            )
-
-            zd_intcoef_dsl[jc, :, k_range] = z_vintcoeff[jc, :, k_range]
-            zd_vertoffset_dsl[jc, :, k_range] = nbidx[jc, :, k_range] - array_ns.transpose(
-                [k_range] * 3
-            )
-            mask_hdiff[jc, k_range] = True
-
-            zd_diffcoef_dsl_var = array_ns.maximum(
-                0.0,
-                array_ns.maximum(
-                    array_ns.sqrt(array_ns.maximum(0.0, maxslp_avg[jc, k_range] - thslp_zdiffu))
-                    / 250.0,
-                    2.0e-4
-                    * array_ns.sqrt(
-                        array_ns.maximum(0.0, maxhgtd_avg[jc, k_range] - thhgtd_zdiffu)
-                    ),
-                ),
-            )
-            zd_diffcoef_dsl[jc, k_range] = array_ns.minimum(0.002, zd_diffcoef_dsl_var)
+    mask = mask_hdiff[cells, np.newaxis, :]
+    zd_intcoef_dsl = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
+    zd_intcoef_dsl[cells] = array_ns.where(mask, z_vintcoeff, 0.0)
+    zd_vertoffset_dsl = array_ns.zeros(shape=(n_cells, n_c2e2c, nlev))
+    zd_vertoffset_dsl[cells] = array_ns.where(mask, nbidx - levels[:, np.newaxis, :], 0.0)
+
+    zd_diffcoef_dsl_var = array_ns.maximum(
+        0.0,
+        array_ns.maximum(
+            array_ns.sqrt(array_ns.maximum(0.0, maxslp_avg - thslp_zdiffu)) / 250.0,
+            2.0e-4 * array_ns.sqrt(array_ns.maximum(0.0, maxhgtd_avg - thhgtd_zdiffu)),
+        ),
+    )
+    zd_diffcoef_dsl = array_ns.where(mask_hdiff, array_ns.minimum(0.002, zd_diffcoef_dsl_var), 0.0)
 
     # flatten first two dims:
     zd_intcoef_dsl = zd_intcoef_dsl.reshape(
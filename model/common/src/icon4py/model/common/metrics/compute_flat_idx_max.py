@@ -25,19 +25,16 @@ def compute_flat_idx_max(
     array_ns: ModuleType = np,
 ) -> data_alloc.NDArray:
     z_me = array_ns.sum(z_mc[e2c] * array_ns.expand_dims(c_lin_e, axis=-1), axis=1)
-    z_ifc_e_0 = z_ifc[e2c[:, 0]]
-    z_ifc_e_k_0 = array_ns.roll(z_ifc_e_0, -1, axis=1)
-    z_ifc_e_1 = z_ifc[e2c[:, 1]]
-    z_ifc_e_k_1 = array_ns.roll(z_ifc_e_1, -1, axis=1)
-    flat_idx = array_ns.zeros_like(z_me)
-    for je in range(horizontal_lower, horizontal_upper):
-        for jk in range(k_lev.shape[0] - 1):
-            if (
-                (z_me[je, jk] <= z_ifc_e_0[je, jk])
-                and (z_me[je, jk] >= z_ifc_e_k_0[je, jk])
-                and (z_me[je, jk] <= z_ifc_e_1[je, jk])
-                and (z_me[je, jk] >= z_ifc_e_k_1[je, jk])
-            ):
-                flat_idx[je, jk] = k_lev[jk]
-    flat_idx_max = array_ns.amax(flat_idx, axis=1)
-    return flat_idx_max.astype(gtx.int32)
+    num_levels = k_lev.shape[0] - 1
+    z_me = z_me[horizontal_lower:horizontal_upper, :num_levels]
+    is_within_cells = array_ns.ones(z_me.shape, dtype=bool)
+    for cell in range(2):
+        z_ifc_e = z_ifc[e2c[horizontal_lower:horizontal_upper, cell]]
+        is_within_cells &= (z_me <= z_ifc_e[:, :num_levels]) & (
+            z_me >= z_ifc_e[:, 1 : num_levels + 1]
+        )
+    flat_idx = array_ns.where(is_within_cells, k_lev[:num_levels], 0)
+    flat_idx_max = array_ns.zeros(e2c.shape[0], dtype=gtx.int32)
+    if num_levels > 0:
+        flat_idx_max[horizontal_lower:horizontal_upper] = array_ns.amax(flat_idx, axis=1)
+    return flat_idx_max
@@ -10,9 +10,24 @@ from types import ModuleType
 
 import numpy as np
 
+from icon4py.model.common.math import column_search
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
+def _find_level(
+    z_ifc: data_alloc.NDArray,
+    heights: data_alloc.NDArray,
+    flat_idx: data_alloc.NDArray,
+    nlev: int,
+    array_ns: ModuleType,
+) -> data_alloc.NDArray:
+    """First level at or below the flat level containing the height, the lowest level if none does."""
+    level, found = column_search.find_bracketing_level(
+        z_ifc, heights, start=flat_idx, array_ns=array_ns
+    )
+    return array_ns.where(found, level, nlev - 1)
+
+
 def compute_zdiff_gradp_dsl(
     e2c,
     z_mc: data_alloc.NDArray,
@@ -25,6 +40,18 @@ def compute_zdiff_gradp_dsl(
     horizontal_start_1: int,
     array_ns: ModuleType = np,
 ) -> data_alloc.NDArray:
+    """
+    Compute the height differences for the horizontal pressure gradient below the flat level.
+
+    ICON searches the levels of the neighbor cells incrementally: the search for a level starts
+    at the level found for the level above, and once no level brackets the edge height the
+    lowest level is kept for all levels below. Here every level is searched from the flat level.
+    Both agree if the edge heights 'z_me' do not increase with the level index below the flat
+    level and do not exceed the interface heights of the neighbor cells at the flat level. This
+    holds if the interpolation coefficients 'c_lin_e' of an edge are non-negative and sum up to
+    one (so that 'z_me' is a convex combination of the cell heights) and 'flat_idx' is computed
+    from the same 'z_me' by 'compute_flat_idx'. Other coefficients can give different results.
+    """
     nedges = e2c.shape[0]
     z_me = array_ns.sum(z_mc[e2c] * array_ns.expand_dims(c_lin_e, axis=-1), axis=1)
     z_aux1 = array_ns.maximum(z_ifc_sliced[e2c[:, 0]], z_ifc_sliced[e2c[:, 1]])
@@ -34,83 +61,30 @@ def compute_zdiff_gradp_dsl(
         array_ns.expand_dims(z_me, axis=1)[horizontal_start:, :, :]
         - z_mc[e2c][horizontal_start:, :, :]
     )
-    """
-    First part for loop implementation with gt4py code
-
-    >>> z_ifc_off_koff = zero_field(icon_grid, EdgeDim, KDim, extend={KDim: 1})
-    >>> z_ifc_off = as_field((EdgeDim, KDim,), z_ifc[e2c[:, 0], :])
-    >>> _compute_z_ifc_off_koff(
-    >>>     z_ifc_off=z_ifc_off,
-    >>>     domain={EdgeDim: (horizontal_start, nedges), KDim: (0, nlev)},
-    >>>     out=z_ifc_off_koff,
-    >>>     offset_provider={"Koff": icon_grid.get_offset_provider("Koff")}
-    >>> )
-    """
-
-    for je in range(horizontal_start, nedges):
-        for jk in range(int(flat_idx[je]) + 1, nlev):
-            """
-            Second part for loop implementation with gt4py code
-            >>> param_2 = as_field((KDim,), array_ns.asarray([False] * nlev))
-            >>> param_3 = as_field((KDim,), array_ns.arange(nlev))
-            >>> z_ifc_off_e = as_field((KDim,), z_ifc[e2c[je, 0], :])
-            >>> _compute_param.with_backend(backend)(
-            >>>     z_me_jk=z_me[je, jk],
-            >>>     z_ifc_off=z_ifc_off_e,
-            >>>     z_ifc_off_koff=as_field((KDim,), z_ifc_off_koff.ndarray[je, :]),
-            >>>     lower=int(flat_idx[je]),
-            >>>     nlev=nlev - 1,
-            >>>     out=(param_3, param_2),
-            >>>     offset_provider={}
-            >>> )
-            >>> zdiff_gradp[je, 0, jk] = z_me[je, jk] - z_mc[e2c[je, 0], array_ns.where(param_2.ndarray)[0][0]]
-            """
-
-            param = array_ns.zeros((nlev,), dtype=bool)
-            for jk1 in range(int(flat_idx[je]), nlev):
-                if jk1 == nlev - 1 or (
-                    z_me[je, jk] <= z_ifc[e2c[je, 0], jk1]
-                    and z_me[je, jk] >= z_ifc[e2c[je, 0], jk1 + 1]
-                ):
-                    param[jk1] = True
-
-            zdiff_gradp[je, 0, jk] = z_me[je, jk] - z_mc[e2c[je, 0], array_ns.where(param)[0][0]]
-
-        jk_start = int(flat_idx[je])
-        for jk in range(int(flat_idx[je]) + 1, nlev):
-            for jk1 in range(jk_start, nlev):
-                if jk1 == nlev - 1 or (
-                    z_me[je, jk] <= z_ifc[e2c[je, 1], jk1]
-                    and z_me[je, jk] >= z_ifc[e2c[je, 1], jk1 + 1]
-                ):
-                    zdiff_gradp[je, 1, jk] = z_me[je, jk] - z_mc[e2c[je, 1], jk1]
-                    jk_start = jk1
-                    break
-
-    for je in range(horizontal_start_1, nedges):
-        jk_start = int(flat_idx[je])
-        for jk in range(int(flat_idx[je]) + 1, nlev):
-            if z_me[je, jk] < z_aux2[je]:
-                for jk1 in range(jk_start, nlev):
-                    if jk1 == nlev - 1 or (
-                        z_aux2[je] <= z_ifc[e2c[je, 0], jk1]
-                        and z_aux2[je] >= z_ifc[e2c[je, 0], jk1 + 1]
-                    ):
-                        zdiff_gradp[je, 0, jk] = z_aux2[je] - z_mc[e2c[je, 0], jk1]
-                        jk_start = jk1
-                        break
-
-        jk_start = int(flat_idx[je])
-        for jk in range(int(flat_idx[je]) + 1, nlev):
-            if z_me[je, jk] < z_aux2[je]:
-                for jk1 in range(jk_start, nlev):
-                    if jk1 == nlev - 1 or (
-                        z_aux2[je] <= z_ifc[e2c[je, 1], jk1]
-                        and z_aux2[je] >= z_ifc[e2c[je, 1], jk1 + 1]
-                    ):
-                        zdiff_gradp[je, 1, jk] = z_aux2[je] - z_mc[e2c[je, 1], jk1]
-                        jk_start = jk1
-                        break
+    # below the flat level the heights are searched in the interface levels of the neighbor cells,
+    # the search for heights below the extrapolation height 'z_aux2' only applies from
+    # 'horizontal_start_1' on
+    start = min(horizontal_start, horizontal_start_1)
+    edges = array_ns.arange(start, nedges)[:, np.newaxis]
+    flat_idx = array_ns.asarray(flat_idx[start:], dtype=np.int64)[:, np.newaxis]
+    z_me = z_me[start:]
+    z_aux2 = z_aux2[start:, np.newaxis]
+    is_below_flat = array_ns.arange(nlev)[np.newaxis, :] > flat_idx
+    is_extrapolated = is_below_flat & (z_me < z_aux2) & (edges >= horizontal_start_1)
+    is_below_flat &= edges >= horizontal_start
+    for cell in range(2):
+        z_ifc_off = z_ifc[e2c[start:, cell]]
+        z_mc_off = z_mc[e2c[start:, cell]]
+        level = _find_level(z_ifc_off, z_me, flat_idx, nlev, array_ns)
+        zdiff = array_ns.where(
+            is_below_flat,
+            z_me - array_ns.take_along_axis(z_mc_off, level, axis=1),
+            zdiff_gradp[start:, cell, :],
+        )
+        level = _find_level(z_ifc_off, z_aux2, flat_idx, nlev, array_ns)
+        zdiff_gradp[start:, cell, :] = array_ns.where(
+            is_extrapolated, z_aux2 - array_ns.take_along_axis(z_mc_off, level, axis=1), zdiff
+        )
 
     zdiff_gradp_full_field = zdiff_gradp.reshape(
         (zdiff_gradp.shape[0] * zdiff_gradp.shape[1],) + zdiff_gradp.shape[2:]
@@ -14,12 +14,15 @@ Creates a DaCe SDFG that fuses any GT4Py Program called by the decorated functio
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
 import inspect
+import itertools
 import operator
 import os
 import shutil
 import uuid
+import weakref
 from collections.abc import Callable
 from pathlib import Path
 from types import ModuleType
@@ -89,6 +92,9 @@ def orchestrate(
 
     def _decorator(fuse_func: Callable[P, R]) -> Callable[P, R]:
         orchestrator_cache = {}  # Caching
+        # SDFG arguments of the last call per instance, dropped with the instance
+        bound_call_cache: weakref.WeakKeyDictionary[Any, _BoundCall] = weakref.WeakKeyDictionary()
+        annotations_cache: dict[str, dict[str, Any]] = {}
         self_name = next(iter(inspect.signature(fuse_func).parameters))
 
         # If not explicitly set by the user, assume the provided callable is a method
@@ -100,93 +106,121 @@ def orchestrate(
                 "The orchestration decorator is only for methods -at least for now-."
             )
 
+        def bind_call(self, args, kwargs, dace_annotations) -> _BoundCall:
+            exchange_obj = None
+            grid = None
+            for attr_name, attr_value in self.__dict__.items():
+                if isinstance(attr_value, decomposition.ExchangeRuntime):
+                    exchange_obj = getattr(self, attr_name)
+                elif isinstance(attr_value, icon_grid.IconGrid):
+                    grid = getattr(self, attr_name)
+
+            # Use assert here to allow disabling the check when running in production
+            assert grid is not None, "No grid object found in the call arguments."
+
+            # To extract the actual values from the function parameters defined as compile-time
+            # we first need to first sort the run-time arguments according to their definition
+            # order and also adding `None`s for the missing ones to make sure we don't use
+            # the wrong one by mistake.
+            ordered_kwargs = [kwargs[key] for key in dace_annotations if key in kwargs]
+            all_args = [*args, *ordered_kwargs]
+            compile_time_args_kwargs = {
+                k: arg
+                for arg, (k, v) in zip(all_args, dace_annotations.items(), strict=True)
+                if v is dace.compiletime
+            }
+
+            unique_id = make_uid(fuse_func, compile_time_args_kwargs, exchange_obj)
+            default_build_folder = Path(".dacecache") / f"uid_{unique_id}"
+            default_build_folder.mkdir(parents=True, exist_ok=True)
+
+            if (cache_item := orchestrator_cache.get(unique_id, None)) is None:
+                fuse_func_orig_annotations = fuse_func.__annotations__
+                fuse_func.__annotations__ = dace_annotations
+
+                cache_item = orchestrator_cache[unique_id] = parse_compile_cache_sdfg(
+                    default_build_folder,
+                    self._backend,
+                    exchange_obj,
+                    fuse_func,
+                    compile_time_args_kwargs,
+                    self_name,
+                    simplify_fused_sdfg=True,
+                )
+
+                fuse_func.__annotations__ = fuse_func_orig_annotations
+
+            dace_program = cache_item["dace_program"]
+            sdfg = cache_item["sdfg"]
+            compiled_sdfg = cache_item["compiled_sdfg"]
+
+            # update the args/kwargs with runtime related values, such as
+            # concretized symbols, runtime connectivity tables, GHEX C++ pointers, and DaCe structures pointers
+            updated_args, updated_kwargs = mod_xargs_for_dace_structures(
+                dace_annotations, fuse_func.__annotations__, args, kwargs
+            )
+            updated_kwargs = {
+                **updated_kwargs,
+                **dace_specific_kwargs(
+                    exchange_obj,
+                    {
+                        k: v
+                        for k, v in grid.offset_providers.items()
+                        if connectivity_identifier(k) in sdfg.arrays
+                    },
+                ),
+            }
+            updated_kwargs = {
+                **updated_kwargs,
+                **dace_symbols_concretization(
+                    grid, dace_annotations, fuse_func.__annotations__, args, kwargs
+                ),
+            }
+
+            sdfg_args = dace_program._create_sdfg_args(sdfg, updated_args, updated_kwargs)
+            if func_is_method:
+                del sdfg_args[self_name]
+
+            # the instance is not kept in the arguments, the cache must not keep it alive
+            parameters = tuple(dace_annotations)[1:]
+            return _BoundCall(
+                instance_state=_instance_state(self),
+                default_build_folder=default_build_folder,
+                compiled_sdfg=compiled_sdfg,
+                sdfg_args=sdfg_args,
+                parameters=parameters,
+                compile_time_arguments=frozenset(compile_time_args_kwargs) - {self_name},
+                arguments={**dict(zip(parameters, args[1:])), **kwargs},
+                passed_arguments={
+                    **dict(zip(parameters, updated_args[1:])),
+                    **{key: updated_kwargs[key] for key in kwargs},
+                },
+            )
+
         def wrapper(*args, **kwargs):
             self = args[0]
             if self._orchestration:
-                # Add DaCe data types annotations for **all args and kwargs**
-                dace_annotations = to_dace_annotations(fuse_func)
                 if self._backend is None or "dace" not in self._backend.name.lower():
                     raise ValueError(
                         "DaCe Orchestration works only with DaCe backends. Change the backend to a DaCe supported one."
                     )
-
-                exchange_obj = None
-                grid = None
-                for attr_name, attr_value in self.__dict__.items():
-                    if isinstance(attr_value, decomposition.ExchangeRuntime):
-                        exchange_obj = getattr(self, attr_name)
-                    elif isinstance(attr_value, icon_grid.IconGrid):
-                        grid = getattr(self, attr_name)
-
-                # Use assert here to allow disabling the check when running in production
-                assert grid is not None, "No grid object found in the call arguments."
-
-                # To extract the actual values from the function parameters defined as compile-time
-                # we first need to first sort the run-time arguments according to their definition
-                # order and also adding `None`s for the missing ones to make sure we don't use
-                # the wrong one by mistake.
-                ordered_kwargs = [kwargs[key] for key in dace_annotations if key in kwargs]
-                all_args = [*args, *ordered_kwargs]
-                compile_time_args_kwargs = {
-                    k: arg
-                    for arg, (k, v) in zip(all_args, dace_annotations.items(), strict=True)
-                    if v is dace.compiletime
-                }
-
-                unique_id = make_uid(fuse_func, compile_time_args_kwargs, exchange_obj)
-                default_build_folder = Path(".dacecache") / f"uid_{unique_id}"
-                default_build_folder.mkdir(parents=True, exist_ok=True)
-
-                if (cache_item := orchestrator_cache.get(unique_id, None)) is None:
-                    fuse_func_orig_annotations = fuse_func.__annotations__
-                    fuse_func.__annotations__ = dace_annotations
-
-                    cache_item = orchestrator_cache[unique_id] = parse_compile_cache_sdfg(
-                        default_build_folder,
-                        self._backend,
-                        exchange_obj,
-                        fuse_func,
-                        compile_time_args_kwargs,
-                        self_name,
-                        simplify_fused_sdfg=True,
+                # Add DaCe data types annotations for **all args and kwargs**
+                if (dace_annotations := annotations_cache.get("dace_annotations")) is None:
+                    dace_annotations = annotations_cache["dace_annotations"] = to_dace_annotations(
+                        fuse_func
                     )
 
-                    fuse_func.__annotations__ = fuse_func_orig_annotations
-
-                dace_program = cache_item["dace_program"]
-                sdfg = cache_item["sdfg"]
-                compiled_sdfg = cache_item["compiled_sdfg"]
-
-                # update the args/kwargs with runtime related values, such as
-                # concretized symbols, runtime connectivity tables, GHEX C++ pointers, and DaCe structures pointers
-                updated_args, updated_kwargs = mod_xargs_for_dace_structures(
-                    dace_annotations, fuse_func.__annotations__, args, kwargs
-                )
-                updated_kwargs = {
-                    **updated_kwargs,
-                    **dace_specific_kwargs(
-                        exchange_obj,
-                        {
-                            k: v
-                            for k, v in grid.offset_providers.items()
-                            if connectivity_identifier(k) in sdfg.arrays
-                        },
-                    ),
-                }
-                updated_kwargs = {
-                    **updated_kwargs,
-                    **dace_symbols_concretization(
-                        grid, dace_annotations, fuse_func.__annotations__, args, kwargs
-                    ),
-                }
-
-                sdfg_args = dace_program._create_sdfg_args(sdfg, updated_args, updated_kwargs)
-                if func_is_method:
-                    del sdfg_args[self_name]
+                # Fast path: reuse the SDFG arguments of the previous call of this instance,
+                # patching in only the scalars and buffers that changed since then.
+                bound_call = bound_call_cache.get(self)
+                if bound_call is None or not bound_call.update(self, args[1:], kwargs):
+                    bound_call = bound_call_cache[self] = bind_call(
+                        self, args, kwargs, dace_annotations
+                    )
 
                 with dace.config.temporary_config():
-                    configure_dace_temp_env(default_build_folder, self._backend)
-                    return compiled_sdfg(**sdfg_args)
+                    configure_dace_temp_env(bound_call.default_build_folder, self._backend)
+                    return bound_call.compiled_sdfg(**bound_call.sdfg_args)
             else:
                 return fuse_func(*args, **kwargs)
 
@@ -195,6 +229,8 @@ def orchestrate(
         # To avoid this, we provide a way to clear the cache.
         def clear_cache():
             orchestrator_cache.clear()
+            bound_call_cache.clear()
+            annotations_cache.clear()
 
         wrapper.clear_cache = clear_cache
 
@@ -203,6 +239,120 @@ def orchestrate(
     return _decorator(func) if func else _decorator
 
 
+@dataclasses.dataclass
+class _BoundCall:
+    """
+    Arguments of the compiled SDFG for the last call of an orchestrated method on an instance.
+
+    Creating the SDFG arguments (unique id of the compile-time arguments, DaCe structures,
+    connectivity tables, symbols, ...) is expensive compared to the execution of the SDFG on
+    small domains. As long as the attributes of the instance are not rebound, the SDFG
+    arguments of the previous call are reused and only the arguments that changed are patched
+    in: scalars, and fields or structures of fields that are stored in new buffers of the same
+    layout. This includes data classes passed again with some of their fields rebound, as done by
+    the state containers kept by the py2fgen wrappers. Any other change falls back to creating
+    the SDFG arguments from scratch.
+
+    In-place modifications of (nested) attributes of the instance that are part of its
+    orchestration uid are not detected, call `clear_cache` of the orchestrated method after them.
+    """
+
+    instance_state: tuple[int, ...]
+    default_build_folder: Path
+    compiled_sdfg: Any
+    sdfg_args: dict[str, Any]
+    # names of the parameters of the method, without the instance
+    parameters: tuple[str, ...]
+    compile_time_arguments: frozenset[str]
+    # arguments of the call without the instance, by parameter name
+    arguments: dict[str, Any]
+    # arguments passed to `_create_sdfg_args` by parameter name, e.g. ctypes structures for data classes
+    passed_arguments: dict[str, Any]
+    layouts: dict[str, Any] = dataclasses.field(init=False)
+    # identities of the fields of the arguments, to detect fields rebound in the same data class
+    buffers: dict[str, Any] = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        self.layouts = {name: _buffer_layout(value) for name, value in self.arguments.items()}
+        self.buffers = {name: _buffer_ids(value) for name, value in self.arguments.items()}
+
+    def update(self, instance: Any, args: tuple, kwargs: dict[str, Any]) -> bool:
+        """
+        Patch the SDFG arguments for a new call, returns False if that is not possible.
+
+        Args:
+            instance: the instance the method is called on, the same as in the previous call
+            args: positional arguments of the call, without the instance
+            kwargs: keyword arguments of the call
+        """
+        if len(args) + len(kwargs) != len(self.arguments):
+            return False
+        if self.instance_state != _instance_state(instance):
+            return False
+        for name, value in itertools.chain(zip(self.parameters, args), kwargs.items()):
+            if value is self.arguments.get(name) and _buffer_ids(value) == self.buffers.get(name):
+                continue
+            if not self._patch(name, value):
+                return False
+        return True
+
+    def _patch(self, name: str, value: Any) -> bool:
+        passed = self.passed_arguments.get(name)
+        if (
+            name not in self.arguments
+            or name in self.compile_time_arguments
+            or self.sdfg_args.get(name) is not passed
+            or (layout := _buffer_layout(value)) != self.layouts[name]
+        ):
+            return False
+        if _is_data_class(value):
+            # data classes are passed as DaCe structures
+            structure = type(passed)(
+                **{
+                    member: getattr(value, member).data_ptr()
+                    for member in value.__dataclass_fields__.keys()
+                }
+            )
+            structure.descriptor = passed.descriptor
+            passed = structure
+        else:
+            passed = value
+        self.sdfg_args[name] = self.passed_arguments[name] = passed
+        self.arguments[name] = value
+        self.layouts[name] = layout
+        self.buffers[name] = _buffer_ids(value)
+        return True
+
+
+def _instance_state(instance: Any) -> tuple[int, ...]:
+    return tuple(map(id, instance.__dict__.values()))
+
+
+def _is_data_class(value: Any) -> bool:
+    """Whether the argument is a data class of fields, GT4Py fields are data classes themselves."""
+    return (
+        dataclasses.is_dataclass(value)
+        and not isinstance(value, type)
+        and not isinstance(value, gtx.Field)
+    )
+
+
+def _buffer_layout(value: Any) -> Any:
+    """Everything of an argument that the SDFG arguments depend on, except for the buffer pointers."""
+    if isinstance(value, gtx.Field):
+        return value.domain, value.dtype, value.ndarray.strides
+    if _is_data_class(value):
+        return tuple(_buffer_layout(getattr(value, f.name)) for f in dataclasses.fields(value))
+    return type(value)
+
+
+def _buffer_ids(value: Any) -> Any:
+    """Identities of an argument and of the fields of a data class argument."""
+    if _is_data_class(value):
+        return tuple(_buffer_ids(getattr(value, f.name)) for f in dataclasses.fields(value))
+    return id(value)
+
+
 def make_uid(
     fuse_func: Callable,
     compile_time_args_kwargs: dict[str, Any],
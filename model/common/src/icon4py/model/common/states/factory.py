@@ -34,6 +34,17 @@ factory.register_provider(bar_provider)
 
 val = factory.get("foo", RetrievalType.DATA_ARRAY)
 
+Computed fields can be persisted across runs in a content addressed on-disk cache: after
+`factory.with_cache(FieldCache(path))` fields are loaded from the cache instead of computing them
+and their dependencies, if they have been computed before for the same grid, vertical grid,
+provider function, parameters and (recursively) dependencies.
+
+Intermediate fields, that is fields without metadata which only feed other providers, can be
+freed once all providers consuming them have been computed: after
+`factory.with_release_policy(ReleasePolicy())` their buffers are dropped (and recomputed if
+requested again) or moved to host memory. `factory.resident_bytes()` reports the memory held by
+the fields of a factory.
+
 
 TODO: @halungge: allow to read configuration data
 
@@ -41,10 +52,16 @@ TODO: @halungge: allow to read configuration data
 import collections
 import enum
 import functools
+import hashlib
 import inspect
+import logging
+import pathlib
+import threading
+import types
 from typing import (
     Any,
     Callable,
+    Iterator,
     Mapping,
     MutableMapping,
     Optional,
@@ -58,10 +75,11 @@ from typing import (
 import gt4py.next as gtx
 import gt4py.next.backend as gtx_backend
 import gt4py.next.ffront.decorator as gtx_decorator
+import numpy as np
 import xarray as xa
 from gt4py.next import backend
 
-from icon4py.model.common import dimension as dims, type_alias as ta
+from icon4py.model.common import __version__ as icon4py_version, dimension as dims, type_alias as ta
 from icon4py.model.common.grid import (
     base as base_grid,
     horizontal as h_grid,
@@ -69,9 +87,11 @@ from icon4py.model.common.grid import (
     vertical as v_grid,
 )
 from icon4py.model.common.states import model, utils as state_utils
-from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.common.utils import data_allocation as data_alloc, disk_cache
 
 
+log = logging.getLogger(__name__)
+
 DomainType = TypeVar("DomainType", h_grid.Domain, v_grid.Domain)
 
 
@@ -135,6 +155,8 @@ class FieldSource(GridProvider, Protocol):
     """
 
     _providers: MutableMapping[str, FieldProvider] = {}  # noqa:  RUF012 instance variable
+    _field_cache: Optional["FieldCache"] = None
+    _release_policy: Optional["ReleasePolicy"] = None
 
     @property
     def _sources(self) -> "FieldSource":
@@ -180,7 +202,18 @@ class FieldSource(GridProvider, Protocol):
                         f"Field {field_name} not provided by f{provider.func.__name__}."
                     )
 
-                buffer = provider(field_name, self._sources, self.backend, self)
+                policy = self._release_policy
+                if policy is not None:
+                    policy.restore(provider, self.backend)
+                was_computed = is_computed(provider)
+                if self._field_cache is not None:
+                    buffer = self._field_cache.get_or_compute(
+                        field_name, provider, self._sources, self.backend, self
+                    )
+                else:
+                    buffer = provider(field_name, self._sources, self.backend, self)
+                if policy is not None and not was_computed:
+                    policy.release_dependencies(provider, self._sources)
                 return (
                     buffer
                     if type_ == RetrievalType.FIELD
@@ -189,6 +222,26 @@ class FieldSource(GridProvider, Protocol):
             case _:
                 raise ValueError(f"Invalid retrieval type {type_}")
 
+    def with_cache(self, cache: "FieldCache") -> "FieldSource":
+        """Persist the fields computed by this source in an on-disk cache."""
+        self._field_cache = cache
+        return self
+
+    def with_release_policy(self, policy: "ReleasePolicy") -> "FieldSource":
+        """Free the intermediate fields of this source once they are not needed anymore."""
+        self._release_policy = policy
+        return self
+
+    def resident_bytes(self) -> dict[str, int]:
+        """Return the size in bytes of the buffers currently held by the fields of this source."""
+        providers = {id(p): p for p in self._providers.values()}.values()
+        return {
+            name: field.ndarray.nbytes
+            for provider in providers
+            for name, field in provider.fields.items()
+            if isinstance(field, gtx.Field)
+        }
+
     def _provided_by_source(self, name):
         return name in self._sources._providers or name in self._sources.metadata.keys()
 
@@ -211,6 +264,8 @@ class CompositeSource(FieldSource):
         self._vertical_grid = me.vertical_grid
         self._metadata = collections.ChainMap(me.metadata, *(s.metadata for s in others))
         self._providers = collections.ChainMap(me._providers, *(s._providers for s in others))
+        self._field_cache = me._field_cache
+        self._release_policy = me._release_policy
 
     @functools.cached_property
     def metadata(self) -> MutableMapping[str, model.FieldMetaData]:
@@ -594,7 +649,7 @@ class NumpyFieldsProvider(FieldProvider):
             parameter_definition = parameters.get(dep_key)
             checked = _check_union(parameter_definition, union=data_alloc.NDArray)
             assert checked, (
-                f"Dependency '{dep_key}' in function '{_func_name(self._func)}':  does not exist or has "
+                f"Dependency '{dep_key}' in function '{func_name(self._func)}':  does not exist or has "
                 f"wrong type ('expected ndarray') but was '{parameter_definition}'."
             )
 
@@ -606,7 +661,7 @@ class NumpyFieldsProvider(FieldProvider):
                 parameter_definition, param_value, union=state_utils.FloatType
             )
             assert checked, (
-                f"Parameter '{param_key}' in function '{_func_name(self._func)}' does not "
+                f"Parameter '{param_key}' in function '{func_name(self._func)}' does not "
                 f"exist or has the wrong type: '{type(param_value)}'."
             )
 
@@ -623,6 +678,309 @@ class NumpyFieldsProvider(FieldProvider):
         return self._fields
 
 
+class ReleasePolicy:
+    """
+    Free intermediate fields once all providers consuming them have been computed.
+
+    Intermediate fields are the fields without metadata in the source they are retrieved from,
+    for example index fields or slices of other fields, which only feed other providers. An
+    intermediate field is released once all providers registered in the source that depend on
+    it are computed:
+    - fields computed by a provider are dropped and recomputed if they are requested again,
+    - fields of a `PrecomputedFieldProvider` cannot be recomputed, device buffers are moved to
+      host memory instead and transferred back if the field is requested again.
+
+    Args:
+        spill: move all released device buffers to host memory instead of dropping them
+        keep: names of intermediate fields that are never released
+    """
+
+    def __init__(self, spill: bool = False, keep: Sequence[str] = ()):
+        self._spill = spill
+        self._keep = frozenset(keep)
+        # host copies of spilled fields by provider: field name -> (domain, array)
+        self._host_fields: dict[int, dict[str, tuple[gtx.Domain, np.ndarray]]] = {}
+        self._lock = threading.Lock()
+
+    def spilled_bytes(self) -> dict[str, int]:
+        """Return the size in bytes of the fields that have been moved to host memory."""
+        with self._lock:
+            return {
+                name: array.nbytes
+                for fields in self._host_fields.values()
+                for name, (_, array) in fields.items()
+            }
+
+    def restore(self, provider: FieldProvider, backend: Optional[gtx_backend.Backend]) -> None:
+        """Transfer spilled fields of a provider back to the device."""
+        with self._lock:
+            spilled = self._host_fields.pop(id(provider), None)
+            if spilled is None:
+                return
+            for name, (domain, array) in spilled.items():
+                provider._fields[name] = gtx.as_field(domain, array, allocator=backend)
+                log.debug(f"restored spilled field '{name}'")
+
+    def release_dependencies(self, provider: FieldProvider, source: FieldSource) -> None:
+        """Release the dependencies of a computed provider that are not needed anymore."""
+        providers = {id(p): p for p in source._providers.values()}.values()
+
+        def _is_unused(name: str) -> bool:
+            return (
+                name not in self._keep
+                and name not in source.metadata
+                and all(is_computed(p) for p in providers if name in p.dependencies)
+            )
+
+        with self._lock:
+            for name in provider.dependencies:
+                dependency = source._providers.get(name)
+                if dependency is None or not isinstance(dependency.fields.get(name), gtx.Field):
+                    continue
+                # computed fields are only released together with all fields of their provider,
+                # otherwise requesting one of the remaining fields would recompute all of them
+                names = (
+                    (name,)
+                    if isinstance(dependency, PrecomputedFieldProvider)
+                    else tuple(dependency.fields.keys())
+                )
+                if all(_is_unused(n) for n in names):
+                    for n in names:
+                        self._release(n, dependency)
+
+    def _release(self, name: str, provider: FieldProvider) -> None:
+        field = provider.fields[name]
+        if not isinstance(field, gtx.Field):
+            return
+        is_on_device = not isinstance(field.ndarray, np.ndarray)
+        if self._spill or isinstance(provider, PrecomputedFieldProvider):
+            if not is_on_device:
+                return
+            self._host_fields.setdefault(id(provider), {})[name] = (
+                field.domain,
+                data_alloc.as_numpy(field.ndarray),
+            )
+            log.debug(f"moved field '{name}' ({field.ndarray.nbytes} bytes) to host memory")
+        else:
+            log.debug(f"released field '{name}' ({field.ndarray.nbytes} bytes)")
+        provider._fields[name] = None
+
+
+class FieldCache:
+    """
+    Content addressed on-disk cache for the fields computed by `FieldProvider` s.
+
+    The key of the fields of a provider is a hash of
+    - the icon4py version,
+    - the horizontal grid: uuid, sizes and connectivities,
+    - the vertical grid configuration and coordinates, if the fields have a vertical dimension,
+    - the provider: its type, function (including a hash of its code), parameters, compute domain
+      and output fields,
+    - the keys of all dependencies, or the content of dependencies that are not computed.
+
+    Fields are stored as `.npy` files and memory mapped when loaded, see `disk_cache.DiskCache`.
+
+    Args:
+        path: directory of the cache
+    """
+
+    def __init__(self, path: Union[pathlib.Path, str]):
+        self._store = disk_cache.DiskCache(path)
+        # keys are memoized per provider object, providers are not shared between grids
+        self._keys: dict[int, str] = {}
+        self._grid_hashes: dict[int, str] = {}
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._store.path
+
+    def get_or_compute(
+        self,
+        field_name: str,
+        provider: FieldProvider,
+        source: FieldSource,
+        backend: Optional[gtx_backend.Backend],
+        grid_provider: GridProvider,
+    ) -> state_utils.FieldType:
+        """Return a field of 'provider', loading all its fields from the cache if possible."""
+        if isinstance(provider, PrecomputedFieldProvider) or all(
+            f is not None for f in provider.fields.values()
+        ):
+            return provider(field_name, source, backend, grid_provider)
+        key = self.key(provider, source, grid_provider)
+        if key in self._store:
+            log.info(f"loading fields {list(provider.fields.keys())} from cache entry '{key}'")
+            self._load(key, provider, backend)
+            return provider.fields[field_name]
+        buffer = provider(field_name, source, backend, grid_provider)
+        if all(isinstance(f, gtx.Field) for f in provider.fields.values()):
+            self._store.store(
+                key,
+                {name: f.ndarray for name, f in provider.fields.items()},
+                {
+                    "field_dims": {
+                        name: [d.value for d in f.domain.dims]
+                        for name, f in provider.fields.items()
+                    }
+                },
+            )
+        return buffer
+
+    def key(self, provider: FieldProvider, source: FieldSource, grid_provider: GridProvider) -> str:
+        cached = self._keys.get(id(provider))
+        if cached is not None:
+            return cached
+        hash_ = hashlib.sha256()
+        hash_.update(f"icon4py={icon4py_version}".encode())
+        hash_.update(self._grid_hash(grid_provider.grid).encode())
+        domain_dims = tuple(getattr(provider, "_dims", ()))
+        if any(d.kind == gtx.DimensionKind.VERTICAL for d in domain_dims):
+            hash_.update(_vertical_grid_hash(grid_provider.vertical_grid).encode())
+        hash_.update(_provider_description(provider).encode())
+        providers = source._sources._providers
+        for dependency in provider.dependencies:
+            dependency_provider = providers.get(dependency)
+            if dependency_provider is None:
+                dependency_key = dependency
+            elif isinstance(dependency_provider, PrecomputedFieldProvider):
+                dependency_key = _content_hash(dependency_provider.fields[dependency])
+            else:
+                dependency_key = self.key(dependency_provider, source, grid_provider)
+            hash_.update(f"{dependency}={dependency_key}".encode())
+        key = f"{func_name(provider.func)}_{hash_.hexdigest()}"
+        self._keys[id(provider)] = key
+        return key
+
+    def _grid_hash(self, grid: base_grid.BaseGrid) -> str:
+        cached = self._grid_hashes.get(id(grid))
+        if cached is None:
+            hash_ = hashlib.sha256(
+                f"{grid.id}:{grid.num_cells}:{grid.num_edges}:{grid.num_vertices}:{grid.config.limited_area}".encode()
+            )
+            for dim in sorted(grid.connectivities.keys(), key=lambda d: d.value):
+                hash_.update(dim.value.encode())
+                hash_.update(_content_hash(grid.connectivities[dim]).encode())
+            cached = hash_.hexdigest()
+            self._grid_hashes[id(grid)] = cached
+        return cached
+
+    def _load(
+        self, key: str, provider: FieldProvider, backend: Optional[gtx_backend.Backend]
+    ) -> None:
+        metadata, arrays = self._store.load(key)
+        dimensions = {d.value: d for d in vars(dims).values() if isinstance(d, gtx.Dimension)}
+        provider._fields = {
+            name: gtx.as_field(
+                tuple(dimensions[d] for d in metadata["field_dims"][name]),
+                arrays[name],
+                allocator=backend,
+            )
+            for name in provider.fields.keys()
+        }
+
+
+def is_computed(provider: FieldProvider) -> bool:
+    """Whether all fields of the provider have been computed."""
+    return all(f is not None for f in provider.fields.values())
+
+
+def _content_hash(value: Any) -> str:
+    if isinstance(value, gtx.Field):
+        value = value.ndarray
+    if isinstance(value, (int, float, bool, np.generic)) or value is None:
+        return repr(value)
+    array = np.ascontiguousarray(data_alloc.as_numpy(value))
+    hash_ = hashlib.sha256(f"{array.dtype.str}{array.shape}".encode())
+    hash_.update(array.tobytes())
+    return hash_.hexdigest()
+
+
+def _vertical_grid_hash(vertical_grid: Optional[v_grid.VerticalGrid]) -> str:
+    if vertical_grid is None:
+        return "None"
+    return ":".join(
+        (
+            repr(vertical_grid.config),
+            _content_hash(vertical_grid.vct_a),
+            _content_hash(vertical_grid.vct_b),
+        )
+    )
+
+
+def _code_hash(func: Callable[..., Any]) -> str:
+    """
+    Hash of the code of a function, so that editing a provider function invalidates its fields.
+
+    gt4py programs and field operators are hashed with their definition and the definitions of
+    the field operators and programs they call.
+    """
+    hash_ = hashlib.sha256()
+    seen: set[int] = set()
+
+    def update_code(code: types.CodeType) -> None:
+        hash_.update(code.co_code)
+        hash_.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                update_code(const)
+            elif isinstance(const, frozenset):
+                # the iteration order of sets differs between interpreter runs
+                hash_.update(repr(sorted(const, key=repr)).encode())
+            else:
+                hash_.update(repr(const).encode())
+
+    def update(obj: Any) -> None:
+        while isinstance(obj, functools.partial):
+            obj = obj.func
+        if isinstance(obj, (gtx_decorator.Program, gtx_decorator.FieldOperator)):
+            obj = obj.definition_stage.definition
+        code = getattr(obj, "__code__", None)
+        if code is None or id(obj) in seen:
+            return
+        seen.add(id(obj))
+        update_code(code)
+        for name in _code_names(code):
+            called = getattr(obj, "__globals__", {}).get(name)
+            if isinstance(called, (gtx_decorator.Program, gtx_decorator.FieldOperator)):
+                update(called)
+
+    update(func)
+    return hash_.hexdigest()
+
+
+def _code_names(code: types.CodeType) -> Iterator[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_names(const)
+
+
+def _provider_description(provider: FieldProvider) -> str:
+    """Describe the computation of a provider in a way that is stable across runs."""
+    func = provider.func
+    func_module = getattr(
+        func.func if isinstance(func, functools.partial) else func, "__module__", ""
+    )
+    params = getattr(provider, "_params", {})
+    return repr(
+        (
+            type(provider).__name__,
+            func_module,
+            func_name(func),
+            _code_hash(func),
+            tuple(sorted((k, repr(v)) for k, v in params.items())),
+            tuple(
+                (dim.value, tuple(str(bound) for bound in bounds))
+                for dim, bounds in getattr(provider, "_compute_domain", {}).items()
+            ),
+            tuple(d.value for d in getattr(provider, "_dims", ())),
+            tuple(sorted(getattr(provider, "_dependencies", {}).items())),
+            tuple(sorted(getattr(provider, "_connectivities", {}).keys())),
+            tuple(provider.fields.keys()),
+        )
+    )
+
+
 def _check_union_and_type(
     parameter_definition: inspect.Parameter,
     value: Union[state_utils.ScalarType, gtx.Field],
@@ -649,7 +1007,8 @@ def _check_union(
     return parameter_definition is not None and (annotation == union or annotation in members)
 
 
-def _func_name(callable_: Callable[..., Any]) -> str:
+def func_name(callable_: Callable[..., Any]) -> str:
+    """Name of the function of a provider, unwrapping `functools.partial`."""
     if isinstance(callable_, functools.partial):
         return callable_.func.__name__
     else:
@@ -0,0 +1,258 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Concurrent computation of the fields of `FieldSource` s.
+
+`FieldSource.get` computes a field and its dependencies lazily and one provider after the other.
+`compute_fields` instead builds the dependency graph of all providers needed for a set of fields
+upfront and runs providers whose dependencies are available concurrently on a thread pool:
+
+---
+report = scheduler.compute_fields(
+    (metrics_factory, interpolation_factory, geometry), field_names, max_workers=8
+)
+log.info(report.summary())
+metrics_factory.get(field_names[0])  # returns the already computed field
+---
+
+Only `NumpyFieldsProvider` are run on the thread pool, all other providers are run in the calling
+thread. In particular `ProgramFieldProvider` are not run concurrently: GT4Py programs are compiled
+lazily at their first call, and neither the translation nor the first compilation of a backend
+are thread safe (see `utils.precompilation`). Each provider is computed through the same
+`FieldSource.get` call that the lazy resolution of its dependent would use, so the results
+(and the use of a `FieldCache`) are the same as with lazy evaluation.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from concurrent import futures
+from typing import Optional, Union
+
+from icon4py.model.common.states import factory
+
+
+log = logging.getLogger(__name__)
+
+_CONCURRENT_PROVIDERS = (factory.NumpyFieldsProvider,)
+
+
+@dataclasses.dataclass(frozen=True)
+class ProviderTiming:
+    """
+    Execution of a single provider.
+
+    Args:
+        fields: names of the fields computed by the provider
+        func_name: name of the function of the provider
+        start: start time in seconds, relative to the start of `compute_fields`
+        duration: duration in seconds
+        thread: name of the thread the provider was run on
+    """
+
+    fields: tuple[str, ...]
+    func_name: str
+    start: float
+    duration: float
+    thread: str
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+@dataclasses.dataclass(frozen=True)
+class ScheduleReport:
+    """
+    Timings of a `compute_fields` run.
+
+    Args:
+        timings: the providers that have been computed in the order of completion
+        critical_path: the chain of dependent providers with the longest total duration
+        wall_time: total time of the run in seconds
+    """
+
+    timings: tuple[ProviderTiming, ...]
+    critical_path: tuple[ProviderTiming, ...]
+    wall_time: float
+
+    @property
+    def critical_path_time(self) -> float:
+        return sum(t.duration for t in self.critical_path)
+
+    @property
+    def total_time(self) -> float:
+        """Sum of the durations of all providers, the time of a serial computation."""
+        return sum(t.duration for t in self.timings)
+
+    def summary(self) -> str:
+        lines = [
+            f"computed {len(self.timings)} providers in {self.wall_time:.3f}s "
+            f"(serial: {self.total_time:.3f}s, critical path: {self.critical_path_time:.3f}s)",
+            "critical path:",
+            *(
+                f"  {t.duration:8.3f}s  {t.func_name} -> {', '.join(t.fields)}"
+                for t in self.critical_path
+            ),
+            "providers:",
+            *(
+                f"  {t.start:8.3f}s +{t.duration:8.3f}s  [{t.thread}]  {t.func_name} -> {', '.join(t.fields)}"
+                for t in sorted(self.timings, key=lambda t: t.start)
+            ),
+        ]
+        return "\n".join(lines)
+
+
+@dataclasses.dataclass
+class _Node:
+    provider: factory.FieldProvider
+    # source through which the provider is computed, as the lazy evaluation would do
+    source: factory.FieldSource
+    field_name: str
+    dependencies: set[int] = dataclasses.field(default_factory=set)
+    dependents: set[int] = dataclasses.field(default_factory=set)
+
+
+def _build_graph(
+    sources: Sequence[factory.FieldSource], field_names: Iterable[str]
+) -> dict[int, _Node]:
+    """Build the graph of all providers that need to be computed for 'field_names'."""
+    nodes: dict[int, _Node] = {}
+    # nodes of the current depth first search path, for cycle detection
+    path: set[int] = set()
+
+    def _visit(name: str, source: factory.FieldSource) -> Optional[int]:
+        provider = source._providers.get(name)
+        if provider is None or factory.is_computed(provider):
+            return None
+        key = id(provider)
+        if key in path:
+            raise ValueError(f"Cyclic dependency of field '{name}' on itself.")
+        if key not in nodes:
+            node = _Node(provider=provider, source=source, field_name=name)
+            path.add(key)
+            for dependency in provider.dependencies:
+                dependency_key = _visit(dependency, source._sources)
+                if dependency_key is not None:
+                    node.dependencies.add(dependency_key)
+            path.remove(key)
+            nodes[key] = node
+            for dependency_key in node.dependencies:
+                nodes[dependency_key].dependents.add(key)
+        return key
+
+    for name in field_names:
+        source = next((s for s in sources if name in s._providers), None)
+        if source is None:
+            raise ValueError(f"Field '{name}' is not provided by any of the sources.")
+        _visit(name, source)
+    return nodes
+
+
+def _critical_path(
+    nodes: dict[int, _Node], timings: dict[int, ProviderTiming]
+) -> tuple[ProviderTiming, ...]:
+    """Longest path through the graph, weighted by the durations of the providers."""
+    length: dict[int, float] = {}
+    predecessor: dict[int, Optional[int]] = {}
+    # the timings are in order of completion, which is a topological order
+    for key in timings:
+        dependencies = nodes[key].dependencies
+        previous = max(dependencies, key=lambda d: length[d], default=None)
+        predecessor[key] = previous
+        length[key] = timings[key].duration + (length[previous] if previous is not None else 0.0)
+    path = []
+    key = max(length, key=lambda k: length[k], default=None)
+    while key is not None:
+        path.append(timings[key])
+        key = predecessor[key]
+    return tuple(reversed(path))
+
+
+def compute_fields(
+    sources: Union[factory.FieldSource, Sequence[factory.FieldSource]],
+    field_names: Iterable[str],
+    max_workers: Optional[int] = None,
+) -> ScheduleReport:
+    """
+    Compute fields and all their dependencies, running independent providers concurrently.
+
+    Args:
+        sources: field sources providing the fields, a field is computed by the first source
+            providing it. Typically these are factories joined by a `CompositeSource`, for
+            example a `MetricsFieldsFactory`, an `InterpolationFieldsFactory` and a `GridGeometry`.
+        field_names: names of the fields to compute
+        max_workers: size of the thread pool, defaults to the `ThreadPoolExecutor` default
+    Returns:
+        report of the timings of all computed providers and the critical path
+    """
+    sources = tuple(sources) if isinstance(sources, Sequence) else (sources,)
+    nodes = _build_graph(sources, field_names)
+    start = time.perf_counter()
+    timings: dict[int, ProviderTiming] = {}
+
+    def _run(key: int) -> ProviderTiming:
+        node = nodes[key]
+        begin = time.perf_counter()
+        node.source.get(node.field_name)
+        end = time.perf_counter()
+        return ProviderTiming(
+            fields=tuple(node.provider.fields.keys()),
+            func_name=factory.func_name(node.provider.func),
+            start=begin - start,
+            duration=end - begin,
+            thread=threading.current_thread().name,
+        )
+
+    missing = {key: len(node.dependencies) for key, node in nodes.items()}
+    ready = [key for key, count in missing.items() if count == 0]
+    running: dict[futures.Future, int] = {}
+
+    def _complete(key: int, timing: ProviderTiming) -> None:
+        timings[key] = timing
+        log.debug(f"computed {timing.fields} in {timing.duration:.3f}s on {timing.thread}")
+        for dependent in nodes[key].dependents:
+            missing[dependent] -= 1
+            if missing[dependent] == 0:
+                ready.append(dependent)
+
+    with futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="field-provider"
+    ) as executor:
+        try:
+            while ready or running:
+                while ready:
+                    key = ready.pop()
+                    if isinstance(nodes[key].provider, _CONCURRENT_PROVIDERS):
+                        running[executor.submit(_run, key)] = key
+                    else:
+                        _complete(key, _run(key))
+                if not running:
+                    continue
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    _complete(running.pop(future), future.result())
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
+
+    report = ScheduleReport(
+        timings=tuple(timings.values()),
+        critical_path=_critical_path(nodes, timings),
+        wall_time=time.perf_counter() - start,
+    )
+    log.info(
+        f"computed {len(report.timings)} field providers in {report.wall_time:.3f}s, "
+        f"critical path {report.critical_path_time:.3f}s"
+    )
+    return report
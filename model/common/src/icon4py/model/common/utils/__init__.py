@@ -8,7 +8,7 @@
 
 from __future__ import annotations
 
-from . import data_allocation
+from . import data_allocation, disk_cache, instrumentation, precompilation
 from ._common import (
     DoubleBuffering,
     Pair,
@@ -30,5 +30,8 @@ __all__ = [
     "chainable",
     # Modules
     "data_allocation",
+    "disk_cache",
+    "instrumentation",
+    "precompilation",
     "serialbox",
 ]
@@ -0,0 +1,127 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+On-disk store for collections of arrays.
+
+Each entry of the cache is a directory named by its key, containing one `.npy` file per array
+and a `metadata.json` file. Entries are written to a temporary directory first and then renamed,
+so that concurrent processes writing the same key never see a partially written entry and
+readers can memory map the arrays.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pathlib
+import re
+import shutil
+import tempfile
+from collections.abc import Mapping
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+_log = logging.getLogger(__name__)
+
+_METADATA_FILE = "metadata.json"
+_INVALID_KEY_CHARACTERS = re.compile(r"[^A-Za-z0-9_.\-]")
+
+
+def sanitize_key(key: str) -> str:
+    """Replace all characters of a key that are not safe to use in a file name."""
+    return _INVALID_KEY_CHARACTERS.sub("_", key)
+
+
+class DiskCache:
+    """
+    Directory based cache of named arrays.
+
+    Args:
+        path: root directory of the cache, it is created if it does not exist.
+    """
+
+    def __init__(self, path: Union[pathlib.Path, str]):
+        self._path = pathlib.Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    def _entry(self, key: str) -> pathlib.Path:
+        return self._path.joinpath(sanitize_key(key))
+
+    def __contains__(self, key: str) -> bool:
+        return self._entry(key).joinpath(_METADATA_FILE).exists()
+
+    def store(
+        self,
+        key: str,
+        arrays: Mapping[str, data_alloc.NDArray],
+        metadata: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Write arrays and json serializable metadata to the cache entry 'key'.
+
+        If the entry already exists, for example because it has been written by another process
+        in the meantime, the existing entry is kept.
+        """
+        entry = self._entry(key)
+        tmp_entry = pathlib.Path(tempfile.mkdtemp(prefix=f".{entry.name}.", dir=self._path))
+        try:
+            for name, array in arrays.items():
+                np.save(tmp_entry.joinpath(f"{sanitize_key(name)}.npy"), data_alloc.as_numpy(array))
+            with open(tmp_entry.joinpath(_METADATA_FILE), "w") as f:
+                json.dump({"metadata": dict(metadata or {}), "arrays": list(arrays.keys())}, f)
+            os.rename(tmp_entry, entry)
+            _log.info(f"stored cache entry '{key}' in '{self._path}'")
+        except OSError as err:
+            if key not in self:
+                raise
+            _log.debug(f"cache entry '{key}' already exists, discarding new one: {err}")
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+    def load(self, key: str, mmap: bool = True) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+        """
+        Read the metadata and arrays of the cache entry 'key'.
+
+        Args:
+            key: key of the entry
+            mmap: if True the arrays are memory mapped read-only instead of read into memory.
+        Returns:
+            tuple of the metadata and a dictionary of all arrays in the entry
+        """
+        entry = self._entry(key)
+        try:
+            with open(entry.joinpath(_METADATA_FILE), "r") as f:
+                content = json.load(f)
+        except FileNotFoundError as err:
+            raise KeyError(f"No cache entry '{key}' in '{self._path}'.") from err
+        mmap_mode = "r" if mmap else None
+        arrays = {
+            name: np.load(entry.joinpath(f"{sanitize_key(name)}.npy"), mmap_mode=mmap_mode)
+            for name in content["arrays"]
+        }
+        return content["metadata"], arrays
+
+    def keys(self) -> list[str]:
+        """Return the (sanitized) keys of all complete entries in the cache, sorted by name."""
+        return sorted(
+            entry.name
+            for entry in self._path.iterdir()
+            if not entry.name.startswith(".") and entry.joinpath(_METADATA_FILE).exists()
+        )
+
+    def remove(self, key: str) -> None:
+        shutil.rmtree(self._entry(key), ignore_errors=True)
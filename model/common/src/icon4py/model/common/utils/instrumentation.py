@@ -0,0 +1,314 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Timing of named regions of the time loop, aggregated into a tree per time step.
+
+The granules mark their phases (predictor, corrector, halo exchanges, ...) as regions, either
+with the `region` context manager or with the `timed` decorator on methods. Regions nest, a
+region opened while another one is open is recorded as its child:
+
+---
+instrumentation.enable(synchronize=True)
+for step in range(n_time_steps):
+    with instrumentation.time_step(step):
+        solve_nonhydro.time_step(...)
+        diffusion.run(...)
+report = instrumentation.disable()
+log.info(report.summary(step=0))
+report.write_chrome_trace("trace.json")  # open in chrome://tracing or https://ui.perfetto.dev
+---
+
+While enabled, every call of a GT4Py program is recorded as a region named after the program,
+so the time of a region is split up down to the single (fused) stencils. The programs of a DaCe
+orchestrated method are not called one by one and are not recorded.
+
+The instrumentation is disabled by default and then costs close to nothing: `region` returns a
+shared no-op context manager, `timed` methods only check a module global and GT4Py programs are
+not patched. GPU backends execute asynchronously; with `synchronize=True` the device is
+synchronized when a region is entered and left, so that a region is charged with the device
+work it launched.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+import json
+import os
+import pathlib
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any, Optional, TypeVar
+
+from gt4py.next.ffront import decorator as gtx_decorator
+
+
+try:
+    import cupy as cp  # type: ignore[import-not-found]
+except ImportError:
+    cp = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_NO_REGION = contextlib.nullcontext()
+_program_call = gtx_decorator.Program.__call__
+
+
+@dataclasses.dataclass(frozen=True)
+class RegionEvent:
+    """
+    A single execution of a region.
+
+    Args:
+        name: name of the region
+        path: names of the enclosing regions and of the region itself
+        start: start time in seconds, relative to the call of `enable`
+        duration: duration in seconds
+        step: index of the time step the region was executed in, None outside of time steps
+        thread: identifier of the thread that executed the region
+    """
+
+    name: str
+    path: tuple[str, ...]
+    start: float
+    duration: float
+    step: Optional[int]
+    thread: int
+
+
+@dataclasses.dataclass
+class RegionTree:
+    """Aggregated timings of a region and of the regions nested in it."""
+
+    name: str
+    count: int = 0
+    total: float = 0.0
+    children: dict[str, RegionTree] = dataclasses.field(default_factory=dict)
+
+    @property
+    def self_time(self) -> float:
+        """Time spent in the region outside of its children."""
+        return self.total - sum(child.total for child in self.children.values())
+
+    def add(self, path: tuple[str, ...], duration: float) -> None:
+        node = self
+        for name in path:
+            node = node.children.setdefault(name, RegionTree(name))
+        node.count += 1
+        node.total += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total": self.total,
+            "children": [child.as_dict() for child in self.children.values()],
+        }
+
+    def lines(self, depth: int = 0, parent_total: Optional[float] = None) -> list[str]:
+        share = f"{self.total / parent_total:7.1%}" if parent_total else " " * 7
+        lines = [
+            f"{'  ' * depth}{self.name:<{max(60 - 2 * depth, 1)}} {self.count:6d} "
+            f"{self.total:10.6f}s {share}"
+        ]
+        for child in sorted(self.children.values(), key=lambda c: c.total, reverse=True):
+            lines.extend(child.lines(depth + 1, self.total))
+        return lines
+
+
+@dataclasses.dataclass(frozen=True)
+class InstrumentationReport:
+    """
+    Regions recorded between `enable` and `disable`.
+
+    Args:
+        events: all executions of regions, in the order in which they ended
+    """
+
+    events: tuple[RegionEvent, ...]
+
+    @property
+    def steps(self) -> list[int]:
+        return sorted({e.step for e in self.events if e.step is not None})
+
+    def tree(self, step: Optional[int] = None) -> RegionTree:
+        """Tree of the regions of time step 'step', or of all regions if 'step' is None."""
+        root = RegionTree("total" if step is None else f"time step {step}")
+        for event in self.events:
+            if step is None or event.step == step:
+                root.add(event.path, event.duration)
+        root.count = 1
+        root.total = sum(child.total for child in root.children.values())
+        return root
+
+    def summary(self, step: Optional[int] = None) -> str:
+        header = f"{'region':<60} {'calls':>6} {'time':>11} {'share':>7}"
+        return "\n".join([header, *self.tree(step).lines()])
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.tree().as_dict(),
+            "steps": {step: self.tree(step).as_dict() for step in self.steps},
+        }
+
+    def write_json(self, path: pathlib.Path | str) -> None:
+        """Write the region trees of all time steps and of the whole run."""
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def write_chrome_trace(self, path: pathlib.Path | str) -> None:
+        """Write all region executions in the Trace Event Format of Chrome and Perfetto."""
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": e.name,
+                "cat": "icon4py",
+                "ph": "X",
+                "ts": e.start * 1e6,
+                "dur": e.duration * 1e6,
+                "pid": pid,
+                "tid": e.thread,
+                "args": {"step": e.step},
+            }
+            for e in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+class _Recorder:
+    def __init__(self, synchronize: bool):
+        self.synchronize = synchronize and cp is not None
+        self.origin = time.perf_counter()
+        self.events: list[RegionEvent] = []
+        self.step: Optional[int] = None
+        self._local = threading.local()
+
+    def stack(self) -> list[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def now(self) -> float:
+        if self.synchronize:
+            cp.cuda.runtime.deviceSynchronize()
+        return time.perf_counter()
+
+
+class _Region:
+    __slots__ = ("_recorder", "_name", "_start")
+
+    def __init__(self, recorder: _Recorder, name: str):
+        self._recorder = recorder
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._recorder.stack().append(self._name)
+        self._start = self._recorder.now()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        end = self._recorder.now()
+        stack = self._recorder.stack()
+        path = tuple(stack)
+        stack.pop()
+        self._recorder.events.append(
+            RegionEvent(
+                name=self._name,
+                path=path,
+                start=self._start - self._recorder.origin,
+                duration=end - self._start,
+                step=self._recorder.step,
+                thread=threading.get_ident(),
+            )
+        )
+
+
+_recorder: Optional[_Recorder] = None
+
+
+def _timed_program_call(program: gtx_decorator.Program, *args: Any, **kwargs: Any) -> Any:
+    recorder = _recorder
+    if recorder is None:
+        return _program_call(program, *args, **kwargs)
+    with _Region(recorder, program.definition_stage.definition.__name__):
+        return _program_call(program, *args, **kwargs)
+
+
+def enable(synchronize: bool = False) -> None:
+    """
+    Start recording regions, discarding the regions recorded so far.
+
+    Args:
+        synchronize: synchronize the device at the begin and end of every region, only has an
+            effect if CuPy is installed
+    """
+    global _recorder
+    _recorder = _Recorder(synchronize)
+    gtx_decorator.Program.__call__ = _timed_program_call
+
+
+def disable() -> InstrumentationReport:
+    """Stop recording regions and return the regions recorded since `enable`."""
+    global _recorder
+    result = report()
+    _recorder = None
+    gtx_decorator.Program.__call__ = _program_call
+    return result
+
+
+def is_enabled() -> bool:
+    return _recorder is not None
+
+
+def report() -> InstrumentationReport:
+    """Return the regions recorded so far."""
+    return InstrumentationReport(events=tuple(_recorder.events) if _recorder is not None else ())
+
+
+def region(name: str) -> contextlib.AbstractContextManager:
+    """Context manager recording a region 'name'."""
+    if _recorder is None:
+        return _NO_REGION
+    return _Region(_recorder, name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator recording every call of the decorated function as region 'name'."""
+
+    def _decorator(func: F) -> F:
+        @functools.wraps(func)
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _Region(recorder, name):
+                return func(*args, **kwargs)
+
+        return _wrapper  # type: ignore[return-value]
+
+    return _decorator
+
+
+@contextlib.contextmanager
+def time_step(index: int) -> Iterator[None]:
+    """Record the regions in its scope as time step 'index', itself a region 'time_step'."""
+    recorder = _recorder
+    if recorder is None:
+        yield
+        return
+    previous = recorder.step
+    recorder.step = index
+    try:
+        with _Region(recorder, "time_step"):
+            yield
+    finally:
+        recorder.step = previous
@@ -0,0 +1,414 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Ahead-of-time compilation of the GT4Py programs bound by the granules.
+
+GT4Py programs are compiled lazily at their first call, so the first time step compiles all
+programs one after the other. `precompile` instead collects the programs bound to the attributes
+of the granules (and of the components they hold, for example the `VelocityAdvection` of a
+`SolveNonhydro`) and compiles them concurrently before the time loop:
+
+---
+report = precompilation.precompile(diffusion_granule, solve_nonhydro_granule, max_workers=8)
+log.info(report.summary())
+---
+
+A program is compiled through the same (cached) workflow of its backend that its first call
+runs, only the compiled program is not executed. The backend caches the compiled programs by the
+types of the arguments and by the names and identities of the offset providers. Only the types
+(and not the sizes) of the arguments matter, so the programs are compiled for dummy arguments of
+the types of their signature. The offset providers however have to be the ones of the later
+calls: they are taken from the calls of the programs in the methods of the granules, see
+`call_site_offset_providers`.
+
+Most of the compilation time is spent in the C++ compiler running as a subprocess, which is why
+a thread pool is sufficient to compile in parallel.
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import functools
+import inspect
+import logging
+import sys
+import textwrap
+import threading
+import time
+from collections.abc import Mapping
+from concurrent import futures
+from typing import Any, Optional
+
+import gt4py.next as gtx
+from gt4py.eve import exceptions as eve_exceptions
+from gt4py.next import common as gtx_common
+from gt4py.next.ffront import decorator as gtx_decorator
+from gt4py.next.otf import stages, workflow
+from gt4py.next.type_system import type_specifications as ts, type_translation as tt
+
+
+log = logging.getLogger(__name__)
+
+OffsetProvider = Mapping[str, Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class CompileTiming:
+    """
+    Compilation of a single program.
+
+    Args:
+        name: attribute path of the program, starting at the granule
+        duration: compile time in seconds
+        thread: name of the thread the program was compiled on
+        offset_providers: names of the offset providers of each variant the program was
+            compiled for
+    """
+
+    name: str
+    duration: float
+    thread: str
+    offset_providers: tuple[tuple[str, ...], ...] = ()
+
+
+@dataclasses.dataclass(frozen=True)
+class CompileReport:
+    """
+    Timings of a `precompile` run.
+
+    Args:
+        timings: the compiled programs in the order of completion
+        skipped: programs that have not been compiled, with the reason
+        wall_time: total time of the run in seconds
+    """
+
+    timings: tuple[CompileTiming, ...]
+    skipped: tuple[tuple[str, str], ...]
+    wall_time: float
+
+    @property
+    def total_time(self) -> float:
+        """Sum of the compile times of all programs, the time of a serial compilation."""
+        return sum(t.duration for t in self.timings)
+
+    def summary(self) -> str:
+        lines = [
+            f"compiled {len(self.timings)} programs in {self.wall_time:.3f}s "
+            f"(serial: {self.total_time:.3f}s), skipped {len(self.skipped)}",
+            "programs:",
+            *(
+                f"  {t.duration:8.3f}s  [{t.thread}]  {t.name}"
+                for t in sorted(self.timings, key=lambda t: t.duration, reverse=True)
+            ),
+            *(["skipped:"] if self.skipped else []),
+            *(f"  {name}: {reason}" for name, reason in self.skipped),
+        ]
+        return "\n".join(lines)
+
+
+@dataclasses.dataclass
+class _BoundProgram:
+    program: gtx_decorator.Program
+    # objects the program is bound to, with the name of the attribute
+    owners: list[tuple[Any, str]] = dataclasses.field(default_factory=list)
+
+
+def _bound_programs(*granules: Any) -> dict[str, _BoundProgram]:
+    programs: dict[str, _BoundProgram] = {}
+    definitions: dict[tuple[int, int], _BoundProgram] = {}
+    visited: set[int] = set()
+
+    def _visit(obj: Any, path: str) -> None:
+        if id(obj) in visited:
+            return
+        visited.add(id(obj))
+        for name, value in vars(obj).items():
+            if isinstance(value, gtx_decorator.Program):
+                if value.backend is None:
+                    continue
+                key = (id(value.definition_stage.definition), id(value.backend))
+                if key not in definitions:
+                    definitions[key] = programs[f"{path}.{name}"] = _BoundProgram(value)
+                definitions[key].owners.append((obj, name))
+            elif type(value).__module__.startswith("icon4py.") and hasattr(value, "__dict__"):
+                _visit(value, f"{path}.{name}")
+
+    for granule in granules:
+        _visit(granule, type(granule).__name__)
+    return programs
+
+
+def bound_programs(*granules: Any) -> dict[str, gtx_decorator.Program]:
+    """
+    Collect the programs with a backend that are bound to attributes of the granules.
+
+    Attributes that are instances of ICON4Py classes are searched recursively. Programs that are
+    bound more than once (in the same or in different granules) are only returned once.
+
+    Returns:
+        the programs by their attribute path, for example 'SolveNonhydro.velocity_advection._compute_contravariant_correction'
+    """
+    return {name: bound.program for name, bound in _bound_programs(*granules).items()}
+
+
+@functools.cache
+def _call_sites(cls: type) -> dict[str, tuple[tuple[type, ast.expr], ...]]:
+    """The `offset_provider` arguments of the calls `self.<attribute>(...)` in the methods of a class."""
+    sites: dict[str, list[tuple[type, ast.expr]]] = {}
+    for base in cls.__mro__:
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(base)))
+        except (OSError, TypeError):
+            continue
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call):
+                continue
+            function = node.func
+            # `self.<attribute>.with_connectivities(...)(...)` calls the same program
+            while (
+                isinstance(function, ast.Call)
+                and isinstance(function.func, ast.Attribute)
+                and function.func.attr.startswith("with_")
+            ):
+                function = function.func.value
+            if not (
+                isinstance(function, ast.Attribute)
+                and isinstance(function.value, ast.Name)
+                and function.value.id == "self"
+            ):
+                continue
+            for keyword in node.keywords:
+                if keyword.arg == "offset_provider":
+                    sites.setdefault(function.attr, []).append((base, keyword.value))
+    return {attribute: tuple(s) for attribute, s in sites.items()}
+
+
+def call_site_offset_providers(owner: Any, attribute: str) -> list[OffsetProvider]:
+    """
+    Offset providers that the methods of an object pass to the program bound to one of its attributes.
+
+    The `offset_provider` arguments of the calls `self.<attribute>(..., offset_provider=...)` in
+    the source of the class of `owner` (and of its base classes) are evaluated with `self` being
+    `owner`, in the module of the class. Arguments that depend on anything else, for example on
+    local variables of the method, are ignored.
+
+    Calls `self.<attribute>.with_connectivities(...)(...)` count as calls of the program as well.
+    They run a copy of the program with its own implicit offset providers, which misses the
+    in-memory cache of the backend but finds the program compiled in its build cache.
+    """
+    providers = []
+    for cls, expression in _call_sites(type(owner)).get(attribute, ()):
+        try:
+            provider = eval(
+                compile(ast.Expression(expression), inspect.getsourcefile(cls) or "", "eval"),
+                vars(sys.modules[cls.__module__]),
+                {"self": owner},
+            )
+        except Exception as error:
+            log.debug(f"ignoring call site of '{attribute}' of {cls.__name__}: {error}")
+            continue
+        providers.append(provider)
+    return providers
+
+
+def _offset_provider_key(offset_provider: OffsetProvider) -> tuple[tuple[str, int], ...]:
+    # the compiled programs are cached by the names and identities of the offset providers
+    return tuple((name, id(value)) for name, value in offset_provider.items())
+
+
+def _implicit_offset_providers(program: gtx_decorator.Program) -> dict[str, gtx.Dimension]:
+    """The offset providers that a call of the program adds for the `Dim + 1` syntax."""
+    return {
+        gtx_common.dimension_to_implicit_offset(dim.value): dim
+        for param in program.past_stage.past_node.params
+        if isinstance(param.type, ts.FieldType)
+        for dim in param.type.dims
+        if dim.kind in (gtx.DimensionKind.HORIZONTAL, gtx.DimensionKind.VERTICAL)
+    }
+
+
+def _grid_offset_providers(granules: tuple[Any, ...]) -> OffsetProvider:
+    """Offset providers of the first grid held by one of the granules."""
+    # imported here, the grid module depends on the utils package
+    from icon4py.model.common.grid import base as base_grid
+
+    for granule in granules:
+        for value in vars(granule).values():
+            if isinstance(value, base_grid.BaseGrid):
+                return value.offset_providers
+    raise ValueError("None of the granules holds a grid, pass the offset providers explicitly.")
+
+
+def _dummy_argument(
+    type_: ts.TypeSpec, backend, dimensions: dict[gtx.Dimension, gtx.Dimension]
+) -> Any:
+    if isinstance(type_, ts.FieldType):
+        return gtx.zeros(
+            {dimensions.setdefault(dim, dim): 1 for dim in type_.dims},
+            dtype=tt.as_dtype(type_.dtype),
+            allocator=backend,
+        )
+    if isinstance(type_, ts.ScalarType):
+        return tt.as_dtype(type_).scalar_type(0)
+    if isinstance(type_, ts.TupleType):
+        return tuple(_dummy_argument(t, backend, dimensions) for t in type_.types)
+    raise NotImplementedError(f"Arguments of type '{type_}' are not supported.")
+
+
+def dummy_arguments(program: gtx_decorator.Program) -> tuple[Any, ...]:
+    """
+    Arguments of the types in the signature of a program, allocated with its backend.
+
+    The fields share one object per dimension, as the fields of a model do: the cache key of
+    the compiled program is a hash over the pickled argument types, which depends on it.
+    """
+    definition = program.past_stage.past_node.type.definition
+    dimensions: dict[gtx.Dimension, gtx.Dimension] = {}
+    return tuple(
+        _dummy_argument(type_, program.backend, dimensions)
+        for type_ in (*definition.pos_only_args, *definition.pos_or_kw_args.values())
+    )
+
+
+def compile_program(program: gtx_decorator.Program, offset_provider: OffsetProvider) -> None:
+    """
+    Compile a program into the cache of its backend, without running it.
+
+    Runs the cached workflow of the backend in the same way as a call of the program does, so
+    that a later call with the same offset providers takes the compiled program from the cache.
+
+    Args:
+        program: a program with a backend that caches its compiled programs (the cached GTFN
+            backends)
+        offset_provider: the offset providers that the program is called with
+    """
+    otf_workflow = getattr(program.backend.executor, "otf_workflow", None)
+    if not isinstance(otf_workflow, workflow.CachedStep):
+        raise NotImplementedError(
+            f"Backend '{program.backend.__name__}' does not cache compiled programs."
+        )
+    program_call = program.backend.transforms_prog(
+        workflow.InputWithArgs(
+            program.definition_stage,
+            dummy_arguments(program),
+            {"offset_provider": {**offset_provider, **_implicit_offset_providers(program)}},
+        )
+    )
+    otf_workflow(
+        stages.ProgramCall(
+            program=program_call.program, args=program_call.args, kwargs=program_call.kwargs
+        )
+    )
+
+
+def _compile_with_fallback(
+    program: gtx_decorator.Program, offset_provider: OffsetProvider
+) -> OffsetProvider:
+    # programs that do not use vertical offsets cannot be translated with offset providers that
+    # contain the vertical offset, they are compiled without offset providers instead
+    try:
+        compile_program(program, offset_provider)
+        return offset_provider
+    except eve_exceptions.EveValueError:
+        compile_program(program, {})
+        return {}
+
+
+def precompile(
+    *granules: Any,
+    offset_provider: Optional[OffsetProvider] = None,
+    max_workers: Optional[int] = None,
+) -> CompileReport:
+    """
+    Compile all programs bound to the granules concurrently.
+
+    Each program is compiled for all offset providers that the granules pass to it (see
+    `call_site_offset_providers`). Programs without such calls in the granules are compiled with
+    `offset_provider`, or without offset providers if they do not use any.
+
+    Args:
+        granules: granules or other objects holding programs
+        offset_provider: offset providers for the programs that are not called by the granules,
+            defaults to the `offset_providers` of the grid held by the first granule
+        max_workers: size of the thread pool, defaults to the `ThreadPoolExecutor` default
+    Returns:
+        report of the compile times of all programs
+    """
+    programs = _bound_programs(*granules)
+    call_sites: dict[str, list[OffsetProvider]] = {}
+    for name, bound in programs.items():
+        variants: dict[tuple[tuple[str, int], ...], OffsetProvider] = {}
+        for owner, attribute in bound.owners:
+            for provider in call_site_offset_providers(owner, attribute):
+                variants.setdefault(_offset_provider_key(provider), provider)
+        call_sites[name] = list(variants.values())
+    if offset_provider is None and not all(call_sites.values()):
+        offset_provider = _grid_offset_providers(granules)
+    start = time.perf_counter()
+
+    def _compile(name: str) -> CompileTiming:
+        begin = time.perf_counter()
+        program = programs[name].program
+        if call_sites[name]:
+            # the variants of a program are compiled one after the other, they may share their
+            # build directory
+            for provider in call_sites[name]:
+                compile_program(program, provider)
+            compiled = call_sites[name]
+        else:
+            compiled = [_compile_with_fallback(program, offset_provider)]
+        return CompileTiming(
+            name=name,
+            duration=time.perf_counter() - begin,
+            thread=threading.current_thread().name,
+            offset_providers=tuple(tuple(provider) for provider in compiled),
+        )
+
+    timings = []
+    skipped = []
+
+    def _complete(name: str, future: futures.Future) -> None:
+        try:
+            timing = future.result()
+        except NotImplementedError as error:
+            skipped.append((name, str(error)))
+            return
+        log.debug(f"compiled {timing.name} in {timing.duration:.3f}s on {timing.thread}")
+        timings.append(timing)
+
+    # The build system of a backend is set up by its first compilation, which is not safe to
+    # run concurrently: compile one program per backend before the others.
+    first_per_backend = {
+        id(bound.program.backend): name for name, bound in reversed(programs.items())
+    }
+    with futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="precompile"
+    ) as executor:
+        for name in first_per_backend.values():
+            future = executor.submit(_compile, name)
+            futures.wait((future,))
+            _complete(name, future)
+        running = {
+            executor.submit(_compile, name): name
+            for name in programs
+            if name not in first_per_backend.values()
+        }
+        for future in futures.as_completed(running):
+            _complete(running[future], future)
+
+    report = CompileReport(
+        timings=tuple(timings),
+        skipped=tuple(skipped),
+        wall_time=time.perf_counter() - start,
+    )
+    log.info(
+        f"compiled {len(report.timings)} programs in {report.wall_time:.3f}s "
+        f"(serial: {report.total_time:.3f}s)"
+    )
+    return report
@@ -0,0 +1,118 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import decomposer, definitions as defs
+from icon4py.model.common.grid import simple
+
+
+def torus_cell_adjacency(nx: int, ny: int) -> np.ndarray:
+    """C2E2C of a periodic mesh of nx * ny parallelograms each split into two triangles."""
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    i = i.ravel()
+    j = j.ravel()
+
+    def cell(i, j, k):
+        return 2 * ((i % nx) + nx * (j % ny)) + k
+
+    c2e2c = np.empty((2 * nx * ny, 3), dtype=np.int32)
+    c2e2c[cell(i, j, 0)] = np.stack((cell(i, j - 1, 1), cell(i, j, 1), cell(i - 1, j, 1)), axis=1)
+    c2e2c[cell(i, j, 1)] = np.stack((cell(i + 1, j, 0), cell(i, j + 1, 0), cell(i, j, 0)), axis=1)
+    return c2e2c
+
+
+@pytest.mark.parametrize("num_partitions", [1, 2, 3, 7, 16])
+def test_recursive_bisection_balanced(num_partitions):
+    adjacency = torus_cell_adjacency(16, 12)
+    partition = decomposer.RecursiveBisectionDecomposer()(adjacency, num_partitions)
+
+    assert partition.shape == (adjacency.shape[0],)
+    sizes = np.bincount(partition, minlength=num_partitions)
+    assert sizes.shape == (num_partitions,)
+    assert sizes.max() - sizes.min() <= 1
+
+
+def test_recursive_bisection_partitions_are_compact():
+    adjacency = torus_cell_adjacency(16, 12)
+    num_partitions = 8
+    partition = decomposer.RecursiveBisectionDecomposer()(adjacency, num_partitions)
+
+    cut_edges = np.count_nonzero(partition[adjacency] != partition[:, np.newaxis]) // 2
+    random_partition = np.random.default_rng(42).permutation(partition)
+    random_cut_edges = (
+        np.count_nonzero(random_partition[adjacency] != random_partition[:, np.newaxis]) // 2
+    )
+    assert cut_edges < random_cut_edges // 2
+
+
+def test_recursive_bisection_invalid_number_of_partitions():
+    adjacency = torus_cell_adjacency(2, 2)
+    with pytest.raises(ValueError):
+        decomposer.RecursiveBisectionDecomposer()(adjacency, 0)
+    with pytest.raises(ValueError):
+        decomposer.RecursiveBisectionDecomposer()(adjacency, adjacency.shape[0] + 1)
+
+
+def test_recursive_bisection_disconnected_graph():
+    adjacency = np.array([[1, -1], [0, -1], [3, -1], [2, -1], [-1, -1], [-1, -1]])
+    partition = decomposer.RecursiveBisectionDecomposer()(adjacency, 3)
+    assert np.all(np.bincount(partition) == 2)
+
+
+def test_single_node_decomposer():
+    adjacency = torus_cell_adjacency(3, 3)
+    assert np.all(decomposer.SingleNodeDecomposer()(adjacency, 1) == 0)
+    with pytest.raises(ValueError):
+        decomposer.SingleNodeDecomposer()(adjacency, 2)
+
+
+@pytest.mark.parametrize("num_ranks", [1, 2, 3])
+def test_decompose_owned_entries_are_disjoint_and_complete(num_ranks):
+    grid = simple.SimpleGrid()
+    infos = [decomposer.decompose(grid, num_ranks, rank) for rank in range(num_ranks)]
+    for dim, size in (
+        (dims.CellDim, grid.num_cells),
+        (dims.EdgeDim, grid.num_edges),
+        (dims.VertexDim, grid.num_vertices),
+    ):
+        owned = np.concatenate(
+            [i.global_index(dim, defs.DecompositionInfo.EntryType.OWNED) for i in infos]
+        )
+        assert np.all(np.sort(owned) == np.arange(size))
+
+
+@pytest.mark.parametrize("num_halo_lines", [1, 2])
+def test_decompose_halo(num_halo_lines):
+    grid = simple.SimpleGrid()
+    num_ranks = 3
+    cell_owner = decomposer.RecursiveBisectionDecomposer()(
+        grid.connectivities[dims.C2E2CDim], num_ranks
+    )
+    for rank in range(num_ranks):
+        info = decomposer.construct_decomposition_info(grid, cell_owner, rank, num_halo_lines)
+        all_cells = info.global_index(dims.CellDim, defs.DecompositionInfo.EntryType.ALL)
+        owned_cells = info.global_index(dims.CellDim, defs.DecompositionInfo.EntryType.OWNED)
+        halo_cells = info.global_index(dims.CellDim, defs.DecompositionInfo.EntryType.HALO)
+
+        assert info.num_cells == all_cells.shape[0]
+        assert np.all(cell_owner[owned_cells] == rank)
+        assert np.all(cell_owner[halo_cells] != rank)
+        assert np.unique(all_cells).shape == all_cells.shape
+        # owned entries come first
+        assert np.all(info.owner_mask(dims.CellDim)[: owned_cells.shape[0]])
+        # all neighbors of owned cells are in the local domain
+        assert np.all(np.isin(grid.connectivities[dims.C2E2CDim][owned_cells], all_cells))
+        assert np.all(
+            np.isin(grid.connectivities[dims.C2EDim][all_cells], info.global_index(dims.EdgeDim))
+        )
+        assert np.all(
+            np.isin(grid.connectivities[dims.C2VDim][all_cells], info.global_index(dims.VertexDim))
+        )
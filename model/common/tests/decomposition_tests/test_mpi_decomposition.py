@@ -258,3 +258,32 @@ def test_exchange_on_dummy_data(
     print(f"rank={processor_props.rank} - num changed points {changed_points.shape} ")
 
     print(f"rank={processor_props.rank} - changed points {changed_points} ")
+
+
+@pytest.mark.mpi
+@pytest.mark.parametrize("processor_props", [True], indirect=True)
+def test_exchange_batch_on_dummy_data(
+    processor_props,  # noqa: F811 # fixture
+    decomposition_info,  # noqa: F811 # fixture
+    grid_savepoint,  # noqa: F811 # fixture
+    metrics_savepoint,  # noqa: F811 # fixture
+):
+    exchange = create_exchange(processor_props, decomposition_info)
+    grid = grid_savepoint.construct_icon_grid(on_gpu=False)
+
+    number = processor_props.rank + 10.0
+    dimensions = (dims.CellDim, dims.VertexDim, dims.EdgeDim)
+    input_fields = {dim: constant_field(grid, number, dim, dims.KDim) for dim in dimensions}
+
+    for _ in range(2):
+        exchange.exchange_batch({dim: (f,) for dim, f in input_fields.items()}).wait()
+
+    for dim, field in input_fields.items():
+        halo_points = decomposition_info.local_index(dim, DecompositionInfo.EntryType.HALO)
+        local_points = decomposition_info.local_index(dim, DecompositionInfo.EntryType.OWNED)
+        result = field.asnumpy()
+        assert np.all(result[local_points, :] == number)
+        assert np.all(result[halo_points, :] != number)
+    if isinstance(exchange, GHexMultiNodeExchange):
+        # descriptors are created once per buffer and reused by the second exchange
+        assert len(exchange._field_descriptors) == len(dimensions)
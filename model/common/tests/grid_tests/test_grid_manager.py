@@ -17,10 +17,12 @@ import pytest
 from gt4py.next import backend as gtx_backend
 
 from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import definitions as decomposition
 from icon4py.model.common.grid import (
     grid_manager as gm,
     horizontal as h_grid,
     refinement as refin,
+    simple,
     vertical as v_grid,
 )
 from icon4py.model.common.grid.grid_manager import GeometryName
@@ -689,3 +691,309 @@ def test_edge_vertex_distance(grid_file, grid_savepoint, backend):
         expected.asnumpy(),
         equal_nan=True,
     )
+
+
+def test_construct_diamond_vertices():
+    e2v = simple.SimpleGridData.e2v_table.astype(gtx.int32)
+    c2v = simple.SimpleGridData.c2v_table.astype(gtx.int32)
+    e2c = simple.SimpleGridData.e2c_table.astype(gtx.int32)
+    e2c2v = gm._construct_diamond_vertices(e2v, c2v, e2c)
+    assert np.all(e2c2v[:, :2] == e2v)
+    assert_up_to_order(e2c2v, simple.SimpleGridData.e2c2v_table)
+
+
+def test_construct_diamond_edges():
+    e2c = simple.SimpleGridData.e2c_table.astype(gtx.int32)
+    c2e = simple.SimpleGridData.c2e_table.astype(gtx.int32)
+    e2c2e = gm._construct_diamond_edges(e2c, c2e)
+    assert e2c2e.dtype == gtx.int32
+    assert_up_to_order(e2c2e, simple.SimpleGridData.e2c2e_table)
+
+
+def test_construct_diamond_with_missing_cell():
+    connectivities = utils.torus_connectivities(4, 6)
+    e2v = connectivities["e2v"]
+    c2v = connectivities["c2v"]
+    c2e = connectivities["c2e"]
+    e2c = connectivities["e2c"].copy()
+    reference_e2c2v = gm._construct_diamond_vertices(e2v, c2v, e2c)
+    reference_e2c2e = gm._construct_diamond_edges(e2c, c2e)
+    e2c[3, 1] = gm.GridFile.INVALID_INDEX
+    e2c[5, 0] = gm.GridFile.INVALID_INDEX
+
+    e2c2v = gm._construct_diamond_vertices(e2v, c2v, e2c)
+    e2c2e = gm._construct_diamond_edges(e2c, c2e)
+
+    assert np.all(e2c2v[3] == np.append(reference_e2c2v[3, :3], gm.GridFile.INVALID_INDEX))
+    assert np.all(e2c2v[5] == np.append(e2v[5], [gm.GridFile.INVALID_INDEX] * 2))
+    assert np.all(e2c2e[3] == np.append(reference_e2c2e[3, :2], [gm.GridFile.INVALID_INDEX] * 2))
+    assert np.all(e2c2e[5] == np.append(reference_e2c2e[5, 2:], [gm.GridFile.INVALID_INDEX] * 2))
+    unchanged = np.ones(e2c.shape[0], dtype=bool)
+    unchanged[[3, 5]] = False
+    assert np.all(e2c2v[unchanged] == reference_e2c2v[unchanged])
+    assert np.all(e2c2e[unchanged] == reference_e2c2e[unchanged])
+
+
+@pytest.mark.with_netcdf
+@pytest.mark.parametrize(
+    "name",
+    (
+        gm.CoordinateName.CELL_LATITUDE,
+        gm.ConnectivityName.C2E,
+        gm.ConnectivityName.V2C,
+        gm.GeometryName.EDGE_CELL_DISTANCE,
+    ),
+)
+@pytest.mark.parametrize("max_gap", (0, gm.GridFile.MAX_READ_GAP))
+def test_grid_file_indexed_read(global_grid_file, name, max_gap):
+    rng = np.random.default_rng(42)
+    grid_file = gm.GridFile(str(global_grid_file))
+    grid_file.MAX_READ_GAP = max_gap
+    grid_file.open()
+    full = grid_file.variable(name)
+    size = full.shape[-1]
+    indices = np.concatenate((rng.permutation(size)[: size // 10], np.arange(20), [3, 3, 0]))
+    partial = grid_file.variable(name, indices)
+    grid_file.close()
+
+    assert partial.shape == (*full.shape[:-1], indices.shape[0])
+    assert np.all(partial == full[..., indices])
+
+
+@pytest.mark.with_netcdf
+def test_grid_manager_distributed_read(global_grid_file):
+    rng = np.random.default_rng(42)
+    reference = _run_grid_manager(dt_utils.R02B04_GLOBAL, backend=None)
+    global_c2e = reference.grid.connectivities[dims.C2EDim]
+    global_c2v = reference.grid.connectivities[dims.C2VDim]
+    global_c2e2c = reference.grid.connectivities[dims.C2E2CDim]
+    global_e2c = reference.grid.connectivities[dims.E2CDim]
+
+    # owned entries first and in global order, followed by the halo
+    def local_domain(owned: np.ndarray, all_entries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        halo = rng.permutation(np.setdiff1d(all_entries, owned))
+        owner_mask = np.concatenate(
+            (np.ones_like(owned, dtype=bool), np.zeros_like(halo, dtype=bool))
+        )
+        return np.concatenate((owned, halo)), owner_mask
+
+    owned_cells = np.sort(rng.permutation(reference.grid.num_cells)[:500])
+    cells, cell_owner = local_domain(owned_cells, np.unique(global_c2e2c[owned_cells]))
+    edges, edge_owner = local_domain(np.unique(global_c2e[owned_cells]), global_c2e[cells])
+    vertices, vertex_owner = local_domain(np.unique(global_c2v[owned_cells]), global_c2v[cells])
+    decomposition_info = decomposition.DecompositionInfo(klevels=1)
+    for dim, index, owner in (
+        (dims.CellDim, cells, cell_owner),
+        (dims.EdgeDim, edges, edge_owner),
+        (dims.VertexDim, vertices, vertex_owner),
+    ):
+        decomposition_info.with_dimension(dim, index, owner)
+
+    manager = gm.GridManager(ZERO_BASE, global_grid_file, v_grid.VerticalGridConfig(num_levels=1))
+    manager(backend=None, limited_area=False, decomposition_info=decomposition_info)
+    manager.close()
+    grid = manager.grid
+
+    assert grid.num_cells == cells.shape[0]
+    assert grid.num_edges == edges.shape[0]
+    assert grid.num_vertices == vertices.shape[0]
+    assert np.all(edges[grid.connectivities[dims.C2EDim]] == global_c2e[cells])
+    assert np.all(vertices[grid.connectivities[dims.C2VDim]] == global_c2v[cells])
+    e2c = grid.connectivities[dims.E2CDim]
+    expected_e2c = np.where(np.isin(global_e2c[edges], cells), global_e2c[edges], -1)
+    assert np.all(np.where(e2c >= 0, cells[e2c], -1) == expected_e2c)
+    for dim, index in ((dims.CellDim, cells), (dims.EdgeDim, edges), (dims.VertexDim, vertices)):
+        assert np.all(manager.refinement[dim] == reference.refinement[dim][index])
+        for coordinate in ("lat", "lon"):
+            assert np.all(
+                manager.coordinates[dim][coordinate].asnumpy()
+                == reference.coordinates[dim][coordinate].asnumpy()[index]
+            )
+    assert np.all(
+        manager.geometry[GeometryName.EDGE_CELL_DISTANCE].asnumpy()
+        == reference.geometry[GeometryName.EDGE_CELL_DISTANCE].asnumpy()[edges]
+    )
+    assert np.all(
+        manager.geometry[GeometryName.CELL_AREA].asnumpy()
+        == reference.geometry[GeometryName.CELL_AREA].asnumpy()[cells]
+    )
+
+    for dim, index, owner in (
+        (dims.CellDim, cells, cell_owner),
+        (dims.EdgeDim, edges, edge_owner),
+        (dims.VertexDim, vertices, vertex_owner),
+    ):
+        domain = h_grid.domain(dim)
+        num_owned = np.count_nonzero(owner)
+        local = slice(
+            grid.start_index(domain(h_grid.Zone.LOCAL)), grid.end_index(domain(h_grid.Zone.LOCAL))
+        )
+        halo = slice(
+            grid.start_index(domain(h_grid.Zone.HALO)), grid.end_index(domain(h_grid.Zone.HALO))
+        )
+        assert (local.start, local.stop) == (0, num_owned)
+        assert (halo.start, halo.stop) == (num_owned, index.shape[0])
+        assert grid.end_index(domain(h_grid.Zone.END)) == index.shape[0]
+        lat = manager.coordinates[dim]["lat"].asnumpy()
+        reference_lat = reference.coordinates[dim]["lat"].asnumpy()
+        assert np.all(lat[local] == reference_lat[index[owner]])
+        assert np.all(lat[halo] == reference_lat[index[~owner]])
+
+
+def test_to_local_start_end_indices():
+    dim = dims.CellDim
+    domain = h_grid.domain(dim)
+    # full grid: lateral boundary [0, 10), nudging [10, 20), interior [20, 100)
+    start = np.full(h_grid._CELL_GRF, 100, dtype=gtx.int32)
+    end = np.full(h_grid._CELL_GRF, 100, dtype=gtx.int32)
+    for zone, (zone_start, zone_end) in (
+        (h_grid.Zone.LATERAL_BOUNDARY, (0, 10)),
+        (h_grid.Zone.NUDGING, (10, 20)),
+        (h_grid.Zone.INTERIOR, (20, 100)),
+        (h_grid.Zone.LOCAL, (0, 100)),
+    ):
+        start[domain(zone)()] = zone_start
+        end[domain(zone)()] = zone_end
+    owned = np.array([3, 7, 12, 50, 60, 99])
+    halo = np.array([51, 2, 13])
+    global_index = np.concatenate((owned, halo))
+    owner_mask = np.arange(global_index.shape[0]) < owned.shape[0]
+
+    local_start, local_end = gm._to_local_start_end_indices(
+        dim, start, end, global_index, owner_mask
+    )
+
+    def local_range(zone: h_grid.Zone) -> tuple[int, int]:
+        return local_start[domain(zone)()], local_end[domain(zone)()]
+
+    assert local_range(h_grid.Zone.LATERAL_BOUNDARY) == (0, 2)
+    assert local_range(h_grid.Zone.NUDGING) == (2, 3)
+    assert local_range(h_grid.Zone.INTERIOR) == (3, 6)
+    assert local_range(h_grid.Zone.LOCAL) == (0, 6)
+    assert local_range(h_grid.Zone.HALO) == (6, 9)
+    assert local_range(h_grid.Zone.HALO_LEVEL_2) == (9, 9)
+    assert local_range(h_grid.Zone.END) == (9, 9)
+
+
+def test_to_local_start_end_indices_requires_ordered_owned_entries():
+    start = np.zeros(h_grid._CELL_GRF, dtype=gtx.int32)
+    end = np.zeros(h_grid._CELL_GRF, dtype=gtx.int32)
+    with pytest.raises(NotImplementedError):
+        gm._to_local_start_end_indices(
+            dims.CellDim, start, end, np.array([7, 3, 5]), np.array([True, True, False])
+        )
+    with pytest.raises(NotImplementedError):
+        gm._to_local_start_end_indices(
+            dims.CellDim, start, end, np.array([3, 5, 7]), np.array([True, False, True])
+        )
+
+
+@pytest.mark.with_netcdf
+def test_grid_manager_cache(tmp_path, backend, monkeypatch):
+    file = gridtest_utils.resolve_full_grid_file_name(dt_utils.R02B04_GLOBAL)
+    reference = gridtest_utils.get_grid_manager(
+        dt_utils.R02B04_GLOBAL, num_levels=1, backend=backend
+    )
+
+    def load_grid():
+        manager = gm.GridManager(
+            ZERO_BASE, file, v_grid.VerticalGridConfig(num_levels=1), cache_path=tmp_path
+        )
+        manager(backend=backend, limited_area=False)
+        manager.close()
+        return manager
+
+    load_grid()
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Grid should be loaded from the cache.")
+
+    monkeypatch.setattr(gm.GridManager, "_construct_grid", fail)
+    manager = load_grid()
+
+    grid = manager.grid
+    assert grid.id == reference.grid.id
+    assert grid.size == reference.grid.size
+    assert grid.global_num_cells == reference.grid.global_num_cells
+    for dim, table in reference.grid.connectivities.items():
+        assert np.all(data_alloc.as_numpy(grid.connectivities[dim]) == data_alloc.as_numpy(table))
+    for dim in utils.horizontal_dim():
+        for domain in utils.global_grid_domains(dim):
+            assert grid.start_index(domain) == reference.grid.start_index(domain)
+            assert grid.end_index(domain) == reference.grid.end_index(domain)
+        assert np.all(
+            data_alloc.as_numpy(manager.refinement[dim])
+            == data_alloc.as_numpy(reference.refinement[dim])
+        )
+        for coordinate in ("lat", "lon"):
+            assert helpers.dallclose(
+                manager.coordinates[dim][coordinate].asnumpy(),
+                reference.coordinates[dim][coordinate].asnumpy(),
+            )
+    for name, field in reference.geometry.items():
+        assert manager.geometry[name].domain == field.domain
+        assert helpers.dallclose(manager.geometry[name].asnumpy(), field.asnumpy())
+
+
+@pytest.mark.with_netcdf
+def test_grid_manager_cache_distinguishes_transformations(tmp_path, backend):
+    file = gridtest_utils.resolve_full_grid_file_name(dt_utils.R02B04_GLOBAL)
+
+    def load_grid(transformation: gm.IndexTransformation) -> gm.GridManager:
+        manager = gm.GridManager(
+            transformation, file, v_grid.VerticalGridConfig(num_levels=1), cache_path=tmp_path
+        )
+        manager(backend=backend, limited_area=False)
+        manager.close()
+        return manager
+
+    zero_based = load_grid(ZERO_BASE)
+    one_based = load_grid(gm.NoTransformation())
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # the (1-based) connectivities read from the file are shifted by one, invalid neighbors
+    # stay invalid
+    for dim in (dims.C2EDim, dims.C2VDim, dims.E2CDim, dims.E2VDim, dims.V2EDim):
+        zero_based_table = data_alloc.as_numpy(zero_based.grid.connectivities[dim])
+        one_based_table = data_alloc.as_numpy(one_based.grid.connectivities[dim])
+        assert np.all(
+            np.where(
+                zero_based_table == gm.GridFile.INVALID_INDEX,
+                one_based_table == gm.GridFile.INVALID_INDEX,
+                one_based_table == zero_based_table + 1,
+            )
+        )
+    assert np.all(
+        data_alloc.as_numpy(load_grid(ZERO_BASE).grid.connectivities[dims.C2EDim])
+        == data_alloc.as_numpy(zero_based.grid.connectivities[dims.C2EDim])
+    )
+
+
+@pytest.mark.parametrize("root, level", [(2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (2, 9)])
+def test_construct_derived_connectivities_benchmark(root, level, benchmark):
+    # periodic mesh with the same number of cells, edges and vertices as a global RnBk grid
+    n = root * 2**level
+    connectivities = utils.torus_connectivities(5 * n // 2, 4 * n)
+    assert connectivities["c2e"].shape[0] == 20 * n**2
+
+    def construct_diamonds():
+        gm._construct_diamond_vertices(
+            connectivities["e2v"], connectivities["c2v"], connectivities["e2c"]
+        )
+        gm._construct_diamond_edges(connectivities["e2c"], connectivities["c2e"])
+
+    benchmark(construct_diamonds)
+
+
+@pytest.mark.with_netcdf
+def test_grid_manager_benchmark(backend, benchmark):
+    file = gridtest_utils.resolve_full_grid_file_name(dt_utils.R02B04_GLOBAL)
+    gridtest_utils.get_grid_manager(dt_utils.R02B04_GLOBAL, num_levels=1, backend=backend)
+
+    def load_grid():
+        manager = gm.GridManager(ZERO_BASE, file, v_grid.VerticalGridConfig(num_levels=1))
+        manager(backend=backend, limited_area=False)
+        manager.close()
+
+    benchmark(load_grid)
@@ -7,6 +7,9 @@
 # SPDX-License-Identifier: BSD-3-Clause
 from __future__ import annotations
 
+import gt4py.next as gtx
+import numpy as np
+
 from icon4py.model.common import dimension as dims
 from icon4py.model.common.grid import horizontal as h_grid
 from icon4py.model.testing import datatest_utils as dt_utils
@@ -59,3 +62,45 @@ def valid_boundary_zones_for_dim(dim: dims.Dimension):
     ]
 
     yield from _domain(dim, zones)
+
+
+def torus_connectivities(nx: int, ny: int) -> dict[str, np.ndarray]:
+    """
+    Construct the E2V, C2V, E2C and C2E connectivities of a periodic triangular mesh.
+
+    The mesh consists of nx * ny parallelograms each split into two triangles, so it has
+    nx * ny vertices, 3 * nx * ny edges and 2 * nx * ny cells, which has the same size ratios as an
+    icosahedral grid and can hence be used as a stand in of configurable size.
+    """
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    i = i.ravel()
+    j = j.ravel()
+
+    def vertex(i, j):
+        return (i % nx) + nx * (j % ny)
+
+    def edge(i, j, k):
+        return 3 * vertex(i, j) + k
+
+    def cell(i, j, k):
+        return 2 * vertex(i, j) + k
+
+    num_vertices = nx * ny
+    e2v = np.empty((3 * num_vertices, 2), dtype=gtx.int32)
+    e2c = np.empty((3 * num_vertices, 2), dtype=gtx.int32)
+    c2v = np.empty((2 * num_vertices, 3), dtype=gtx.int32)
+    c2e = np.empty((2 * num_vertices, 3), dtype=gtx.int32)
+
+    e2v[edge(i, j, 0)] = np.stack((vertex(i, j), vertex(i + 1, j)), axis=1)
+    e2v[edge(i, j, 1)] = np.stack((vertex(i, j), vertex(i, j + 1)), axis=1)
+    e2v[edge(i, j, 2)] = np.stack((vertex(i + 1, j), vertex(i, j + 1)), axis=1)
+    e2c[edge(i, j, 0)] = np.stack((cell(i, j, 0), cell(i, j - 1, 1)), axis=1)
+    e2c[edge(i, j, 1)] = np.stack((cell(i, j, 0), cell(i - 1, j, 1)), axis=1)
+    e2c[edge(i, j, 2)] = np.stack((cell(i, j, 0), cell(i, j, 1)), axis=1)
+    c2v[cell(i, j, 0)] = np.stack((vertex(i, j), vertex(i + 1, j), vertex(i, j + 1)), axis=1)
+    c2v[cell(i, j, 1)] = np.stack(
+        (vertex(i + 1, j), vertex(i + 1, j + 1), vertex(i, j + 1)), axis=1
+    )
+    c2e[cell(i, j, 0)] = np.stack((edge(i, j, 0), edge(i, j, 2), edge(i, j, 1)), axis=1)
+    c2e[cell(i, j, 1)] = np.stack((edge(i + 1, j, 1), edge(i, j + 1, 0), edge(i, j, 2)), axis=1)
+    return {"e2v": e2v, "e2c": e2c, "c2v": c2v, "c2e": c2e}
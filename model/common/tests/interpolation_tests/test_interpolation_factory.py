@@ -304,3 +304,29 @@ def test_cells_aw_verts(interpolation_savepoint, grid_file, experiment, backend,
 
     assert field.shape == (grid.num_vertices, 6)
     assert test_helpers.dallclose(field_ref.asnumpy(), field.asnumpy(), rtol=rtol)
+
+
+@pytest.mark.with_netcdf
+@pytest.mark.parametrize(
+    "grid_file, experiment",
+    [
+        (dt_utils.R02B04_GLOBAL, dt_utils.GLOBAL_EXPERIMENT),
+    ],
+)
+def test_interpolation_factory_benchmark(grid_file, experiment, backend, benchmark):
+    geometry = gridtest_utils.get_grid_geometry(backend, experiment, grid_file)
+
+    def compute_all_fields():
+        interpolation_source = interpolation_factory.InterpolationFieldsFactory(
+            grid=geometry.grid,
+            decomposition_info=geometry._decomposition_info,
+            geometry_source=geometry,
+            backend=backend,
+            metadata=attrs.attrs,
+        )
+        for name in attrs.attrs:
+            interpolation_source.get(name)
+
+    # computes the geometry fields and compiles the programs
+    compute_all_fields()
+    benchmark(compute_all_fields)
@@ -5,10 +5,11 @@
 #
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
+import dataclasses
 import datetime as dt
 import pathlib
 import re
-from typing import Union
+from typing import Any, Union
 
 import gt4py.next as gtx
 import numpy as np
@@ -18,8 +19,9 @@ import xarray as xr
 
 import icon4py.model.common.exceptions as errors
 from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import decomposer, definitions as decomposition
 from icon4py.model.common.grid import base, simple, vertical as v_grid
-from icon4py.model.common.io import ugrid, utils
+from icon4py.model.common.io import ugrid, utils, writers
 from icon4py.model.common.io.io import (
     FieldGroupIOConfig,
     FieldGroupMonitor,
@@ -75,6 +77,27 @@ def model_state(grid: base.BaseGrid) -> dict[str, xr.DataArray]:
     }
 
 
+@dataclasses.dataclass(frozen=True)
+class FakeProcessProperties(decomposition.ProcessProperties):
+    rank: int
+    comm_size: int
+    comm: Any = None
+    comm_name: str = ""
+
+
+def local_state(state: dict, decomposition_info: decomposition.DecompositionInfo) -> dict:
+    """Restrict a global state to the local domain of a rank, including its halo."""
+    global_index = {
+        writers.CELL: decomposition_info.global_index(dims.CellDim),
+        writers.EDGE: decomposition_info.global_index(dims.EdgeDim),
+        writers.VERTEX: decomposition_info.global_index(dims.VertexDim),
+    }
+    return {
+        name: field.isel({d: global_index[d] for d in field.dims if d in global_index})
+        for name, field in state.items()
+    }
+
+
 def state_values() -> xr.DataArray:
     state = model_state(simple_grid)
     for v in state.values():
@@ -151,6 +174,64 @@ def test_io_monitor_create_output_path(test_path):
     assert monitor.path.is_dir()
 
 
+def _vertical_grid() -> v_grid.VerticalGrid:
+    return v_grid.VerticalGrid(
+        config=v_grid.VerticalGridConfig(num_levels=simple_grid.num_levels),
+        vct_a=gtx.as_field((dims.KDim,), np.linspace(12000.0, 0.0, simple_grid.num_levels + 1)),
+        vct_b=None,
+    )
+
+
+class _FakeComm:
+    """Records the broadcast messages, returns 'root_message' on the non root ranks."""
+
+    def __init__(self, root_message=None):
+        self.root_message = root_message
+        self.messages = []
+
+    def bcast(self, message, root):
+        self.messages.append(message)
+        return message if message is not None else self.root_message
+
+
+def test_io_monitor_existing_output_path(test_path):
+    path = test_path.joinpath("output")
+    path.mkdir()
+    config = IOConfig(field_groups=[], output_path=str(path))
+    with pytest.raises(errors.InvalidConfigError, match="exists"):
+        IOMonitor(
+            config,
+            _vertical_grid(),
+            simple_grid.config.horizontal_config,
+            grid_file,
+            simple_grid.id,
+        )
+
+
+@pytest.mark.parametrize("rank", [0, 1])
+def test_io_monitor_output_initialization_error_is_broadcast(test_path, rank):
+    path = test_path.joinpath("output")
+    path.mkdir()
+    config = IOConfig(field_groups=[], output_path=str(path))
+    comm = _FakeComm(root_message="InvalidConfigError: output directory exists")
+    process_properties = dataclasses.replace(
+        FakeProcessProperties(rank=rank, comm_size=2), comm=comm
+    )
+    expected_error = errors.InvalidConfigError if rank == 0 else RuntimeError
+    with pytest.raises(expected_error, match="exists"):
+        IOMonitor(
+            config,
+            _vertical_grid(),
+            simple_grid.config.horizontal_config,
+            grid_file,
+            simple_grid.id,
+            process_properties=process_properties,
+        )
+    # every rank takes part in the broadcast, only rank 0 sends a message
+    assert len(comm.messages) == 1
+    assert (comm.messages[0] is not None) == (rank == 0)
+
+
 def test_io_monitor_write_ugrid_file(test_path):
     path_name = test_path.absolute().as_posix() + "/output"
     vertical_config = v_grid.VerticalGridConfig(num_levels=simple_grid.num_levels)
@@ -180,7 +261,8 @@ def test_io_monitor_write_ugrid_file(test_path):
         ["normal_velocity", "upward_air_velocity", "theta_v"],
     ),
 )
-def test_io_monitor_write_and_read_ugrid_dataset(test_path, variables):
+@pytest.mark.parametrize("asynchronous", (False, True))
+def test_io_monitor_write_and_read_ugrid_dataset(test_path, variables, asynchronous):
     path_name = test_path.absolute().as_posix() + "/output"
     grid = grid_utils.get_grid_manager_for_experiment(
         datatest_utils.GLOBAL_EXPERIMENT, backend
@@ -203,7 +285,7 @@ def test_io_monitor_write_and_read_ugrid_dataset(test_path, variables):
             nc_comment="Writing dummy data from icon4py for testing.",
         )
     ]
-    config = IOConfig(field_groups=field_configs, output_path=path_name)
+    config = IOConfig(field_groups=field_configs, output_path=path_name, asynchronous=asynchronous)
     monitor = IOMonitor(
         config,
         vertical_params,
@@ -354,6 +436,92 @@ def test_fieldgroup_monitor_no_output_before_start_time(test_path):
     assert len([f for f in group_monitor.output_path.iterdir() if f.is_file()]) == 0
 
 
+def test_fieldgroup_monitor_asynchronous_output_writes_snapshot(test_path):
+    config = FieldGroupIOConfig(
+        start_time="2024-01-01T00:00:00",
+        filename="test_async.nc",
+        output_interval="1 HOUR",
+        variables=["exner_function", "air_density"],
+        timesteps_per_file=2,
+    )
+    vertical_params = v_grid.VerticalGrid(
+        config=v_grid.VerticalGridConfig(num_levels=simple_grid.num_levels),
+        vct_a=gtx.as_field((dims.KDim,), np.linspace(12000.0, 0.0, simple_grid.num_levels + 1)),
+        vct_b=None,
+    )
+    writer = writers.AsyncWriter()
+    group_monitor = FieldGroupMonitor(
+        config,
+        vertical=vertical_params,
+        horizontal=simple_grid.config.horizontal_config,
+        grid_id=simple_grid.id,
+        output_path=test_path,
+        writer=writer,
+        num_output_buffers=1,
+    )
+    state = model_state(simple_grid)
+    time = dt.datetime.fromisoformat(config.start_time)
+    expected = []
+    for _ in range(3):
+        expected.append(state["air_density"].data.copy())
+        group_monitor.store(state, time)
+        # the model continues to update the fields while they are written
+        state["air_density"].data[:] = np.random.default_rng().random(state["air_density"].shape)
+        time = time + dt.timedelta(hours=1)
+    group_monitor.close()
+    writer.shutdown()
+
+    files = sorted(f for f in group_monitor.output_path.iterdir() if f.is_file())
+    assert len(files) == 2
+    with ugrid.load_data_file(files[0]) as ds:
+        assert np.all(ds["air_density"].values[0] == expected[0].T)
+        assert np.all(ds["air_density"].values[1] == expected[1].T)
+    with ugrid.load_data_file(files[1]) as ds:
+        assert np.all(ds["air_density"].values[0] == expected[2].T)
+
+
+def test_fieldgroup_monitor_asynchronous_output_write_error(test_path, monkeypatch):
+    config = FieldGroupIOConfig(
+        start_time="2024-01-01T00:00:00",
+        filename="test_async_error.nc",
+        output_interval="1 HOUR",
+        variables=["air_density"],
+    )
+    vertical_params = v_grid.VerticalGrid(
+        config=v_grid.VerticalGridConfig(num_levels=simple_grid.num_levels),
+        vct_a=gtx.as_field((dims.KDim,), np.linspace(12000.0, 0.0, simple_grid.num_levels + 1)),
+        vct_b=None,
+    )
+
+    def failing_append(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(writers.NETCDFWriter, "append", failing_append)
+    writer = writers.AsyncWriter()
+    group_monitor = FieldGroupMonitor(
+        config,
+        vertical=vertical_params,
+        horizontal=simple_grid.config.horizontal_config,
+        grid_id=simple_grid.id,
+        output_path=test_path,
+        writer=writer,
+        num_output_buffers=1,
+    )
+    state = model_state(simple_grid)
+    time = dt.datetime.fromisoformat(config.start_time)
+    group_monitor.store(state, time)
+    with pytest.raises(OSError, match="disk full"):
+        writer.flush()
+
+    # later stores fail instead of waiting for the buffers of the failed write
+    for _ in range(2):
+        time = time + dt.timedelta(hours=1)
+        with pytest.raises(OSError, match="disk full"):
+            group_monitor.store(state, time)
+    with pytest.raises(OSError, match="disk full"):
+        writer.shutdown()
+
+
 def create_field_group_monitor(test_path, grid, start_time="2024-01-01T00:00:00"):
     config = FieldGroupIOConfig(
         start_time=start_time,
@@ -422,6 +590,74 @@ def test_fieldgroup_config_validate_filename(start_time, filename, interval, var
     assert message in str(err.value)
 
 
+@pytest.mark.parametrize(
+    "compression, level, chunk_size, message",
+    [
+        ("lz4", 4, None, "Unsupported compression"),
+        ("zlib", 0, None, "Compression level"),
+        ("zstd", 10, None, "Compression level"),
+        (None, 4, 0, "Horizontal chunk size"),
+    ],
+)
+def test_fieldgroup_config_validate_storage_options(compression, level, chunk_size, message):
+    with pytest.raises(errors.InvalidConfigError) as err:
+        FieldGroupIOConfig(
+            start_time="2023-04-04T11:00:00",
+            filename="vars/prognostics.nc",
+            output_interval="1 HOUR",
+            variables=["air_density"],
+            compression=compression,
+            compression_level=level,
+            horizontal_chunk_size=chunk_size,
+        )
+    assert message in str(err.value)
+
+
+def test_fieldgroup_monitor_distributed_output_is_merged_to_global_dataset(test_path):
+    num_ranks = 2
+    config = FieldGroupIOConfig(
+        start_time="2024-01-01T00:00:00",
+        filename="test_distributed.nc",
+        output_interval="1 HOUR",
+        variables=["normal_velocity", "air_density"],
+        timesteps_per_file=-1,
+        compression="zlib",
+    )
+    vertical_params = v_grid.VerticalGrid(
+        config=v_grid.VerticalGridConfig(num_levels=simple_grid.num_levels),
+        vct_a=gtx.as_field((dims.KDim,), np.linspace(12000.0, 0.0, simple_grid.num_levels + 1)),
+        vct_b=None,
+    )
+    states = [model_state(simple_grid) for _ in range(2)]
+    for rank in range(num_ranks):
+        decomposition_info = decomposer.decompose(simple_grid, num_ranks, rank)
+        group_monitor = FieldGroupMonitor(
+            config,
+            vertical=vertical_params,
+            horizontal=simple_grid.config.horizontal_config,
+            grid_id=simple_grid.id,
+            output_path=test_path,
+            decomposition_info=decomposition_info,
+            process_properties=FakeProcessProperties(rank=rank, comm_size=num_ranks),
+        )
+        assert group_monitor.is_distributed
+        time = dt.datetime.fromisoformat(config.start_time)
+        for state in states:
+            group_monitor.store(local_state(state, decomposition_info), time)
+            time = time + dt.timedelta(hours=1)
+        group_monitor.close()
+
+    global_file = group_monitor.output_path.joinpath(generate_name(config.filename, 1))
+    shards = writers.find_shards(global_file)
+    assert len(shards) == num_ranks
+    writers.merge_shards(shards, global_file, config.storage_options)
+    with ugrid.load_data_file(global_file) as ds:
+        assert ds.sizes["edge"] == simple_grid.num_edges
+        for i, state in enumerate(states):
+            for name in config.variables:
+                assert np.allclose(ds[name].values[i], state[name].data.T)
+
+
 def test_fieldgroup_monitor_constructs_output_path_and_filepattern(test_path):
     config = FieldGroupIOConfig(
         start_time="2023-04-04T11:00:00",
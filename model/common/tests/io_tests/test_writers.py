@@ -5,13 +5,16 @@
 #
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
+import threading
 from datetime import datetime, timedelta
 
 import gt4py.next as gtx
+import netCDF4
 import numpy as np
 import pytest
 
 from icon4py.model.common import dimension as dims
+from icon4py.model.common.decomposition import decomposer, definitions as decomposition
 from icon4py.model.common.grid import base as grid_def, vertical as v_grid
 from icon4py.model.common.io import cf_utils, utils, writers
 from icon4py.model.common.io.writers import (
@@ -43,17 +46,20 @@ def test_filter_by_standard_name_non_existing_name():
     assert filter_by_standard_name(state, "does_not_exist") == {}
 
 
-def initialized_writer(
-    test_path, random_name, grid=test_io.simple_grid
-) -> tuple[NETCDFWriter, grid_def.BaseGrid]:
-    num_levels = grid.config.vertical_size
+def vertical_grid(num_levels: int) -> v_grid.VerticalGrid:
     heights = np.linspace(start=12000.0, stop=0.0, num=num_levels + 1)
     vertical_config = v_grid.VerticalGridConfig(num_levels=num_levels)
-    vertical_params = v_grid.VerticalGrid(
+    return v_grid.VerticalGrid(
         vertical_config,
         vct_a=gtx.as_field((dims.KDim,), heights),
         vct_b=None,
     )
+
+
+def initialized_writer(
+    test_path, random_name, grid=test_io.simple_grid
+) -> tuple[NETCDFWriter, grid_def.BaseGrid]:
+    vertical_params = vertical_grid(grid.config.vertical_size)
     horizontal = grid.config.horizontal_config
     fname = str(test_path.absolute()) + "/" + random_name + ".nc"
     writer = NETCDFWriter(
@@ -201,3 +207,179 @@ def test_initialize_writer_create_dimensions(
 
     assert writer.variables[writers.TIME].units == cf_utils.DEFAULT_TIME_UNIT
     assert writer.variables[writers.TIME].calendar == cf_utils.DEFAULT_CALENDAR
+
+
+def test_async_writer_executes_tasks_in_order():
+    writer = writers.AsyncWriter()
+    results = []
+    for i in range(10):
+        writer.submit(lambda i=i: results.append(i))
+    writer.flush()
+    assert results == list(range(10))
+    writer.shutdown()
+
+
+def test_async_writer_raises_error_of_task():
+    writer = writers.AsyncWriter()
+
+    def failing_task():
+        raise OSError("disk full")
+
+    writer.submit(failing_task)
+    with pytest.raises(OSError, match="disk full"):
+        writer.flush()
+    # the error is sticky
+    with pytest.raises(OSError, match="disk full"):
+        writer.check()
+    with pytest.raises(OSError, match="disk full"):
+        writer.shutdown()
+    with pytest.raises(OSError, match="disk full"):
+        writer.submit(lambda: None)
+
+
+def test_async_writer_runs_cleanup_of_skipped_tasks():
+    writer = writers.AsyncWriter()
+    blocked = threading.Event()
+    executed = []
+    cleaned_up = []
+
+    def failing_task():
+        blocked.wait(timeout=5)
+        raise OSError("disk full")
+
+    writer.submit(failing_task, cleanup=lambda: cleaned_up.append(0))
+    # submitted before the first task failed
+    writer.submit(lambda: executed.append(1), cleanup=lambda: cleaned_up.append(1))
+    blocked.set()
+    with pytest.raises(OSError, match="disk full"):
+        writer.flush()
+    assert executed == []
+    assert cleaned_up == [0, 1]
+    with pytest.raises(OSError):
+        writer.shutdown()
+
+
+def test_host_buffer_pool_snapshot_is_a_copy():
+    state = test_io.model_state(test_io.simple_grid)
+    pool = writers.HostBufferPool(1)
+    snapshot, buffers = pool.snapshot(state)
+    for name, field in state.items():
+        assert np.all(snapshot[name].data == field.data)
+        assert snapshot[name].attrs == field.attrs
+        assert not np.shares_memory(snapshot[name].data, field.data)
+    pool.release(buffers)
+    # buffers are reused by the next snapshot
+    second, _ = pool.snapshot(state)
+    assert all(second[name].data is buffers[name] for name in state.keys())
+
+
+def test_host_buffer_pool_blocks_until_release():
+    state = test_io.model_state(test_io.simple_grid)
+    pool = writers.HostBufferPool(1)
+    _, buffers = pool.snapshot(state)
+    taken = threading.Event()
+
+    def take_snapshot():
+        pool.snapshot(state)
+        taken.set()
+
+    thread = threading.Thread(target=take_snapshot)
+    thread.start()
+    assert not taken.wait(timeout=0.1)
+    pool.release(buffers)
+    assert taken.wait(timeout=5)
+    thread.join()
+
+
+def test_writer_storage_options(test_path, random_name):
+    grid = test_io.simple_grid
+    writer = NETCDFWriter(
+        test_path.joinpath(f"{random_name}.nc"),
+        vertical_grid(grid.num_levels),
+        grid.config.horizontal_config,
+        TimeProperties(cf_utils.DEFAULT_TIME_UNIT, cf_utils.DEFAULT_CALENDAR),
+        global_attrs={"title": "test"},
+        storage_options=writers.StorageOptions(
+            compression="zlib", compression_level=5, horizontal_chunk_size=7
+        ),
+    )
+    writer.initialize_dataset()
+    state = test_io.model_state(grid)
+    writer.append(state, datetime.now())
+
+    variable = writer.variables["air_density"]
+    assert variable.filters()["zlib"]
+    assert variable.filters()["complevel"] == 5
+    assert variable.chunking() == [1, grid.num_levels, 7]
+    assert np.allclose(variable[0], state["air_density"].data.T)
+    writer.close()
+
+
+@pytest.mark.parametrize("num_ranks", [1, 2, 3])
+def test_sharded_writer_and_merge_shards(test_path, random_name, num_ranks):
+    grid = test_io.simple_grid
+    file_name = test_path.joinpath(f"{random_name}.nc")
+    states = [test_io.model_state(grid) for _ in range(2)]
+    start = datetime(2024, 3, 1)
+
+    for rank in range(num_ranks):
+        decomposition_info = decomposer.decompose(grid, num_ranks, rank)
+        writer = writers.ShardedNETCDFWriter(
+            file_name,
+            vertical_grid(grid.num_levels),
+            grid.config.horizontal_config,
+            TimeProperties(cf_utils.DEFAULT_TIME_UNIT, cf_utils.DEFAULT_CALENDAR),
+            global_attrs={"title": "test"},
+            decomposition_info=decomposition_info,
+            process_properties=test_io.FakeProcessProperties(rank=rank, comm_size=num_ranks),
+        )
+        writer.initialize_dataset()
+        for i, state in enumerate(states):
+            writer.append(
+                test_io.local_state(state, decomposition_info), start + timedelta(hours=i)
+            )
+        num_owned_cells = decomposition_info.global_index(
+            dims.CellDim, decomposition.DecompositionInfo.EntryType.OWNED
+        ).shape[0]
+        assert writer.dims[writers.CELL].size == num_owned_cells
+        assert writer.variables["air_density"].shape == (2, grid.num_levels, num_owned_cells)
+        writer.close()
+
+    shards = writers.find_shards(file_name)
+    assert shards == [writers.generate_shard_name(file_name, rank) for rank in range(num_ranks)]
+    merged_file = test_path.joinpath(f"{random_name}_merged.nc")
+    writers.merge_shards(shards, merged_file)
+
+    with netCDF4.Dataset(merged_file) as ds:
+        assert ds.title == "test"
+        assert len(ds.dimensions[writers.CELL]) == grid.num_cells
+        assert len(ds.dimensions[writers.EDGE]) == grid.num_edges
+        assert len(ds.dimensions[writers.TIME]) == 2
+        assert not any(v.startswith(writers.GLOBAL_INDEX_PREFIX) for v in ds.variables)
+        assert np.allclose(
+            ds.variables["height"][:], np.linspace(12000.0, 0.0, grid.num_levels + 1)
+        )
+        for i, state in enumerate(states):
+            for name, field in state.items():
+                expected = cf_utils.to_canonical_dim_order(field).data
+                assert np.allclose(ds.variables[name][i], expected)
+
+
+def test_merge_shards_incomplete(test_path, random_name):
+    grid = test_io.simple_grid
+    file_name = test_path.joinpath(f"{random_name}.nc")
+    writer = writers.ShardedNETCDFWriter(
+        file_name,
+        vertical_grid(grid.num_levels),
+        grid.config.horizontal_config,
+        TimeProperties(cf_utils.DEFAULT_TIME_UNIT, cf_utils.DEFAULT_CALENDAR),
+        global_attrs={"title": "test"},
+        decomposition_info=decomposer.decompose(grid, 2, 0),
+        process_properties=test_io.FakeProcessProperties(rank=0, comm_size=2),
+    )
+    writer.initialize_dataset()
+    writer.close()
+    with pytest.raises(ValueError):
+        writers.merge_shards(writers.find_shards(file_name), test_path.joinpath("merged.nc"))
+    with pytest.raises(ValueError):
+        writers.merge_shards([], test_path.joinpath("merged.nc"))
@@ -0,0 +1,62 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from icon4py.model.common.math import column_search
+
+
+def columns_and_values(num_levels: int):
+    rng = np.random.default_rng(42)
+    columns = -np.cumsum(rng.uniform(1.0, 10.0, (20, num_levels)), axis=1)
+    values = rng.uniform(columns[:, -1:] - 10.0, 10.0, (20, 15))
+    # values equal to levels
+    ties = columns[:, ::3][:, : values.shape[1]]
+    values[:, : ties.shape[1]] = ties
+    return columns, values
+
+
+def reference_bracketing_level(column, value, start, from_top):
+    levels = range(start, column.shape[0] - 1) if from_top else reversed(range(column.shape[0] - 1))
+    for level in levels:
+        if column[level] >= value >= column[level + 1]:
+            return level, True
+    return None, False
+
+
+@pytest.mark.parametrize("num_levels", [1, 2, 7, 16])
+@pytest.mark.parametrize("inclusive", [True, False])
+def test_count_levels_above(num_levels, inclusive):
+    columns, values = columns_and_values(num_levels)
+    count = column_search.count_levels_above(columns, values, inclusive=inclusive)
+    operator = np.greater_equal if inclusive else np.greater
+    expected = np.sum(operator(columns[:, np.newaxis, :], values[:, :, np.newaxis]), axis=2)
+    assert np.all(count == expected)
+
+
+@pytest.mark.parametrize("num_levels", [2, 7, 16])
+@pytest.mark.parametrize("from_top", [True, False])
+@pytest.mark.parametrize("with_start", [True, False])
+def test_find_bracketing_level(num_levels, from_top, with_start):
+    columns, values = columns_and_values(num_levels)
+    start = (
+        np.arange(columns.shape[0])[:, np.newaxis] % num_levels
+        if with_start and from_top
+        else np.zeros((columns.shape[0], 1), dtype=int)
+    )
+    level, found = column_search.find_bracketing_level(
+        columns, values, start=start if with_start else None, from_top=from_top
+    )
+    for i, j in np.ndindex(values.shape):
+        expected_level, expected_found = reference_bracketing_level(
+            columns[i], values[i, j], start[i, 0], from_top
+        )
+        assert found[i, j] == expected_found
+        if expected_found:
+            assert level[i, j] == expected_level
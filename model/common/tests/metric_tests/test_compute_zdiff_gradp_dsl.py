@@ -6,6 +6,7 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 import gt4py.next as gtx
+import numpy as np
 import pytest
 
 import icon4py.model.common.grid.horizontal as h_grid
@@ -78,3 +79,87 @@ def test_compute_zdiff_gradp_dsl(
         atol=1e-10,
         rtol=1.0e-9,
     )
+
+
+def reference_zdiff_gradp(
+    e2c, z_mc, c_lin_e, z_ifc, flat_idx, z_ifc_sliced, nlev, horizontal_start, horizontal_start_1
+):
+    """Loop implementation of ICON with the incremental searches of the neighbor levels."""
+    nedges = e2c.shape[0]
+    z_me = np.sum(z_mc[e2c] * np.expand_dims(c_lin_e, axis=-1), axis=1)
+    z_aux2 = np.maximum(z_ifc_sliced[e2c[:, 0]], z_ifc_sliced[e2c[:, 1]]) - 5.0
+    zdiff_gradp = np.zeros_like(z_mc[e2c])
+    zdiff_gradp[horizontal_start:, :, :] = (
+        np.expand_dims(z_me, axis=1)[horizontal_start:, :, :] - z_mc[e2c][horizontal_start:, :, :]
+    )
+
+    def is_bracketing(height, cell, jk1):
+        return jk1 == nlev - 1 or z_ifc[cell, jk1] >= height >= z_ifc[cell, jk1 + 1]
+
+    for je in range(horizontal_start, nedges):
+        for jk in range(int(flat_idx[je]) + 1, nlev):
+            jk1 = next(
+                jk1
+                for jk1 in range(int(flat_idx[je]), nlev)
+                if is_bracketing(z_me[je, jk], e2c[je, 0], jk1)
+            )
+            zdiff_gradp[je, 0, jk] = z_me[je, jk] - z_mc[e2c[je, 0], jk1]
+        jk_start = int(flat_idx[je])
+        for jk in range(int(flat_idx[je]) + 1, nlev):
+            for jk1 in range(jk_start, nlev):
+                if is_bracketing(z_me[je, jk], e2c[je, 1], jk1):
+                    zdiff_gradp[je, 1, jk] = z_me[je, jk] - z_mc[e2c[je, 1], jk1]
+                    jk_start = jk1
+                    break
+
+    for je in range(horizontal_start_1, nedges):
+        for cell in range(2):
+            jk_start = int(flat_idx[je])
+            for jk in range(int(flat_idx[je]) + 1, nlev):
+                if z_me[je, jk] < z_aux2[je]:
+                    for jk1 in range(jk_start, nlev):
+                        if is_bracketing(z_aux2[je], e2c[je, cell], jk1):
+                            zdiff_gradp[je, cell, jk] = z_aux2[je] - z_mc[e2c[je, cell], jk1]
+                            jk_start = jk1
+                            break
+
+    return zdiff_gradp.reshape((nedges * 2, nlev))
+
+
+def test_compute_zdiff_gradp_dsl_matches_incremental_search():
+    rng = np.random.default_rng(7)
+    num_cells, num_edges, nlev = 30, 60, 12
+    # terrain following levels over steep orography, flat from a height of 6000 m on
+    surface = rng.uniform(0.0, 3000.0, num_cells)
+    heights = np.linspace(12000.0, 0.0, nlev + 1)
+    z_ifc = heights + np.outer(surface, np.maximum(0.0, 1.0 - heights / 6000.0))
+    z_mc = 0.5 * (z_ifc[:, :-1] + z_ifc[:, 1:])
+    e2c = np.stack(
+        [rng.integers(0, num_cells, num_edges), rng.integers(0, num_cells, num_edges)], axis=1
+    )
+    weight = rng.uniform(0.0, 1.0, num_edges)
+    c_lin_e = np.stack([weight, 1.0 - weight], axis=1)
+
+    # as computed by 'compute_flat_idx'
+    z_me = np.sum(z_mc[e2c] * c_lin_e[:, :, np.newaxis], axis=1)[:, : nlev - 1]
+    is_flat = np.all(
+        (z_me[:, np.newaxis, :] <= z_ifc[e2c][:, :, : nlev - 1])
+        & (z_me[:, np.newaxis, :] >= z_ifc[e2c][:, :, 1:nlev]),
+        axis=1,
+    )
+    flat_idx = np.amax(np.where(is_flat, np.arange(nlev - 1), 0), axis=1)
+
+    arguments = dict(
+        e2c=e2c,
+        z_mc=z_mc,
+        c_lin_e=c_lin_e,
+        z_ifc=z_ifc,
+        flat_idx=flat_idx,
+        z_ifc_sliced=z_ifc[:, nlev],
+        nlev=nlev,
+        horizontal_start=3,
+        horizontal_start_1=10,
+    )
+    zdiff_gradp = compute_zdiff_gradp_dsl(**arguments)
+
+    assert np.array_equal(zdiff_gradp, reference_zdiff_gradp(**arguments))
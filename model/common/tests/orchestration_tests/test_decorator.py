@@ -0,0 +1,146 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import dataclasses
+import gc
+import weakref
+from pathlib import Path
+
+import gt4py.next as gtx
+import pytest
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.grid import simple
+from icon4py.model.common.orchestration import decorator
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+@dataclasses.dataclass
+class _State:
+    a: gtx.Field
+    b: gtx.Field
+
+
+class _Granule:
+    def __init__(self, grid):
+        self._grid = grid
+        self._scratch = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+
+
+@pytest.fixture
+def grid():
+    return simple.SimpleGrid()
+
+
+def _bound_call(granule: _Granule, **arguments) -> decorator._BoundCall:
+    """Bound call as created by the orchestration for the arguments, 'mode' is compile-time."""
+    return decorator._BoundCall(
+        instance_state=decorator._instance_state(granule),
+        default_build_folder=Path("."),
+        compiled_sdfg=None,
+        sdfg_args=dict(arguments),
+        parameters=tuple(arguments),
+        compile_time_arguments=frozenset({"mode"}),
+        arguments=dict(arguments),
+        passed_arguments=dict(arguments),
+    )
+
+
+def test_buffer_layout_and_ids(grid):
+    a = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    state = _State(a=a, b=data_alloc.zero_field(grid, dims.CellDim, dims.KDim))
+    rebound = dataclasses.replace(state, b=data_alloc.zero_field(grid, dims.CellDim, dims.KDim))
+
+    assert decorator._buffer_layout(a) == (a.domain, a.dtype, a.ndarray.strides)
+    assert decorator._buffer_layout(rebound) == decorator._buffer_layout(state)
+    assert decorator._buffer_layout(2.0) == float
+    assert decorator._buffer_ids(state) == (id(a), id(state.b))
+    assert decorator._buffer_ids(rebound) != decorator._buffer_ids(state)
+    assert decorator._buffer_ids(rebound)[0] == id(a)
+
+
+def test_update_same_arguments(grid):
+    granule = _Granule(grid)
+    x = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    bound_call = _bound_call(granule, x=x, scale=2.0, mode=1)
+
+    assert bound_call.update(granule, (x, 2.0), {"mode": 1})
+    assert bound_call.sdfg_args == {"x": x, "scale": 2.0, "mode": 1}
+    assert bound_call.sdfg_args["x"] is x
+
+
+def test_update_patches_scalar(grid):
+    granule = _Granule(grid)
+    x = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    bound_call = _bound_call(granule, x=x, scale=2.0, mode=1)
+
+    assert bound_call.update(granule, (x,), {"scale": 3.0, "mode": 1})
+    assert bound_call.sdfg_args["scale"] == 3.0
+    assert bound_call.arguments["scale"] == 3.0
+    assert bound_call.sdfg_args["x"] is x
+
+
+def test_update_patches_field_in_new_buffer(grid):
+    granule = _Granule(grid)
+    x = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    bound_call = _bound_call(granule, x=x, scale=2.0, mode=1)
+    moved = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+
+    assert bound_call.update(granule, (moved, 2.0, 1), {})
+    assert bound_call.sdfg_args["x"] is moved
+    assert bound_call.passed_arguments["x"] is moved
+    assert bound_call.buffers["x"] == id(moved)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        "layout",
+        "dtype",
+        "compile_time",
+        "number_of_arguments",
+    ],
+)
+def test_update_falls_back_to_binding(grid, change):
+    granule = _Granule(grid)
+    x = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    bound_call = _bound_call(granule, x=x, scale=2.0, mode=1)
+    args = {
+        "layout": (
+            data_alloc.zero_field(grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}),
+            2.0,
+            1,
+        ),
+        "dtype": (data_alloc.zero_field(grid, dims.CellDim, dims.KDim, dtype=gtx.float32), 2.0, 1),
+        "compile_time": (x, 2.0, 2),
+        "number_of_arguments": (x, 2.0),
+    }[change]
+
+    assert not bound_call.update(granule, args, {})
+
+
+def test_update_falls_back_to_binding_on_rebound_attribute(grid):
+    granule = _Granule(grid)
+    x = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+    bound_call = _bound_call(granule, x=x, scale=2.0, mode=1)
+    granule._scratch = data_alloc.zero_field(grid, dims.CellDim, dims.KDim)
+
+    assert not bound_call.update(granule, (x, 2.0, 1), {})
+
+
+def test_bound_call_does_not_keep_instance_alive(grid):
+    granule = _Granule(grid)
+    instance = weakref.ref(granule)
+    cache = weakref.WeakKeyDictionary()
+    cache[granule] = _bound_call(granule, x=data_alloc.zero_field(grid, dims.CellDim, dims.KDim))
+
+    del granule
+    gc.collect()
+
+    assert instance() is None
+    assert len(cache) == 0
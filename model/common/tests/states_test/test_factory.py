@@ -6,16 +6,19 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import threading
+import time
 from typing import Optional
 
 import gt4py.next as gtx
+import numpy as np
 import pytest
 
 from icon4py.model.common import dimension as dims, utils as common_utils
-from icon4py.model.common.grid import horizontal as h_grid, icon, vertical as v_grid
+from icon4py.model.common.grid import horizontal as h_grid, icon, simple, vertical as v_grid
 from icon4py.model.common.math import helpers as math_helpers
 from icon4py.model.common.metrics import metric_fields as metrics
-from icon4py.model.common.states import factory, model, utils as state_utils
+from icon4py.model.common.states import factory, model, scheduler, utils as state_utils
 from icon4py.model.common.utils import data_allocation as data_alloc
 
 
@@ -236,3 +239,262 @@ def test_composite_field_source_raises_upon_get_unknown_field(
     with pytest.raises(ValueError) as err:
         composite.get("alice")
         assert "not provided by source " in err.value
+
+
+def _scaled_source(grid, foo, scale: float, calls: list[str]) -> SimpleFieldSource:
+    def scale_field(foo: data_alloc.NDArray, factor: float) -> data_alloc.NDArray:
+        calls.append("bar")
+        return factor * foo
+
+    def add_one(bar: data_alloc.NDArray) -> data_alloc.NDArray:
+        calls.append("baz")
+        return bar + 1.0
+
+    source = SimpleFieldSource(
+        data_={"foo": (foo, {"standard_name": "foo", "units": ""})}, backend=None, grid=grid
+    )
+    source.register_provider(
+        factory.NumpyFieldsProvider(
+            func=scale_field,
+            domain=(dims.CellDim, dims.KDim),
+            fields=("bar",),
+            deps={"foo": "foo"},
+            params={"factor": scale},
+        )
+    )
+    source.register_provider(
+        factory.NumpyFieldsProvider(
+            func=add_one, domain=(dims.CellDim, dims.KDim), fields=("baz",), deps={"bar": "bar"}
+        )
+    )
+    return source
+
+
+def test_field_cache_warm_start_skips_computation(tmp_path):
+    grid = simple.SimpleGrid()
+    foo = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    calls = []
+    cold = _scaled_source(grid, foo, 2.0, calls).with_cache(factory.FieldCache(tmp_path))
+    expected = cold.get("baz").asnumpy()
+    assert calls == ["bar", "baz"]
+    assert np.allclose(expected, 2.0 * foo.asnumpy() + 1.0)
+
+    calls.clear()
+    warm = _scaled_source(grid, foo, 2.0, calls).with_cache(factory.FieldCache(tmp_path))
+    baz = warm.get("baz")
+    assert calls == []
+    assert baz.domain.dims == (dims.CellDim, dims.KDim)
+    assert np.all(baz.asnumpy() == expected)
+    assert np.allclose(warm.get("bar").asnumpy(), 2.0 * foo.asnumpy())
+    assert calls == []
+
+
+def test_field_cache_key_depends_on_parameters_and_inputs(tmp_path):
+    grid = simple.SimpleGrid()
+    foo = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    _scaled_source(grid, foo, 2.0, []).with_cache(factory.FieldCache(tmp_path)).get("baz")
+
+    calls = []
+    other_param = _scaled_source(grid, foo, 3.0, calls).with_cache(factory.FieldCache(tmp_path))
+    assert np.allclose(other_param.get("baz").asnumpy(), 3.0 * foo.asnumpy() + 1.0)
+    assert calls == ["bar", "baz"]
+
+    calls.clear()
+    other_foo = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    other_input = _scaled_source(grid, other_foo, 2.0, calls).with_cache(
+        factory.FieldCache(tmp_path)
+    )
+    assert np.allclose(other_input.get("baz").asnumpy(), 2.0 * other_foo.asnumpy() + 1.0)
+    assert calls == ["bar", "baz"]
+
+
+def test_field_cache_key_depends_on_function_code(tmp_path):
+    grid = simple.SimpleGrid()
+    foo = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+
+    def scale_field(foo: data_alloc.NDArray) -> data_alloc.NDArray:
+        return 2.0 * foo
+
+    def edited_scale_field(foo: data_alloc.NDArray) -> data_alloc.NDArray:
+        return 3.0 * foo
+
+    # the same function after an edit of its body
+    edited_scale_field.__name__ = scale_field.__name__
+    edited_scale_field.__qualname__ = scale_field.__qualname__
+
+    def source(func) -> SimpleFieldSource:
+        source = SimpleFieldSource(
+            data_={"foo": (foo, {"standard_name": "foo", "units": ""})}, backend=None, grid=grid
+        )
+        source.register_provider(
+            factory.NumpyFieldsProvider(
+                func=func, domain=(dims.CellDim, dims.KDim), fields=("bar",), deps={"foo": "foo"}
+            )
+        )
+        return source.with_cache(factory.FieldCache(tmp_path))
+
+    assert np.allclose(source(scale_field).get("bar").asnumpy(), 2.0 * foo.asnumpy())
+    assert np.allclose(source(edited_scale_field).get("bar").asnumpy(), 3.0 * foo.asnumpy())
+    assert np.allclose(source(scale_field).get("bar").asnumpy(), 2.0 * foo.asnumpy())
+
+
+@pytest.mark.parametrize("keep", [(), ("bar",)])
+def test_release_policy_frees_intermediate_fields(keep):
+    grid = simple.SimpleGrid()
+    foo = data_alloc.random_field(grid, dims.CellDim, dims.KDim)
+    calls = []
+    source = _scaled_source(grid, foo, 2.0, calls).with_release_policy(
+        factory.ReleasePolicy(keep=keep)
+    )
+    source.metadata["baz"] = {"standard_name": "baz", "units": ""}
+
+    baz = source.get("baz")
+    resident = source.resident_bytes()
+    assert resident["baz"] == baz.ndarray.nbytes
+    # fields of precomputed providers on the host are kept
+    assert resident["foo"] == foo.ndarray.nbytes
+    assert ("bar" in resident) == ("bar" in keep)
+    assert source.with_release_policy(factory.ReleasePolicy()).resident_bytes() == resident
+
+    # released fields are recomputed when requested again
+    assert np.allclose(source.get("bar").asnumpy(), 2.0 * foo.asnumpy())
+    assert calls == (["bar", "baz"] if keep else ["bar", "baz", "bar"])
+    assert source.get("baz") is baz
+
+
+def _sleeping_source(grid, calls: list[str], delay: float = 0.2) -> SimpleFieldSource:
+    """Source with the providers 'a' <- ('b', 'c') <- 'd', where 'b' and 'c' are independent."""
+
+    def compute(name: str, offset: float):
+        def _compute(x: data_alloc.NDArray, y: data_alloc.NDArray = None) -> data_alloc.NDArray:
+            calls.append(name)
+            time.sleep(delay)
+            return x + (y if y is not None else 0.0) + offset
+
+        _compute.__name__ = f"compute_{name}"
+        return _compute
+
+    foo = data_alloc.constant_field(grid, 1.0, dims.CellDim, dims.KDim)
+    source = SimpleFieldSource(
+        data_={"foo": (foo, {"standard_name": "foo", "units": ""})}, backend=None, grid=grid
+    )
+    for name, deps, offset in (
+        ("a", {"x": "foo"}, 1.0),
+        ("b", {"x": "a"}, 2.0),
+        ("c", {"x": "a"}, 3.0),
+        ("d", {"x": "b", "y": "c"}, 4.0),
+    ):
+        source.register_provider(
+            factory.NumpyFieldsProvider(
+                func=compute(name, offset),
+                domain=(dims.CellDim, dims.KDim),
+                fields=(name,),
+                deps=deps,
+            )
+        )
+    return source
+
+
+def test_scheduler_computes_independent_providers_concurrently():
+    grid = simple.SimpleGrid()
+    calls = []
+    source = _sleeping_source(grid, calls)
+    report = scheduler.compute_fields(source, ["d"], max_workers=2)
+
+    assert calls[0] == "a" and calls[-1] == "d"
+    assert sorted(calls) == ["a", "b", "c", "d"]
+    timings = {t.fields: t for t in report.timings}
+    assert timings[("b",)].start < timings[("c",)].end
+    assert timings[("c",)].start < timings[("b",)].end
+    assert report.wall_time < report.total_time
+    assert [t.fields for t in report.critical_path] in (
+        [("a",), ("b",), ("d",)],
+        [("a",), ("c",), ("d",)],
+    )
+    assert "compute_d" in report.summary()
+
+    # the fields are computed, get does not compute them again
+    assert np.all(source.get("d").asnumpy() == 1.0 + 1.0 + 2.0 + 1.0 + 1.0 + 3.0 + 4.0)
+    assert len(calls) == 4
+    assert scheduler.compute_fields(source, ["b", "d"]).timings == ()
+
+
+class DerivedFieldSource(SimpleFieldSource):
+    """Field source depending on the fields of another source, like the factories do."""
+
+    def __init__(self, other: factory.FieldSource, grid: icon.IconGrid):
+        super().__init__(data_={}, backend=None, grid=grid)
+        self._other = other
+
+    @property
+    def _sources(self) -> factory.FieldSource:
+        return factory.CompositeSource(self, (self._other,))
+
+
+def test_scheduler_resolves_fields_through_composite_source():
+    grid = simple.SimpleGrid()
+    calls = []
+    first = _sleeping_source(grid, calls, delay=0.0)
+    second = DerivedFieldSource(first, grid)
+    second.register_provider(
+        factory.NumpyFieldsProvider(
+            func=_double, domain=(dims.CellDim, dims.KDim), fields=("e",), deps={"x": "d"}
+        )
+    )
+    report = scheduler.compute_fields((second, first), ["e", "b"])
+
+    assert sorted(t.fields for t in report.timings) == [("a",), ("b",), ("c",), ("d",), ("e",)]
+    assert [t.fields for t in report.critical_path][-1] == ("e",)
+    assert np.all(second.get("e").asnumpy() == 2.0 * first.get("d").asnumpy())
+    assert len(calls) == 4
+
+
+def _double(x: data_alloc.NDArray) -> data_alloc.NDArray:
+    return 2.0 * x
+
+
+def test_scheduler_runs_program_providers_in_calling_thread(backend):
+    grid = simple.SimpleGrid()
+    edge_domain = h_grid.domain(dims.EdgeDim)
+    foo = data_alloc.random_field(grid, dims.EdgeDim, low=1.0, backend=backend)
+    source = SimpleFieldSource(
+        data_={"foo": (foo, {"standard_name": "foo", "units": ""})}, backend=backend, grid=grid
+    )
+    source.register_provider(
+        factory.ProgramFieldProvider(
+            func=math_helpers.compute_inverse_on_edges,
+            domain={dims.EdgeDim: (edge_domain(h_grid.Zone.LOCAL), edge_domain(h_grid.Zone.END))},
+            fields={"f_inverse": "inverse"},
+            deps={"f": "foo"},
+        )
+    )
+    source.register_provider(
+        factory.NumpyFieldsProvider(
+            func=_double, domain=(dims.EdgeDim,), fields=("double_inverse",), deps={"x": "inverse"}
+        )
+    )
+    report = scheduler.compute_fields(source, ["double_inverse"], max_workers=2)
+
+    threads = {t.fields: t.thread for t in report.timings}
+    assert threads[("inverse",)] == threading.current_thread().name
+    assert threads[("double_inverse",)].startswith("field-provider")
+    assert np.allclose(source.get("inverse").asnumpy(), 1.0 / foo.asnumpy())
+    assert np.allclose(source.get("double_inverse").asnumpy(), 2.0 / foo.asnumpy())
+
+
+def test_scheduler_raises_on_unknown_field_and_failing_provider():
+    grid = simple.SimpleGrid()
+    source = _sleeping_source(grid, [], delay=0.0)
+    with pytest.raises(ValueError):
+        scheduler.compute_fields(source, ["unknown"])
+
+    def fail(x: data_alloc.NDArray) -> data_alloc.NDArray:
+        raise RuntimeError("failing provider")
+
+    source.register_provider(
+        factory.NumpyFieldsProvider(
+            func=fail, domain=(dims.CellDim, dims.KDim), fields=("e",), deps={"x": "a"}
+        )
+    )
+    with pytest.raises(RuntimeError, match="failing provider"):
+        scheduler.compute_fields(source, ["e", "d"])
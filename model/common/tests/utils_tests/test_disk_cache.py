@@ -0,0 +1,78 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+
+from icon4py.model.common.utils import disk_cache
+
+
+def test_disk_cache_store_and_load(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    arrays = {"a": np.arange(10, dtype=np.int32), "b": np.ones((3, 4))}
+    assert "key" not in cache
+
+    cache.store("key", arrays, {"answer": 42})
+
+    assert "key" in cache
+    metadata, loaded = cache.load("key")
+    assert metadata == {"answer": 42}
+    assert loaded.keys() == arrays.keys()
+    for name, array in arrays.items():
+        assert isinstance(loaded[name], np.memmap)
+        assert loaded[name].dtype == array.dtype
+        assert np.all(loaded[name] == array)
+
+
+def test_disk_cache_load_without_mmap(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    cache.store("key", {"a": np.arange(10)})
+    _, loaded = cache.load("key", mmap=False)
+    assert not isinstance(loaded["a"], np.memmap)
+    assert np.all(loaded["a"] == np.arange(10))
+
+
+def test_disk_cache_keeps_existing_entry(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    cache.store("key", {"a": np.zeros(3)}, {"version": 1})
+    cache.store("key", {"a": np.ones(3)}, {"version": 2})
+
+    metadata, loaded = cache.load("key")
+    assert metadata["version"] == 1
+    assert np.all(loaded["a"] == 0.0)
+    assert [p.name for p in tmp_path.iterdir()] == ["key"]
+
+
+def test_disk_cache_sanitizes_key(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    cache.store("some/key with:special chars", {"a": np.zeros(1)})
+    assert "some/key with:special chars" in cache
+    assert [p.name for p in tmp_path.iterdir()] == ["some_key_with_special_chars"]
+
+
+def test_disk_cache_raises_for_missing_entry(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    with pytest.raises(KeyError):
+        cache.load("missing")
+
+
+def test_disk_cache_remove(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    cache.store("key", {"a": np.zeros(1)})
+    cache.remove("key")
+    assert "key" not in cache
+
+
+def test_disk_cache_keys(tmp_path):
+    cache = disk_cache.DiskCache(tmp_path)
+    cache.store("b", {"a": np.zeros(1)})
+    cache.store("a", {"a": np.zeros(1)})
+    # incomplete entries are not listed
+    tmp_path.joinpath(".c.tmp").mkdir()
+    tmp_path.joinpath("d").mkdir()
+    assert cache.keys() == ["a", "b"]
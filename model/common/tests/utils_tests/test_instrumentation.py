@@ -0,0 +1,114 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+
+import pytest
+from gt4py.next.ffront import decorator as gtx_decorator
+
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.grid import simple
+from icon4py.model.common.math import helpers
+from icon4py.model.common.utils import data_allocation as data_alloc, instrumentation
+
+
+class _Granule:
+    @instrumentation.timed("granule.run")
+    def run(self):
+        with instrumentation.region("predictor"):
+            pass
+        with instrumentation.region("corrector"):
+            with instrumentation.region("exchange"):
+                pass
+
+
+@pytest.fixture
+def recording():
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+
+
+def _run_steps(n: int):
+    granule = _Granule()
+    for step in range(n):
+        with instrumentation.time_step(step):
+            granule.run()
+
+
+def test_disabled_records_nothing():
+    assert not instrumentation.is_enabled()
+    assert instrumentation.region("predictor") is instrumentation.region("corrector")
+
+    _run_steps(2)
+
+    assert instrumentation.report().events == ()
+
+
+def test_region_tree(recording):
+    _run_steps(3)
+    report = instrumentation.disable()
+
+    assert report.steps == [0, 1, 2]
+    tree = report.tree()
+    run = tree.children["time_step"].children["granule.run"]
+    assert run.count == 3
+    assert set(run.children) == {"predictor", "corrector"}
+    assert run.children["corrector"].children["exchange"].count == 3
+    assert run.total >= run.children["corrector"].total >= 0.0
+
+    step = report.tree(step=1)
+    assert step.children["time_step"].count == 1
+    assert step.children["time_step"].children["granule.run"].children["predictor"].count == 1
+    assert "exchange" in report.summary(step=1)
+
+
+def test_program_calls_are_recorded(recording, backend):
+    grid = simple.SimpleGrid()
+    program = helpers.compute_inverse_on_edges.with_backend(backend)
+    f = data_alloc.random_field(grid, dims.EdgeDim, backend=backend)
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim, backend=backend)
+
+    with instrumentation.time_step(0):
+        with instrumentation.region("granule"):
+            program(f, f_inverse, 0, grid.num_edges, offset_provider={})
+    report = instrumentation.disable()
+
+    granule = report.tree(step=0).children["time_step"].children["granule"]
+    assert granule.children["compute_inverse_on_edges"].count == 1
+    assert gtx_decorator.Program.__call__ is instrumentation._program_call
+
+
+def test_write_json(recording, tmp_path):
+    _run_steps(2)
+    report = instrumentation.disable()
+    path = tmp_path / "instrumentation.json"
+
+    report.write_json(path)
+
+    with open(path) as f:
+        result = json.load(f)
+    assert set(result["steps"]) == {"0", "1"}
+    (time_step,) = result["total"]["children"]
+    assert time_step["name"] == "time_step"
+    assert time_step["count"] == 2
+
+
+def test_write_chrome_trace(recording, tmp_path):
+    _run_steps(1)
+    report = instrumentation.disable()
+    path = tmp_path / "trace.json"
+
+    report.write_chrome_trace(path)
+
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    assert sorted(e["name"] for e in events) == sorted(
+        ["time_step", "granule.run", "predictor", "corrector", "exchange"]
+    )
+    assert all(e["ph"] == "X" and e["dur"] >= 0.0 for e in events)
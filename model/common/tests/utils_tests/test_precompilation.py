@@ -0,0 +1,148 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import numpy as np
+import pytest
+from gt4py.next.type_system import type_translation as tt
+
+from icon4py.model.common import dimension as dims, model_backends
+from icon4py.model.common.grid import simple
+from icon4py.model.common.math import helpers
+from icon4py.model.common.metrics import metric_fields
+from icon4py.model.common.utils import data_allocation as data_alloc, precompilation
+
+
+class _Granule:
+    def __init__(self, backend):
+        self._grid = simple.SimpleGrid()
+        self._backend = backend
+        self._compute_inverse_on_edges = helpers.compute_inverse_on_edges.with_backend(backend)
+        self._compute_z_mc = metric_fields.compute_z_mc.with_backend(backend)
+        # the same program bound twice
+        self._compute_z_mc_again = metric_fields.compute_z_mc.with_backend(backend)
+        self._embedded = metric_fields.compute_z_mc
+
+    def run(self, f, f_inverse, z_ifc, z_mc):
+        self._compute_inverse_on_edges(f, f_inverse, 0, self._grid.num_edges, offset_provider={})
+        self._compute_z_mc(
+            z_ifc,
+            z_mc,
+            0,
+            self._grid.num_cells,
+            0,
+            self._grid.num_levels,
+            offset_provider=self._grid.offset_providers,
+        )
+
+    def run_embedded(self, z_ifc, z_mc):
+        self._embedded.with_connectivities({})(
+            z_ifc,
+            z_mc,
+            0,
+            self._grid.num_cells,
+            0,
+            self._grid.num_levels,
+            offset_provider={"Koff": dims.KDim},
+        )
+
+
+def test_bound_programs(backend):
+    granule = _Granule(backend)
+    programs = precompilation.bound_programs(granule)
+    if backend is None:
+        assert programs == {}
+    else:
+        assert set(programs) == {
+            "_Granule._compute_inverse_on_edges",
+            "_Granule._compute_z_mc",
+        }
+
+
+def test_dummy_arguments_match_signature():
+    program = metric_fields.compute_z_mc.with_backend(None)
+    arguments = precompilation.dummy_arguments(program)
+    signature = program.past_stage.past_node.type.definition.pos_or_kw_args
+    assert [tt.from_value(a) for a in arguments] == list(signature.values())
+
+
+@pytest.fixture
+def compiling_backend():
+    return model_backends.BACKENDS["gtfn_cpu"]
+
+
+def test_call_site_offset_providers():
+    granule = _Granule(None)
+    assert precompilation.call_site_offset_providers(granule, "_compute_inverse_on_edges") == [{}]
+    (offset_provider,) = precompilation.call_site_offset_providers(granule, "_compute_z_mc")
+    assert offset_provider is granule._grid.offset_providers
+    assert precompilation.call_site_offset_providers(granule, "_compute_z_mc_again") == []
+    assert precompilation.call_site_offset_providers(granule, "_embedded") == [{"Koff": dims.KDim}]
+
+
+def test_precompile_avoids_compilation_at_first_call(compiling_backend):
+    granule = _Granule(compiling_backend)
+    grid = granule._grid
+    cache = compiling_backend.executor.otf_workflow._cache
+
+    report = precompilation.precompile(granule, max_workers=2)
+
+    assert report.skipped == ()
+    assert {t.name for t in report.timings} == {
+        "_Granule._compute_inverse_on_edges",
+        "_Granule._compute_z_mc",
+    }
+    offset_providers = {t.name: t.offset_providers for t in report.timings}
+    assert offset_providers["_Granule._compute_inverse_on_edges"] == ((),)
+    assert offset_providers["_Granule._compute_z_mc"] == (tuple(grid.offset_providers),)
+    assert report.total_time >= 0.0
+    assert "_Granule._compute_z_mc" in report.summary()
+
+    # the calls of the granule take the precompiled programs from the cache
+    compiled = len(cache)
+    f = data_alloc.random_field(grid, dims.EdgeDim, backend=compiling_backend)
+    f_inverse = data_alloc.zero_field(grid, dims.EdgeDim, backend=compiling_backend)
+    z_ifc = data_alloc.random_field(
+        grid, dims.CellDim, dims.KDim, extend={dims.KDim: 1}, backend=compiling_backend
+    )
+    z_mc = data_alloc.zero_field(grid, dims.CellDim, dims.KDim, backend=compiling_backend)
+    granule.run(f, f_inverse, z_ifc, z_mc)
+    assert len(cache) == compiled
+    assert np.allclose(f_inverse.asnumpy(), 1.0 / f.asnumpy())
+    z_ifc_np = z_ifc.asnumpy()
+    assert np.allclose(z_mc.asnumpy(), 0.5 * (z_ifc_np[:, :-1] + z_ifc_np[:, 1:]))
+
+
+class _GranuleWithPublicGrid:
+    def __init__(self, backend):
+        self.grid = simple.SimpleGrid()
+        self._compute_inverse_on_edges = helpers.compute_inverse_on_edges.with_backend(backend)
+
+
+def test_precompile_programs_without_call_site(compiling_backend):
+    granule = _GranuleWithPublicGrid(compiling_backend)
+    report = precompilation.precompile(granule)
+
+    assert report.skipped == ()
+    (timing,) = report.timings
+    assert timing.name == "_GranuleWithPublicGrid._compute_inverse_on_edges"
+    # the program does not use the offset providers of the grid
+    assert timing.offset_providers == ((),)
+
+    del granule.grid
+    with pytest.raises(ValueError, match="grid"):
+        precompilation.precompile(granule)
+
+
+def test_precompile_skips_backends_without_cache():
+    granule = _GranuleWithPublicGrid(model_backends.BACKENDS["roundtrip"])
+    report = precompilation.precompile(granule)
+
+    assert report.timings == ()
+    assert [name for name, _ in report.skipped] == [
+        "_GranuleWithPublicGrid._compute_inverse_on_edges"
+    ]
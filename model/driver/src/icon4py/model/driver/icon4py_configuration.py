@@ -42,7 +42,17 @@ class Icon4pyRunConfig:
 
     restart_mode: bool = False
 
+    checkpoint_interval: int = 0
+    """number of time steps between two restart files, 0 disables writing restart files"""
+
+    restart_path: str = "./restart/"
+    """directory to write restart files to and read them from"""
+
     def __post_init__(self):
+        if self.checkpoint_interval < 0:
+            raise ValueError(
+                f"Invalid checkpoint interval: {self.checkpoint_interval}, it must not be negative."
+            )
         if self.backend_name not in model_backends.BACKENDS:
             raise ValueError(
                 f"Invalid driver backend: {self.backend_name}. \n"
@@ -6,11 +6,12 @@
 # Please, refer to the LICENSE file in the root directory.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import dataclasses
 import datetime
 import logging
 import pathlib
 import uuid
-from typing import Callable, NamedTuple
+from typing import Callable, NamedTuple, Optional, Union
 
 import click
 import numpy as np
@@ -27,9 +28,11 @@ from icon4py.model.common.states import (
     diagnostic_state as diagnostics,
     prognostic_state as prognostics,
 )
+from icon4py.model.common.utils import instrumentation, precompilation
 from icon4py.model.driver import (
     icon4py_configuration as driver_config,
     initialization_utils as driver_init,
+    restart,
 )
 
 
@@ -46,8 +49,10 @@ class TimeLoop:
         run_config: driver_config.Icon4pyRunConfig,
         diffusion_granule: diffusion.Diffusion,
         solve_nonhydro_granule: solve_nh.SolveNonhydro,
+        process_properties: decomposition.ProcessProperties = decomposition.SingleNodeProcessProperties(),  # noqa: B008 # immutable default
     ):
         self.run_config: driver_config.Icon4pyRunConfig = run_config
+        self._process_properties = process_properties
         self.diffusion = diffusion_granule
         self.solve_nonhydro = solve_nonhydro_granule
 
@@ -64,11 +69,19 @@ class TimeLoop:
         self._simulation_date: datetime.datetime = self.run_config.start_date
 
         self._is_first_step_in_simulation: bool = not self.run_config.restart_mode
+        self._completed_time_steps: int = 0
+
+        self._restart_writer: Optional[restart.RestartWriter] = (
+            restart.RestartWriter(self.run_config.restart_path, rank=process_properties.rank)
+            if self.run_config.checkpoint_interval > 0
+            else None
+        )
 
     def re_init(self):
         self._simulation_date = self.run_config.start_date
         self._is_first_step_in_simulation = True
         self._n_substeps_var = self.run_config.n_substeps
+        self._completed_time_steps = 0
 
     def _validate_config(self):
         if self._n_time_steps < 0:
@@ -104,6 +117,73 @@ class TimeLoop:
     def substep_timestep(self):
         return self._substep_timestep
 
+    @property
+    def completed_time_steps(self):
+        return self._completed_time_steps
+
+    def counters(self) -> restart.TimeLoopCounters:
+        return restart.TimeLoopCounters(
+            simulation_date=self._simulation_date,
+            completed_time_steps=self._completed_time_steps,
+            is_first_step_in_simulation=self._is_first_step_in_simulation,
+            n_substeps_var=self._n_substeps_var,
+            dtime_in_seconds=self.dtime_in_seconds,
+        )
+
+    def precompile(self, max_workers: Optional[int] = None) -> precompilation.CompileReport:
+        """Compile the programs of all granules concurrently before the first time step."""
+        report = precompilation.precompile(
+            self.diffusion, self.solve_nonhydro, max_workers=max_workers
+        )
+        log.info(report.summary())
+        return report
+
+    def _is_checkpoint_step(self) -> bool:
+        return self._restart_writer is not None and (
+            self._completed_time_steps % self.run_config.checkpoint_interval == 0
+            or self._completed_time_steps == self._n_time_steps
+        )
+
+    def restore(
+        self,
+        diffusion_diagnostic_state: diffusion_states.DiffusionDiagnosticState,
+        solve_nonhydro_diagnostic_state: dycore_states.DiagnosticStateNonHydro,
+        prognostic_states: common_utils.TimeStepPair[prognostics.PrognosticState],
+        prep_adv: dycore_states.PrepAdvection,
+        path: Optional[Union[pathlib.Path, str]] = None,
+    ) -> None:
+        """
+        Restore the model state and the time loop counters from the most recent restart file.
+
+        Every rank reads its own restart file of the most recent restart written by all ranks.
+        The states are overwritten in place, 'path' defaults to the restart path of the run config.
+        """
+        counters, arrays = restart.read_restart(
+            path if path is not None else self.run_config.restart_path,
+            rank=self._process_properties.rank,
+            num_ranks=self._process_properties.comm_size,
+        )
+        if counters.dtime_in_seconds != self.dtime_in_seconds:
+            raise ValueError(
+                f"Restart file was written with dtime={counters.dtime_in_seconds} s, the run uses dtime={self.dtime_in_seconds} s."
+            )
+        restart.restore_fields(
+            restart.restart_fields(
+                diffusion_diagnostic_state,
+                solve_nonhydro_diagnostic_state,
+                prognostic_states,
+                prep_adv,
+            ),
+            arrays,
+        )
+        self._simulation_date = counters.simulation_date
+        self._completed_time_steps = counters.completed_time_steps
+        self._is_first_step_in_simulation = counters.is_first_step_in_simulation
+        self._n_substeps_var = counters.n_substeps_var
+        log.info(
+            f"restored time loop at simulation date {self._simulation_date} after {self._completed_time_steps} time steps"
+        )
+
     def _full_name(self, func: Callable):
         return ":".join((self.__class__.__name__, func.__name__))
 
@@ -146,7 +226,7 @@ class TimeLoop:
             f"starting real time loop for dtime={self.dtime_in_seconds} n_timesteps={self._n_time_steps}"
         )
         timer = Timer(self._full_name(self._integrate_one_time_step))
-        for time_step in range(self._n_time_steps):
+        for time_step in range(self._completed_time_steps, self._n_time_steps):
             log.info(f"simulation date : {self._simulation_date} run timestep : {time_step}")
             log.debug(
                 f" MAX VN: {np.abs(prognostic_states.current.vn.asnumpy()).max():.15e} , MAX W: {np.abs(prognostic_states.current.w.asnumpy()).max():.15e}"
@@ -161,17 +241,30 @@ class TimeLoop:
             # update boundary condition
 
             timer.start()
-            self._integrate_one_time_step(
-                diffusion_diagnostic_state,
-                solve_nonhydro_diagnostic_state,
-                prognostic_states,
-                prep_adv,
-                initial_divdamp_fac_o2,
-                do_prep_adv,
-            )
+            with instrumentation.time_step(time_step):
+                self._integrate_one_time_step(
+                    diffusion_diagnostic_state,
+                    solve_nonhydro_diagnostic_state,
+                    prognostic_states,
+                    prep_adv,
+                    initial_divdamp_fac_o2,
+                    do_prep_adv,
+                )
             timer.capture()
 
             self._is_first_step_in_simulation = False
+            self._completed_time_steps += 1
+
+            if self._is_checkpoint_step():
+                self._restart_writer.write(
+                    self.counters(),
+                    restart.restart_fields(
+                        diffusion_diagnostic_state,
+                        solve_nonhydro_diagnostic_state,
+                        prognostic_states,
+                        prep_adv,
+                    ),
+                )
 
             # TODO (Chia Rui): modify n_substeps_var if cfl condition is not met. (set_dyn_substeps subroutine)
 
@@ -179,6 +272,8 @@ class TimeLoop:
 
             # TODO (Chia Rui): simple IO enough for JW test
 
+        if self._restart_writer is not None:
+            self._restart_writer.close()
         timer.summary(True)
 
     def _integrate_one_time_step(
@@ -283,6 +378,8 @@ def initialize(
     grid_root,
     grid_level,
     icon4py_driver_backend: str,
+    checkpoint_interval: int = 0,
+    restart_path: str = "./restart/",
 ) -> tuple[TimeLoop, DriverStates, DriverParams]:
     """
     Initialize the driver run.
@@ -302,6 +399,8 @@ def initialize(
         grid_id: Grid ID.
         grid_root: Grid root.
         grid_level: Grid level.
+        checkpoint_interval: Number of time steps between two restart files, 0 disables writing restart files.
+        restart_path: Directory of the restart files.
 
     Returns:
         TimeLoop: Time loop object.
@@ -311,6 +410,9 @@ def initialize(
     log.info("initialize parallel runtime")
     log.info(f"reading configuration: experiment {experiment_type}")
     config = driver_config.read_config(icon4py_driver_backend, experiment_type)
+    config.run_config = dataclasses.replace(
+        config.run_config, checkpoint_interval=checkpoint_interval, restart_path=restart_path
+    )
 
     decomp_info = driver_init.read_decomp_info(
         file_path,
@@ -416,6 +518,7 @@ def initialize(
         run_config=config.run_config,
         diffusion_granule=diffusion_granule,
         solve_nonhydro_granule=solve_nonhydro_granule,
+        process_properties=props,
     )
 
     return (
@@ -480,6 +583,46 @@ def initialize(
     is_flag=True,
     help="Enable all debugging messages. Otherwise, only critical error messages are printed.",
 )
+@click.option(
+    "--checkpoint_interval",
+    default=0,
+    show_default=True,
+    help="Number of time steps between two restart files. Restart files are not written if it is 0.",
+)
+@click.option(
+    "--restart_path",
+    default="./restart/",
+    show_default=True,
+    help="Directory to write restart files to and to read them from.",
+)
+@click.option(
+    "--restart",
+    "restart_run",
+    is_flag=True,
+    help="Continue the run from the most recent restart file in the restart path.",
+)
+@click.option(
+    "--precompile",
+    is_flag=True,
+    help="Compile all programs concurrently before the time loop, instead of one after the other during the first time step.",
+)
+@click.option(
+    "--precompile_workers",
+    default=None,
+    type=int,
+    help="Number of programs compiled at the same time with --precompile, defaults to the number of processors plus 4 (at most 32).",
+)
+@click.option(
+    "--instrumentation_output",
+    default=None,
+    type=click.Path(path_type=pathlib.Path),
+    help="Time the regions of the granules and write the region tree of every time step to INSTRUMENTATION_OUTPUT.json and a Chrome trace to INSTRUMENTATION_OUTPUT.trace.json.",
+)
+@click.option(
+    "--instrumentation_synchronize",
+    is_flag=True,
+    help="Synchronize the GPU at the begin and end of every timed region, use with --instrumentation_output on GPU backends.",
+)
 @click.option(
     "--icon4py_driver_backend",
     "-b",
@@ -496,6 +639,13 @@ def icon4py_driver(
     grid_root,
     grid_level,
     enable_output,
+    checkpoint_interval,
+    restart_path,
+    restart_run,
+    precompile,
+    precompile_workers,
+    instrumentation_output,
+    instrumentation_synchronize,
     icon4py_driver_backend,
 ) -> None:
     """
@@ -516,7 +666,13 @@ def icon4py_driver(
 
         e) setup the time loop
 
-    2. run time loop
+        f) optionally restore the state from a restart file
+
+        g) optionally compile all programs concurrently
+
+    2. run time loop, writing restart files every `checkpoint_interval` time steps
+
+    3. optionally report where the time of the time steps went
     """
     parallel_props = decomposition.get_processor_properties(decomposition.get_runtype(with_mpi=mpi))
     grid_id = uuid.UUID(grid_id)
@@ -534,7 +690,19 @@ def icon4py_driver(
         grid_root,
         grid_level,
         icon4py_driver_backend,
+        checkpoint_interval=checkpoint_interval,
+        restart_path=restart_path,
     )
+    if restart_run:
+        time_loop.restore(
+            ds.diffusion_diagnostic,
+            ds.solve_nonhydro_diagnostic,
+            ds.prognostics,
+            ds.prep_advection_prognostic,
+        )
+    if precompile:
+        log.info("precompiling programs")
+        time_loop.precompile(max_workers=precompile_workers)
     log.info(f"Starting ICON dycore run: {time_loop.simulation_date.isoformat()}")
     log.info(
         f"input args: input_path={input_path}, n_time_steps={time_loop.n_time_steps}, ending date={time_loop.run_config.end_date}"
@@ -545,6 +713,8 @@ def icon4py_driver(
     log.info("dycore configuring: DONE")
     log.info("time loop: START")
 
+    if instrumentation_output is not None:
+        instrumentation.enable(synchronize=instrumentation_synchronize)
     time_loop.time_integration(
         ds.diffusion_diagnostic,
         ds.solve_nonhydro_diagnostic,
@@ -556,6 +726,12 @@ def icon4py_driver(
 
     log.info("time loop:  DONE")
 
+    if instrumentation_output is not None:
+        report = instrumentation.disable()
+        log.info(f"time spent in the time loop:\n{report.summary()}")
+        report.write_json(instrumentation_output.with_suffix(".json"))
+        report.write_chrome_trace(instrumentation_output.with_suffix(".trace.json"))
+
 
 if __name__ == "__main__":
     icon4py_driver()
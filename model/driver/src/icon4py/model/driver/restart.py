@@ -0,0 +1,230 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Checkpoint and restart of the driver time loop.
+
+A restart file captures the model state needed to continue the time loop: both time levels of
+the prognostic state, the diagnostic states of solve_nonhydro and diffusion, the fields prepared
+for advection and the counters of the time loop. Restart files are entries of a
+`disk_cache.DiskCache` (one `.npy` file per field), keyed by the number of completed time steps.
+Every rank writes its local fields to its own cache in the subdirectory `rank_<rank>` of the
+restart path, a restart is complete once all ranks have written it.
+
+Checkpoints are written asynchronously: the fields are copied to host buffers and written to
+disk in a background thread while the time loop continues. Restoring memory maps the arrays and
+copies them directly into the already allocated fields of the model.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+import pathlib
+from collections.abc import Mapping
+from typing import Any, Optional, Union
+
+import gt4py.next as gtx
+import numpy as np
+import xarray as xr
+
+from icon4py.model.atmosphere.diffusion import diffusion_states
+from icon4py.model.atmosphere.dycore import dycore_states
+from icon4py.model.common import utils as common_utils
+from icon4py.model.common.io import writers
+from icon4py.model.common.states import prognostic_state as prognostics
+from icon4py.model.common.utils import data_allocation as data_alloc, disk_cache
+
+
+log = logging.getLogger(__name__)
+
+_KEY_PREFIX = "restart_step_"
+
+
+@dataclasses.dataclass(frozen=True)
+class TimeLoopCounters:
+    """Counters of the time loop needed to resume a run."""
+
+    simulation_date: datetime.datetime
+    completed_time_steps: int
+    is_first_step_in_simulation: bool
+    n_substeps_var: int
+    dtime_in_seconds: float
+
+    def to_metadata(self) -> dict[str, Any]:
+        return {
+            **dataclasses.asdict(self),
+            "simulation_date": self.simulation_date.isoformat(),
+        }
+
+    @classmethod
+    def from_metadata(cls, metadata: Mapping[str, Any]) -> TimeLoopCounters:
+        return cls(
+            simulation_date=datetime.datetime.fromisoformat(metadata["simulation_date"]),
+            completed_time_steps=int(metadata["completed_time_steps"]),
+            is_first_step_in_simulation=bool(metadata["is_first_step_in_simulation"]),
+            n_substeps_var=int(metadata["n_substeps_var"]),
+            dtime_in_seconds=float(metadata["dtime_in_seconds"]),
+        )
+
+
+def _collect_fields(prefix: str, state: Any) -> dict[str, gtx.Field]:
+    """Collect all fields of a state dataclass, fields of pairs are stored as '<name>.0', '<name>.1'."""
+    fields = {}
+    for attribute in dataclasses.fields(state):
+        value = getattr(state, attribute.name)
+        name = f"{prefix}.{attribute.name}"
+        if isinstance(value, common_utils.Pair):
+            fields.update({f"{name}.{i}": v for i, v in enumerate(value)})
+        elif value is not None:
+            fields[name] = value
+    return fields
+
+
+def restart_fields(
+    diffusion_diagnostic_state: diffusion_states.DiffusionDiagnosticState,
+    solve_nonhydro_diagnostic_state: dycore_states.DiagnosticStateNonHydro,
+    prognostic_states: common_utils.TimeStepPair[prognostics.PrognosticState],
+    prep_adv: dycore_states.PrepAdvection,
+) -> dict[str, gtx.Field]:
+    """Return all fields of the model state that go into a restart file by their name in the file."""
+    return {
+        **_collect_fields("prognostic_current", prognostic_states.current),
+        **_collect_fields("prognostic_next", prognostic_states.next),
+        **_collect_fields("solve_nonhydro_diagnostic", solve_nonhydro_diagnostic_state),
+        **_collect_fields("diffusion_diagnostic", diffusion_diagnostic_state),
+        **_collect_fields("prep_advection", prep_adv),
+    }
+
+
+def _restart_key(completed_time_steps: int) -> str:
+    return f"{_KEY_PREFIX}{completed_time_steps:0>10}"
+
+
+def rank_path(path: Union[pathlib.Path, str], rank: int) -> pathlib.Path:
+    """Directory of the restart files of 'rank' in the restart path 'path'."""
+    return pathlib.Path(path).joinpath(f"rank_{rank}")
+
+
+def latest_restart(path: Union[pathlib.Path, str], num_ranks: int = 1) -> Optional[str]:
+    """
+    Return the key of the most recent restart that is complete on all ranks, None if there is none.
+
+    Args:
+        path: restart path
+        num_ranks: number of ranks of the run that wrote the restart files
+    """
+    keys: Optional[set[str]] = None
+    for rank in range(num_ranks):
+        directory = rank_path(path, rank)
+        if not directory.is_dir():
+            return None
+        rank_keys = {k for k in disk_cache.DiskCache(directory).keys() if k.startswith(_KEY_PREFIX)}
+        keys = rank_keys if keys is None else keys & rank_keys
+    return max(keys) if keys else None
+
+
+class RestartWriter:
+    """
+    Write restart files in the background.
+
+    Args:
+        path: restart path
+        rank: rank whose local fields are written, its files go to `rank_path(path, rank)`
+        num_restart_files: number of most recent restart files to keep, older ones are removed
+        num_buffers: number of checkpoints that can be pending, `write` blocks if all are in use
+    """
+
+    def __init__(
+        self,
+        path: Union[pathlib.Path, str],
+        rank: int = 0,
+        num_restart_files: int = 2,
+        num_buffers: int = 1,
+    ):
+        if num_restart_files < 1:
+            raise ValueError(f"Need to keep at least one restart file, got {num_restart_files}.")
+        self._cache = disk_cache.DiskCache(rank_path(path, rank))
+        self._num_restart_files = num_restart_files
+        self._buffers = writers.HostBufferPool(num_buffers)
+        self._writer = writers.AsyncWriter(name="restart-writer")
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._cache.path
+
+    def write(self, counters: TimeLoopCounters, fields: Mapping[str, gtx.Field]) -> None:
+        """Take a snapshot of the fields and schedule writing it to a restart file."""
+        snapshot, buffers = self._buffers.snapshot(
+            {name: xr.DataArray(field.ndarray) for name, field in fields.items()}
+        )
+        key = _restart_key(counters.completed_time_steps)
+
+        def _store():
+            self._cache.store(
+                key, {name: s.data for name, s in snapshot.items()}, counters.to_metadata()
+            )
+            self._remove_outdated()
+
+        log.info(f"writing restart file '{key}' at {counters.simulation_date}")
+        try:
+            self._writer.submit(_store, cleanup=lambda: self._buffers.release(buffers))
+        except Exception:
+            self._buffers.release(buffers)
+            raise
+
+    def _remove_outdated(self) -> None:
+        keys = [k for k in self._cache.keys() if k.startswith(_KEY_PREFIX)]
+        for key in keys[: -self._num_restart_files]:
+            self._cache.remove(key)
+
+    def flush(self) -> None:
+        """Wait until all scheduled restart files are written."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Wait until all scheduled restart files are written and stop the background thread."""
+        self._writer.shutdown()
+
+
+def read_restart(
+    path: Union[pathlib.Path, str],
+    key: Optional[str] = None,
+    rank: int = 0,
+    num_ranks: int = 1,
+) -> tuple[TimeLoopCounters, dict[str, np.ndarray]]:
+    """
+    Read the restart file of a rank, the arrays are memory mapped.
+
+    Args:
+        path: restart path
+        key: restart file to read, defaults to the most recent one complete on all ranks
+        rank: rank whose local fields are read
+        num_ranks: number of ranks of the run
+    """
+    key = key if key is not None else latest_restart(path, num_ranks)
+    if key is None:
+        raise FileNotFoundError(f"No restart file for all {num_ranks} ranks found in '{path}'.")
+    directory = rank_path(path, rank)
+    metadata, arrays = disk_cache.DiskCache(directory).load(key, mmap=True)
+    log.info(f"reading restart file '{key}' from '{directory}'")
+    return TimeLoopCounters.from_metadata(metadata), arrays
+
+
+def restore_fields(fields: Mapping[str, gtx.Field], arrays: Mapping[str, np.ndarray]) -> None:
+    """Copy the arrays of a restart file into the (allocated) fields of the model state."""
+    for name, field in fields.items():
+        if name not in arrays:
+            raise ValueError(f"Field '{name}' is missing in the restart file.")
+        array = arrays[name]
+        if array.shape != field.ndarray.shape:
+            raise ValueError(
+                f"Shape mismatch for '{name}': restart file has {array.shape}, model has {field.ndarray.shape}."
+            )
+        xp = data_alloc.array_ns(not isinstance(field.ndarray, np.ndarray))
+        field.ndarray[...] = xp.asarray(array)
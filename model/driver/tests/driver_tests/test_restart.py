@@ -0,0 +1,235 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+import types
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import icon4py.model.common.utils as common_utils
+from icon4py.model.atmosphere.diffusion import diffusion_states
+from icon4py.model.atmosphere.dycore import dycore_states
+from icon4py.model.common import dimension as dims
+from icon4py.model.common.grid import simple
+from icon4py.model.common.states import prognostic_state as prognostics
+from icon4py.model.common.utils import data_allocation as data_alloc
+from icon4py.model.driver import icon4py_configuration, icon4py_driver, restart
+
+
+grid = simple.SimpleGrid()
+
+
+def _cell_k(extend: int = 0):
+    return data_alloc.random_field(grid, dims.CellDim, dims.KDim, extend={dims.KDim: extend})
+
+
+def _edge_k(extend: int = 0):
+    return data_alloc.random_field(grid, dims.EdgeDim, dims.KDim, extend={dims.KDim: extend})
+
+
+def _prognostic_state() -> prognostics.PrognosticState:
+    return prognostics.PrognosticState(
+        rho=_cell_k(), w=_cell_k(1), vn=_edge_k(), exner=_cell_k(), theta_v=_cell_k()
+    )
+
+
+def model_states():
+    solve_nonhydro_diagnostic_state = dycore_states.DiagnosticStateNonHydro(
+        vt=_edge_k(),
+        vn_ie=_edge_k(1),
+        w_concorr_c=_cell_k(1),
+        theta_v_ic=_cell_k(1),
+        exner_pr=_cell_k(),
+        rho_ic=_cell_k(1),
+        ddt_exner_phy=_cell_k(),
+        grf_tend_rho=_cell_k(),
+        grf_tend_thv=_cell_k(),
+        grf_tend_w=_cell_k(1),
+        mass_fl_e=_edge_k(),
+        ddt_vn_phy=_edge_k(),
+        grf_tend_vn=_edge_k(),
+        ddt_vn_apc_pc=common_utils.PredictorCorrectorPair(_edge_k(), _edge_k()),
+        ddt_w_adv_pc=common_utils.PredictorCorrectorPair(_cell_k(1), _cell_k(1)),
+        rho_incr=None,
+        vn_incr=None,
+        exner_incr=None,
+        exner_dyn_incr=_cell_k(),
+    )
+    diffusion_diagnostic_state = diffusion_states.DiffusionDiagnosticState(
+        hdef_ic=_cell_k(1), div_ic=_cell_k(1), dwdx=_cell_k(1), dwdy=_cell_k(1)
+    )
+    prep_adv = dycore_states.PrepAdvection(
+        vn_traj=_edge_k(), mass_flx_me=_edge_k(), mass_flx_ic=_cell_k(1), vol_flx_ic=_cell_k(1)
+    )
+    prognostic_states = common_utils.TimeStepPair(_prognostic_state(), _prognostic_state())
+    return (
+        diffusion_diagnostic_state,
+        solve_nonhydro_diagnostic_state,
+        prognostic_states,
+        prep_adv,
+    )
+
+
+def counters(completed_time_steps: int) -> restart.TimeLoopCounters:
+    return restart.TimeLoopCounters(
+        simulation_date=datetime(2021, 6, 20, 12, 0, 0)
+        + timedelta(seconds=10 * completed_time_steps),
+        completed_time_steps=completed_time_steps,
+        is_first_step_in_simulation=False,
+        n_substeps_var=5,
+        dtime_in_seconds=10.0,
+    )
+
+
+def test_restart_fields_contain_both_time_levels_and_pairs():
+    fields = restart.restart_fields(*model_states())
+    assert "prognostic_current.vn" in fields
+    assert "prognostic_next.vn" in fields
+    assert "solve_nonhydro_diagnostic.ddt_vn_apc_pc.0" in fields
+    assert "solve_nonhydro_diagnostic.ddt_vn_apc_pc.1" in fields
+    assert "solve_nonhydro_diagnostic.vn_incr" not in fields
+    assert "prep_advection.mass_flx_ic" in fields
+
+
+def test_write_and_restore_restart_file(tmp_path):
+    states = model_states()
+    fields = restart.restart_fields(*states)
+    expected = {name: field.asnumpy().copy() for name, field in fields.items()}
+
+    writer = restart.RestartWriter(tmp_path)
+    writer.write(counters(3), fields)
+    # the time loop continues while the restart file is written
+    for field in fields.values():
+        field.ndarray[...] = 0.0
+    writer.flush()
+    writer.close()
+
+    restored_counters, arrays = restart.read_restart(tmp_path)
+    assert restored_counters == counters(3)
+    restart.restore_fields(fields, arrays)
+    for name, field in fields.items():
+        assert np.all(field.asnumpy() == expected[name])
+
+
+def test_restart_writer_keeps_most_recent_files(tmp_path):
+    fields = restart.restart_fields(*model_states())
+    writer = restart.RestartWriter(tmp_path, num_restart_files=2)
+    for step in (2, 4, 6):
+        writer.write(counters(step), fields)
+    writer.close()
+
+    restored_counters, _ = restart.read_restart(tmp_path)
+    assert restored_counters.completed_time_steps == 6
+    restored_counters, _ = restart.read_restart(tmp_path, restart.latest_restart(tmp_path))
+    assert restored_counters.completed_time_steps == 6
+    with pytest.raises(KeyError):
+        restart.read_restart(tmp_path, "restart_step_0000000002")
+
+
+def test_restart_files_of_ranks_are_separate(tmp_path):
+    rank_fields = [restart.restart_fields(*model_states()) for _ in range(2)]
+    expected = [
+        {name: field.asnumpy().copy() for name, field in fields.items()} for fields in rank_fields
+    ]
+    writers = [restart.RestartWriter(tmp_path, rank=rank) for rank in range(2)]
+    for writer, fields in zip(writers, rank_fields, strict=True):
+        writer.write(counters(2), fields)
+    # rank 1 has not yet written the restart of step 4
+    writers[0].write(counters(4), rank_fields[0])
+    for writer in writers:
+        writer.close()
+
+    assert restart.latest_restart(tmp_path, num_ranks=2) == "restart_step_0000000002"
+    assert restart.latest_restart(tmp_path, num_ranks=3) is None
+    for rank in range(2):
+        restored_counters, arrays = restart.read_restart(tmp_path, rank=rank, num_ranks=2)
+        assert restored_counters == counters(2)
+        for name, array in arrays.items():
+            assert np.all(array == expected[rank][name])
+
+
+def test_read_restart_without_restart_file(tmp_path):
+    assert restart.latest_restart(tmp_path.joinpath("does_not_exist")) is None
+    with pytest.raises(FileNotFoundError):
+        restart.read_restart(tmp_path)
+
+
+def test_restore_fields_shape_mismatch(tmp_path):
+    fields = restart.restart_fields(*model_states())
+    arrays = {name: field.asnumpy() for name, field in fields.items()}
+    arrays["prognostic_current.w"] = arrays["prognostic_current.w"][:, :-1]
+    with pytest.raises(ValueError):
+        restart.restore_fields(fields, arrays)
+    del arrays["prognostic_current.w"]
+    with pytest.raises(ValueError):
+        restart.restore_fields(fields, arrays)
+
+
+class FakeTimeLoop(icon4py_driver.TimeLoop):
+    """Time loop with a cheap deterministic time step replacing the granules."""
+
+    def _integrate_one_time_step(
+        self,
+        diffusion_diagnostic_state,
+        solve_nonhydro_diagnostic_state,
+        prognostic_states,
+        prep_adv,
+        initial_divdamp_fac_o2,
+        do_prep_adv,
+    ):
+        current, next_state = prognostic_states.current, prognostic_states.next
+        next_state.vn.ndarray[...] = 0.5 * current.vn.ndarray + 1.0
+        prep_adv.vn_traj.ndarray[...] += current.vn.ndarray
+        prognostic_states.swap()
+
+
+def run_config(tmp_path, checkpoint_interval: int):
+    return icon4py_configuration.Icon4pyRunConfig(
+        dtime=timedelta(seconds=10.0),
+        start_date=datetime(2021, 6, 20, 12, 0, 0),
+        end_date=datetime(2021, 6, 20, 12, 1, 0),
+        apply_initial_stabilization=False,
+        checkpoint_interval=checkpoint_interval,
+        restart_path=str(tmp_path),
+        backend_name="embedded",
+    )
+
+
+def test_timeloop_restart_reproduces_uninterrupted_run(tmp_path):
+    diffusion_granule = types.SimpleNamespace(
+        config=types.SimpleNamespace(apply_to_horizontal_wind=False)
+    )
+    states = model_states()
+    restart_states = model_states()
+    for field, restart_field in zip(
+        restart.restart_fields(*states).values(),
+        restart.restart_fields(*restart_states).values(),
+        strict=True,
+    ):
+        restart_field.ndarray[...] = field.ndarray
+
+    reference = FakeTimeLoop(run_config(tmp_path, 0), diffusion_granule, None)
+    reference.time_integration(*states, 0.0, False)
+
+    first_run = FakeTimeLoop(run_config(tmp_path, 4), diffusion_granule, None)
+    first_run._n_time_steps = 4
+    first_run.time_integration(*restart_states, 0.0, False)
+    assert restart.latest_restart(tmp_path) == "restart_step_0000000004"
+
+    continued = FakeTimeLoop(run_config(tmp_path, 4), diffusion_granule, None)
+    for field in restart.restart_fields(*restart_states).values():
+        field.ndarray[...] = 0.0
+    continued.restore(*restart_states)
+    assert continued.completed_time_steps == 4
+    assert continued.simulation_date == datetime(2021, 6, 20, 12, 0, 40)
+    assert not continued.first_step_in_simulation
+    continued.time_integration(*restart_states, 0.0, False)
+
+    assert continued.simulation_date == reference.simulation_date
+    for name, field in restart.restart_fields(*states).items():
+        assert np.all(restart.restart_fields(*restart_states)[name].asnumpy() == field.asnumpy())
@@ -0,0 +1,144 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Counting of memory allocations, used to check that time stepping components do not allocate.
+
+All GT4Py field constructors (`gtx.as_field`, `gtx.zeros`, `gtx.empty`, ... and hence the
+helpers in `data_allocation`) obtain their buffers from `gt4py.next.allocators.allocate`, which
+is intercepted while an `AllocationCounter` is active. If CuPy is installed, allocations from the
+CuPy memory pool (for example temporaries of array expressions on device arrays) are counted
+as well.
+
+---
+solve_nonhydro.time_step(...)  # first call, may compile programs
+with allocation_counter.AllocationCounter() as counter:
+    solve_nonhydro.time_step(...)
+counter.assert_no_allocations()
+---
+
+Temporaries created by the execution of programs with the embedded backend are not counted.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import traceback
+
+from gt4py.next import allocators as gtx_allocators
+
+from icon4py.model.common.utils import data_allocation as data_alloc
+
+
+try:
+    import cupy as cp  # type: ignore[import-not-found]
+except ImportError:
+    cp = None
+
+
+_IGNORED_FRAMES = ("gt4py", "cupy", data_alloc.__file__, __file__)
+
+_lock = threading.Lock()
+
+
+class AllocationError(RuntimeError):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class Allocation:
+    """
+    A single allocation.
+
+    Args:
+        kind: 'field' for GT4Py field buffers, 'device' for CuPy memory pool allocations
+        description: shape and dtype of a field buffer, size of a device allocation
+        location: file and line of the allocating call outside of GT4Py, CuPy and the
+            `data_allocation` helpers
+    """
+
+    kind: str
+    description: str
+    location: str
+
+    def __str__(self) -> str:
+        return f"{self.kind} allocation of {self.description} at {self.location}"
+
+
+def _caller_location() -> str:
+    for frame in reversed(traceback.extract_stack()):
+        if not any(ignored in frame.filename for ignored in _IGNORED_FRAMES):
+            return f"{frame.filename}:{frame.lineno} ({frame.name})"
+    return "<unknown>"
+
+
+if cp is not None:
+
+    class _PoolHook(cp.cuda.MemoryHook):
+        name = "icon4py_allocation_counter"
+
+        def __init__(self, counter: AllocationCounter):
+            self._counter = counter
+
+        def malloc_preprocess(self, device_id: int, size: int, mem_size: int) -> None:
+            self._counter._record("device", f"{mem_size} bytes on device {device_id}")
+
+
+class AllocationCounter:
+    """
+    Context manager recording all allocations in its scope.
+
+    Args:
+        raise_on_allocation: raise an `AllocationError` at the first allocation, so that the
+            traceback points to the allocating code
+    """
+
+    def __init__(self, raise_on_allocation: bool = False):
+        self.raise_on_allocation = raise_on_allocation
+        self.allocations: list[Allocation] = []
+        self._original_allocate = None
+        self._pool_hook = None
+
+    def __len__(self) -> int:
+        return len(self.allocations)
+
+    def _record(self, kind: str, description: str) -> None:
+        allocation = Allocation(kind=kind, description=description, location=_caller_location())
+        self.allocations.append(allocation)
+        if self.raise_on_allocation:
+            raise AllocationError(f"Unexpected {allocation}.")
+
+    def __enter__(self) -> AllocationCounter:
+        _lock.acquire()
+        original_allocate = gtx_allocators.allocate
+
+        def _counting_allocate(domain, dtype, **kwargs):
+            buffer = original_allocate(domain, dtype, **kwargs)
+            self._record("field", f"shape {buffer.ndarray.shape} of {buffer.ndarray.dtype}")
+            return buffer
+
+        self._original_allocate = original_allocate
+        gtx_allocators.allocate = _counting_allocate
+        if cp is not None:
+            self._pool_hook = _PoolHook(self)
+            self._pool_hook.__enter__()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            if self._pool_hook is not None:
+                self._pool_hook.__exit__(*exc_info)
+                self._pool_hook = None
+            gtx_allocators.allocate = self._original_allocate
+        finally:
+            _lock.release()
+
+    def assert_no_allocations(self) -> None:
+        if self.allocations:
+            details = "\n".join(f"  {allocation}" for allocation in self.allocations)
+            raise AllocationError(f"{len(self.allocations)} unexpected allocations:\n{details}")
@@ -0,0 +1,207 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Timing of the functions called from Fortran through the generated wrappers.
+
+Wrappers generated with `--profile` measure for every call the time spent converting the Fortran
+pointers to GT4Py fields ('unpack') and the time spent in the wrapped function ('compute') and
+record them in the module-level `profiler`. On GPU backends the device is synchronized before
+taking a time, on CPU backends no synchronization is needed.
+
+The timings are aggregated per function and written by `finalize`, as JSON or CSV depending on
+the suffix of the output file:
+
+---
+profiling.enable()
+...  # calls from Fortran
+profiling.disable()
+profiling.finalize("py2fgen_profile.csv")
+---
+
+The wrapper modules expose this as `profile_enable` and `profile_disable`, which can be called
+from Fortran. The default output file is taken from the environment variable
+`ICON4PY_PROFILE_OUTPUT`.
+"""
+
+from __future__ import annotations
+
+import csv
+import dataclasses
+import json
+import logging
+import math
+import pathlib
+import time
+from types import ModuleType
+from typing import Optional
+
+import numpy as np
+
+from icon4py.tools.py2fgen.settings import config
+
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class Timing:
+    """Aggregated durations in seconds."""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "total": self.total,
+            "min": self.min if self.count else 0.0,
+            "mean": self.mean,
+            "max": self.max,
+        }
+
+
+@dataclasses.dataclass
+class FunctionProfile:
+    """
+    Timings of a wrapped function.
+
+    Args:
+        name: name of the function
+        unpack: time spent converting the arguments passed from Fortran
+        compute: time spent in the function
+    """
+
+    name: str
+    unpack: Timing = dataclasses.field(default_factory=Timing)
+    compute: Timing = dataclasses.field(default_factory=Timing)
+
+    @property
+    def calls(self) -> int:
+        return self.compute.count
+
+    @property
+    def unpack_fraction(self) -> float:
+        """Fraction of the time of the calls that is spent converting the arguments."""
+        total = self.unpack.total + self.compute.total
+        return self.unpack.total / total if total > 0.0 else 0.0
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "calls": self.calls,
+            "unpack": self.unpack.as_dict(),
+            "compute": self.compute.as_dict(),
+            "unpack_fraction": self.unpack_fraction,
+        }
+
+
+class Profiler:
+    """Collects the timings of the calls of the wrapped functions while enabled."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.functions: dict[str, FunctionProfile] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def now(self, xp: ModuleType = np) -> float:
+        """
+        Return the current time, after waiting for the work queued on the device.
+
+        Args:
+            xp: the array namespace of the wrapper, the device is synchronized if it is CuPy
+        """
+        if not self.enabled:
+            return 0.0
+        if xp is not np:
+            xp.cuda.Stream.null.synchronize()
+        return time.perf_counter()
+
+    def record(self, name: str, unpack: float, compute: float) -> None:
+        """Record a call of function 'name' that took 'unpack' + 'compute' seconds."""
+        if not self.enabled:
+            return
+        profile = self.functions.get(name)
+        if profile is None:
+            profile = self.functions[name] = FunctionProfile(name)
+        profile.unpack.add(unpack)
+        profile.compute.add(compute)
+
+    def reset(self) -> None:
+        self.functions.clear()
+
+    def as_dict(self) -> dict[str, dict[str, object]]:
+        return {name: profile.as_dict() for name, profile in self.functions.items()}
+
+    def to_json(self, path: pathlib.Path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def to_csv(self, path: pathlib.Path) -> None:
+        header = ["function", "calls"]
+        for phase in ("unpack", "compute"):
+            header.extend(f"{phase}_{stat}" for stat in ("total", "min", "mean", "max"))
+        header.append("unpack_fraction")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for name, profile in self.functions.items():
+                writer.writerow(
+                    [
+                        name,
+                        profile.calls,
+                        *profile.unpack.as_dict().values(),
+                        *profile.compute.as_dict().values(),
+                        profile.unpack_fraction,
+                    ]
+                )
+
+    def dump(self, path: pathlib.Path | str) -> None:
+        """Write the timings to 'path', as CSV if it ends with '.csv' and as JSON otherwise."""
+        path = pathlib.Path(path)
+        if path.suffix == ".csv":
+            self.to_csv(path)
+        else:
+            self.to_json(path)
+
+
+profiler = Profiler()
+
+
+def enable() -> None:
+    profiler.enable()
+
+
+def disable() -> None:
+    profiler.disable()
+
+
+def finalize(path: Optional[pathlib.Path | str] = None) -> None:
+    """
+    Write the timings recorded so far.
+
+    Args:
+        path: output file, defaults to `ICON4PY_PROFILE_OUTPUT`
+    """
+    path = pathlib.Path(path if path is not None else config.profile_output)
+    profiler.dump(path)
+    log.info(f"wrote timings of {len(profiler.functions)} functions to {path}")
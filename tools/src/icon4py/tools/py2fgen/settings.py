@@ -89,6 +89,15 @@ class Icon4PyConfig:
         # Any value other than None will be considered as True
         return env_flag_to_bool("ICON4PY_DACE_ORCHESTRATION", False)
 
+    @cached_property
+    def reuse_wrapper_states(self) -> bool:
+        # Keep the state containers passed to the granules between calls of the wrappers
+        return env_flag_to_bool("ICON4PY_REUSE_WRAPPER_STATES", True)
+
+    @cached_property
+    def profile_output(self) -> str:
+        return os.environ.get("ICON4PY_PROFILE_OUTPUT", "py2fgen_profile.json")
+
     @cached_property
     def array_ns(self) -> ModuleType:
         if self.device == Device.GPU:
@@ -109,6 +109,25 @@ def to_iso_c_type(scalar_type: ts.ScalarKind) -> str:
     return BUILTIN_TO_ISO_C_TYPE[scalar_type]
 
 
+def to_c_param_type(param: FuncParameter) -> str:
+    """
+    Return the C type of the elements of a parameter.
+
+    Boolean arrays are passed as 1-byte `_Bool` arrays, which have the memory layout of NumPy
+    booleans and can therefore be used without conversion. Boolean scalars are passed as `int`.
+    """
+    if param.is_array and param.is_bool:
+        return "_Bool"
+    return to_c_type(param.d_type)
+
+
+def to_iso_c_param_type(param: FuncParameter) -> str:
+    """Return the ISO C type of the elements of a parameter, `logical(c_bool)` for boolean arrays."""
+    if param.is_array and param.is_bool:
+        return "logical(c_bool)"
+    return to_iso_c_type(param.d_type)
+
+
 def as_f90_value(param: FuncParameter) -> Optional[str]:
     """
     Return the Fortran 90 'value' keyword for scalar types.
@@ -186,7 +205,7 @@ class PythonWrapperGenerator(TemplatedGenerator):
         """\
 # imports for generated wrapper code
 import logging
-{% if _this_node.profile %}import time{% endif %}
+{% if _this_node.profile %}from icon4py.tools.py2fgen import profiling{% endif %}
 from {{ plugin_name }} import ffi
 {% if _this_node.backend == 'GPU' %}import cupy as cp {% endif %}
 import gt4py.next as gtx
@@ -223,14 +242,7 @@ def {{ func.name }}_wrapper(
         {% endif %}
 
         {% if _this_node.profile %}
-        cp.cuda.Stream.null.synchronize()
-        unpack_start_time = time.perf_counter()
-        {% endif %}
-
-
-        {% if _this_node.profile %}
-        cp.cuda.Stream.null.synchronize()
-        allocate_start_time = time.perf_counter()
+        unpack_start_time = profiling.profiler.now(xp)
         {% endif %}
 
         # Convert ptr to GT4Py fields
@@ -244,14 +256,7 @@ def {{ func.name }}_wrapper(
         {% endfor %}
 
         {% if _this_node.profile %}
-        cp.cuda.Stream.null.synchronize()
-        allocate_end_time = time.perf_counter()
-        logging.critical('{{ func.name }} allocating to gt4py fields time per timestep: %s' % str(allocate_end_time - allocate_start_time))
-        {% endif %}
-
-        {% if _this_node.profile %}
-        cp.cuda.Stream.null.synchronize()
-        func_start_time = time.perf_counter()
+        func_start_time = profiling.profiler.now(xp)
         {% endif %}
 
         {{ func.name }}(
@@ -261,9 +266,8 @@ def {{ func.name }}_wrapper(
         )
 
         {% if _this_node.profile %}
-        cp.cuda.Stream.null.synchronize()
-        func_end_time = time.perf_counter()
-        logging.critical('{{ func.name }} function time per timestep: %s' % str(func_end_time - func_start_time))
+        func_end_time = profiling.profiler.now(xp)
+        profiling.profiler.record("{{ func.name }}", func_start_time - unpack_start_time, func_end_time - func_start_time)
         {% endif %}
 
 
@@ -312,7 +316,7 @@ class CHeaderGenerator(TemplatedGenerator):
 
     def visit_FuncParameter(self, param: FuncParameter, **kwargs: Any) -> str:
         return self.generic_visit(
-            param, rendered_type=to_c_type(param.d_type), pointer=render_c_pointer(param)
+            param, rendered_type=to_c_param_type(param), pointer=render_c_pointer(param)
         )
 
     FuncParameter = as_jinja("""{{rendered_type}}{{pointer}} {{name}}""")
@@ -467,7 +471,7 @@ end function {{name}}_wrapper
             _render_parameter_declaration(
                 name=param.name,
                 attributes=[
-                    to_iso_c_type(param.d_type),
+                    to_iso_c_param_type(param),
                     render_fortran_array_dimensions(param, False),
                     as_f90_value(param),
                     "pointer" if param.is_optional else "target",
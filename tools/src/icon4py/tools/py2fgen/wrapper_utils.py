@@ -54,8 +54,9 @@ def _unpack(ffi: cffi.FFI, ptr, *sizes: int) -> np.typing.NDArray:  # type: igno
     dtype_map: dict[str, np.dtype] = {
         "int": np.dtype(np.int32),
         "double": np.dtype(np.float64),
+        "_Bool": np.dtype(np.bool_),
     }
-    dtype = dtype_map.get(c_type, np.dtype(c_type))
+    dtype = dtype_map[c_type] if c_type in dtype_map else np.dtype(c_type)
 
     # Create a NumPy array from the buffer, specifying the Fortran order
     arr = np.frombuffer(ffi.buffer(ptr, length * ffi.sizeof(c_type)), dtype=dtype).reshape(  # type: ignore
@@ -94,6 +95,7 @@ def _unpack_gpu(ffi: cffi.FFI, ptr, *sizes: int):  # type: ignore[no-untyped-def
     dtype_map = {
         "int": cp.int32,
         "double": cp.float64,
+        "_Bool": cp.bool_,
     }
     dtype = dtype_map.get(c_type, None)
     if dtype is None:
@@ -111,19 +113,50 @@ def _unpack_gpu(ffi: cffi.FFI, ptr, *sizes: int):  # type: ignore[no-untyped-def
     return arr
 
 
-def _int_array_to_bool_array(int_array: np.typing.NDArray) -> np.typing.NDArray:
+class FieldViewCache:
     """
-    Converts a NumPy array of integers to a boolean array.
-    In the input array, 0 represents False, and any non-zero value (1 or -1) represents True.
+    Cache of the fields created by `as_field`, by pointer, scalar kind and domain.
 
-    Args:
-        int_array: A NumPy array of integers.
+    Fortran passes the same arrays in every call of a wrapped function. As the fields are only
+    views of the Fortran memory, the field created at the first call can be returned for all
+    later calls with the same pointer, scalar kind and domain. An entry never becomes invalid:
+    if Fortran deallocates an array, the entry can only be hit again by an array allocated at
+    the same address with the same size, for which the view is the same.
 
-    Returns:
-        A NumPy array of booleans.
+    Args:
+        max_size: the cache is cleared when it holds more fields than this
     """
-    bool_array = int_array != 0
-    return bool_array
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._fields: dict[tuple, gtx.Field] = {}
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def get(self, key: tuple) -> Optional[gtx.Field]:
+        field = self._fields.get(key)
+        if field is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return field
+
+    def store(self, key: tuple, field: gtx.Field) -> None:
+        if len(self._fields) >= self.max_size:
+            self._fields.clear()
+        self._fields[key] = field
+
+    def clear(self) -> None:
+        self._fields.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+field_view_cache = FieldViewCache()
 
 
 def as_field(  # type: ignore[no-untyped-def] # CData type not public?
@@ -134,16 +167,20 @@ def as_field(  # type: ignore[no-untyped-def] # CData type not public?
     domain: dict[gtx.Dimension, int],
     is_optional: bool,
 ) -> Optional[gtx.Field]:
-    sizes = domain.values()
-    unpack = _unpack if xp == np else _unpack_gpu
     if ptr == ffi.NULL:
         if is_optional:
             return None
         else:
             raise ValueError("Field is required but was not provided.")
+    cacheable = field_view_cache.enabled
+    if cacheable:
+        key = (int(ffi.cast("uintptr_t", ptr)), scalar_kind, tuple(domain.items()), xp)
+        if (field := field_view_cache.get(key)) is not None:
+            return field
+    sizes = domain.values()
+    unpack = _unpack if xp == np else _unpack_gpu
     arr = unpack(ffi, ptr, *sizes)
-    if scalar_kind == ts.ScalarKind.BOOL:
-        # TODO(havogt): This transformation breaks if we want to write to this array as we do a copy.
-        # Probably we need to do this transformation by hand on the Fortran side and pass responsibility to the user.
-        arr = _int_array_to_bool_array(arr)
-    return gtx_common._field(arr, domain=gtx_common.domain(domain))
+    field = gtx_common._field(arr, domain=gtx_common.domain(domain))
+    if cacheable:
+        field_view_cache.store(key, field)
+    return field
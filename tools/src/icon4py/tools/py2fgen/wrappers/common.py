@@ -7,11 +7,14 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # type: ignore
 
+import dataclasses
 import logging
+from typing import Any
 
+import gt4py.next as gtx
 import numpy as np
 
-from icon4py.model.common import dimension as dims
+from icon4py.model.common import dimension as dims, utils as common_utils
 from icon4py.model.common.decomposition import definitions, mpi_decomposition
 from icon4py.model.common.grid import base, horizontal, icon
 from icon4py.tools.py2fgen.settings import config
@@ -176,3 +179,61 @@ def construct_decomposition(
     exchange = definitions.create_exchange(processor_props, decomposition_info)
 
     return processor_props, decomposition_info, exchange
+
+
+class StateCache:
+    """
+    State containers passed to a granule, kept from one call of a wrapper to the next.
+
+    Fortran usually passes the same arrays in every call, for which `wrapper_utils.as_field`
+    returns the same fields. `get` then returns the state of the previous call instead of building
+    a new one. Fields that are passed in other arrays than in the previous call are rebound in the
+    state, frozen data classes and pairs are rebuilt instead. The granule itself is not modified,
+    so the orchestration uid of an orchestrated granule, and hence its compiled SDFG, stay the same.
+
+    Args:
+        enabled: if False, `get` builds a new state in every call
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._states: dict[str, Any] = {}
+
+    def get(self, name: str, state_type: type, *args: Any, **kwargs: Any) -> Any:
+        """
+        Return the state 'name' holding the given values.
+
+        Args:
+            name: key of the state in the cache
+            state_type: a data class, or a `Pair` that is given the values as positional arguments
+        """
+        if not self.enabled:
+            return state_type(*args, **kwargs)
+        state = self._states.get(name)
+        if type(state) is not state_type:
+            state = self._states[name] = state_type(*args, **kwargs)
+        elif isinstance(state, common_utils.Pair):
+            # pairs can be swapped by the granules, in which case they are rebuilt as well
+            if any(old is not new for old, new in zip(state, args, strict=True)):
+                state = self._states[name] = state_type(*args)
+        elif changed := {
+            key: value for key, value in kwargs.items() if getattr(state, key) is not value
+        }:
+            if state.__dataclass_params__.frozen:
+                state = self._states[name] = dataclasses.replace(state, **changed)
+            else:
+                for key, value in changed.items():
+                    setattr(state, key, value)
+        return state
+
+    def scratch_field(self, name: str, like: gtx.Field, allocator: Any) -> gtx.Field:
+        """Return a field with the domain and dtype of 'like', allocated and zeroed once."""
+        field = self._states.get(name)
+        if field is None or field.domain != like.domain or field.dtype != like.dtype:
+            field = self._states[name] = gtx.zeros(
+                like.domain, dtype=like.dtype, allocator=allocator
+            )
+        return field
+
+    def clear(self) -> None:
+        self._states.clear()
@@ -17,8 +17,6 @@ Fortran granule interfaces:
 - passing of scalar types or fields of simple types
 """
 
-import cProfile
-import pstats
 from typing import Optional
 
 import gt4py.next as gtx
@@ -45,7 +43,7 @@ from icon4py.model.common.states.prognostic_state import PrognosticState
 from icon4py.model.common.type_alias import wpfloat
 from icon4py.model.common.utils import data_allocation as data_alloc
 from icon4py.tools.common.logger import setup_logger
-from icon4py.tools.py2fgen import settings as settings
+from icon4py.tools.py2fgen import profiling, settings as settings
 from icon4py.tools.py2fgen.settings import backend, config as config_settings, device
 from icon4py.tools.py2fgen.wrappers import common as wrapper_common
 from icon4py.tools.py2fgen.wrappers.debug_utils import print_grid_decomp_info
@@ -62,19 +60,17 @@ from icon4py.tools.py2fgen.wrappers.wrapper_dimension import (
 logger = setup_logger(__name__)
 
 diffusion_wrapper_state = {
-    "profiler": cProfile.Profile(),
     "exchange_runtime": definitions.ExchangeRuntime,
 }
 
 
 def profile_enable():
-    diffusion_wrapper_state["profiler"].enable()
+    profiling.enable()
 
 
 def profile_disable():
-    diffusion_wrapper_state["profiler"].disable()
-    stats = pstats.Stats(diffusion_wrapper_state["profiler"])
-    stats.dump_stats(f"{__name__}.profile")
+    profiling.disable()
+    profiling.finalize()
 
 
 def diffusion_init(
@@ -280,6 +276,10 @@ def diffusion_init(
         backend=backend,
         exchange=diffusion_wrapper_state["exchange_runtime"],
     )
+    # state containers of diffusion_run, built in its first call and reused in the later ones
+    diffusion_wrapper_state["states"] = wrapper_common.StateCache(
+        enabled=config_settings.reuse_wrapper_states
+    )
 
 
 def diffusion_run(
@@ -295,8 +295,12 @@ def diffusion_run(
     dtime: gtx.float64,
     linit: bool,
 ):
+    states = diffusion_wrapper_state["states"]
+
     # prognostic and diagnostic variables
-    prognostic_state = PrognosticState(
+    prognostic_state = states.get(
+        "prognostic_state",
+        PrognosticState,
         w=w,
         vn=vn,
         exner=exner,
@@ -304,15 +308,18 @@ def diffusion_run(
         rho=rho,
     )
 
+    # diagnostics not requested by Fortran are written to fields allocated once
     if hdef_ic is None:
-        hdef_ic = gtx.zeros(w.domain, dtype=w.dtype, allocator=backend)
+        hdef_ic = states.scratch_field("hdef_ic", like=w, allocator=backend)
     if div_ic is None:
-        div_ic = gtx.zeros(w.domain, dtype=w.dtype, allocator=backend)
+        div_ic = states.scratch_field("div_ic", like=w, allocator=backend)
     if dwdx is None:
-        dwdx = gtx.zeros(w.domain, dtype=w.dtype, allocator=backend)
+        dwdx = states.scratch_field("dwdx", like=w, allocator=backend)
     if dwdy is None:
-        dwdy = gtx.zeros(w.domain, dtype=w.dtype, allocator=backend)
-    diagnostic_state = DiffusionDiagnosticState(
+        dwdy = states.scratch_field("dwdy", like=w, allocator=backend)
+    diagnostic_state = states.get(
+        "diagnostic_state",
+        DiffusionDiagnosticState,
         hdef_ic=hdef_ic,
         div_ic=div_ic,
         dwdx=dwdx,
@@ -29,9 +29,6 @@ Fortran granule interfaces:
 - passing of scalar types or fields of simple types
 """
 
-import cProfile
-import pstats
-
 import gt4py.next as gtx
 
 import icon4py.model.common.grid.states as grid_states
@@ -43,7 +40,8 @@ from icon4py.model.common.grid.vertical import VerticalGrid, VerticalGridConfig
 from icon4py.model.common.states.prognostic_state import PrognosticState
 from icon4py.model.common.utils import data_allocation as data_alloc
 from icon4py.tools.common.logger import setup_logger
-from icon4py.tools.py2fgen.settings import backend, device
+from icon4py.tools.py2fgen import profiling
+from icon4py.tools.py2fgen.settings import backend, config as config_settings, device
 from icon4py.tools.py2fgen.wrappers import common as wrapper_common
 from icon4py.tools.py2fgen.wrappers.wrapper_dimension import (
     CellIndexDim,
@@ -54,19 +52,16 @@ from icon4py.tools.py2fgen.wrappers.wrapper_dimension import (
 
 logger = setup_logger(__name__)
 
-dycore_wrapper_state = {
-    "profiler": cProfile.Profile(),
-}
+dycore_wrapper_state = {}
 
 
 def profile_enable():
-    dycore_wrapper_state["profiler"].enable()
+    profiling.enable()
 
 
 def profile_disable():
-    dycore_wrapper_state["profiler"].disable()
-    stats = pstats.Stats(dycore_wrapper_state["profiler"])
-    stats.dump_stats(f"{__name__}.profile")
+    profiling.disable()
+    profiling.finalize()
 
 
 def solve_nh_init(
@@ -334,6 +329,14 @@ def solve_nh_init(
         owner_mask=c_owner_mask,
         backend=backend,
     )
+    # not passed from Fortran, allocated once to not allocate in every call of solve_nh_run
+    dycore_wrapper_state["vol_flx_ic"] = data_alloc.zero_field(
+        dycore_wrapper_state["grid"], dims.CellDim, dims.KDim, dtype=gtx.float64, backend=backend
+    )
+    # state containers of solve_nh_run, built in its first call and reused in the later ones
+    dycore_wrapper_state["states"] = wrapper_common.StateCache(
+        enabled=config_settings.reuse_wrapper_states
+    )
 
 
 def solve_nh_run(
@@ -377,16 +380,20 @@ def solve_nh_run(
 ):
     logger.info(f"Using Device = {device}")
 
-    prep_adv = dycore_states.PrepAdvection(
+    states = dycore_wrapper_state["states"]
+
+    prep_adv = states.get(
+        "prep_adv",
+        dycore_states.PrepAdvection,
         vn_traj=vn_traj,
         mass_flx_me=mass_flx_me,
         mass_flx_ic=mass_flx_ic,
-        vol_flx_ic=data_alloc.zero_field(
-            dycore_wrapper_state["grid"], dims.CellDim, dims.KDim, dtype=gtx.float64
-        ),
+        vol_flx_ic=dycore_wrapper_state["vol_flx_ic"],
     )
 
-    diagnostic_state_nh = dycore_states.DiagnosticStateNonHydro(
+    diagnostic_state_nh = states.get(
+        "diagnostic_state_nh",
+        dycore_states.DiagnosticStateNonHydro,
         theta_v_ic=theta_v_ic,
         exner_pr=exner_pr,
         rho_ic=rho_ic,
@@ -397,8 +404,12 @@ def solve_nh_run(
         mass_fl_e=mass_fl_e,
         ddt_vn_phy=ddt_vn_phy,
         grf_tend_vn=grf_tend_vn,
-        ddt_vn_apc_pc=common_utils.PredictorCorrectorPair(ddt_vn_apc_ntl1, ddt_vn_apc_ntl2),
-        ddt_w_adv_pc=common_utils.PredictorCorrectorPair(ddt_w_adv_ntl1, ddt_w_adv_ntl2),
+        ddt_vn_apc_pc=states.get(
+            "ddt_vn_apc_pc", common_utils.PredictorCorrectorPair, ddt_vn_apc_ntl1, ddt_vn_apc_ntl2
+        ),
+        ddt_w_adv_pc=states.get(
+            "ddt_w_adv_pc", common_utils.PredictorCorrectorPair, ddt_w_adv_ntl1, ddt_w_adv_ntl2
+        ),
         vt=vt,
         vn_ie=vn_ie,
         w_concorr_c=w_concorr_c,
@@ -408,21 +419,30 @@ def solve_nh_run(
         exner_dyn_incr=exner_dyn_incr,
     )
 
-    prognostic_state_nnow = PrognosticState(
+    prognostic_state_nnow = states.get(
+        "prognostic_state_nnow",
+        PrognosticState,
         w=w_now,
         vn=vn_now,
         theta_v=theta_v_now,
         rho=rho_now,
         exner=exner_now,
     )
-    prognostic_state_nnew = PrognosticState(
+    prognostic_state_nnew = states.get(
+        "prognostic_state_nnew",
+        PrognosticState,
         w=w_new,
         vn=vn_new,
         theta_v=theta_v_new,
         rho=rho_new,
         exner=exner_new,
     )
-    prognostic_states = common_utils.TimeStepPair(prognostic_state_nnow, prognostic_state_nnew)
+    prognostic_states = states.get(
+        "prognostic_states",
+        common_utils.TimeStepPair,
+        prognostic_state_nnow,
+        prognostic_state_nnew,
+    )
 
     # adjust for Fortran indexes
     idyn_timestep = idyn_timestep - 1
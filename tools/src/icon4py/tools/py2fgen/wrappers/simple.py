@@ -7,32 +7,26 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 # mypy: ignore-errors
-import cProfile
-import pstats
-
 import gt4py.next as gtx
 from gt4py.next.common import GridType
 from gt4py.next.ffront.decorator import field_operator, program
 
 from icon4py.model.common import dimension as dims
 from icon4py.model.common.grid.simple import SimpleGrid
+from icon4py.tools.py2fgen import profiling
 from icon4py.tools.py2fgen.settings import backend
 
 
-# global profiler object
-profiler = cProfile.Profile()
-
 grid = SimpleGrid()
 
 
 def profile_enable():
-    profiler.enable()
+    profiling.enable()
 
 
 def profile_disable():
-    profiler.disable()
-    stats = pstats.Stats(profiler)
-    stats.dump_stats(f"{__name__}.profile")
+    profiling.disable()
+    profiling.finalize()
 
 
 @field_operator
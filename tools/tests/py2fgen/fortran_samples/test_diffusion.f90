@@ -79,10 +79,10 @@ contains
     end subroutine fill_random_3d
 
     subroutine fill_random_2d_bool(array)
-    use, intrinsic :: iso_c_binding, only: c_int
+    use, intrinsic :: iso_c_binding, only: c_bool
     implicit none
 
-    logical(c_int), intent(inout) :: array(:, :)
+    logical(c_bool), intent(inout) :: array(:, :)
     integer :: i, j
     real :: rnd  ! real number between 0 and 1
 
@@ -179,7 +179,7 @@ program diffusion_simulation
    real(c_double), dimension(:, :), allocatable :: primal_normal_vert_x
    real(c_double), dimension(:, :), allocatable :: primal_normal_vert_y
    real(c_double), dimension(:, :), allocatable :: zd_diffcoef
-   logical(c_int), dimension(:, :), allocatable :: mask_hdiff
+   logical(c_bool), dimension(:, :), allocatable :: mask_hdiff
 
    integer(c_int), dimension(:, :, :), allocatable :: zd_vertoffset
    real(c_double), dimension(:, :, :), allocatable :: zd_intcoef
@@ -96,10 +96,10 @@ contains
    end subroutine fill_random_3d
 
    subroutine fill_random_2d_bool(array)
-      use, intrinsic :: iso_c_binding, only: c_int
+      use, intrinsic :: iso_c_binding, only: c_bool
       implicit none
 
-      logical(c_int), intent(inout) :: array(:, :)
+      logical(c_bool), intent(inout) :: array(:, :)
       integer :: i, j
       real :: rnd
 
@@ -116,10 +116,10 @@ contains
    end subroutine fill_random_2d_bool
 
    subroutine fill_random_1d_bool(array)
-      use, intrinsic :: iso_c_binding, only: c_int
+      use, intrinsic :: iso_c_binding, only: c_bool
       implicit none
 
-      logical(c_int), intent(inout) :: array(:)
+      logical(c_bool), intent(inout) :: array(:)
       integer :: i
       real :: rnd
 
@@ -137,7 +137,7 @@ contains
 end module random_utils
 
 program solve_nh_simulation
-   use, intrinsic :: iso_c_binding, only: c_double, c_int
+   use, intrinsic :: iso_c_binding, only: c_double, c_int, c_bool
    use random_utils, only: fill_random_1d, fill_random_2d, fill_random_2d_int, fill_random_2d_bool, fill_random_1d_bool, &
                             fill_random_3d_int, fill_random_3d
    use dycore_plugin
@@ -229,9 +229,9 @@ program solve_nh_simulation
     real(c_double), dimension(:), allocatable :: scalfac_dd3d
     real(c_double), dimension(:), allocatable :: nudgecoeff_e
     real(c_double), dimension(:), allocatable :: hmask_dd3d
-    logical(c_int), dimension(:), allocatable :: bdy_halo_c
-    logical(c_int), dimension(:), allocatable :: mask_prog_halo_c
-    logical(c_int), dimension(:), allocatable :: c_owner_mask
+    logical(c_bool), dimension(:), allocatable :: bdy_halo_c
+    logical(c_bool), dimension(:), allocatable :: mask_prog_halo_c
+    logical(c_bool), dimension(:), allocatable :: c_owner_mask
 
     real(c_double), dimension(:, :), allocatable :: theta_ref_mc
     real(c_double), dimension(:, :), allocatable :: exner_pr
@@ -306,7 +306,7 @@ program solve_nh_simulation
     real(c_double), dimension(:, :), allocatable :: rho_ic
     real(c_double), dimension(:, :), allocatable :: e_flx_avg
     real(c_double), dimension(:, :), allocatable :: ddt_exner_phy
-    logical(c_int), dimension(:, :), allocatable :: ipeidx_dsl
+    logical(c_bool), dimension(:, :), allocatable :: ipeidx_dsl
     real(c_double), dimension(:, :), allocatable :: coeff_gradekin
     real(c_double), dimension(:, :), allocatable :: geofac_grdiv
     real(c_double), dimension(:, :), allocatable :: geofac_rot
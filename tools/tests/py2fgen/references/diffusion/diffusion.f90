@@ -920,7 +920,7 @@ contains
 
       real(c_double), dimension(:, :), target :: rbf_coeff_2
 
-      logical(c_int), dimension(:, :), pointer :: mask_hdiff
+      logical(c_bool), dimension(:, :), pointer :: mask_hdiff
 
       real(c_double), dimension(:, :), pointer :: zd_diffcoef
 
@@ -1523,11 +1523,11 @@ contains
 
       integer(c_int), dimension(:, :), target :: c2v
 
-      logical(c_int), dimension(:), target :: c_owner_mask
+      logical(c_bool), dimension(:), target :: c_owner_mask
 
-      logical(c_int), dimension(:), target :: e_owner_mask
+      logical(c_bool), dimension(:), target :: e_owner_mask
 
-      logical(c_int), dimension(:), target :: v_owner_mask
+      logical(c_bool), dimension(:), target :: v_owner_mask
 
       integer(c_int), dimension(:), target :: c_glb_index
 
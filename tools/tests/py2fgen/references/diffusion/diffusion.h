@@ -17,7 +17,7 @@ extern int diffusion_init_wrapper(
     double *geofac_n2s, int geofac_n2s_size_0, int geofac_n2s_size_1,
     double *nudgecoeff_e, int nudgecoeff_e_size_0, double *rbf_coeff_1,
     int rbf_coeff_1_size_0, int rbf_coeff_1_size_1, double *rbf_coeff_2,
-    int rbf_coeff_2_size_0, int rbf_coeff_2_size_1, int *mask_hdiff,
+    int rbf_coeff_2_size_0, int rbf_coeff_2_size_1, _Bool *mask_hdiff,
     int mask_hdiff_size_0, int mask_hdiff_size_1, double *zd_diffcoef,
     int zd_diffcoef_size_0, int zd_diffcoef_size_1, int *zd_vertoffset,
     int zd_vertoffset_size_0, int zd_vertoffset_size_1,
@@ -65,8 +65,8 @@ extern int grid_init_diffusion_wrapper(
     int e2v_size_1, int *v2e, int v2e_size_0, int v2e_size_1, int *v2c,
     int v2c_size_0, int v2c_size_1, int *e2c2v, int e2c2v_size_0,
     int e2c2v_size_1, int *c2v, int c2v_size_0, int c2v_size_1,
-    int *c_owner_mask, int c_owner_mask_size_0, int *e_owner_mask,
-    int e_owner_mask_size_0, int *v_owner_mask, int v_owner_mask_size_0,
+    _Bool *c_owner_mask, int c_owner_mask_size_0, _Bool *e_owner_mask,
+    int e_owner_mask_size_0, _Bool *v_owner_mask, int v_owner_mask_size_0,
     int *c_glb_index, int c_glb_index_size_0, int *e_glb_index,
     int e_glb_index_size_0, int *v_glb_index, int v_glb_index_size_0,
     int comm_id, int global_root, int global_level, int num_vertices,
@@ -1815,9 +1815,9 @@ contains
 
       real(c_double), dimension(:), target :: nudgecoeff_e
 
-      logical(c_int), dimension(:), target :: bdy_halo_c
+      logical(c_bool), dimension(:), target :: bdy_halo_c
 
-      logical(c_int), dimension(:), target :: mask_prog_halo_c
+      logical(c_bool), dimension(:), target :: mask_prog_halo_c
 
       real(c_double), dimension(:), target :: rayleigh_w
 
@@ -1857,7 +1857,7 @@ contains
 
       integer(c_int), dimension(:, :, :), target :: vertoffset_gradp
 
-      logical(c_int), dimension(:, :), target :: ipeidx_dsl
+      logical(c_bool), dimension(:, :), target :: ipeidx_dsl
 
       real(c_double), dimension(:, :), target :: pg_exdist
 
@@ -1881,7 +1881,7 @@ contains
 
       real(c_double), dimension(:, :), target :: coeff_gradekin
 
-      logical(c_int), dimension(:), target :: c_owner_mask
+      logical(c_bool), dimension(:), target :: c_owner_mask
 
       real(c_double), dimension(:), target :: cell_center_lat
 
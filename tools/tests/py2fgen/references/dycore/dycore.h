@@ -68,8 +68,8 @@ extern int solve_nh_init_wrapper(
     int geofac_n2s_size_0, int geofac_n2s_size_1, double *geofac_grg_x,
     int geofac_grg_x_size_0, int geofac_grg_x_size_1, double *geofac_grg_y,
     int geofac_grg_y_size_0, int geofac_grg_y_size_1, double *nudgecoeff_e,
-    int nudgecoeff_e_size_0, int *bdy_halo_c, int bdy_halo_c_size_0,
-    int *mask_prog_halo_c, int mask_prog_halo_c_size_0, double *rayleigh_w,
+    int nudgecoeff_e_size_0, _Bool *bdy_halo_c, int bdy_halo_c_size_0,
+    _Bool *mask_prog_halo_c, int mask_prog_halo_c_size_0, double *rayleigh_w,
     int rayleigh_w_size_0, double *exner_exfac, int exner_exfac_size_0,
     int exner_exfac_size_1, double *exner_ref_mc, int exner_ref_mc_size_0,
     int exner_ref_mc_size_1, double *wgtfac_c, int wgtfac_c_size_0,
@@ -90,7 +90,7 @@ extern int solve_nh_init_wrapper(
     int ddxn_z_full_size_1, double *zdiff_gradp, int zdiff_gradp_size_0,
     int zdiff_gradp_size_1, int zdiff_gradp_size_2, int *vertoffset_gradp,
     int vertoffset_gradp_size_0, int vertoffset_gradp_size_1,
-    int vertoffset_gradp_size_2, int *ipeidx_dsl, int ipeidx_dsl_size_0,
+    int vertoffset_gradp_size_2, _Bool *ipeidx_dsl, int ipeidx_dsl_size_0,
     int ipeidx_dsl_size_1, double *pg_exdist, int pg_exdist_size_0,
     int pg_exdist_size_1, double *ddqz_z_full_e, int ddqz_z_full_e_size_0,
     int ddqz_z_full_e_size_1, double *ddxt_z_full, int ddxt_z_full_size_0,
@@ -101,7 +101,7 @@ extern int solve_nh_init_wrapper(
     int scalfac_dd3d_size_0, double *coeff1_dwdz, int coeff1_dwdz_size_0,
     int coeff1_dwdz_size_1, double *coeff2_dwdz, int coeff2_dwdz_size_0,
     int coeff2_dwdz_size_1, double *coeff_gradekin, int coeff_gradekin_size_0,
-    int coeff_gradekin_size_1, int *c_owner_mask, int c_owner_mask_size_0,
+    int coeff_gradekin_size_1, _Bool *c_owner_mask, int c_owner_mask_size_0,
     double *cell_center_lat, int cell_center_lat_size_0,
     double *cell_center_lon, int cell_center_lon_size_0,
     double *edge_center_lat, int edge_center_lat_size_0,
@@ -10,10 +10,13 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+import gt4py.next as gtx
 import numpy as np
 import pytest
 from cffi import FFI
+from gt4py.next.type_system import type_specifications as ts
 
+from icon4py.tools.py2fgen import wrapper_utils
 from icon4py.tools.py2fgen.plugin import generate_and_compile_cffi_plugin
 from icon4py.tools.py2fgen.wrapper_utils import _unpack
 
@@ -40,6 +43,60 @@ def test_unpack_column_major(data, expected_result, ffi):
     assert np.array_equal(result, expected_result)
 
 
+@pytest.fixture
+def field_view_cache():
+    wrapper_utils.field_view_cache.clear()
+    yield wrapper_utils.field_view_cache
+    wrapper_utils.field_view_cache.clear()
+    wrapper_utils.field_view_cache.enabled = True
+
+
+def test_as_field_reuses_cached_view(ffi, field_view_cache):
+    cell = gtx.Dimension("Cell")
+    k = gtx.Dimension("K", kind=gtx.DimensionKind.VERTICAL)
+    ptr = ffi.new("double[]", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+    field = wrapper_utils.as_field(ffi, np, ptr, ts.ScalarKind.FLOAT64, {cell: 2, k: 3}, False)
+    again = wrapper_utils.as_field(ffi, np, ptr, ts.ScalarKind.FLOAT64, {cell: 2, k: 3}, False)
+    reshaped = wrapper_utils.as_field(ffi, np, ptr, ts.ScalarKind.FLOAT64, {cell: 3, k: 2}, False)
+
+    assert again is field
+    assert reshaped is not field
+    assert (field_view_cache.hits, field_view_cache.misses) == (1, 2)
+    # the cached field is a view of the memory
+    ptr[1] = 42.0
+    assert again.asnumpy()[1, 0] == 42.0
+    again.ndarray[0, 0] = -1.0
+    assert ptr[0] == -1.0
+
+
+def test_as_field_bool_is_view(ffi, field_view_cache):
+    cell = gtx.Dimension("Cell")
+    ptr = ffi.new("_Bool[]", [False, True, True])
+
+    field = wrapper_utils.as_field(ffi, np, ptr, ts.ScalarKind.BOOL, {cell: 3}, False)
+
+    assert field.dtype.scalar_type == np.bool_
+    assert np.array_equal(field.asnumpy(), [False, True, True])
+    assert wrapper_utils.as_field(ffi, np, ptr, ts.ScalarKind.BOOL, {cell: 3}, False) is field
+    # writes are visible on the Fortran side
+    field.ndarray[0] = True
+    assert ptr[0]
+
+
+def test_as_field_without_cache(ffi, field_view_cache):
+    cell = gtx.Dimension("Cell")
+    ptr = ffi.new("double[]", [1.0, 2.0])
+    field_view_cache.enabled = False
+
+    field = wrapper_utils.as_field(ffi, np, ptr, ts.ScalarKind.FLOAT64, {cell: 2}, False)
+
+    assert (
+        wrapper_utils.as_field(ffi, np, ptr, ts.ScalarKind.FLOAT64, {cell: 2}, False) is not field
+    )
+    assert len(field_view_cache) == 0
+
+
 def test_compile_and_run_cffi_plugin_from_C():
     plugin_name = "test_plugin"
     c_header = "int test_function();"
@@ -69,9 +69,10 @@ def run_test_case(
     extra_compiler_flags=(),
     expected_error_code=0,
     env_vars=None,
+    profile=False,
 ):
     with cli.isolated_filesystem(temp_dir=test_temp_dir):
-        invoke_cli(cli, module, function, plugin_name, backend)
+        invoke_cli(cli, module, function, plugin_name, backend, profile)
         compile_and_run_fortran(
             plugin_name,
             samples_path,
@@ -84,8 +85,8 @@ def run_test_case(
         )
 
 
-def invoke_cli(cli, module, function, plugin_name, backend):
-    cli_args = [module, function, plugin_name, "-b", backend, "-d"]
+def invoke_cli(cli, module, function, plugin_name, backend, profile=False):
+    cli_args = [module, function, plugin_name, "-b", backend, "-d", *(["-p"] if profile else [])]
     result = cli.invoke(main, cli_args)
     assert result.exit_code == 0, "CLI execution failed"
 
@@ -211,7 +212,7 @@ def test_py2fgen_compilation_and_execution_gpu(
 def test_py2fgen_compilation_and_profiling(
     cli_runner, run_backend, samples_path, square_wrapper_module, extra_flags, test_temp_dir
 ):
-    """Test profiling using cProfile of the generated wrapper."""
+    """Test profiling of the generated wrapper."""
     run_test_case(
         cli_runner,
         square_wrapper_module,
@@ -222,6 +223,8 @@ def test_py2fgen_compilation_and_profiling(
         "test_square",
         test_temp_dir,
         extra_compiler_flags=extra_flags,
+        env_vars={"ICON4PY_PROFILE_OUTPUT": "square_profile.csv"},
+        profile=True,
     )
 
 
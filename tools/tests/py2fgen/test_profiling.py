@@ -0,0 +1,71 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from icon4py.tools.py2fgen import profiling
+
+
+@pytest.fixture
+def profiler():
+    profiler = profiling.Profiler()
+    profiler.record("diffusion_run", unpack=1.0, compute=3.0)
+    profiler.record("diffusion_run", unpack=3.0, compute=5.0)
+    profiler.record("grid_init", unpack=0.5, compute=0.5)
+    return profiler
+
+
+def test_record(profiler):
+    run = profiler.functions["diffusion_run"]
+    assert run.calls == 2
+    assert (run.unpack.min, run.unpack.mean, run.unpack.max) == (1.0, 2.0, 3.0)
+    assert (run.compute.min, run.compute.mean, run.compute.max) == (3.0, 4.0, 5.0)
+    assert run.unpack_fraction == pytest.approx(4.0 / 12.0)
+    assert profiler.functions["grid_init"].calls == 1
+
+
+def test_disabled_profiler_does_not_record(profiler):
+    profiler.disable()
+    profiler.record("diffusion_run", unpack=1.0, compute=1.0)
+    assert profiler.functions["diffusion_run"].calls == 2
+    assert profiler.now(np) == 0.0
+
+    profiler.enable()
+    assert profiler.now(np) > 0.0
+
+
+def test_dump_json(profiler, tmp_path):
+    path = tmp_path / "profile.json"
+    profiler.dump(path)
+
+    with open(path) as f:
+        result = json.load(f)
+    assert set(result) == {"diffusion_run", "grid_init"}
+    assert result["diffusion_run"]["calls"] == 2
+    assert result["diffusion_run"]["compute"] == {
+        "total": 8.0,
+        "min": 3.0,
+        "mean": 4.0,
+        "max": 5.0,
+    }
+
+
+def test_dump_csv(profiler, tmp_path):
+    path = tmp_path / "profile.csv"
+    profiler.dump(path)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["function"] for row in rows] == ["diffusion_run", "grid_init"]
+    assert int(rows[0]["calls"]) == 2
+    assert float(rows[0]["unpack_mean"]) == 2.0
+    assert float(rows[0]["compute_max"]) == 5.0
@@ -0,0 +1,111 @@
+# ICON4Py - ICON inspired code in Python and GT4Py
+#
+# Copyright (c) 2022-2024, ETH Zurich and MeteoSwiss
+# All rights reserved.
+#
+# Please, refer to the LICENSE file in the root directory.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import gt4py.next as gtx
+import numpy as np
+
+from icon4py.model.atmosphere.diffusion import diffusion_states
+from icon4py.model.common import dimension as dims, utils as common_utils
+from icon4py.model.common.states import prognostic_state
+from icon4py.tools.py2fgen.wrappers import common as wrapper_common
+
+
+def _fields(n: int) -> list[gtx.Field]:
+    return [gtx.zeros({dims.CellDim: 3, dims.KDim: 2}, dtype=gtx.float64) for _ in range(n)]
+
+
+def _prognostics(states, w, vn, exner, theta_v, rho):
+    return states.get(
+        "prognostic_state",
+        prognostic_state.PrognosticState,
+        w=w,
+        vn=vn,
+        exner=exner,
+        theta_v=theta_v,
+        rho=rho,
+    )
+
+
+def test_state_cache_reuses_state():
+    states = wrapper_common.StateCache()
+    fields = _fields(5)
+
+    state = _prognostics(states, *fields)
+
+    assert _prognostics(states, *fields) is state
+
+
+def test_state_cache_rebinds_changed_fields():
+    states = wrapper_common.StateCache()
+    fields = _fields(5)
+    state = _prognostics(states, *fields)
+
+    new_w = _fields(1)[0]
+    rebound = _prognostics(states, new_w, *fields[1:])
+
+    assert rebound is state
+    assert rebound.w is new_w
+    assert rebound.vn is fields[1]
+
+
+def test_state_cache_rebuilds_frozen_states():
+    states = wrapper_common.StateCache()
+    fields = _fields(5)
+    state = states.get(
+        "diagnostic_state",
+        diffusion_states.DiffusionDiagnosticState,
+        hdef_ic=fields[0],
+        div_ic=fields[1],
+        dwdx=fields[2],
+        dwdy=fields[3],
+    )
+
+    rebuilt = states.get(
+        "diagnostic_state",
+        diffusion_states.DiffusionDiagnosticState,
+        hdef_ic=fields[4],
+        div_ic=fields[1],
+        dwdx=fields[2],
+        dwdy=fields[3],
+    )
+
+    assert rebuilt is not state
+    assert rebuilt.hdef_ic is fields[4]
+    assert state.hdef_ic is fields[0]
+
+
+def test_state_cache_restores_swapped_pair():
+    states = wrapper_common.StateCache()
+    ntl1, ntl2 = _fields(2)
+    pair = states.get("pair", common_utils.PredictorCorrectorPair, ntl1, ntl2)
+    assert states.get("pair", common_utils.PredictorCorrectorPair, ntl1, ntl2) is pair
+
+    # swapped by the granule
+    pair.swap()
+    restored = states.get("pair", common_utils.PredictorCorrectorPair, ntl1, ntl2)
+
+    assert restored.predictor is ntl1
+    assert restored.corrector is ntl2
+
+
+def test_state_cache_disabled():
+    states = wrapper_common.StateCache(enabled=False)
+    fields = _fields(5)
+
+    assert _prognostics(states, *fields) is not _prognostics(states, *fields)
+
+
+def test_scratch_field_is_allocated_once():
+    states = wrapper_common.StateCache()
+    like = _fields(1)[0]
+
+    field = states.scratch_field("hdef_ic", like=like, allocator=None)
+
+    assert field.domain == like.domain
+    assert np.all(field.asnumpy() == 0.0)
+    assert states.scratch_field("hdef_ic", like=like, allocator=None) is field